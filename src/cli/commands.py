@@ -6,11 +6,13 @@ Implements all CLI commands:
 - batch: Batch file processing
 - version: Version information
 - config: Configuration management
+- cache: Extraction cache management
 
 Each command provides user-friendly messages and error handling
 for non-technical users.
 """
 
+import functools
 import glob as glob_module
 import io
 import sys
@@ -23,7 +25,8 @@ from rich.console import Console
 from cli.progress_display import BatchProgress, SingleFileProgress
 from extractors import DocxExtractor, PdfExtractor, TextFileExtractor
 from formatters import ChunkedTextFormatter, JsonFormatter, MarkdownFormatter
-from infrastructure import ConfigManager, ErrorHandler
+from infrastructure import ConfigManager, ErrorHandler, get_extraction_cache
+from infrastructure.extraction_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE_MB
 
 # Use absolute imports that work both in development and installed package
 # When installed via wheel, cli/extractors/etc become top-level packages
@@ -70,28 +73,71 @@ console = Console(
 error_handler = ErrorHandler()
 
 
-def create_pipeline(config_path: Optional[Path] = None):
+def get_cache_settings(config=None) -> tuple:
     """
-    Create and configure extraction pipeline.
+    Get extraction cache location and size limit.
+
+    Args:
+        config: Optional ConfigManager with a "cache" section
+
+    Returns:
+        Tuple of (cache directory, maximum size in MB)
+    """
+    cache_config = {}
+    if config is not None and hasattr(config, "get_section"):
+        cache_config = config.get_section("cache", default={})
+
+    cache_dir = cache_config.get("extraction_dir")
+    max_size_mb = cache_config.get("max_size_mb")
+    return (
+        Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR,
+        max_size_mb if max_size_mb is not None else DEFAULT_MAX_SIZE_MB,
+    )
+
+
+def load_config(config_path: Optional[Path] = None):
+    """
+    Load configuration file, falling back to defaults on errors.
 
     Args:
         config_path: Optional path to configuration file
 
     Returns:
-        Tuple of (ExtractionPipeline, config) - pipeline and loaded config
+        ConfigManager, or None if no usable file was given
     """
-    # Load configuration
-    config = None
     if config_path and config_path.exists():
         try:
-            config = ConfigManager(config_path)
+            return ConfigManager(config_path)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not load config: {e}[/yellow]")
             console.print("[yellow]Using default configuration[/yellow]")
+    return None
+
+
+def create_pipeline(config_path: Optional[Path] = None, use_cache: bool = False):
+    """
+    Create and configure extraction pipeline.
+
+    Args:
+        config_path: Optional path to configuration file
+        use_cache: Reuse extraction results of unchanged files across runs
+
+    Returns:
+        Tuple of (ExtractionPipeline, config) - pipeline and loaded config
+    """
+    # Load configuration
+    config = load_config(config_path)
 
     # Create pipeline
     pipeline = ExtractionPipeline(config=config)
 
+    if use_cache:
+        cache_dir, max_size_mb = get_cache_settings(config)
+        try:
+            pipeline.extraction_cache = get_extraction_cache(cache_dir, max_size_mb)
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Warning: Extraction cache disabled: {e}[/yellow]")
+
     # Register extractors with config
     pipeline.register_extractor("docx", DocxExtractor(config=config))
     pipeline.register_extractor("pdf", PdfExtractor(config=config))
@@ -149,6 +195,28 @@ def add_formatters(pipeline: ExtractionPipeline, format_type: str, config=None)
         pipeline.add_formatter(ChunkedTextFormatter(config=chunked_config))
 
 
+def build_pipeline(
+    config_path: Optional[Path], format_type: str, use_cache: bool = False
+) -> ExtractionPipeline:
+    """
+    Create a pipeline with extractors, processors and formatters.
+
+    Module-level so that a functools.partial of it can be sent to batch
+    worker processes, which each build their own pipeline.
+
+    Args:
+        config_path: Optional path to configuration file
+        format_type: Format type ('json', 'markdown', 'chunked', 'all')
+        use_cache: Reuse extraction results of unchanged files across runs
+
+    Returns:
+        Configured ExtractionPipeline
+    """
+    pipeline, config = create_pipeline(config_path, use_cache=use_cache)
+    add_formatters(pipeline, format_type, config)
+    return pipeline
+
+
 def write_outputs(result, output_path: Path, format_type: str) -> None:
     """
     Write formatted outputs to files with proper UTF-8 encoding.
@@ -254,8 +322,11 @@ def format_user_error(error_msg: str, suggestion: Optional[str] = None) -> str:
     help="Output format (default: json)",
 )
 @click.option("--force", is_flag=True, help="Overwrite existing files without asking")
+@click.option("--no-cache", is_flag=True, help="Extract again even if the file is unchanged")
 @click.pass_context
-def extract_command(ctx, file_path: Path, output: Optional[Path], format: str, force: bool):
+def extract_command(
+    ctx, file_path: Path, output: Optional[Path], format: str, force: bool, no_cache: bool
+):
     """
     Extract content from a single file.
 
@@ -271,6 +342,9 @@ def extract_command(ctx, file_path: Path, output: Optional[Path], format: str, f
 
         Extract to all formats:
         $ data-extract extract presentation.pptx --format all
+
+        Ignore cached results from earlier runs:
+        $ data-extract extract report.pdf --no-cache
     """
     verbose = ctx.obj.get("verbose", False)
     quiet = ctx.obj.get("quiet", False)
@@ -298,7 +372,7 @@ def extract_command(ctx, file_path: Path, output: Optional[Path], format: str, f
         if not quiet:
             console.print(f"[cyan]Processing file: {file_path.name}[/cyan]")
 
-        pipeline, config = create_pipeline(config_path)
+        pipeline, config = create_pipeline(config_path, use_cache=not no_cache)
         add_formatters(pipeline, format, config)
 
         # Process file with enhanced progress tracking
@@ -358,9 +432,33 @@ def extract_command(ctx, file_path: Path, output: Optional[Path], format: str, f
 @click.option(
     "--workers", "-w", type=int, default=4, help="Number of parallel workers (default: 4)"
 )
+@click.option(
+    "--executor",
+    type=click.Choice(["thread", "process", "staged"], case_sensitive=False),
+    default="thread",
+    help=(
+        "Run workers as threads, as processes, or as staged read/extract/write "
+        "pools (default: thread)"
+    ),
+)
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="Per-file time limit in seconds; stuck files are stopped (requires --executor process)",
+)
+@click.option("--no-cache", is_flag=True, help="Extract again even if files are unchanged")
 @click.pass_context
 def batch_command(
-    ctx, paths: tuple, output: Path, pattern: Optional[str], format: str, workers: int
+    ctx,
+    paths: tuple,
+    output: Path,
+    pattern: Optional[str],
+    format: str,
+    workers: int,
+    executor: str,
+    timeout: Optional[float],
+    no_cache: bool,
 ):
     """
     Process multiple files in batch.
@@ -378,6 +476,18 @@ def batch_command(
 
         Process with custom worker count:
         $ data-extract batch ./documents/ --output ./results/ --workers 8
+
+        Use one process per worker for CPU-heavy documents:
+        $ data-extract batch ./documents/ --output ./results/ --executor process
+
+        Overlap reading, extraction and writing across files:
+        $ data-extract batch ./documents/ --output ./results/ --executor staged
+
+        Stop any file that takes longer than 5 minutes:
+        $ data-extract batch ./documents/ --output ./results/ --executor process --timeout 300
+
+        Ignore cached results from earlier runs:
+        $ data-extract batch ./documents/ --output ./results/ --no-cache
     """
     verbose = ctx.obj.get("verbose", False)
     quiet = ctx.obj.get("quiet", False)
@@ -389,6 +499,14 @@ def batch_command(
             console.print("[red]Error: Number of workers must be greater than 0[/red]")
             sys.exit(1)
 
+        if timeout is not None:
+            if timeout <= 0:
+                console.print("[red]Error: Timeout must be greater than 0[/red]")
+                sys.exit(1)
+            if executor != "process":
+                console.print("[red]Error: --timeout requires --executor process[/red]")
+                sys.exit(1)
+
         # Collect files to process
         files_to_process = []
 
@@ -415,17 +533,37 @@ def batch_command(
         output.mkdir(parents=True, exist_ok=True)
 
         # Create and configure pipeline
-        pipeline, config = create_pipeline(config_path)
-        add_formatters(pipeline, format, config)
+        pipeline_factory = functools.partial(
+            build_pipeline, config_path, format, use_cache=not no_cache
+        )
+        pipeline = pipeline_factory()
+
+        # Timings from earlier runs calibrate the largest-first schedule
+        cache_dir, _ = get_cache_settings(pipeline.config)
+        timing_history = cache_dir.parent / "batch_timings.json"
 
         # Create batch processor
-        batch_processor = BatchProcessor(pipeline=pipeline, max_workers=workers)
+        batch_processor = BatchProcessor(
+            pipeline=pipeline,
+            max_workers=workers,
+            config={"timeout_per_file": timeout, "timing_history": timing_history},
+            executor=executor,
+            pipeline_factory=pipeline_factory,
+        )
 
         if not quiet:
             console.print(
                 f"[cyan]Processing {len(files_to_process)} files with {workers} workers...[/cyan]"
             )
 
+        # Write outputs as each file completes; the batch keeps only a
+        # status record per file
+        def write_result(result):
+            if result.success:
+                # For batch processing, write directly to output directory
+                # write_outputs will create properly named files with extensions
+                write_outputs(result, output, format)
+
         # Process batch with enhanced progress tracking
         if not quiet:
             with BatchProgress(
@@ -436,17 +574,10 @@ def batch_command(
                     progress_display.update(status)
 
                 results = batch_processor.process_batch(
-                    files_to_process, progress_callback=progress_callback
+                    files_to_process, progress_callback=progress_callback, on_result=write_result
                 )
         else:
-            results = batch_processor.process_batch(files_to_process)
-
-        # Write outputs
-        for result in results:
-            if result.success:
-                # For batch processing, write directly to output directory
-                # write_outputs will create properly named files with extensions
-                write_outputs(result, output, format)
+            results = batch_processor.process_batch(files_to_process, on_result=write_result)
 
         # Display summary
         summary = batch_processor.get_summary(results)
@@ -458,6 +589,30 @@ def batch_command(
             console.print(f"  [red]Failed: {summary['failed']}[/red]")
             console.print(f"  Success rate: {summary['success_rate']:.1%}")
 
+            if verbose and batch_processor.last_schedule is not None:
+                schedule = batch_processor.last_schedule
+                console.print(
+                    f"  Makespan: {schedule['actual_makespan_seconds']:.2f}s "
+                    f"(predicted {schedule['predicted_makespan_seconds']:.2f}s)"
+                )
+
+            stage_stats = batch_processor.get_stage_stats()
+            if verbose and stage_stats is not None:
+                for name, stage in stage_stats["stages"].items():
+                    console.print(
+                        f"  Stage {name}: {stage['utilization']:.0%} busy, "
+                        f"max queue {stage['max_queue_depth']}"
+                    )
+                console.print(f"  Bottleneck: {stage_stats['bottleneck']}")
+
+            # Worker processes keep their own cache statistics
+            if verbose and executor == "thread" and pipeline.extraction_cache is not None:
+                cache_stats = pipeline.extraction_cache.get_stats()
+                console.print(
+                    f"  Cache hits: {cache_stats['hits']} of "
+                    f"{cache_stats['hits'] + cache_stats['misses']}"
+                )
+
             if verbose and summary["failed"] > 0:
                 console.print("\n[bold]Failed files:[/bold]")
                 for result in batch_processor.get_failed_results(results):
@@ -587,3 +742,47 @@ def config_path_command(ctx):
             console.print("  [yellow](not found)[/yellow]")
     else:
         console.print("No configuration file specified. Using defaults.")
+
+
+@click.group()
+def cache_command():
+    """
+    Extraction cache commands.
+
+    Extraction results are cached by file content, so unchanged files are
+    not extracted again. Location and size are set in the "cache" section
+    of the configuration file.
+    """
+    pass
+
+
+@cache_command.command(name="stats")
+@click.pass_context
+def cache_stats(ctx):
+    """Show extraction cache location, entries and size."""
+    cache_dir, max_size_mb = get_cache_settings(load_config(ctx.obj.get("config_path")))
+
+    if not cache_dir.exists():
+        console.print(f"[yellow]No extraction cache at {cache_dir}[/yellow]")
+        return
+
+    stats = get_extraction_cache(cache_dir, max_size_mb).get_stats()
+    console.print(f"[bold]Extraction cache:[/bold] {stats['cache_dir']}")
+    console.print(f"  Entries: {stats['num_entries']}")
+    console.print(f"  Size: {stats['total_size_mb']:.1f} MB of {stats['max_size_mb']:.0f} MB")
+
+
+@cache_command.command(name="clear")
+@click.pass_context
+def cache_clear(ctx):
+    """Remove all cached extraction results."""
+    cache_dir, max_size_mb = get_cache_settings(load_config(ctx.obj.get("config_path")))
+
+    if not cache_dir.exists():
+        console.print(f"[yellow]No extraction cache at {cache_dir}[/yellow]")
+        return
+
+    cache = get_extraction_cache(cache_dir, max_size_mb)
+    num_entries = cache.get_stats()["num_entries"]
+    cache.clear()
+    console.print(f"[green]Removed {num_entries} cached results[/green]")
@@ -6,6 +6,7 @@ Provides command-line interface using Click framework with commands:
 - batch: Process multiple files
 - version: Show version information
 - config: Configuration management
+- cache: Extraction cache management
 
 Design:
 - User-friendly for non-technical auditors
@@ -22,6 +23,7 @@ import click
 
 from .commands import (
     batch_command,
+    cache_command,
     config_command,
     extract_command,
     version_command,
@@ -71,6 +73,7 @@ cli.add_command(extract_command, name="extract")
 cli.add_command(batch_command, name="batch")
 cli.add_command(version_command, name="version")
 cli.add_command(config_command, name="config")
+cli.add_command(cache_command, name="cache")
 
 
 # Alternative short flag for version
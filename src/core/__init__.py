@@ -10,12 +10,14 @@ Public API:
         - ProcessingResult: Output from processors
         - FormattedOutput: Output from formatters
         - PipelineResult: Complete pipeline output
+        - SparseCells: Compact cell storage for large tables
 
     Interfaces:
         - BaseExtractor: Interface for format extractors
         - BaseProcessor: Interface for content processors
         - BaseFormatter: Interface for output formatters
         - BasePipeline: Interface for pipeline orchestrators
+        - collect_extraction_stream: Materialize an extract_stream() iterator
 
     Enums:
         - ContentType: Types of content blocks
@@ -29,6 +31,8 @@ from .interfaces import (
     BaseFormatter,
     BasePipeline,
     BaseProcessor,
+    ExtractionStreamItem,
+    collect_extraction_stream,
 )
 from .models import (
     ContentBlock,
@@ -41,6 +45,8 @@ from .models import (
     Position,
     ProcessingResult,
     ProcessingStage,
+    SparseCells,
+    SparseCellsBuilder,
     TableMetadata,
 )
 
@@ -56,10 +62,14 @@ __all__ = [
     "Position",
     "ProcessingResult",
     "ProcessingStage",
+    "SparseCells",
+    "SparseCellsBuilder",
     "TableMetadata",
     # Interfaces
     "BaseExtractor",
     "BaseFormatter",
     "BasePipeline",
     "BaseProcessor",
+    "ExtractionStreamItem",
+    "collect_extraction_stream",
 ]
@@ -13,15 +13,26 @@ Design Principles:
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 
 from .models import (
+    ContentBlock,
     ExtractionResult,
     FormattedOutput,
     ProcessingResult,
+    TableMetadata,
 )
 
+# Items produced by BaseExtractor.extract_stream(): content blocks in document
+# order, followed by exactly one ExtractionResult trailer (no content_blocks)
+# carrying metadata, images, tables, success flag, errors and warnings.
+# Extractors that emit a large table in segments yield each TableMetadata just
+# before the block that references it; streamed tables are not repeated on
+# the trailer.
+ExtractionStreamItem = Union[ContentBlock, TableMetadata, ExtractionResult]
+
 
 class BaseExtractor(ABC):
     """
@@ -35,6 +46,7 @@ class BaseExtractor(ABC):
     - If extraction fails, return ExtractionResult with success=False and errors
     - Never raise exceptions for file-level failures (network issues, corrupted files)
     - DO raise exceptions for programming errors (bugs, invalid arguments)
+    - extract_stream() yields ContentBlocks, then one ExtractionResult trailer
     """
 
     def __init__(self, config: Optional[dict] = None):
@@ -87,10 +99,38 @@ class BaseExtractor(ABC):
         entire file into memory. Not all formats support this.
 
         Returns:
-            True if streaming is supported
+            True if extract_stream() yields blocks as they are produced
         """
         return False
 
+    def extract_stream(self, file_path: Path) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract content from file incrementally.
+
+        Yields ContentBlocks in document order as they are produced, followed
+        by exactly one ExtractionResult trailer. The trailer has no
+        content_blocks; it carries document metadata (computed after the last
+        block), images, tables, success flag, errors and warnings. A failed
+        trailer means any blocks already yielded are incomplete. Tables may
+        also be yielded ahead of the blocks that reference them (see
+        ExtractionStreamItem).
+
+        The default implementation runs extract() and replays its result, so
+        every extractor supports the API. Streaming extractors override it
+        (and supports_streaming()) and implement extract() with
+        collect_extraction_stream().
+
+        Args:
+            file_path: Path to file to extract
+
+        Yields:
+            ContentBlock (and optionally TableMetadata) items, then one
+            ExtractionResult
+        """
+        result = self.extract(file_path)
+        yield from result.content_blocks
+        yield replace(result, content_blocks=())
+
     def validate_file(self, file_path: Path) -> tuple[bool, list[str]]:
         """
         Pre-extraction validation.
@@ -134,6 +174,44 @@ class BaseExtractor(ABC):
         return []
 
 
+def collect_extraction_stream(stream: Iterable[ExtractionStreamItem]) -> ExtractionResult:
+    """
+    Materialize an extract_stream() iterator into a single ExtractionResult.
+
+    Blocks from a stream whose trailer reports failure are discarded, matching
+    extract() semantics where a failed result carries no content.
+
+    Args:
+        stream: Items yielded by BaseExtractor.extract_stream()
+
+    Returns:
+        ExtractionResult with all streamed content blocks (and streamed tables
+        ahead of the trailer's own)
+
+    Raises:
+        ValueError: If the stream ends without an ExtractionResult trailer
+    """
+    blocks = []
+    tables = []
+    for item in stream:
+        # Duck-typed so results from modules imported as ``src.core`` and
+        # ``core`` (distinct class objects) are both recognized
+        if isinstance(item, ExtractionResult) or hasattr(item, "content_blocks"):
+            if not item.success:
+                return item
+            if tables:
+                return replace(
+                    item, content_blocks=tuple(blocks), tables=tuple(tables) + item.tables
+                )
+            return replace(item, content_blocks=tuple(blocks))
+        if isinstance(item, TableMetadata) or hasattr(item, "cells"):
+            tables.append(item)
+        else:
+            blocks.append(item)
+
+    raise ValueError("Extraction stream ended without an ExtractionResult trailer")
+
+
 class BaseProcessor(ABC):
     """
     Abstract base class for content processors.
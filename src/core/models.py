@@ -11,11 +11,12 @@ Design Principles:
 - Serializable for persistence and debugging
 """
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
 from uuid import UUID, uuid4
 
 
@@ -155,6 +156,198 @@ class ImageMetadata:
     quality_issues: tuple[str, ...] = field(default_factory=tuple)
 
 
+@dataclass(frozen=True, eq=False)
+class SparseCells:
+    """
+    Compact row-major cell grid storing only non-empty cells.
+
+    Spreadsheet tables are mostly empty strings and repeated values. Cells
+    are kept in CSR form: ``row_offsets[r]:row_offsets[r + 1]`` indexes the
+    ``columns`` and ``value_ids`` of row ``r``'s non-empty cells, and each
+    distinct value is stored once in ``values``. The arrays pickle as flat
+    bytes, which keeps tables cheap to send between batch workers.
+
+    Behaves like the tuple-of-tuples it replaces: ``len()``, indexing and
+    iteration yield full-width row tuples with ``""`` for empty cells, and
+    it compares equal to the equivalent tuple of tuples.
+    """
+
+    num_rows: int = 0
+    num_columns: int = 0
+    values: tuple[str, ...] = ()
+    row_offsets: array = field(default_factory=lambda: array("I", [0]))
+    columns: array = field(default_factory=lambda: array("I"))
+    value_ids: array = field(default_factory=lambda: array("I"))
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Sequence[str]], num_columns: Optional[int] = None
+    ) -> "SparseCells":
+        """
+        Build from an iterable of rows (consumed once, rows may be ragged).
+
+        Args:
+            rows: Rows of cell strings
+            num_columns: Grid width (default: widest row)
+
+        Returns:
+            SparseCells holding the rows
+        """
+        builder = SparseCellsBuilder()
+        for row in rows:
+            builder.add_row(row)
+        return builder.build(num_columns)
+
+    @property
+    def non_empty_count(self) -> int:
+        """Number of stored (non-empty) cells."""
+        return len(self.value_ids)
+
+    def _row(self, row: int) -> tuple[str, ...]:
+        cells = [""] * self.num_columns
+        values = self.values
+        for i in range(self.row_offsets[row], self.row_offsets[row + 1]):
+            cells[self.columns[i]] = values[self.value_ids[i]]
+        return tuple(cells)
+
+    def iter_non_empty(self) -> Iterator[tuple[int, int, str]]:
+        """
+        Iterate stored cells without materializing rows.
+
+        Yields:
+            (row, column, value) tuples in row-major order
+        """
+        values = self.values
+        for row in range(self.num_rows):
+            for i in range(self.row_offsets[row], self.row_offsets[row + 1]):
+                yield row, self.columns[i], values[self.value_ids[i]]
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __bool__(self) -> bool:
+        return self.num_rows > 0
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        for row in range(self.num_rows):
+            yield self._row(row)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return tuple(self._row(row) for row in range(*index.indices(self.num_rows)))
+        if index < 0:
+            index += self.num_rows
+        if not 0 <= index < self.num_rows:
+            raise IndexError("row index out of range")
+        return self._row(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SparseCells):
+            return (
+                self.num_rows == other.num_rows
+                and self.num_columns == other.num_columns
+                and list(self.iter_non_empty()) == list(other.iter_non_empty())
+            )
+        if isinstance(other, (tuple, list)):
+            return len(other) == self.num_rows and all(tuple(a) == b for a, b in zip(other, self))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Consistent with equality against the equivalent tuple of tuples
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return (
+            f"SparseCells(num_rows={self.num_rows}, num_columns={self.num_columns}, "
+            f"non_empty={self.non_empty_count}, distinct_values={len(self.values)})"
+        )
+
+
+class SparseCellsBuilder:
+    """
+    Incrementally build SparseCells one row at a time.
+
+    Lets extractors stream rows into compact storage without first holding
+    the full grid as Python strings.
+
+    Example:
+        >>> builder = SparseCellsBuilder()
+        >>> builder.add_row(["name", "", "value"])
+        >>> cells = builder.build()
+    """
+
+    def __init__(self):
+        self._pool: dict[str, int] = {}
+        self._row_offsets = array("I", [0])
+        self._columns = array("I")
+        self._value_ids = array("I")
+        self._width = 0
+
+    @property
+    def num_rows(self) -> int:
+        """Rows added so far."""
+        return len(self._row_offsets) - 1
+
+    @property
+    def width(self) -> int:
+        """Length of the widest row added so far."""
+        return self._width
+
+    def add_row(self, row: Sequence[str]) -> None:
+        """
+        Append a row, storing only non-empty cells.
+
+        Args:
+            row: Cell strings for the row
+        """
+        pool = self._pool
+        for col, value in enumerate(row):
+            if value == "":
+                continue
+            value_id = pool.get(value)
+            if value_id is None:
+                value_id = pool[value] = len(pool)
+            self._columns.append(col)
+            self._value_ids.append(value_id)
+        self._row_offsets.append(len(self._value_ids))
+        self._width = max(self._width, len(row))
+
+    def build(self, num_columns: Optional[int] = None) -> SparseCells:
+        """
+        Finish the grid.
+
+        Args:
+            num_columns: Grid width (default: widest row added); cells beyond
+                it are dropped
+
+        Returns:
+            SparseCells holding the added rows
+        """
+        width = self._width if num_columns is None else num_columns
+        columns, value_ids = self._columns, self._value_ids
+        row_offsets = self._row_offsets
+
+        if width < self._width:
+            kept_columns, kept_ids = array("I"), array("I")
+            row_offsets = array("I", [0])
+            for row in range(self.num_rows):
+                for i in range(self._row_offsets[row], self._row_offsets[row + 1]):
+                    if columns[i] < width:
+                        kept_columns.append(columns[i])
+                        kept_ids.append(value_ids[i])
+                row_offsets.append(len(kept_ids))
+            columns, value_ids = kept_columns, kept_ids
+
+        return SparseCells(
+            num_rows=self.num_rows,
+            num_columns=width,
+            values=tuple(self._pool),
+            row_offsets=row_offsets,
+            columns=columns,
+            value_ids=value_ids,
+        )
+
+
 @dataclass(frozen=True)
 class TableMetadata:
     """Metadata for extracted tables."""
@@ -167,8 +360,12 @@ class TableMetadata:
     has_header: bool = False
     header_row: Optional[tuple[str, ...]] = None
 
-    # Content
-    cells: tuple[tuple[str, ...], ...] = field(default_factory=tuple)  # Row-major order
+    # Content (row-major; spreadsheet extractors use SparseCells, which iterates
+    # as the same row tuples)
+    cells: Union[tuple[tuple[str, ...], ...], SparseCells] = field(default_factory=tuple)
+
+    # Inferred type per column ("empty", "numeric", "date", "text"), if profiled
+    column_types: tuple[str, ...] = field(default_factory=tuple)
 
     # Formatting
     merged_cells: tuple[tuple[int, int, int, int], ...] = field(
@@ -15,8 +15,9 @@ Example:
 """
 
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
+from infrastructure.extraction_cache import ExtractionCache
 from src.data_extract.extract.adapter import ExtractorAdapter
 from src.data_extract.extract.csv import CsvExtractorAdapter
 from src.data_extract.extract.docx import DocxExtractorAdapter
@@ -53,7 +54,7 @@ EXTRACTOR_REGISTRY: Dict[str, Type[ExtractorAdapter]] = {
 SUPPORTED_EXTENSIONS = set(EXTRACTOR_REGISTRY.keys())
 
 
-def get_extractor(file_path: Path) -> ExtractorAdapter:
+def get_extractor(file_path: Path, cache: Optional[ExtractionCache] = None) -> ExtractorAdapter:
     """Get appropriate extractor adapter for file.
 
     Auto-detects file format from extension and returns the corresponding
@@ -62,6 +63,8 @@ def get_extractor(file_path: Path) -> ExtractorAdapter:
 
     Args:
         file_path: Path to file to extract
+        cache: Optional ExtractionCache (e.g. from get_extraction_cache) the
+            adapter consults before extraction
 
     Returns:
         ExtractorAdapter: Adapter instance for the file format
@@ -91,7 +94,7 @@ def get_extractor(file_path: Path) -> ExtractorAdapter:
         )
 
     # Instantiate and return adapter
-    return adapter_class()
+    return adapter_class(cache=cache)
 
 
 def is_supported(file_path: Path) -> bool:
@@ -13,14 +13,15 @@ Design Principles:
 - Immutable outputs following greenfield conventions
 """
 
-import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Protocol, TypeVar, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, TypeVar, runtime_checkable
 from uuid import uuid4
 
 from pydantic import ValidationError
 
+from infrastructure.extraction_cache import ExtractionCache
+from infrastructure.file_provenance import get_provenance_cache
 from src.core.models import ExtractionResult as BrownfieldExtractionResult
 from src.data_extract.core.models import (
     Document,
@@ -77,17 +78,22 @@ class ExtractorAdapter:
     Attributes:
         extractor: Brownfield extractor instance (e.g., PdfExtractor)
         format_name: Human-readable format name (e.g., "PDF", "DOCX")
+        cache: Optional persistent cache of brownfield extraction results
     """
 
-    def __init__(self, extractor: Any, format_name: str) -> None:
+    def __init__(
+        self, extractor: Any, format_name: str, cache: Optional[ExtractionCache] = None
+    ) -> None:
         """Initialize adapter with brownfield extractor.
 
         Args:
             extractor: Brownfield extractor instance with extract(Path) method
             format_name: Human-readable format name for metadata
+            cache: Optional ExtractionCache consulted before extraction
         """
         self.extractor = extractor
         self.format_name = format_name
+        self.cache = cache
 
     def process(self, input_data: Path) -> Document:
         """Extract and convert file to greenfield Document.
@@ -109,8 +115,12 @@ class ExtractorAdapter:
         if not input_data.exists():
             raise FileNotFoundError(f"File not found: {input_data}")
 
-        # Delegate to brownfield extractor
-        extraction_result = self.extractor.extract(input_data)
+        # Delegate to brownfield extractor. The cache holds the brownfield
+        # result, so each run still converts it into a Document with a new ID.
+        if self.cache is not None:
+            extraction_result = self.cache.get_or_extract(self.extractor, input_data)
+        else:
+            extraction_result = self.extractor.extract(input_data)
 
         # Check for critical failure
         if not extraction_result.success and extraction_result.errors:
@@ -254,18 +264,16 @@ class ExtractorAdapter:
     def _compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of file for integrity verification.
 
+        Served from the process-wide provenance cache, which the brownfield
+        extractor has normally just filled for this file.
+
         Args:
             file_path: Path to file
 
         Returns:
             SHA-256 hash as hex string
         """
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files efficiently
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return get_provenance_cache().file_hash(file_path)
 
     def _extract_ocr_confidence(self, result: BrownfieldExtractionResult) -> Dict[int, float]:
         """Extract per-page OCR confidence scores from content blocks.
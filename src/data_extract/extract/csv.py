@@ -4,6 +4,9 @@ Wraps brownfield CSVExtractor and converts output to greenfield Document model.
 Preserves table structure and header information.
 """
 
+from typing import Optional
+
+from infrastructure.extraction_cache import ExtractionCache
 from src.data_extract.extract.adapter import ExtractorAdapter
 from src.extractors.csv_extractor import CSVExtractor as BrownfieldCSVExtractor
 
@@ -27,7 +30,11 @@ class CsvExtractorAdapter(ExtractorAdapter):
         1
     """
 
-    def __init__(self) -> None:
-        """Initialize CSV adapter with brownfield extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize CSV adapter with brownfield extractor.
+
+        Args:
+            cache: Optional ExtractionCache consulted before extraction
+        """
         extractor = BrownfieldCSVExtractor()
-        super().__init__(extractor, format_name="CSV")
+        super().__init__(extractor, format_name="CSV", cache=cache)
@@ -4,6 +4,9 @@ Wraps brownfield DocxExtractor and converts output to greenfield Document model.
 Preserves document structure (headings, tables, comments).
 """
 
+from typing import Optional
+
+from infrastructure.extraction_cache import ExtractionCache
 from src.data_extract.extract.adapter import ExtractorAdapter
 from src.extractors.docx_extractor import DocxExtractor as BrownfieldDocxExtractor
 
@@ -27,7 +30,11 @@ class DocxExtractorAdapter(ExtractorAdapter):
         5
     """
 
-    def __init__(self) -> None:
-        """Initialize DOCX adapter with brownfield extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize DOCX adapter with brownfield extractor.
+
+        Args:
+            cache: Optional ExtractionCache consulted before extraction
+        """
         extractor = BrownfieldDocxExtractor()
-        super().__init__(extractor, format_name="DOCX")
+        super().__init__(extractor, format_name="DOCX", cache=cache)
@@ -4,6 +4,9 @@ Wraps brownfield ExcelExtractor and converts output to greenfield Document model
 Preserves worksheet structure and table data.
 """
 
+from typing import Optional
+
+from infrastructure.extraction_cache import ExtractionCache
 from src.data_extract.extract.adapter import ExtractorAdapter
 from src.extractors.excel_extractor import ExcelExtractor as BrownfieldExcelExtractor
 
@@ -27,7 +30,11 @@ class ExcelExtractorAdapter(ExtractorAdapter):
         3
     """
 
-    def __init__(self) -> None:
-        """Initialize Excel adapter with brownfield extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize Excel adapter with brownfield extractor.
+
+        Args:
+            cache: Optional ExtractionCache consulted before extraction
+        """
         extractor = BrownfieldExcelExtractor()
-        super().__init__(extractor, format_name="Excel")
+        super().__init__(extractor, format_name="Excel", cache=cache)
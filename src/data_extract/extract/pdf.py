@@ -4,8 +4,9 @@ Wraps brownfield PdfExtractor and converts output to greenfield Document model.
 Preserves OCR confidence scores, page counts, and extraction metadata.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
+from infrastructure.extraction_cache import ExtractionCache
 from src.core.models import ExtractionResult as BrownfieldExtractionResult
 from src.data_extract.core.models import ValidationReport
 from src.data_extract.extract.adapter import ExtractorAdapter
@@ -31,10 +32,14 @@ class PdfExtractorAdapter(ExtractorAdapter):
         {1: 0.98, 2: 0.95, 3: 0.92}
     """
 
-    def __init__(self) -> None:
-        """Initialize PDF adapter with brownfield extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize PDF adapter with brownfield extractor.
+
+        Args:
+            cache: Optional ExtractionCache consulted before extraction
+        """
         extractor = BrownfieldPdfExtractor()
-        super().__init__(extractor, format_name="PDF")
+        super().__init__(extractor, format_name="PDF", cache=cache)
 
     def _generate_validation_report(
         self, result: BrownfieldExtractionResult, ocr_confidence: Dict[int, float]
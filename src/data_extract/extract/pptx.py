@@ -4,6 +4,9 @@ Wraps brownfield PptxExtractor and converts output to greenfield Document model.
 Preserves slide structure and notes.
 """
 
+from typing import Optional
+
+from infrastructure.extraction_cache import ExtractionCache
 from src.data_extract.extract.adapter import ExtractorAdapter
 from src.extractors.pptx_extractor import PptxExtractor as BrownfieldPptxExtractor
 
@@ -27,7 +30,11 @@ class PptxExtractorAdapter(ExtractorAdapter):
         25
     """
 
-    def __init__(self) -> None:
-        """Initialize PPTX adapter with brownfield extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize PPTX adapter with brownfield extractor.
+
+        Args:
+            cache: Optional ExtractionCache consulted before extraction
+        """
         extractor = BrownfieldPptxExtractor()
-        super().__init__(extractor, format_name="PPTX")
+        super().__init__(extractor, format_name="PPTX", cache=cache)
@@ -3,6 +3,9 @@
 Wraps brownfield TextFileExtractor and converts output to greenfield Document model.
 """
 
+from typing import Optional
+
+from infrastructure.extraction_cache import ExtractionCache
 from src.data_extract.extract.adapter import ExtractorAdapter
 from src.extractors.txt_extractor import TextFileExtractor as BrownfieldTextExtractor
 
@@ -25,7 +28,11 @@ class TxtExtractorAdapter(ExtractorAdapter):
         5000
     """
 
-    def __init__(self) -> None:
-        """Initialize TXT adapter with brownfield extractor."""
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize TXT adapter with brownfield extractor.
+
+        Args:
+            cache: Optional ExtractionCache consulted before extraction
+        """
         extractor = BrownfieldTextExtractor()
-        super().__init__(extractor, format_name="TXT")
+        super().__init__(extractor, format_name="TXT", cache=cache)
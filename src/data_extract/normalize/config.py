@@ -41,6 +41,10 @@ class NormalizationConfig(BaseModel):
         ocr_confidence_threshold: Minimum OCR confidence threshold (AC-2.4.2)
         ocr_preprocessing_enabled: Enable image preprocessing before OCR (AC-2.4.3)
         quarantine_low_confidence: Enable quarantine for low confidence (AC-2.4.5)
+        ocr_cache_dir: Directory for the persistent OCR result cache (None disables it)
+        ocr_cache_max_mb: Size limit for the OCR result cache in MB
+        ocr_single_pass: Run OCR once per image during validation
+        ocr_comparison_sample_rate: Fraction of images compared before/after preprocessing
     """
 
     model_config = ConfigDict(frozen=False)
@@ -118,6 +122,23 @@ class NormalizationConfig(BaseModel):
     quarantine_low_confidence: bool = Field(
         default=True, description="Enable quarantine for low confidence extractions (AC-2.4.5)"
     )
+    ocr_cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for persistent OCR results shared with PDF extraction (None disables)",
+    )
+    ocr_cache_max_mb: float = Field(
+        default=500, gt=0, description="Size limit for the OCR result cache in MB"
+    )
+    ocr_single_pass: bool = Field(
+        default=False,
+        description="OCR each image once, sampling the preprocessing comparison",
+    )
+    ocr_comparison_sample_rate: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of images compared before/after preprocessing in single-pass mode",
+    )
 
     # Completeness Validation Flags (Story 2.5)
     completeness_threshold: float = Field(
@@ -310,6 +331,7 @@ def load_config(
         "header_footer_patterns_file",
         "entity_patterns_file",
         "entity_dictionary_file",
+        "ocr_cache_dir",
     ]:
         if path_field in merged_config and isinstance(merged_config[path_field], str):
             merged_config[path_field] = Path(merged_config[path_field])
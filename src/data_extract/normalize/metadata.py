@@ -1,7 +1,7 @@
 """Metadata enrichment module for Story 2.6.
 
 This module provides metadata enrichment functionality for the normalization pipeline:
-- calculate_file_hash(): SHA-256 file hashing with chunked reading for memory efficiency
+- calculate_file_hash(): SHA-256 file hashing via the shared provenance cache
 - aggregate_entity_tags(): Extract and count entities by type
 - aggregate_quality_scores(): Aggregate quality metrics from validation
 - serialize_config_snapshot(): Serialize configuration for reproducibility
@@ -10,11 +10,13 @@ This module provides metadata enrichment functionality for the normalization pip
 All functions support the continue-on-error pattern (ADR-006) and structured logging.
 """
 
-import hashlib
+import warnings
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+# Same module the brownfield extractors import, so the cache is one instance
+from infrastructure.file_provenance import get_provenance_cache
 from src.data_extract.core.exceptions import ProcessingError
 from src.data_extract.core.models import (
     Entity,
@@ -24,15 +26,16 @@ from src.data_extract.core.models import (
 from src.data_extract.normalize.config import NormalizationConfig
 
 
-def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
-    """Calculate SHA-256 hash of a file using chunked reading.
+def calculate_file_hash(file_path: Path, chunk_size: Optional[int] = None) -> str:
+    """Calculate SHA-256 hash of a file.
 
-    Uses chunked reading (default 8KB chunks) for memory efficiency with large files.
+    Served from the process-wide provenance cache, so a file already hashed
+    during extraction is not read again. Misses are hashed with large buffers.
     Ensures deterministic hashing for audit trail integrity.
 
     Args:
         file_path: Path to file to hash
-        chunk_size: Size of chunks to read (default 8192 bytes = 8KB)
+        chunk_size: Deprecated and ignored; passing it emits a DeprecationWarning
 
     Returns:
         SHA-256 hash as 64-character hexadecimal string
@@ -51,6 +54,14 @@ def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
     Story: 2.6 - Metadata Enrichment Framework
     AC: 2.6.1 (file hash), 2.6.8 (audit trail)
     """
+    if chunk_size is not None:
+        warnings.warn(
+            "calculate_file_hash(chunk_size=...) is deprecated and ignored; "
+            "hashing is served by the provenance cache",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
     if not file_path.exists():
         raise ProcessingError(f"File not found for hashing: {file_path}")
 
@@ -58,14 +69,7 @@ def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
         raise ProcessingError(f"Path is not a file: {file_path}")
 
     try:
-        sha256_hash = hashlib.sha256()
-
-        with open(file_path, "rb") as f:
-            # Read file in chunks for memory efficiency
-            while chunk := f.read(chunk_size):
-                sha256_hash.update(chunk)
-
-        return sha256_hash.hexdigest()
+        return get_provenance_cache().file_hash(file_path)
 
     except PermissionError as e:
         raise ProcessingError(f"Permission denied reading file: {file_path}") from e
@@ -12,6 +12,8 @@ from typing import Optional
 
 import structlog
 
+# Same module the PDF extractor imports, so one OCRCache exists per directory
+from infrastructure.ocr_cache import get_ocr_cache
 from src.data_extract.core.exceptions import CriticalError, ProcessingError
 from src.data_extract.core.models import Document, ProcessingContext
 from src.data_extract.normalize.cleaning import TextCleaner
@@ -86,10 +88,18 @@ class Normalizer:
 
         # Initialize QualityValidator (Story 2.4 + 2.5)
         # Note: Always initialized but will skip validation if Tesseract unavailable
+        # OCR results are cached on disk when configured (shared with PdfExtractor)
+        ocr_cache = None
+        if config.ocr_cache_dir is not None:
+            ocr_cache = get_ocr_cache(config.ocr_cache_dir, config.ocr_cache_max_mb)
+
         self.quality_validator = QualityValidator(
             ocr_confidence_threshold=config.ocr_confidence_threshold,
             ocr_preprocessing_enabled=config.ocr_preprocessing_enabled,
             quarantine_low_confidence=config.quarantine_low_confidence,
+            ocr_cache=ocr_cache,
+            ocr_single_pass=config.ocr_single_pass,
+            ocr_comparison_sample_rate=config.ocr_comparison_sample_rate,
         )
 
         # Initialize MetadataEnricher (Story 2.6)
@@ -8,6 +8,7 @@ Classes:
 """
 
 import json
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -43,6 +44,10 @@ class QualityValidator(PipelineStage[Document, Document]):
         ocr_preprocessing_enabled: Enable OCR preprocessing (default True)
         quarantine_low_confidence: Enable quarantine for low confidence (default True)
         completeness_threshold: Minimum completeness ratio threshold (default 0.90, Story 2.5)
+        ocr_cache: Optional persistent OCR result cache (OCRCache)
+        ocr_single_pass: OCR each image once and sample the preprocessing comparison
+        ocr_comparison_sample_rate: Fraction of images compared before/after preprocessing
+            in single-pass mode (default 0.1)
     """
 
     def __init__(
@@ -52,6 +57,9 @@ class QualityValidator(PipelineStage[Document, Document]):
         quarantine_low_confidence: bool = True,
         completeness_threshold: float = 0.90,
         logger: Optional[Any] = None,
+        ocr_cache: Optional[Any] = None,
+        ocr_single_pass: bool = False,
+        ocr_comparison_sample_rate: float = 0.1,
     ) -> None:
         """Initialize quality validator.
 
@@ -61,12 +69,20 @@ class QualityValidator(PipelineStage[Document, Document]):
             quarantine_low_confidence: Enable quarantine mechanism
             completeness_threshold: Minimum completeness ratio threshold (0.0-1.0, Story 2.5)
             logger: Structured logger instance
+            ocr_cache: OCRCache for reusing OCR results across runs (None disables)
+            ocr_single_pass: Run tesseract once per image, sampling the
+                preprocessing comparison
+            ocr_comparison_sample_rate: Fraction of images (0.0-1.0) that also get the
+                before-preprocessing OCR pass for telemetry in single-pass mode
         """
         self.logger = logger or structlog.get_logger(__name__)
         self.ocr_confidence_threshold = ocr_confidence_threshold
         self.ocr_preprocessing_enabled = ocr_preprocessing_enabled
         self.quarantine_low_confidence = quarantine_low_confidence
         self.completeness_threshold = completeness_threshold
+        self.ocr_cache = ocr_cache
+        self.ocr_single_pass = ocr_single_pass
+        self.ocr_comparison_sample_rate = ocr_comparison_sample_rate
 
         # Check if Tesseract is available
         if not TESSERACT_AVAILABLE:
@@ -83,7 +99,13 @@ class QualityValidator(PipelineStage[Document, Document]):
         """Calculate OCR confidence score for an image.
 
         Uses pytesseract.image_to_data() to extract word-level confidence scores
-        and calculates page-level average confidence.
+        and calculates page-level average confidence. When an OCR cache is
+        configured, results are keyed by the image pixels and preprocessing
+        mode, so an unchanged image skips preprocessing and tesseract entirely.
+
+        The preprocessed image is recognized once; its result doubles as the
+        "after" measurement of the preprocessing comparison. In single-pass mode
+        the "before" measurement only runs on a deterministic sample of images.
 
         Args:
             image_path: Path to image file
@@ -105,40 +127,84 @@ class QualityValidator(PipelineStage[Document, Document]):
         try:
             # Load image
             image = Image.open(image_path)
+            apply_preprocessing = preprocess and self.ocr_preprocessing_enabled
+
+            cache_key = None
+            if self.ocr_cache is not None:
+                cache_key = self.ocr_cache.make_image_key(
+                    image, flags=("preprocess",) if apply_preprocessing else ()
+                )
+                cached = self.ocr_cache.get(cache_key)
+                if cached is not None:
+                    self.logger.debug("ocr_cache_hit", image_path=str(image_path))
+                    return self._average_confidence(cached), cached
 
             # Apply preprocessing if enabled
-            if preprocess and self.ocr_preprocessing_enabled:
-                confidence_before = self._calculate_raw_confidence(image)
+            confidence_before = None
+            if apply_preprocessing:
+                if self._should_compare_preprocessing(image_path):
+                    confidence_before = self._calculate_raw_confidence(image)
                 image = self.preprocess_image_for_ocr(image)
-                confidence_after = self._calculate_raw_confidence(image)
 
+            # Get OCR data with confidence scores (single tesseract pass on final image)
+            ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+            confidence = self._average_confidence(ocr_data)
+
+            if confidence_before is not None:
                 self.logger.info(
                     "ocr_preprocessing_applied",
                     image_path=str(image_path),
                     confidence_before=confidence_before,
-                    confidence_after=confidence_after,
-                    improvement=confidence_after - confidence_before,
+                    confidence_after=confidence,
+                    improvement=confidence - confidence_before,
                 )
-            else:
-                confidence_after = None
 
-            # Get OCR data with confidence scores
-            ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+            if cache_key is not None:
+                self.ocr_cache.set(cache_key, ocr_data)
 
-            # Extract valid confidence scores (filter out -1 which indicates no OCR)
-            confidences = [int(conf) for conf in ocr_data["conf"] if str(conf) != "-1"]
+            return confidence, ocr_data
 
-            if not confidences:
-                # No text detected - return 0.0 confidence
-                return 0.0, ocr_data
+        except Exception as e:
+            raise ProcessingError(f"Failed to calculate OCR confidence for {image_path}: {str(e)}")
 
-            # Calculate average confidence and normalize to 0.0-1.0 scale
-            average_confidence = sum(confidences) / len(confidences) / 100.0
+    def _should_compare_preprocessing(self, image_path: Path) -> bool:
+        """Decide whether to measure confidence before preprocessing for an image.
 
-            return average_confidence, ocr_data
+        Outside single-pass mode every image is compared. In single-pass mode a
+        stable hash of the image path selects ocr_comparison_sample_rate of images,
+        so the same inputs are always sampled.
 
-        except Exception as e:
-            raise ProcessingError(f"Failed to calculate OCR confidence for {image_path}: {str(e)}")
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            True if the before-preprocessing OCR pass should run
+        """
+        if not self.ocr_single_pass:
+            return True
+        if self.ocr_comparison_sample_rate <= 0.0:
+            return False
+        bucket = zlib.crc32(str(image_path).encode("utf-8")) % 10000
+        return bucket < self.ocr_comparison_sample_rate * 10000
+
+    def _average_confidence(self, ocr_data: Dict[str, Any]) -> float:
+        """Calculate average confidence from pytesseract image_to_data output.
+
+        Args:
+            ocr_data: OCR data dictionary with a "conf" list
+
+        Returns:
+            Average confidence score (0.0-1.0), 0.0 if no text was detected
+        """
+        # Extract valid confidence scores (filter out -1 which indicates no OCR)
+        confidences = [int(conf) for conf in ocr_data["conf"] if str(conf) != "-1"]
+
+        if not confidences:
+            # No text detected - return 0.0 confidence
+            return 0.0
+
+        # Calculate average confidence and normalize to 0.0-1.0 scale
+        return sum(confidences) / len(confidences) / 100.0
 
     def _calculate_raw_confidence(self, image: Any) -> float:
         """Calculate raw OCR confidence for an image.
@@ -153,12 +219,7 @@ class QualityValidator(PipelineStage[Document, Document]):
         """
         try:
             ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-            confidences = [int(conf) for conf in ocr_data["conf"] if str(conf) != "-1"]
-
-            if not confidences:
-                return 0.0
-
-            return sum(confidences) / len(confidences) / 100.0
+            return self._average_confidence(ocr_data)
         except Exception:
             return 0.0
 
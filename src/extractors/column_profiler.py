@@ -0,0 +1,254 @@
+"""
+Column Profiler - Batch Column Type Inference for Tabular Extractors
+
+Classifies the columns of a row sample as empty, numeric, date or text and
+detects whether the first row is a header. Used by CSVExtractor (header
+detection and column types) and ExcelExtractor (column types).
+
+Each column of the sample is joined into one newline-separated string and
+tested with a single anchored regex match per type ("every line is a number
+or blank", then "every line is a date or blank"), so the per-cell work runs
+inside the regex engine instead of a Python loop with try/except float().
+Columns whose cells contain newlines are classified cell by cell with the
+same patterns.
+
+Example:
+    >>> profile = ColumnProfiler().profile([["id", "when"], ["1", "2024-01-05"]])
+    >>> profile.has_header, profile.column_types
+    (True, ('numeric', 'date'))
+"""
+
+import re
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import List, Optional, Sequence
+
+# Rows profiled by default
+DEFAULT_SAMPLE_ROWS = 1000
+
+_DIGITS = r"\d(?:_?\d)*"
+
+# Everything float() accepts (signs, exponents, underscores between digits,
+# inf/infinity/nan)
+_NUMBER = (
+    rf"[+-]?(?:(?:(?:{_DIGITS})?\.{_DIGITS}|{_DIGITS}\.?)(?:[eE][+-]?{_DIGITS})?"
+    r"|(?i:inf(?:inity)?|nan))"
+)
+
+_MONTH = r"(?i:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+_DATE = (
+    r"(?:\d{4}-\d{1,2}-\d{1,2}(?:[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+    r"|\d{4}/\d{1,2}/\d{1,2}"
+    r"|\d{1,2}[/.-]\d{1,2}[/.-](?:\d{4}|\d{2})"
+    rf"|{_MONTH} \d{{1,2}},? \d{{4}}"
+    rf"|\d{{1,2}}[ -]{_MONTH}[ -]\d{{4}})"
+)
+
+_HSPACE = r"[^\S\n]*"
+
+
+def _column_pattern(value: str) -> "re.Pattern[str]":
+    """Pattern matching a joined column where every line is `value` or blank."""
+    # Atomic lines keep a failed match from backtracking into earlier lines
+    line = rf"(?>{_HSPACE}(?:{value})?{_HSPACE})"
+    return re.compile(rf"(?:{line}\n)*{line}")
+
+
+# Whole-column patterns over a newline-joined column
+_NUMERIC_COLUMN = _column_pattern(_NUMBER)
+_DATE_COLUMN = _column_pattern(_DATE)
+_BLANK = re.compile(r"\s*")
+
+# Single-cell patterns for the fallback path and header detection
+_NUMERIC_CELL = re.compile(rf"\s*{_NUMBER}\s*")
+_DATE_CELL = re.compile(rf"\s*{_DATE}\s*")
+
+
+@dataclass(frozen=True)
+class TableProfile:
+    """
+    Result of profiling a row sample.
+
+    Attributes:
+        has_header: True if the first row looks like a header
+        column_types: Inferred type per column ("empty", "numeric", "date", "text"),
+            computed over the data rows (excluding the header row)
+        sample_rows: Number of rows profiled
+    """
+
+    has_header: bool = False
+    column_types: tuple[str, ...] = ()
+    sample_rows: int = 0
+
+    def types_for(self, num_columns: int) -> tuple[str, ...]:
+        """
+        Return column types sized to a table width.
+
+        Args:
+            num_columns: Number of columns in the table
+
+        Returns:
+            Types truncated, or padded with "empty", to num_columns
+        """
+        types = self.column_types[:num_columns]
+        return types + ("empty",) * (num_columns - len(types))
+
+
+class ColumnProfiler:
+    """
+    Batch column type inference and header detection over a row sample.
+
+    Example:
+        >>> profiler = ColumnProfiler()
+        >>> profile = profiler.profile(rows[:1000])
+        >>> if profile.has_header:
+        ...     header, data = rows[0], rows[1:]
+    """
+
+    def __init__(self, sample_rows: int = DEFAULT_SAMPLE_ROWS):
+        """
+        Initialize profiler.
+
+        Args:
+            sample_rows: Maximum rows profiled per call (default: 1000)
+        """
+        self.sample_rows = sample_rows
+
+    def profile(
+        self, rows: Sequence[Sequence[str]], has_header: Optional[bool] = None
+    ) -> TableProfile:
+        """
+        Profile the leading rows of a table.
+
+        Args:
+            rows: Rows of cell strings (ragged rows allowed)
+            has_header: Known header presence (default: detect)
+
+        Returns:
+            TableProfile with header detection and per-column types
+        """
+        rows = list(rows[: self.sample_rows])
+        if not rows:
+            return TableProfile(has_header=bool(has_header))
+
+        if has_header is None:
+            has_header = self._detect_header(rows)
+
+        body = rows[1:] if has_header else rows
+        return TableProfile(
+            has_header=has_header,
+            column_types=self.column_types(body, max(len(row) for row in rows)),
+            sample_rows=len(rows),
+        )
+
+    def column_types(self, rows: Sequence[Sequence[str]], width: int) -> tuple[str, ...]:
+        """
+        Infer one type per column.
+
+        A column is numeric or date only if every non-empty cell is; mixed
+        columns are text and all-empty columns are empty.
+
+        Args:
+            rows: Data rows (shorter rows are treated as padded with empty cells)
+            width: Number of columns
+
+        Returns:
+            Tuple of "empty", "numeric", "date" or "text" per column
+        """
+        if not rows:
+            return ("empty",) * width
+
+        columns = list(zip_longest(*rows, fillvalue=""))
+        columns += [("",) * len(rows)] * (width - len(columns))
+        return tuple(self._column_type(column) for column in columns[:width])
+
+    @staticmethod
+    def _column_type(column: Sequence[str]) -> str:
+        """Classify one column with whole-column matches."""
+        joined = "\n".join(column)
+        if joined.count("\n") != len(column) - 1:
+            # Cells containing newlines break the line mapping
+            return ColumnProfiler._column_type_by_cell(column)
+
+        if _BLANK.fullmatch(joined):
+            return "empty"
+        if _NUMERIC_COLUMN.fullmatch(joined):
+            return "numeric"
+        if _DATE_COLUMN.fullmatch(joined):
+            return "date"
+        return "text"
+
+    @staticmethod
+    def _column_type_by_cell(column: Sequence[str]) -> str:
+        """Classify one column cell by cell (fallback path)."""
+        types = {ColumnProfiler.classify_cell(cell) for cell in column} - {"empty"}
+        if not types:
+            return "empty"
+        if len(types) == 1:
+            return types.pop()
+        return "text"
+
+    @staticmethod
+    def classify_cell(cell: str) -> str:
+        """
+        Classify a single cell.
+
+        Args:
+            cell: Cell string
+
+        Returns:
+            "empty", "numeric", "date" or "text"
+        """
+        if not cell.strip():
+            return "empty"
+        if _NUMERIC_CELL.fullmatch(cell):
+            return "numeric"
+        if _DATE_CELL.fullmatch(cell):
+            return "date"
+        return "text"
+
+    @staticmethod
+    def _detect_header(rows: List[Sequence[str]]) -> bool:
+        """
+        Detect header presence using multi-check heuristic.
+
+        Algorithm:
+        1. Check if first row has fewer numeric cells than second row
+        2. Check if first row values are unique
+        3. Check if first row has longer strings (typical header pattern)
+        4. Combine checks with weighted scoring
+
+        Args:
+            rows: Sample rows
+
+        Returns:
+            True if header detected
+        """
+        if len(rows) < 2:
+            return False
+
+        first_row = rows[0]
+        second_row = rows[1]
+
+        score = 0.0
+
+        # Check 1: Type consistency (headers are usually all text/non-numeric)
+        first_numeric = sum(1 for cell in first_row if _NUMERIC_CELL.fullmatch(cell))
+        second_numeric = sum(1 for cell in second_row if _NUMERIC_CELL.fullmatch(cell))
+
+        if first_numeric < second_numeric:
+            score += 0.4
+
+        # Check 2: Uniqueness (headers are usually unique)
+        if len(first_row) == len(set(first_row)):
+            score += 0.3
+
+        # Check 3: Length patterns (headers often longer, more descriptive)
+        first_avg_len = sum(map(len, first_row)) / len(first_row) if first_row else 0
+        second_avg_len = sum(map(len, second_row)) / len(second_row) if second_row else 0
+
+        if first_avg_len > second_avg_len * 1.2:
+            score += 0.3
+
+        # Threshold: 0.5 = has header
+        return score >= 0.5
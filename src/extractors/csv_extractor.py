@@ -8,6 +8,7 @@ Extracts content from CSV/TSV files with support for:
 - Configuration overrides for all detection parameters
 - Malformed data handling (variable row lengths)
 - Large file support with max_rows limiting
+- Chunked streaming (one table segment per row batch, bounded memory)
 
 Implementation follows strict TDD methodology with infrastructure integration.
 """
@@ -15,20 +16,12 @@ Implementation follows strict TDD methodology with infrastructure integration.
 import csv
 import hashlib
 import logging
+import sys
 import time
 from datetime import datetime, timezone
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional, Union
-
-# Try to import chardet for encoding detection
-try:
-    import chardet
-
-    CHARDET_AVAILABLE = True
-except ImportError:
-    CHARDET_AVAILABLE = False
-
-import sys
+from typing import Iterator, List, Optional, Union
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -38,10 +31,15 @@ from src.core import (
     ContentType,
     DocumentMetadata,
     ExtractionResult,
+    ExtractionStreamItem,
     Position,
+    SparseCells,
     TableMetadata,
+    collect_extraction_stream,
 )
 
+from .csv_sniffer import CsvSniffer, CsvSource
+
 # Import infrastructure components
 try:
     from src.infrastructure import (
@@ -56,6 +54,15 @@ try:
 except ImportError:
     INFRASTRUCTURE_AVAILABLE = False
 
+# The provenance cache is shared with the other extractors, which import the
+# package as ``infrastructure``; one module path keeps it one instance
+try:
+    from infrastructure import get_provenance_cache
+
+    PROVENANCE_AVAILABLE = True
+except ImportError:
+    PROVENANCE_AVAILABLE = False
+
 
 class CSVExtractor(BaseExtractor):
     """
@@ -67,8 +74,8 @@ class CSVExtractor(BaseExtractor):
     - Header row presence
 
     Design Notes:
-    - Single TABLE ContentBlock per CSV file
-    - Full grid structure stored in TableMetadata
+    - Single TABLE ContentBlock per CSV file (one per row batch with chunk_rows)
+    - Full grid structure stored in TableMetadata (as SparseCells)
     - All cells stored as strings (no type conversion)
     - Malformed rows normalized to consistent length
     - Configuration overrides available for all auto-detection
@@ -81,6 +88,7 @@ class CSVExtractor(BaseExtractor):
         skip_rows (int): Number of rows to skip at start (default: 0)
         quotechar (str): Quote character for fields (default: '"')
         strict (bool): Strict parsing mode (default: False)
+        chunk_rows (int): Rows per table segment when streaming (default: None)
 
     Example:
         >>> extractor = CSVExtractor()
@@ -103,6 +111,9 @@ class CSVExtractor(BaseExtractor):
                 - skip_rows: Number of rows to skip (default: 0)
                 - quotechar: Quote character (default: '"')
                 - strict: Strict parsing mode (default: False)
+                - chunk_rows: Stream the file in table segments of this many
+                  data rows, each with the header carried through (default:
+                  None = one table for the whole file)
         """
         super().__init__(config if isinstance(config, dict) or config is None else {})
 
@@ -133,6 +144,7 @@ class CSVExtractor(BaseExtractor):
             self.skip_rows = extractor_config.get("skip_rows", 0)
             self.quotechar = extractor_config.get("quotechar", '"')
             self.strict = extractor_config.get("strict", False)
+            self.chunk_rows = extractor_config.get("chunk_rows")
         elif isinstance(config, dict):
             # From dict (backward compatible)
             self.delimiter = config.get("delimiter")
@@ -142,6 +154,7 @@ class CSVExtractor(BaseExtractor):
             self.skip_rows = config.get("skip_rows", 0)
             self.quotechar = config.get("quotechar", '"')
             self.strict = config.get("strict", False)
+            self.chunk_rows = config.get("chunk_rows")
         else:
             # Defaults
             self.delimiter = None
@@ -151,6 +164,11 @@ class CSVExtractor(BaseExtractor):
             self.skip_rows = 0
             self.quotechar = '"'
             self.strict = False
+            self.chunk_rows = None
+
+        # Reads one head buffer per file for encoding/dialect detection and
+        # hashes the file as it is parsed
+        self._sniffer = CsvSniffer()
 
     def supports_format(self, file_path: Path) -> bool:
         """
@@ -172,29 +190,51 @@ class CSVExtractor(BaseExtractor):
         """Return human-readable format name."""
         return "CSV"
 
+    def supports_streaming(self) -> bool:
+        """Table blocks are yielded before document metadata is computed."""
+        return True
+
     def extract(self, file_path: Path) -> ExtractionResult:
         """
         Extract content from CSV file.
 
+        Collects extract_stream() into a single result.
+
+        Args:
+            file_path: Path to CSV file
+
+        Returns:
+            ExtractionResult with TABLE ContentBlock(s) and metadata
+        """
+        return collect_extraction_stream(self.extract_stream(file_path))
+
+    def extract_stream(self, file_path: Path) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract content from CSV file as a stream.
+
         Strategy:
         1. Validate file exists and is accessible
-        2. Detect encoding (or use configured)
-        3. Detect delimiter (or use configured)
-        4. Read all rows using csv.reader
+        2. Detect encoding (or use configured) from one head buffer
+        3. Detect delimiter (or use configured) from the same buffer
+        4. Read all rows using csv.reader (file hashed during the read)
         5. Skip rows if configured
         6. Detect header row (or use configured)
         7. Normalize row lengths
         8. Apply max_rows limit if configured
         9. Create TableMetadata with full grid
-        10. Create single TABLE ContentBlock
+        10. Yield single TABLE ContentBlock
         11. Generate document metadata
-        12. Return structured result
+        12. Yield ExtractionResult trailer
+
+        With chunk_rows set, steps 4-10 run per row batch instead
+        (see _stream_table_segments).
 
         Args:
             file_path: Path to CSV file
 
-        Returns:
-            ExtractionResult with single TABLE ContentBlock and metadata
+        Yields:
+            Single TABLE ContentBlock (or a TableMetadata and TABLE ContentBlock
+            per row batch), then one ExtractionResult
         """
         start_time = time.time()
 
@@ -204,7 +244,6 @@ class CSVExtractor(BaseExtractor):
 
         errors = []
         warnings = []
-        content_blocks = []
         tables = []
 
         # Step 1: Validate file
@@ -218,7 +257,7 @@ class CSVExtractor(BaseExtractor):
             else:
                 errors.extend(validation_errors)
 
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(errors),
                 document_metadata=DocumentMetadata(
@@ -226,22 +265,25 @@ class CSVExtractor(BaseExtractor):
                     file_format="csv",
                 ),
             )
+            return
 
+        source = None
         try:
-            # Step 2: Detect encoding
-            detected_encoding = self.encoding or self._detect_encoding(file_path)
+            # Steps 2-3: Open the file once and detect encoding and delimiter
+            source = self._sniffer.open(file_path, encoding=self.encoding, delimiter=self.delimiter)
+            detected_encoding = source.encoding
+            detected_delimiter = source.delimiter
 
-            # Step 3: Detect delimiter
-            detected_delimiter = self.delimiter or self._detect_delimiter(
-                file_path, detected_encoding
-            )
+            if self.chunk_rows:
+                yield from self._stream_table_segments(file_path, source, start_time)
+                return
 
             # Step 4: Read CSV file
-            rows = self._read_csv_file(file_path, detected_encoding, detected_delimiter)
+            rows = self._read_csv_file(source)
 
             # Handle empty file
             if not rows or len(rows) == 0:
-                return ExtractionResult(
+                yield ExtractionResult(
                     success=False,
                     errors=("CSV file is empty",),
                     document_metadata=DocumentMetadata(
@@ -249,12 +291,13 @@ class CSVExtractor(BaseExtractor):
                         file_format="csv",
                     ),
                 )
+                return
 
             # Step 5: Skip rows if configured
             if self.skip_rows > 0:
                 rows = rows[self.skip_rows :]
                 if not rows:
-                    return ExtractionResult(
+                    yield ExtractionResult(
                         success=False,
                         errors=(f"No data remaining after skipping {self.skip_rows} rows",),
                         document_metadata=DocumentMetadata(
@@ -262,11 +305,11 @@ class CSVExtractor(BaseExtractor):
                             file_format="csv",
                         ),
                     )
+                    return
 
-            # Step 6: Detect header
-            detected_has_header = (
-                self.has_header if self.has_header is not None else self._detect_header(rows)
-            )
+            # Step 6: Detect header and column types from a row sample
+            profile = self._sniffer.profile(rows, has_header=self.has_header)
+            detected_has_header = profile.has_header
 
             # Extract header and data rows
             header_row = None
@@ -296,7 +339,8 @@ class CSVExtractor(BaseExtractor):
                 num_columns=column_count,
                 has_header=detected_has_header,
                 header_row=tuple(header_row) if header_row else None,
-                cells=tuple(tuple(row) for row in normalized_data_rows),
+                cells=SparseCells.from_rows(normalized_data_rows, column_count),
+                column_types=profile.types_for(column_count),
             )
 
             # Step 10: Create ContentBlock
@@ -308,10 +352,11 @@ class CSVExtractor(BaseExtractor):
                 "has_header": detected_has_header,
                 "row_count": len(normalized_data_rows),
                 "column_count": column_count,
+                "column_types": list(table_metadata.column_types),
                 "table_id": str(table_metadata.table_id),
             }
 
-            block = ContentBlock(
+            yield ContentBlock(
                 block_type=ContentType.TABLE,
                 content="",
                 position=Position(sequence_index=0),
@@ -319,13 +364,14 @@ class CSVExtractor(BaseExtractor):
                 metadata=block_metadata,
             )
 
-            content_blocks.append(block)
             tables.append(table_metadata)
 
             # Step 11: Generate document metadata
-            doc_metadata = self._extract_document_metadata(file_path, table_metadata)
+            doc_metadata = self._extract_document_metadata(
+                file_path, table_metadata, file_hash=self._source_file_hash(source)
+            )
 
-            # Step 12: Log completion and return result
+            # Step 12: Log completion and yield result trailer
             duration = time.time() - start_time
             if INFRASTRUCTURE_AVAILABLE:
                 self.logger.info(
@@ -338,13 +384,13 @@ class CSVExtractor(BaseExtractor):
                     },
                 )
 
-            return ExtractionResult(
-                content_blocks=tuple(content_blocks),
+            yield ExtractionResult(
                 document_metadata=doc_metadata,
                 tables=tuple(tables),
                 success=True,
                 warnings=tuple(warnings),
             )
+            return
 
         except PermissionError:
             if self.error_handler:
@@ -370,8 +416,12 @@ class CSVExtractor(BaseExtractor):
                     "Extraction failed", extra={"file": str(file_path), "error": str(e)}
                 )
 
-        # Return failed result
-        return ExtractionResult(
+        finally:
+            if source is not None:
+                source.close()
+
+        # Yield failed result
+        yield ExtractionResult(
             success=False,
             errors=tuple(errors),
             warnings=tuple(warnings),
@@ -381,176 +431,128 @@ class CSVExtractor(BaseExtractor):
             ),
         )
 
-    def _detect_encoding(self, file_path: Path) -> str:
-        """
-        Detect file encoding with UTF-8 → chardet → Latin-1 cascade.
-
-        Algorithm:
-        1. Try UTF-8 (most common)
-        2. Check for UTF-8 BOM
-        3. Use chardet on first 100KB if available
-        4. Fallback to Latin-1 (always works)
-
-        Args:
-            file_path: Path to CSV file
-
-        Returns:
-            Detected encoding name
+    def _stream_table_segments(
+        self, file_path: Path, source: CsvSource, start_time: float
+    ) -> Iterator[ExtractionStreamItem]:
         """
-        # Try UTF-8 first (most common)
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                f.read(1024)
-            return "utf-8"
-        except UnicodeDecodeError:
-            pass
+        Stream a CSV as table segments of chunk_rows data rows each.
 
-        # Check for UTF-8 BOM
-        try:
-            with open(file_path, "rb") as f:
-                first_bytes = f.read(3)
-                if first_bytes == b"\xef\xbb\xbf":
-                    return "utf-8-sig"
-        except:
-            pass
-
-        # Use chardet if available
-        if CHARDET_AVAILABLE:
-            try:
-                with open(file_path, "rb") as f:
-                    raw_data = f.read(102400)  # 100KB
-
-                detection = chardet.detect(raw_data)
-                if detection["confidence"] > 0.7 and detection["encoding"]:
-                    return detection["encoding"].lower()
-            except Exception:
-                pass
-
-        # Fallback to Latin-1 (always works)
-        return "latin-1"
-
-    def _detect_delimiter(self, file_path: Path, encoding: str) -> str:
-        """
-        Detect CSV delimiter using csv.Sniffer with fallback.
-
-        Algorithm:
-        1. Read first 8KB of file
-        2. Try csv.Sniffer.sniff()
-        3. If fails, count delimiter candidates
-        4. Return most common valid delimiter
-        5. Default to comma if all fail
+        Rows are read lazily and normalized into sparse storage as they
+        arrive, so peak memory is set by chunk_rows rather than file size.
+        Header detection, column types and the column count use the first
+        batch; later rows are padded or truncated to that width. Every
+        segment carries the header row.
 
         Args:
             file_path: Path to CSV file
-            encoding: File encoding to use
+            source: Open CsvSource (encoding and delimiter detected)
+            start_time: Extraction start (for the completion log)
 
-        Returns:
-            Detected delimiter: ",", "\t", ";", "|"
+        Yields:
+            (TableMetadata, TABLE ContentBlock) per batch, then one ExtractionResult
         """
-        try:
-            with open(file_path, "r", encoding=encoding, errors="replace") as f:
-                sample = f.read(8192)
-
-            # Try csv.Sniffer
-            try:
-                sniffer = csv.Sniffer()
-                dialect = sniffer.sniff(sample, delimiters=",\t;|")
-                return dialect.delimiter
-            except csv.Error:
-                pass
-
-            # Fallback: count delimiter candidates
-            delimiter_counts = {
-                ",": sample.count(","),
-                "\t": sample.count("\t"),
-                ";": sample.count(";"),
-                "|": sample.count("|"),
-            }
-
-            # Return most common delimiter
-            max_delimiter = max(delimiter_counts, key=delimiter_counts.get)
-            if delimiter_counts[max_delimiter] > 0:
-                return max_delimiter
-
-            # Default to comma
-            return ","
-
-        except Exception:
-            return ","
-
-    def _detect_header(self, rows: List[List[str]]) -> bool:
-        """
-        Detect header presence using multi-check heuristic.
-
-        Algorithm:
-        1. Check if first row has different data types than second row
-        2. Check if first row values are unique
-        3. Check if first row has longer strings (typical header pattern)
-        4. Combine checks with weighted scoring
-
-        Target accuracy: ≥95%
-
-        Args:
-            rows: List of rows (list of lists)
-
-        Returns:
-            True if header detected
-        """
-        if len(rows) < 2:
-            return False
-
-        first_row = rows[0]
-        second_row = rows[1]
+        batch_size = max(1, int(self.chunk_rows))
+        encoding, delimiter = source.encoding, source.delimiter
+        rows = self._iter_csv_rows(source)
+
+        skipped = sum(1 for _ in islice(rows, self.skip_rows)) if self.skip_rows > 0 else 0
+        first_batch = list(islice(rows, batch_size + 1))
+
+        if not first_batch:
+            error = (
+                f"No data remaining after skipping {self.skip_rows} rows"
+                if skipped
+                else "CSV file is empty"
+            )
+            yield ExtractionResult(
+                success=False,
+                errors=(error,),
+                document_metadata=DocumentMetadata(source_file=file_path, file_format="csv"),
+            )
+            return
 
-        score = 0.0
+        profile = self._sniffer.profile(first_batch, has_header=self.has_header)
+        detected_has_header = profile.has_header
+        header_row = first_batch.pop(0) if detected_has_header else None
 
-        # Check 1: Type consistency (headers are usually all text/non-numeric)
-        first_numeric = sum(1 for cell in first_row if self._is_numeric(cell))
-        second_numeric = sum(1 for cell in second_row if self._is_numeric(cell))
+        if header_row:
+            column_count = len(header_row)
+        elif first_batch:
+            column_count = max(len(row) for row in first_batch)
+        else:
+            column_count = 0
+
+        data_rows = chain(first_batch, rows)
+        del first_batch
+        if self.max_rows is not None:
+            data_rows = islice(data_rows, self.max_rows)
+
+        segment_index = 0
+        total_rows = 0
+        while True:
+            cells = SparseCells.from_rows(
+                (self._normalize_row(row, column_count) for row in islice(data_rows, batch_size)),
+                column_count,
+            )
+            # Always emit at least one (possibly empty) segment
+            if not cells and segment_index > 0:
+                break
 
-        if first_numeric < second_numeric:
-            score += 0.4
+            table_metadata = TableMetadata(
+                num_rows=len(cells),
+                num_columns=column_count,
+                has_header=detected_has_header,
+                header_row=tuple(header_row) if header_row else None,
+                cells=cells,
+                column_types=profile.types_for(column_count),
+            )
+            yield table_metadata
+            yield ContentBlock(
+                block_type=ContentType.TABLE,
+                content="",
+                position=Position(sequence_index=segment_index),
+                confidence=1.0,
+                metadata={
+                    "source_type": "csv",
+                    "file_path": str(file_path),
+                    "encoding": encoding,
+                    "delimiter": delimiter,
+                    "has_header": detected_has_header,
+                    "row_count": len(cells),
+                    "column_count": column_count,
+                    "column_types": list(table_metadata.column_types),
+                    "table_id": str(table_metadata.table_id),
+                    "segment_index": segment_index,
+                    "row_offset": total_rows,
+                },
+            )
 
-        # Check 2: Uniqueness (headers are usually unique)
-        if len(first_row) == len(set(first_row)):
-            score += 0.3
+            segment_index += 1
+            total_rows += len(cells)
+            if len(cells) < batch_size:
+                break
 
-        # Check 3: Length patterns (headers often longer, more descriptive)
-        first_avg_len = (
-            sum(len(str(cell)) for cell in first_row) / len(first_row) if first_row else 0
+        doc_metadata = self._extract_document_metadata(
+            file_path,
+            table_metadata,
+            table_count=segment_index,
+            file_hash=self._source_file_hash(source),
         )
-        second_avg_len = (
-            sum(len(str(cell)) for cell in second_row) / len(second_row) if second_row else 0
-        )
-
-        if first_avg_len > second_avg_len * 1.2:
-            score += 0.3
-
-        # Threshold: 0.5 = has header
-        return score >= 0.5
-
-    def _is_numeric(self, value: str) -> bool:
-        """
-        Check if string value is numeric.
 
-        Args:
-            value: String to check
-
-        Returns:
-            True if value is numeric
-        """
-        if not value or not isinstance(value, str):
-            return False
-
-        # Remove whitespace
-        value = value.strip()
+        duration = time.time() - start_time
+        if INFRASTRUCTURE_AVAILABLE:
+            self.logger.info(
+                "CSV extraction complete",
+                extra={
+                    "file": str(file_path),
+                    "rows": total_rows,
+                    "columns": column_count,
+                    "segments": segment_index,
+                    "duration_seconds": round(duration, 3),
+                },
+            )
 
-        # Check if it's a number (int or float)
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+        yield ExtractionResult(document_metadata=doc_metadata, success=True)
 
     def _normalize_row(self, row: List[str], expected_columns: int) -> List[str]:
         """
@@ -574,40 +576,56 @@ class CSVExtractor(BaseExtractor):
                 self.logger.warning(f"Truncating row from {len(row)} to {expected_columns} columns")
             return row[:expected_columns]
 
-    def _read_csv_file(self, file_path: Path, encoding: str, delimiter: str) -> List[List[str]]:
+    def _iter_csv_rows(self, source: CsvSource) -> Iterator[List[str]]:
         """
-        Read CSV file and return rows.
+        Lazily read CSV rows, stripping a BOM from the first cell.
 
         Args:
-            file_path: Path to CSV file
-            encoding: File encoding
-            delimiter: CSV delimiter
+            source: Open CsvSource (encoding and delimiter detected)
 
-        Returns:
-            List of rows (each row is a list of strings)
+        Yields:
+            Rows (each row is a list of strings)
         """
-        rows = []
-
         try:
-            with open(file_path, "r", encoding=encoding, errors="replace") as f:
-                reader = csv.reader(
-                    f, delimiter=delimiter, quotechar=self.quotechar, strict=self.strict
-                )
-                rows = list(reader)
+            reader = csv.reader(
+                source.text,
+                delimiter=source.delimiter,
+                quotechar=self.quotechar,
+                strict=self.strict,
+            )
+            first_row = next(reader, None)
+            if first_row is None:
+                return
 
             # Strip BOM from first cell of first row if present
-            if rows and rows[0] and rows[0][0].startswith("\ufeff"):
-                rows[0] = [rows[0][0][1:]] + list(rows[0][1:])
+            if first_row and first_row[0].startswith("\ufeff"):
+                first_row = [first_row[0][1:]] + list(first_row[1:])
+            yield first_row
+            yield from reader
 
         except Exception as e:
             if INFRASTRUCTURE_AVAILABLE and self.logger:
                 self.logger.error(f"Error reading CSV file: {str(e)}")
             raise
 
-        return rows
+    def _read_csv_file(self, source: CsvSource) -> List[List[str]]:
+        """
+        Read CSV file and return rows.
+
+        Args:
+            source: Open CsvSource (encoding and delimiter detected)
+
+        Returns:
+            List of rows (each row is a list of strings)
+        """
+        return list(self._iter_csv_rows(source))
 
     def _extract_document_metadata(
-        self, file_path: Path, table_metadata: TableMetadata
+        self,
+        file_path: Path,
+        table_metadata: TableMetadata,
+        table_count: int = 1,
+        file_hash: Optional[str] = None,
     ) -> DocumentMetadata:
         """
         Extract document-level metadata from CSV file.
@@ -615,6 +633,8 @@ class CSVExtractor(BaseExtractor):
         Args:
             file_path: Path to file
             table_metadata: Table metadata for statistics
+            table_count: Number of tables (segments) extracted
+            file_hash: SHA256 computed while parsing (computed here if None)
 
         Returns:
             DocumentMetadata with available properties
@@ -623,19 +643,35 @@ class CSVExtractor(BaseExtractor):
         file_stat = file_path.stat()
         file_size = file_stat.st_size
 
-        # Generate file hash
-        file_hash = self._compute_file_hash(file_path)
+        # Generate file hash (normally already computed during the parse)
+        if file_hash is None:
+            file_hash = self._compute_file_hash(file_path)
 
         return DocumentMetadata(
             source_file=file_path,
             file_format="csv",
             file_size_bytes=file_size,
             file_hash=file_hash,
-            table_count=1,
+            table_count=table_count,
             extracted_at=datetime.now(timezone.utc),
             extractor_version="1.0.6",
         )
 
+    def _source_file_hash(self, source: CsvSource) -> str:
+        """
+        Finish the hash computed during the parse and share it.
+
+        Args:
+            source: Open CSV source
+
+        Returns:
+            Hex string of SHA256 hash
+        """
+        file_hash = source.file_hash()
+        if PROVENANCE_AVAILABLE:
+            get_provenance_cache().record(source.file_path, file_hash, source.file_stat)
+        return file_hash
+
     def _compute_file_hash(self, file_path: Path) -> str:
         """
         Compute SHA256 hash of file for deduplication.
@@ -646,6 +682,9 @@ class CSVExtractor(BaseExtractor):
         Returns:
             Hex string of SHA256 hash
         """
+        if PROVENANCE_AVAILABLE:
+            return get_provenance_cache().file_hash(file_path)
+
         sha256 = hashlib.sha256()
 
         with open(file_path, "rb") as f:
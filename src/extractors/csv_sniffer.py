@@ -0,0 +1,319 @@
+"""
+CSV Sniffer - Single-Read Detection and Hashing for CSV Extraction
+
+CSVExtractor needs the encoding, delimiter and header layout of a file
+before parsing it, and a SHA256 of the whole file afterwards. CsvSniffer
+reads one head buffer and runs BOM, encoding and dialect detection on it.
+The opened CsvSource then replays that buffer into the main parse and
+hashes the rest of the file as the parse streams through it, so the file
+is opened and read once.
+
+Features:
+- One head buffer (default 100KB) shared by BOM, encoding and delimiter detection
+- UTF-8 → BOM → chardet → Latin-1 encoding cascade
+- csv.Sniffer delimiter detection with candidate-count fallback
+- Header detection and column types on the first parsed rows (no extra
+  read), via ColumnProfiler
+- SHA256 computed from the bytes the parser reads, finished on demand
+
+Example:
+    >>> with CsvSniffer().open(Path("data.csv")) as source:
+    ...     reader = csv.reader(source.text, delimiter=source.delimiter)
+    ...     rows = list(reader)
+    ...     file_hash = source.file_hash()
+"""
+
+import codecs
+import csv
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, List, Optional
+
+from .column_profiler import ColumnProfiler, TableProfile
+
+# Try to import chardet for encoding detection
+try:
+    import chardet
+
+    CHARDET_AVAILABLE = True
+except ImportError:
+    CHARDET_AVAILABLE = False
+
+# Bytes read up front for detection (also the chardet sample size)
+DEFAULT_HEAD_SIZE = 102400
+
+# Characters of the decoded head given to csv.Sniffer
+DELIMITER_SAMPLE_CHARS = 8192
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class _HashingReader(io.RawIOBase):
+    """
+    Raw stream that replays an already-read head, then reads the file.
+
+    Bytes read from the file after the head are fed to the hasher (the head
+    was hashed when it was read), so every byte is hashed exactly once.
+    """
+
+    def __init__(self, raw: BinaryIO, head: bytes, hasher: Any):
+        self._raw = raw
+        self._head = memoryview(head)
+        self._head_pos = 0
+        self._hasher = hasher
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._head_pos < len(self._head):
+            n = min(len(buffer), len(self._head) - self._head_pos)
+            buffer[:n] = self._head[self._head_pos : self._head_pos + n]
+            self._head_pos += n
+            return n
+
+        n = self._raw.readinto(buffer)
+        if n:
+            self._hasher.update(memoryview(buffer)[:n])
+        return n
+
+    def drain(self) -> None:
+        """Hash whatever the parser has not read yet."""
+        for chunk in iter(lambda: self._raw.read(65536), b""):
+            self._hasher.update(chunk)
+
+    def close(self) -> None:
+        try:
+            self._raw.close()
+        finally:
+            super().close()
+
+
+class CsvSource:
+    """
+    An open CSV file with its detected encoding and delimiter.
+
+    Attributes:
+        file_path: Path to the CSV file
+        encoding: Detected (or configured) encoding
+        delimiter: Detected (or configured) delimiter
+        has_bom: True if the file starts with a UTF-8 byte order mark
+        head: Head buffer used for detection
+        file_stat: stat of the file taken when it was opened
+
+    Note:
+        Not thread-safe. Use as a context manager, or call close().
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        raw: BinaryIO,
+        head: bytes,
+        hasher: Any,
+        encoding: str,
+        delimiter: str,
+    ):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.has_bom = head.startswith(UTF8_BOM)
+        self.head = head
+        self.file_stat = os.fstat(raw.fileno())
+        self._reader = _HashingReader(raw, head, hasher)
+        self._hasher = hasher
+        self._text: Optional[io.TextIOWrapper] = None
+        self._file_hash: Optional[str] = None
+
+    def __enter__(self) -> "CsvSource":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def text(self) -> io.TextIOWrapper:
+        """
+        Decoded text stream over the whole file, starting at the first byte.
+
+        Opened on first access; undecodable bytes are replaced.
+        """
+        if self._text is None:
+            self._text = io.TextIOWrapper(
+                io.BufferedReader(self._reader), encoding=self.encoding, errors="replace"
+            )
+        return self._text
+
+    def file_hash(self) -> str:
+        """
+        SHA256 hex digest of the file.
+
+        Bytes not yet consumed by the parser (e.g., after max_rows) are read
+        and hashed now.
+
+        Returns:
+            Hex string of SHA256 hash
+        """
+        if self._file_hash is None:
+            self._reader.drain()
+            self._file_hash = self._hasher.hexdigest()
+        return self._file_hash
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        if self._text is not None:
+            self._text.close()
+        else:
+            self._reader.close()
+
+
+class CsvSniffer:
+    """
+    Detects CSV encoding, dialect and header layout from one head buffer.
+
+    Example:
+        >>> sniffer = CsvSniffer()
+        >>> with sniffer.open(Path("data.csv"), delimiter=";") as source:
+        ...     print(source.encoding)
+    """
+
+    def __init__(
+        self,
+        head_size: int = DEFAULT_HEAD_SIZE,
+        delimiters: str = ",\t;|",
+        profiler: Optional[ColumnProfiler] = None,
+    ):
+        """
+        Initialize sniffer.
+
+        Args:
+            head_size: Bytes read up front for detection (default: 100KB)
+            delimiters: Candidate delimiters (default: comma, tab, semicolon, pipe)
+            profiler: Column profiler for header/type detection (default: new one)
+        """
+        self.head_size = head_size
+        self.delimiters = delimiters
+        self.profiler = profiler or ColumnProfiler()
+
+    def open(
+        self, file_path: Path, encoding: Optional[str] = None, delimiter: Optional[str] = None
+    ) -> CsvSource:
+        """
+        Open a CSV file, read its head and detect encoding and delimiter.
+
+        Args:
+            file_path: Path to CSV file
+            encoding: Configured encoding (skips detection)
+            delimiter: Configured delimiter (skips detection)
+
+        Returns:
+            CsvSource positioned at the start of the file
+
+        Raises:
+            OSError: If the file cannot be opened or read
+        """
+        raw = open(file_path, "rb")
+        try:
+            head = raw.read(self.head_size)
+            hasher = hashlib.sha256(head)
+
+            detected_encoding = encoding or self.detect_encoding(head)
+            detected_delimiter = delimiter or self.detect_delimiter(head, detected_encoding)
+        except BaseException:
+            raw.close()
+            raise
+
+        return CsvSource(file_path, raw, head, hasher, detected_encoding, detected_delimiter)
+
+    def detect_encoding(self, head: bytes) -> str:
+        """
+        Detect encoding with UTF-8 → BOM → chardet → Latin-1 cascade.
+
+        Args:
+            head: Head buffer of the file
+
+        Returns:
+            Detected encoding name
+        """
+        # Try UTF-8 first (most common); a multi-byte character split by the
+        # end of the buffer is not an error
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+
+        # Check for UTF-8 BOM
+        if head.startswith(UTF8_BOM):
+            return "utf-8-sig"
+
+        # Use chardet if available
+        if CHARDET_AVAILABLE:
+            try:
+                detection = chardet.detect(head)
+                if detection["confidence"] > 0.7 and detection["encoding"]:
+                    return detection["encoding"].lower()
+            except Exception:
+                pass
+
+        # Fallback to Latin-1 (always works)
+        return "latin-1"
+
+    def detect_delimiter(self, head: bytes, encoding: str) -> str:
+        """
+        Detect delimiter using csv.Sniffer with candidate-count fallback.
+
+        Args:
+            head: Head buffer of the file
+            encoding: File encoding
+
+        Returns:
+            Detected delimiter (comma if nothing matches)
+        """
+        try:
+            sample = head.decode(encoding, errors="replace")[:DELIMITER_SAMPLE_CHARS]
+        except LookupError:
+            return ","
+
+        # Try csv.Sniffer
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=self.delimiters)
+            return dialect.delimiter
+        except csv.Error:
+            pass
+
+        # Fallback: count delimiter candidates
+        delimiter_counts = {candidate: sample.count(candidate) for candidate in self.delimiters}
+        max_delimiter = max(delimiter_counts, key=delimiter_counts.get)
+        if delimiter_counts[max_delimiter] > 0:
+            return max_delimiter
+
+        # Default to comma
+        return ","
+
+    def profile(self, rows: List[List[str]], has_header: Optional[bool] = None) -> TableProfile:
+        """
+        Profile the first parsed rows: header presence and column types.
+
+        Args:
+            rows: First parsed rows of the file
+            has_header: Configured header presence (default: detect)
+
+        Returns:
+            TableProfile from the column profiler
+        """
+        return self.profiler.profile(rows, has_header=has_header)
+
+    def detect_header(self, rows: List[List[str]]) -> bool:
+        """
+        Detect header presence from the first parsed rows.
+
+        Args:
+            rows: First parsed rows of the file (at least two for a positive result)
+
+        Returns:
+            True if header detected
+        """
+        return self.profiler.profile(rows).has_header
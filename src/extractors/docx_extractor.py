@@ -10,6 +10,7 @@ Current Scope:
 - Document metadata
 - Error handling
 - Tables (DOCX-TABLE-001) ✓
+- Streaming lxml backend over word/document.xml (default)
 
 Not Yet Implemented:
 - Images (DOCX-IMAGE-001)
@@ -23,11 +24,12 @@ import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 try:
     from docx import Document
     from docx.oxml.exceptions import InvalidXmlError
+    from docx.table import Table
 except ImportError:
     raise ImportError(
         "python-docx is required for DocxExtractor. " "Install with: pip install python-docx"
@@ -43,10 +45,14 @@ from core import (
     ContentType,
     DocumentMetadata,
     ExtractionResult,
+    ExtractionStreamItem,
     Position,
     TableMetadata,
+    collect_extraction_stream,
 )
 
+from .docx_xml import LXML_AVAILABLE, DocxParagraph, DocxXmlReader
+
 # Import infrastructure components
 try:
     from infrastructure import (
@@ -55,6 +61,7 @@ try:
         ProgressTracker,
         RecoveryAction,
         get_logger,
+        get_provenance_cache,
         timed,
         timer,
     )
@@ -101,6 +108,8 @@ class DocxExtractor(BaseExtractor):
                 - max_paragraph_length: Max characters per paragraph (default: None)
                 - skip_empty: Skip empty paragraphs (default: True)
                 - extract_styles: Include style information (default: True)
+                - backend: "lxml" (stream word/document.xml) or "python-docx"
+                  (full object model) (default: "lxml")
         """
         super().__init__(config if isinstance(config, dict) or config is None else {})
 
@@ -131,16 +140,23 @@ class DocxExtractor(BaseExtractor):
             self.skip_empty = skip_empty_val if skip_empty_val is not None else True
             extract_styles_val = extractor_config.get("extract_styles")
             self.extract_styles = extract_styles_val if extract_styles_val is not None else True
+            self.backend = extractor_config.get("backend") or "lxml"
         elif isinstance(config, dict):
             # Use dict config (backward compatibility)
             self.max_paragraph_length = config.get("max_paragraph_length", None)
             self.skip_empty = config.get("skip_empty", True)
             self.extract_styles = config.get("extract_styles", True)
+            self.backend = config.get("backend", "lxml")
         else:
             # Use defaults
             self.max_paragraph_length = None
             self.skip_empty = True
             self.extract_styles = True
+            self.backend = "lxml"
+
+        # Any other value (or a missing lxml) uses the python-docx object model
+        if self.backend != "lxml" or not LXML_AVAILABLE:
+            self.backend = "python-docx"
 
     def supports_format(self, file_path: Path) -> bool:
         """
@@ -162,26 +178,44 @@ class DocxExtractor(BaseExtractor):
         """Return human-readable format name."""
         return "Microsoft Word"
 
+    def supports_streaming(self) -> bool:
+        """Paragraph blocks are yielded as the document body is walked."""
+        return True
+
     def extract(self, file_path: Path) -> ExtractionResult:
         """
         Extract content from DOCX file.
 
+        Collects extract_stream() into a single result.
+
+        Args:
+            file_path: Path to DOCX file
+
+        Returns:
+            ExtractionResult with content blocks and metadata
+        """
+        return collect_extraction_stream(self.extract_stream(file_path))
+
+    def extract_stream(self, file_path: Path) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract content from DOCX file, yielding blocks as they are produced.
+
         Strategy:
         1. Validate file exists and is accessible
-        2. Open document with python-docx
-        3. Extract paragraphs sequentially
-        4. Detect content types (heading vs paragraph)
+        2. Open document (streaming lxml reader, or python-docx)
+        3. Extract paragraphs and tables in one body walk
+        4. Detect content types (heading vs paragraph) from style names
         5. Generate document metadata
-        6. Return structured result
+        6. Yield ExtractionResult trailer (tables, metadata, warnings)
 
         Args:
             file_path: Path to DOCX file
 
-        Returns:
-            ExtractionResult with content blocks and metadata
+        Yields:
+            ContentBlock per paragraph, then one ExtractionResult
 
         Note:
-            - Returns success=False for file-level errors
+            - Yields a success=False trailer for file-level errors
             - Returns partial results if some paragraphs fail
             - Logs warnings for recoverable issues
         """
@@ -195,7 +229,6 @@ class DocxExtractor(BaseExtractor):
 
         errors = []
         warnings = []
-        content_blocks = []
 
         # Step 1: Validate file
         is_valid, validation_errors = self.validate_file(file_path)
@@ -212,7 +245,7 @@ class DocxExtractor(BaseExtractor):
             else:
                 errors.extend(validation_errors)
 
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(errors),
                 document_metadata=DocumentMetadata(
@@ -220,13 +253,14 @@ class DocxExtractor(BaseExtractor):
                     file_format="docx",
                 ),
             )
+            return
 
         try:
             # Step 2: Open document
             try:
-                doc = Document(file_path)
+                doc = DocxXmlReader(file_path) if self.backend == "lxml" else Document(file_path)
             except Exception as e:
-                return ExtractionResult(
+                yield ExtractionResult(
                     success=False,
                     errors=(f"Failed to open DOCX file: {str(e)}",),
                     document_metadata=DocumentMetadata(
@@ -234,72 +268,81 @@ class DocxExtractor(BaseExtractor):
                         file_format="docx",
                     ),
                 )
+                return
 
-            # Step 3: Extract paragraphs
+            # Step 3: Extract paragraphs (and tables, in document order)
             paragraph_count = 0
-            for idx, paragraph in enumerate(doc.paragraphs):
-                # Get text content
-                text = paragraph.text.strip()
-
-                # Skip empty paragraphs if configured
-                if not text and self.skip_empty:
-                    continue
-
-                # Check length limit
-                if self.max_paragraph_length and len(text) > self.max_paragraph_length:
-                    warnings.append(
-                        f"Paragraph {idx} truncated from {len(text)} to "
-                        f"{self.max_paragraph_length} characters"
+            total_chars = 0
+            total_words = 0
+            tables = []
+            table_warnings = []
+            table_idx = 0
+            try:
+                for item in self._iter_body(doc):
+                    if isinstance(item, Table):
+                        try:
+                            tables.append(self._extract_table(item, table_idx))
+                        except Exception as e:
+                            table_warnings.append(f"Failed to extract table {table_idx}: {str(e)}")
+                        table_idx += 1
+                        continue
+
+                    paragraph_index, raw_text, style_name, block_type = item
+
+                    # Get text content
+                    text = raw_text.strip()
+
+                    # Skip empty paragraphs if configured
+                    if not text and self.skip_empty:
+                        continue
+
+                    # Check length limit
+                    if self.max_paragraph_length and len(text) > self.max_paragraph_length:
+                        warnings.append(
+                            f"Paragraph {paragraph_index} truncated from {len(text)} to "
+                            f"{self.max_paragraph_length} characters"
+                        )
+                        text = text[: self.max_paragraph_length] + "..."
+
+                    # Build metadata
+                    metadata = {
+                        "paragraph_index": paragraph_index,
+                        "char_count": len(text),
+                        "word_count": len(text.split()) if text else 0,
+                    }
+
+                    # Add style information if configured
+                    if self.extract_styles and style_name is not None:
+                        metadata["style_name"] = style_name
+
+                    # Create content block
+                    yield ContentBlock(
+                        block_type=block_type,
+                        content=text,
+                        raw_content=raw_text,  # Unstripped original
+                        position=Position(sequence_index=paragraph_count),
+                        confidence=1.0,  # High confidence for native format
+                        metadata=metadata,
                     )
-                    text = text[: self.max_paragraph_length] + "..."
-
-                # Step 4: Detect content type
-                block_type = self._detect_content_type(paragraph)
-
-                # Build metadata
-                metadata = {
-                    "paragraph_index": idx,
-                    "char_count": len(text),
-                    "word_count": len(text.split()) if text else 0,
-                }
-
-                # Add style information if configured
-                if self.extract_styles and paragraph.style:
-                    metadata["style_name"] = paragraph.style.name
-
-                # Create content block
-                block = ContentBlock(
-                    block_type=block_type,
-                    content=text,
-                    raw_content=paragraph.text,  # Unstripped original
-                    position=Position(sequence_index=paragraph_count),
-                    confidence=1.0,  # High confidence for native format
-                    metadata=metadata,
-                )
 
-                content_blocks.append(block)
-                paragraph_count += 1
+                    paragraph_count += 1
+                    total_chars += len(text)
+                    total_words += metadata["word_count"]
+            finally:
+                if isinstance(doc, DocxXmlReader):
+                    doc.close()
 
             # Check if we got any content
-            if not content_blocks:
+            if paragraph_count == 0:
                 warnings.append("No content extracted from document")
 
-            # Step 4.5: Extract tables
-            tables = []
-            for table_idx, table in enumerate(doc.tables):
-                try:
-                    table_metadata = self._extract_table(table, table_idx)
-                    tables.append(table_metadata)
-                except Exception as e:
-                    warnings.append(f"Failed to extract table {table_idx}: {str(e)}")
+            # Step 4.5: Table failures are reported after paragraph warnings
+            warnings.extend(table_warnings)
 
             # Step 5: Generate document metadata
             doc_metadata = self._extract_document_metadata(file_path, doc)
 
-            # Update statistics
-            total_chars = sum(len(b.content) for b in content_blocks)
-            total_words = sum(len(b.content.split()) for b in content_blocks)
-
+            # Update statistics (accumulated while streaming)
             doc_metadata = DocumentMetadata(
                 source_file=doc_metadata.source_file,
                 file_format=doc_metadata.file_format,
@@ -318,26 +361,26 @@ class DocxExtractor(BaseExtractor):
                 extractor_version="0.1.0-spike",
             )
 
-            # Step 6: Log completion and return result
+            # Step 6: Log completion and yield result trailer
             duration = time.time() - start_time
             if INFRASTRUCTURE_AVAILABLE:
                 self.logger.info(
                     "DOCX extraction complete",
                     extra={
                         "file": str(file_path),
-                        "blocks": len(content_blocks),
+                        "blocks": paragraph_count,
                         "words": total_words,
                         "duration_seconds": round(duration, 3),
                     },
                 )
 
-            return ExtractionResult(
-                content_blocks=tuple(content_blocks),
+            yield ExtractionResult(
                 document_metadata=doc_metadata,
                 tables=tuple(tables),
                 success=True,
                 warnings=tuple(warnings),
             )
+            return
 
         except InvalidXmlError as e:
             if self.error_handler:
@@ -379,8 +422,8 @@ class DocxExtractor(BaseExtractor):
                     "Extraction failed", extra={"file": str(file_path), "error": str(e)}
                 )
 
-        # Return failed result
-        return ExtractionResult(
+        # Yield failed result
+        yield ExtractionResult(
             success=False,
             errors=tuple(errors),
             warnings=tuple(warnings),
@@ -390,12 +433,54 @@ class DocxExtractor(BaseExtractor):
             ),
         )
 
+    def _iter_body(self, doc) -> Iterator[Union[tuple, Table]]:
+        """
+        Walk the document body with the configured backend.
+
+        Args:
+            doc: DocxXmlReader (lxml backend) or python-docx Document
+
+        Yields:
+            (paragraph_index, raw_text, style_name, block_type) per body
+            paragraph, and python-docx Table per body table. The lxml backend
+            yields both in document order; python-docx yields all paragraphs,
+            then all tables.
+        """
+        if isinstance(doc, DocxXmlReader):
+            # Style name and content type resolved once per style ID
+            style_info = {}
+            paragraph_index = 0
+            for item in doc.iter_body():
+                if not isinstance(item, DocxParagraph):
+                    yield item
+                    continue
+
+                info = style_info.get(item.style_id)
+                if info is None:
+                    style = doc.paragraph_style(item.style_id)
+                    style_name = style.name if style is not None else None
+                    info = (style_name, self._content_type_for_style(style_name))
+                    style_info[item.style_id] = info
+
+                yield (paragraph_index, item.text, *info)
+                paragraph_index += 1
+            return
+
+        for paragraph_index, paragraph in enumerate(doc.paragraphs):
+            style = paragraph.style
+            style_name = style.name if style is not None else None
+            yield (
+                paragraph_index,
+                paragraph.text,
+                style_name,
+                self._content_type_for_style(style_name),
+            )
+        yield from doc.tables
+
     def _detect_content_type(self, paragraph) -> ContentType:
         """
         Detect content type based on paragraph style.
 
-        Uses Word's built-in style names to classify content.
-
         Args:
             paragraph: python-docx Paragraph object
 
@@ -404,8 +489,24 @@ class DocxExtractor(BaseExtractor):
         """
         if not paragraph.style:
             return ContentType.PARAGRAPH
+        return self._content_type_for_style(paragraph.style.name)
 
-        style_name = paragraph.style.name.lower()
+    def _content_type_for_style(self, style_name: Optional[str]) -> ContentType:
+        """
+        Detect content type from a paragraph style name.
+
+        Uses Word's built-in style names to classify content.
+
+        Args:
+            style_name: Style name (None if the paragraph has no style)
+
+        Returns:
+            ContentType enum value
+        """
+        if not style_name:
+            return ContentType.PARAGRAPH
+
+        style_name = style_name.lower()
 
         # Check for heading styles
         if "heading" in style_name:
@@ -426,7 +527,7 @@ class DocxExtractor(BaseExtractor):
         # Default to paragraph
         return ContentType.PARAGRAPH
 
-    def _extract_document_metadata(self, file_path: Path, doc: Document) -> DocumentMetadata:
+    def _extract_document_metadata(self, file_path: Path, doc) -> DocumentMetadata:
         """
         Extract document-level metadata from DOCX file.
 
@@ -434,7 +535,7 @@ class DocxExtractor(BaseExtractor):
 
         Args:
             file_path: Path to file
-            doc: python-docx Document object
+            doc: python-docx Document or DocxXmlReader (anything with core_properties)
 
         Returns:
             DocumentMetadata with available properties
@@ -482,6 +583,9 @@ class DocxExtractor(BaseExtractor):
         Returns:
             Hex string of SHA256 hash
         """
+        if INFRASTRUCTURE_AVAILABLE:
+            return get_provenance_cache().file_hash(file_path)
+
         sha256 = hashlib.sha256()
 
         # Read in chunks to handle large files
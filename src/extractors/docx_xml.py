@@ -0,0 +1,264 @@
+"""
+DOCX XML Reader - Streaming Body Walk over word/document.xml
+
+DocxExtractor's python-docx backend builds the whole document object model
+and resolves each paragraph's style through the style hierarchy. DocxXmlReader
+instead streams the main document part out of the zip with lxml iterparse
+and hands back body-level paragraphs and tables in document order, releasing
+each one once it has been read.
+
+Paragraph text, style lookup, table cells and core properties follow
+python-docx exactly:
+- Paragraph text joins the direct runs and hyperlink runs (w:t, tabs, breaks)
+- Style IDs resolve like Paragraph.style (unknown or missing → default style),
+  once per distinct ID
+- Tables are handed to python-docx as detached Table objects, so merged
+  cells read the same way
+- Core properties are parsed from docProps/core.xml with python-docx
+
+Example:
+    >>> with DocxXmlReader(Path("report.docx")) as reader:
+    ...     for item in reader.iter_body():
+    ...         if isinstance(item, DocxParagraph):
+    ...             print(reader.paragraph_style(item.style_id).name, item.text)
+"""
+
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional, Union
+
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.coreprops import CoreProperties
+from docx.opc.parts.coreprops import CorePropertiesPart
+from docx.oxml import parse_xml
+from docx.parts.styles import StylesPart
+from docx.styles.style import BaseStyle
+from docx.styles.styles import Styles
+from docx.table import Table
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+W_BODY = f"{_W}body"
+W_P = f"{_W}p"
+W_TBL = f"{_W}tbl"
+W_R = f"{_W}r"
+W_HYPERLINK = f"{_W}hyperlink"
+W_PPR = f"{_W}pPr"
+W_PSTYLE = f"{_W}pStyle"
+W_VAL = f"{_W}val"
+W_TYPE = f"{_W}type"
+
+# Text equivalents of run content elements (as in python-docx CT_R.text);
+# w:t and w:br are handled separately
+_RUN_CHARS = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+
+
+class DocxParagraph(NamedTuple):
+    """A body-level paragraph read from the document part."""
+
+    text: str
+    style_id: Optional[str]
+
+
+def _run_text(run) -> str:
+    """Text of a w:r element, matching python-docx CT_R.text."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W_BR:
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            char = _RUN_CHARS.get(tag)
+            if char:
+                parts.append(char)
+    return "".join(parts)
+
+
+def paragraph_text(p) -> str:
+    """
+    Text of a w:p element, matching python-docx Paragraph.text.
+
+    Args:
+        p: lxml w:p element
+
+    Returns:
+        Text of the direct runs and hyperlink runs
+    """
+    parts = []
+    for child in p:
+        if child.tag == W_R:
+            parts.append(_run_text(child))
+        elif child.tag == W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterchildren(W_R))
+    return "".join(parts)
+
+
+def paragraph_style_id(p) -> Optional[str]:
+    """Return the w:pStyle ID of a w:p element, or None."""
+    ppr = p.find(W_PPR)
+    if ppr is None:
+        return None
+    pstyle = ppr.find(W_PSTYLE)
+    return pstyle.get(W_VAL) if pstyle is not None else None
+
+
+class DocxXmlReader:
+    """
+    Streaming reader for the main document part of a DOCX package.
+
+    Attributes:
+        file_path: Path to the DOCX file
+        core_properties: python-docx CoreProperties of the package
+
+    Note:
+        Not thread-safe. Use as a context manager, or call close().
+    """
+
+    def __init__(self, file_path: Path):
+        """
+        Open a DOCX package and load its styles and core properties.
+
+        Args:
+            file_path: Path to DOCX file
+
+        Raises:
+            ImportError: If lxml is not installed
+            zipfile.BadZipFile: If the file is not a zip package
+            KeyError: If the package has no main document part
+            Exception: XML parse errors in the package parts
+        """
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml library not available")
+
+        self.file_path = file_path
+        self._zip = zipfile.ZipFile(file_path)
+        try:
+            package_rels = self._read_rels("")
+            self.document_part = package_rels[RT.OFFICE_DOCUMENT]
+            self._zip.getinfo(self.document_part)
+
+            document_rels = self._read_rels(self.document_part)
+            styles_part = document_rels.get(RT.STYLES)
+            styles_xml = (
+                self._zip.read(styles_part)
+                if styles_part and styles_part in self._zip.NameToInfo
+                else StylesPart._default_styles_xml()
+            )
+            self._styles = Styles(parse_xml(styles_xml))
+
+            core_part = package_rels.get(RT.CORE_PROPERTIES)
+            if core_part and core_part in self._zip.NameToInfo:
+                self.core_properties = CoreProperties(parse_xml(self._zip.read(core_part)))
+            else:
+                self.core_properties = CorePropertiesPart.default(None).core_properties
+        except BaseException:
+            self._zip.close()
+            raise
+
+        self._paragraph_styles: Dict[Optional[str], Optional[BaseStyle]] = {}
+
+    def __enter__(self) -> "DocxXmlReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _read_rels(self, source_part: str) -> Dict[str, str]:
+        """
+        Map relationship types of a part to target part names.
+
+        Args:
+            source_part: Part name ("" for the package itself)
+
+        Returns:
+            Dict of relationship type to zip member name (first internal target)
+        """
+        base_dir, name = posixpath.split(source_part)
+        rels_name = posixpath.join(base_dir, "_rels", f"{name}.rels")
+        if rels_name not in self._zip.NameToInfo:
+            return {}
+
+        root = etree.fromstring(self._zip.read(rels_name), etree.XMLParser(resolve_entities=False))
+        targets = {}
+        for rel in root.iterchildren(f"{_REL}Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                part = target.lstrip("/")
+            else:
+                part = posixpath.normpath(posixpath.join(base_dir, target))
+            targets.setdefault(rel.get("Type"), part)
+        return targets
+
+    def paragraph_style(self, style_id: Optional[str]) -> Optional[BaseStyle]:
+        """
+        Resolve a paragraph style ID the way Paragraph.style does.
+
+        Unknown, missing or non-paragraph style IDs resolve to the default
+        paragraph style. Each ID is resolved once.
+
+        Args:
+            style_id: w:pStyle value (None for no explicit style)
+
+        Returns:
+            python-docx style, or None if the document has no default paragraph style
+        """
+        if style_id not in self._paragraph_styles:
+            self._paragraph_styles[style_id] = self._styles.get_by_id(
+                style_id, WD_STYLE_TYPE.PARAGRAPH
+            )
+        return self._paragraph_styles[style_id]
+
+    def iter_body(self) -> Iterator[Union[DocxParagraph, Table]]:
+        """
+        Stream body-level paragraphs and tables in document order.
+
+        Each element is released after it is yielded, so memory stays
+        proportional to the largest paragraph or table, not the document.
+
+        Yields:
+            DocxParagraph for each w:p, detached python-docx Table for each w:tbl
+        """
+        with self._zip.open(self.document_part) as stream:
+            for _, elem in etree.iterparse(
+                stream, events=("end",), tag=(W_P, W_TBL), resolve_entities=False
+            ):
+                parent = elem.getparent()
+                if parent is None or parent.tag != W_BODY:
+                    # Paragraphs inside tables are read with their table
+                    continue
+
+                if elem.tag == W_P:
+                    yield DocxParagraph(paragraph_text(elem), paragraph_style_id(elem))
+                else:
+                    yield Table(parse_xml(etree.tostring(elem)), None)
+
+                # Release this element and everything before it in the body
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._zip.close()
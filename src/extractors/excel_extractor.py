@@ -4,6 +4,8 @@ Excel Extractor - Microsoft Excel Workbook Extraction
 Extracts content from Excel workbooks (.xlsx, .xls) with support for:
 - Multi-sheet workbooks
 - Cell values and formulas
+- Read-only streaming of large sheets (formulas and values paired per row)
+- Optional sheet-parallel extraction across a process pool
 - Table structure preservation
 - Chart metadata extraction
 - Cross-sheet references
@@ -13,14 +15,17 @@ Implementation follows strict TDD methodology with infrastructure integration.
 
 import hashlib
 import logging
+import os
 import time
 import warnings as warnings_module
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 try:
     from openpyxl import load_workbook
+    from openpyxl.utils import get_column_letter
     from openpyxl.utils.exceptions import InvalidFileException
 except ImportError:
     raise ImportError(
@@ -38,9 +43,12 @@ from core import (
     DocumentMetadata,
     ExtractionResult,
     Position,
+    SparseCellsBuilder,
     TableMetadata,
 )
 
+from .column_profiler import ColumnProfiler
+
 # Import infrastructure components
 try:
     from infrastructure import (
@@ -49,6 +57,7 @@ try:
         ProgressTracker,
         RecoveryAction,
         get_logger,
+        get_provenance_cache,
     )
 
     INFRASTRUCTURE_AVAILABLE = True
@@ -56,6 +65,78 @@ except ImportError:
     INFRASTRUCTURE_AVAILABLE = False
 
 
+def _open_workbooks(file_path: Path, read_only: bool, include_formulas: bool) -> tuple:
+    """
+    Open the formula view of a workbook and, if wanted, its cached-value view.
+
+    Args:
+        file_path: Path to Excel file
+        read_only: Open with openpyxl read-only (streaming) mode
+        include_formulas: Also open a data_only view for calculated values
+
+    Returns:
+        Tuple of (formula workbook, value workbook or None)
+
+    Raises:
+        InvalidFileException: If the file is not a valid workbook
+    """
+    # Suppress openpyxl UserWarning about workbook default style
+    # This warning appears for some Excel files but doesn't affect extraction
+    with warnings_module.catch_warnings():
+        warnings_module.filterwarnings("ignore", message="Workbook contains no default style")
+
+        # Load with data_only=False to get formulas, then open a data_only=True
+        # view for cached values. In read-only mode both loads only parse the
+        # workbook part; sheet XML is streamed row by row during extraction.
+        wb = load_workbook(file_path, read_only=read_only, data_only=False)
+        wb_values = None
+        if include_formulas:
+            try:
+                wb_values = load_workbook(file_path, read_only=read_only, data_only=True)
+            except:
+                pass  # If we can't load values, use formulas only
+
+    return wb, wb_values
+
+
+def _extract_sheet_subset(
+    file_path: str, config: dict, sheet_indices: List[int]
+) -> List[tuple[int, list[ContentBlock], Optional[TableMetadata]]]:
+    """
+    Extract a subset of sheets in a worker process.
+
+    Each worker opens its own read-only workbook, so no parser state crosses
+    process boundaries. Defined at module level so it can be pickled by the
+    pool.
+
+    Args:
+        file_path: Path to Excel file (as string for cheap pickling)
+        config: Extractor settings (plain dict)
+        sheet_indices: Workbook positions of the sheets to extract (0-indexed)
+
+    Returns:
+        List of (sheet_index, content_blocks, table_metadata) tuples
+    """
+    extractor = ExcelExtractor({**config, "read_only": True, "parallel_sheets": False})
+    wb, wb_values = _open_workbooks(Path(file_path), True, extractor.include_formulas)
+
+    try:
+        sheet_names = wb.sheetnames
+        results = []
+        for sheet_index in sheet_indices:
+            sheet_name = sheet_names[sheet_index]
+            ws_values = wb_values[sheet_name] if wb_values else None
+            blocks, table = extractor._extract_sheet(
+                wb[sheet_name], sheet_name, sheet_index, ws_values
+            )
+            results.append((sheet_index, blocks, table))
+        return results
+    finally:
+        wb.close()
+        if wb_values is not None:
+            wb_values.close()
+
+
 class ExcelExtractor(BaseExtractor):
     """
     Extracts content from Microsoft Excel workbooks.
@@ -89,6 +170,13 @@ class ExcelExtractor(BaseExtractor):
                 - include_formulas: Extract formula strings (default: True)
                 - include_charts: Extract chart metadata (default: True)
                 - skip_empty_cells: Skip empty cells (default: False)
+                - read_only: Stream sheets with openpyxl read-only mode (default: True)
+                - parallel_sheets: Extract sheets across a process pool
+                  (default: False)
+                - max_sheet_workers: Worker processes for sheet-parallel
+                  extraction (default: None = CPU count)
+                - parallel_min_sheets: Minimum sheet count before the pool is
+                  used (default: 4)
         """
         super().__init__(config if isinstance(config, dict) or config is None else {})
 
@@ -122,6 +210,13 @@ class ExcelExtractor(BaseExtractor):
             self.include_charts = include_charts_val if include_charts_val is not None else True
             skip_empty_val = extractor_config.get("skip_empty_cells")
             self.skip_empty_cells = skip_empty_val if skip_empty_val is not None else False
+            read_only_val = extractor_config.get("read_only")
+            self.read_only = read_only_val if read_only_val is not None else True
+            parallel_sheets_val = extractor_config.get("parallel_sheets")
+            self.parallel_sheets = parallel_sheets_val if parallel_sheets_val is not None else False
+            self.max_sheet_workers = extractor_config.get("max_sheet_workers")
+            parallel_min_val = extractor_config.get("parallel_min_sheets")
+            self.parallel_min_sheets = parallel_min_val if parallel_min_val is not None else 4
         elif isinstance(config, dict):
             # From dict (backward compatible)
             self.max_rows = config.get("max_rows", None)
@@ -129,6 +224,10 @@ class ExcelExtractor(BaseExtractor):
             self.include_formulas = config.get("include_formulas", True)
             self.include_charts = config.get("include_charts", True)
             self.skip_empty_cells = config.get("skip_empty_cells", False)
+            self.read_only = config.get("read_only", True)
+            self.parallel_sheets = config.get("parallel_sheets", False)
+            self.max_sheet_workers = config.get("max_sheet_workers", None)
+            self.parallel_min_sheets = config.get("parallel_min_sheets", 4)
         else:
             # Defaults
             self.max_rows = None
@@ -136,6 +235,13 @@ class ExcelExtractor(BaseExtractor):
             self.include_formulas = True
             self.include_charts = True
             self.skip_empty_cells = False
+            self.read_only = True
+            self.parallel_sheets = False
+            self.max_sheet_workers = None
+            self.parallel_min_sheets = 4
+
+        # Column type inference over the first rows of each sheet
+        self._profiler = ColumnProfiler()
 
     def supports_format(self, file_path: Path) -> bool:
         """
@@ -163,8 +269,8 @@ class ExcelExtractor(BaseExtractor):
 
         Strategy:
         1. Validate file exists and is accessible
-        2. Open workbook with openpyxl
-        3. Extract each sheet sequentially
+        2. Open workbook with openpyxl (read-only unless disabled)
+        3. Extract each sheet sequentially in one row walk
         4. Create TableMetadata for each sheet
         5. Extract cell values and formulas
         6. Detect charts if enabled
@@ -208,25 +314,12 @@ class ExcelExtractor(BaseExtractor):
                 ),
             )
 
+        wb = None
+        wb_values = None
         try:
             # Step 2: Open workbook
             try:
-                # Suppress openpyxl UserWarning about workbook default style
-                # This warning appears for some Excel files but doesn't affect extraction
-                with warnings_module.catch_warnings():
-                    warnings_module.filterwarnings(
-                        "ignore", message="Workbook contains no default style"
-                    )
-
-                    # Load with data_only=False to get formulas, then reload with data_only=True for values
-                    wb = load_workbook(file_path, data_only=False)
-                    # Keep reference to formula workbook
-                    wb_values = None
-                    if self.include_formulas:
-                        try:
-                            wb_values = load_workbook(file_path, data_only=True)
-                        except:
-                            pass  # If we can't load values, use formulas only
+                wb, wb_values = _open_workbooks(file_path, self.read_only, self.include_formulas)
             except InvalidFileException as e:
                 if self.error_handler:
                     error = self.error_handler.create_error(
@@ -254,23 +347,18 @@ class ExcelExtractor(BaseExtractor):
                     ),
                 )
 
-            # Step 3: Extract all sheets
-            sheet_count = 0
-            for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                ws_values = wb_values[sheet_name] if wb_values else None
-
-                # Extract sheet content
-                sheet_blocks, sheet_table = self._extract_sheet(
-                    ws, sheet_name, sheet_count, ws_values
-                )
+            # Step 3: Extract all sheets (in workbook order)
+            sheet_count = len(wb.sheetnames)
+            if self._should_parallelize(sheet_count):
+                sheet_results = self._extract_sheets_parallel(file_path, wb, wb_values)
+            else:
+                sheet_results = self._extract_sheets(wb, wb_values)
 
+            for sheet_blocks, sheet_table in sheet_results:
                 content_blocks.extend(sheet_blocks)
                 if sheet_table:
                     tables.append(sheet_table)
 
-                sheet_count += 1
-
             # Step 4: Generate document metadata
             doc_metadata = self._extract_document_metadata(file_path, wb)
 
@@ -337,6 +425,12 @@ class ExcelExtractor(BaseExtractor):
                     "Extraction failed", extra={"file": str(file_path), "error": str(e)}
                 )
 
+        finally:
+            # Read-only workbooks keep the archive open until closed
+            for workbook in (wb, wb_values):
+                if workbook is not None and self.read_only:
+                    workbook.close()
+
         # Return failed result
         return ExtractionResult(
             success=False,
@@ -348,6 +442,106 @@ class ExcelExtractor(BaseExtractor):
             ),
         )
 
+    def _extract_sheets(
+        self, wb, wb_values=None
+    ) -> List[tuple[list[ContentBlock], Optional[TableMetadata]]]:
+        """
+        Extract every sheet serially from already-open workbooks.
+
+        Args:
+            wb: openpyxl Workbook (with formulas)
+            wb_values: Optional Workbook with calculated values
+
+        Returns:
+            List of (content_blocks, table_metadata) in sheet order
+        """
+        results = []
+        for sheet_index, sheet_name in enumerate(wb.sheetnames):
+            ws_values = wb_values[sheet_name] if wb_values else None
+            results.append(self._extract_sheet(wb[sheet_name], sheet_name, sheet_index, ws_values))
+        return results
+
+    def _should_parallelize(self, sheet_count: int) -> bool:
+        """
+        Decide whether sheets should be extracted across a process pool.
+
+        Args:
+            sheet_count: Number of sheets in the workbook
+
+        Returns:
+            True if sheet-parallel extraction is enabled and worthwhile
+        """
+        if not self.parallel_sheets:
+            return False
+        return sheet_count >= max(self.parallel_min_sheets, 2) and self._sheet_worker_count() > 1
+
+    def _sheet_worker_count(self) -> int:
+        """Return the number of worker processes to use for sheet extraction."""
+        return max(1, self.max_sheet_workers or os.cpu_count() or 1)
+
+    def _worker_config(self) -> dict:
+        """Return the settings a worker process needs to extract sheets."""
+        return {
+            "max_rows": self.max_rows,
+            "max_columns": self.max_columns,
+            "include_formulas": self.include_formulas,
+            "include_charts": self.include_charts,
+            "skip_empty_cells": self.skip_empty_cells,
+        }
+
+    def _extract_sheets_parallel(
+        self, file_path: Path, wb, wb_values=None
+    ) -> List[tuple[list[ContentBlock], Optional[TableMetadata]]]:
+        """
+        Extract sheets with the workbook split across a process pool.
+
+        Sheets are dealt round-robin to one task per worker, so each worker
+        opens the file (read-only) once and similar-sized sheets spread
+        evenly. Results are merged back in sheet order, keeping sheet_index
+        and sequence_index deterministic. If the pool cannot be used (e.g.,
+        restricted environment), falls back to serial extraction with the
+        already-open workbooks.
+
+        Args:
+            file_path: Path to Excel file
+            wb: Open formula Workbook used for fallback
+            wb_values: Optional open value Workbook used for fallback
+
+        Returns:
+            List of (content_blocks, table_metadata) in sheet order
+        """
+        sheet_count = len(wb.sheetnames)
+        workers = min(self._sheet_worker_count(), sheet_count)
+        subsets = [list(range(start, sheet_count, workers)) for start in range(workers)]
+
+        if INFRASTRUCTURE_AVAILABLE:
+            self.logger.info(
+                "Extracting Excel sheets in parallel",
+                extra={"file": str(file_path), "sheets": sheet_count, "workers": workers},
+            )
+
+        try:
+            config = self._worker_config()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_extract_sheet_subset, str(file_path), config, subset)
+                    for subset in subsets
+                ]
+                by_index = {}
+                for future in futures:
+                    for sheet_index, blocks, table in future.result():
+                        by_index[sheet_index] = (blocks, table)
+
+        except Exception as e:
+            if INFRASTRUCTURE_AVAILABLE:
+                self.logger.warning(
+                    "Parallel sheet extraction failed, falling back to serial",
+                    extra={"file": str(file_path), "error": str(e)},
+                )
+            return self._extract_sheets(wb, wb_values)
+
+        return [by_index[sheet_index] for sheet_index in range(sheet_count)]
+
     def _extract_sheet(
         self, worksheet, sheet_name: str, sheet_index: int, worksheet_values=None
     ) -> tuple[list[ContentBlock], Optional[TableMetadata]]:
@@ -365,29 +559,50 @@ class ExcelExtractor(BaseExtractor):
         """
         content_blocks = []
 
-        # Get sheet dimensions
-        max_row = worksheet.max_row
-        max_col = worksheet.max_column
-
-        # Apply limits if configured
-        if self.max_rows:
-            max_row = min(max_row, self.max_rows)
-        if self.max_columns:
-            max_col = min(max_col, self.max_columns)
-
-        # Extract cell data
-        cells_data = []
+        if self.read_only:
+            # The dimension record stored in the file is often stale, so measure
+            # the sheet from the cells the row walk actually sees. Its width is
+            # kept only to size sheets cut short by max_rows (see below).
+            declared_width = worksheet.max_column or 0
+            worksheet.reset_dimensions()
+            if worksheet_values:
+                worksheet_values.reset_dimensions()
+            max_row = self.max_rows or None
+            max_col = None
+        else:
+            # Get sheet dimensions
+            max_row = worksheet.max_row
+            max_col = worksheet.max_column
+
+            # Apply limits if configured
+            if self.max_rows:
+                max_row = min(max_row, self.max_rows)
+            if self.max_columns:
+                max_col = min(max_col, self.max_columns)
+
+        # Extract cell data in one synchronized walk over the formula sheet and
+        # the cached-value sheet, so only the current row of each is in memory.
+        # Rows go straight into sparse storage (non-empty cells, interned values).
+        cells = SparseCellsBuilder()
         formulas = {}
         has_formulas = False
 
-        for row_idx in range(1, max_row + 1):
-            row_data = []
-            for col_idx in range(1, max_col + 1):
-                cell = worksheet.cell(row_idx, col_idx)
+        formula_rows = worksheet.iter_rows(max_row=max_row, max_col=max_col)
+        value_rows = (
+            worksheet_values.iter_rows(max_row=max_row, max_col=max_col, values_only=True)
+            if worksheet_values
+            else None
+        )
 
+        for row_idx, row_cells in enumerate(formula_rows, start=1):
+            row_values = next(value_rows, None) if value_rows is not None else None
+            if self.max_columns:
+                row_cells = row_cells[: self.max_columns]
+            row_data = []
+            for col_idx, cell in enumerate(row_cells, start=1):
                 # Get cell value - prefer calculated value if available
-                if worksheet_values:
-                    cell_value = worksheet_values.cell(row_idx, col_idx).value
+                if row_values is not None:
+                    cell_value = row_values[col_idx - 1] if col_idx <= len(row_values) else None
                 else:
                     cell_value = cell.value
 
@@ -397,7 +612,7 @@ class ExcelExtractor(BaseExtractor):
                 row_data.append(str(cell_value))
 
                 # Extract formula if present and enabled
-                if self.include_formulas and hasattr(cell, "data_type") and cell.data_type == "f":
+                if self.include_formulas and getattr(cell, "data_type", None) == "f":
                     try:
                         formula_value = (
                             cell.value
@@ -405,21 +620,43 @@ class ExcelExtractor(BaseExtractor):
                             else None
                         )
                         if formula_value:
-                            cell_ref = f"{chr(64 + col_idx)}{row_idx}"
+                            cell_ref = f"{get_column_letter(col_idx)}{row_idx}"
                             formulas[cell_ref] = formula_value
                             has_formulas = True
                     except:
                         pass  # Ignore formula extraction errors
 
-            cells_data.append(tuple(row_data))
+            cells.add_row(row_data)
+
+        # Read-only rows end at their last stored cell, so the grid is sized from
+        # the walk (an empty sheet is one empty cell, as in a full load)
+        if self.read_only:
+            width = cells.width
+            if self.max_rows and cells.num_rows >= self.max_rows:
+                # A full load sizes the grid from the whole sheet. Rows past the
+                # limit are never parsed, so take their width from the declared
+                # dimension instead; unlike a full load, a stale or missing
+                # record only sizes the grid from the rows read.
+                width = max(width, declared_width)
+                if self.max_columns:
+                    width = min(width, self.max_columns)
+            max_row = max(cells.num_rows, 1)
+            max_col = max(width, 1)
+            while cells.num_rows < max_row:
+                cells.add_row(())
+        cells_data = cells.build(max_col)
 
         # Create TableMetadata
         table_metadata = TableMetadata(
             num_rows=max_row,
             num_columns=max_col,
             has_header=max_row > 0,  # Assume first row is header if data exists
-            header_row=tuple(cells_data[0]) if cells_data else None,
-            cells=tuple(cells_data),
+            header_row=cells_data[0] if cells_data else None,
+            cells=cells_data,
+            # Profile the finished grid so read-only rows are full-width, as on a full load
+            column_types=self._profiler.profile(cells_data, has_header=max_row > 0).types_for(
+                max_col
+            ),
         )
 
         # Create ContentBlock for sheet
@@ -428,6 +665,7 @@ class ExcelExtractor(BaseExtractor):
             "sheet_index": sheet_index,
             "num_rows": max_row,
             "num_columns": max_col,
+            "column_types": list(table_metadata.column_types),
             "table_id": table_metadata.table_id,
         }
 
@@ -502,6 +740,9 @@ class ExcelExtractor(BaseExtractor):
         Returns:
             Hex string of SHA256 hash
         """
+        if INFRASTRUCTURE_AVAILABLE:
+            return get_provenance_cache().file_hash(file_path)
+
         sha256 = hashlib.sha256()
 
         with open(file_path, "rb") as f:
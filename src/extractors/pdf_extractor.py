@@ -20,10 +20,15 @@ Performance Targets:
 
 import hashlib
 import logging
+import os
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 try:
     import pypdf
@@ -61,11 +66,15 @@ from core import (
     ContentType,
     DocumentMetadata,
     ExtractionResult,
+    ExtractionStreamItem,
     ImageMetadata,
     Position,
     TableMetadata,
+    collect_extraction_stream,
 )
 
+from .pdf_session import PdfDocumentSession, get_page_image_xobjects
+
 # Import infrastructure components
 try:
     from infrastructure import (
@@ -73,6 +82,8 @@ try:
         ErrorHandler,
         ProgressTracker,
         get_logger,
+        get_ocr_cache,
+        get_provenance_cache,
     )
 
     INFRASTRUCTURE_AVAILABLE = True
@@ -80,6 +91,36 @@ except ImportError:
     INFRASTRUCTURE_AVAILABLE = False
 
 
+def _extract_page_range_text(
+    file_path: str, start: int, stop: int
+) -> List[tuple[int, Optional[str], Optional[str]]]:
+    """
+    Extract native text for a contiguous page range in a worker process.
+
+    Each worker opens its own PdfReader so no parser state crosses process
+    boundaries. Defined at module level so it can be pickled by the pool.
+
+    Args:
+        file_path: Path to PDF file (as string for cheap pickling)
+        start: First page index (0-indexed, inclusive)
+        stop: Last page index (0-indexed, exclusive)
+
+    Returns:
+        List of (page_num, text, error) tuples with 1-indexed page numbers
+    """
+    reader = PdfReader(file_path)
+    results = []
+
+    for page_index in range(start, stop):
+        try:
+            text = reader.pages[page_index].extract_text()
+            results.append((page_index + 1, text, None))
+        except Exception as e:
+            results.append((page_index + 1, None, str(e)))
+
+    return results
+
+
 class PdfExtractor(BaseExtractor):
     """
     Extracts content from PDF files.
@@ -108,7 +149,30 @@ class PdfExtractor(BaseExtractor):
                 - ocr_lang: Language for OCR (default: "eng")
                 - extract_images: Extract image metadata (default: True)
                 - extract_tables: Extract table structures (default: True)
+                - table_prefilter: Skip pdfplumber table detection on pages
+                  without ruling lines (default: True)
                 - min_text_threshold: Min chars to consider native text (default: 10)
+                - parallel_pages: Shard native text extraction across a process
+                  pool (default: False)
+                - max_page_workers: Worker processes for page sharding
+                  (default: None = CPU count)
+                - parallel_min_pages: Minimum page count before sharding is
+                  used (default: 16)
+                - ocr_window_size: Pages rasterized per pdf2image call during
+                  OCR (default: 2)
+                - ocr_workers: Concurrent tesseract workers
+                  (default: None = CPU count, capped at 4)
+                - ocr_min_image_coverage: Fraction of a page that images must
+                  cover before a page without a text layer is OCRed
+                  (default: 0.5)
+                - ocr_cache_dir: Directory for the persistent OCR result cache
+                  (default: None = caching disabled)
+                - ocr_cache_max_mb: Size limit for the OCR cache (default: 500)
+                - ocr_adaptive_dpi: OCR at ocr_low_dpi first and re-render at
+                  ocr_dpi only low-confidence pages (default: False)
+                - ocr_low_dpi: First-pass DPI for adaptive OCR (default: 150)
+                - ocr_escalation_threshold: Mean page confidence (0.0-1.0) below
+                  which adaptive OCR re-renders at ocr_dpi (default: 0.8)
         """
         super().__init__(config if isinstance(config, dict) or config is None else {})
 
@@ -138,7 +202,19 @@ class PdfExtractor(BaseExtractor):
             self.ocr_lang = cfg.get("ocr_lang", "eng")
             self.extract_images = self._get_config_value(cfg, "extract_images", True)
             self.extract_tables = self._get_config_value(cfg, "extract_tables", True)
+            self.table_prefilter = self._get_config_value(cfg, "table_prefilter", True)
             self.min_text_threshold = cfg.get("min_text_threshold", 10)
+            self.parallel_pages = self._get_config_value(cfg, "parallel_pages", False)
+            self.max_page_workers = cfg.get("max_page_workers", None)
+            self.parallel_min_pages = cfg.get("parallel_min_pages", 16)
+            self.ocr_window_size = cfg.get("ocr_window_size", 2)
+            self.ocr_workers = cfg.get("ocr_workers", None)
+            self.ocr_min_image_coverage = cfg.get("ocr_min_image_coverage", 0.5)
+            self.ocr_cache_dir = cfg.get("ocr_cache_dir", None)
+            self.ocr_cache_max_mb = cfg.get("ocr_cache_max_mb", 500)
+            self.ocr_adaptive_dpi = cfg.get("ocr_adaptive_dpi", False)
+            self.ocr_low_dpi = cfg.get("ocr_low_dpi", 150)
+            self.ocr_escalation_threshold = cfg.get("ocr_escalation_threshold", 0.8)
         elif isinstance(config, dict):
             self.use_ocr = config.get("use_ocr", True)
             self.tesseract_cmd = config.get("tesseract_cmd", None)
@@ -147,7 +223,19 @@ class PdfExtractor(BaseExtractor):
             self.ocr_lang = config.get("ocr_lang", "eng")
             self.extract_images = config.get("extract_images", True)
             self.extract_tables = config.get("extract_tables", True)
+            self.table_prefilter = config.get("table_prefilter", True)
             self.min_text_threshold = config.get("min_text_threshold", 10)
+            self.parallel_pages = config.get("parallel_pages", False)
+            self.max_page_workers = config.get("max_page_workers", None)
+            self.parallel_min_pages = config.get("parallel_min_pages", 16)
+            self.ocr_window_size = config.get("ocr_window_size", 2)
+            self.ocr_workers = config.get("ocr_workers", None)
+            self.ocr_min_image_coverage = config.get("ocr_min_image_coverage", 0.5)
+            self.ocr_cache_dir = config.get("ocr_cache_dir", None)
+            self.ocr_cache_max_mb = config.get("ocr_cache_max_mb", 500)
+            self.ocr_adaptive_dpi = config.get("ocr_adaptive_dpi", False)
+            self.ocr_low_dpi = config.get("ocr_low_dpi", 150)
+            self.ocr_escalation_threshold = config.get("ocr_escalation_threshold", 0.8)
         else:
             self.use_ocr = True
             self.tesseract_cmd = None
@@ -156,7 +244,34 @@ class PdfExtractor(BaseExtractor):
             self.ocr_lang = "eng"
             self.extract_images = True
             self.extract_tables = True
+            self.table_prefilter = True
             self.min_text_threshold = 10
+            self.parallel_pages = False
+            self.max_page_workers = None
+            self.parallel_min_pages = 16
+            self.ocr_window_size = 2
+            self.ocr_workers = None
+            self.ocr_min_image_coverage = 0.5
+            self.ocr_cache_dir = None
+            self.ocr_cache_max_mb = 500
+            self.ocr_adaptive_dpi = False
+            self.ocr_low_dpi = 150
+            self.ocr_escalation_threshold = 0.8
+
+        # Cumulative table prefilter counters (see get_table_prefilter_stats)
+        self._table_stats_lock = threading.Lock()
+        self._table_stats = {"pages_scanned": 0, "pages_skipped": 0, "pages_extracted": 0}
+
+        # Persistent OCR result cache (shared per directory within a process)
+        self.ocr_cache = None
+        if self.ocr_cache_dir and INFRASTRUCTURE_AVAILABLE:
+            try:
+                self.ocr_cache = get_ocr_cache(self.ocr_cache_dir, self.ocr_cache_max_mb)
+            except Exception as e:
+                self.logger.warning(
+                    "OCR cache unavailable, continuing without it",
+                    extra={"cache_dir": str(self.ocr_cache_dir), "error": str(e)},
+                )
 
         # Configure pytesseract if custom path provided
         if self.tesseract_cmd and TESSERACT_AVAILABLE:
@@ -189,29 +304,52 @@ class PdfExtractor(BaseExtractor):
         """Return human-readable format name."""
         return "PDF"
 
+    def supports_streaming(self) -> bool:
+        """Page blocks are yielded as pages are extracted (or OCRed)."""
+        return True
+
     def extract(self, file_path: Path) -> ExtractionResult:
         """
         Extract content from PDF file.
 
+        Collects extract_stream() into a single result.
+
+        Args:
+            file_path: Path to PDF file
+
+        Returns:
+            ExtractionResult with content blocks and metadata
+        """
+        return collect_extraction_stream(self.extract_stream(file_path))
+
+    def extract_stream(self, file_path: Path) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract content from PDF file, yielding blocks page by page.
+
         Strategy:
         1. Validate file exists and is accessible
         2. Try native text extraction with pypdf
-        3. If text is minimal, fall back to OCR
+        3. OCR pages without a text layer that are mostly images (per page)
         4. Extract tables if configured
         5. Extract image metadata if configured
         6. Generate document metadata
-        7. Return structured result
+        7. Yield ExtractionResult trailer
+
+        Native pages are yielded as soon as their text is extracted. Pages
+        routed to OCR are recognized in batches (window size x OCR workers);
+        native pages that follow a pending OCR page are held until that batch
+        completes, so blocks are always yielded in page order.
 
         Args:
             file_path: Path to PDF file
 
-        Returns:
-            ExtractionResult with content blocks and metadata
+        Yields:
+            ContentBlocks in page order, then one ExtractionResult
 
         Note:
-            - Returns success=False for file-level errors
+            - Yields a success=False trailer for file-level errors
             - Returns partial results if some pages fail
-            - Uses OCR fallback automatically if native text is insufficient
+            - OCRs only the pages whose native text is insufficient
         """
         start_time = time.time()
 
@@ -221,7 +359,6 @@ class PdfExtractor(BaseExtractor):
 
         errors = []
         warnings = []
-        content_blocks = []
         images = []
         tables = []
 
@@ -239,7 +376,7 @@ class PdfExtractor(BaseExtractor):
             else:
                 errors.extend(validation_errors)
 
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(errors),
                 document_metadata=DocumentMetadata(
@@ -247,11 +384,12 @@ class PdfExtractor(BaseExtractor):
                     file_format="pdf",
                 ),
             )
+            return
 
         # Check dependencies
         if not PYPDF_AVAILABLE:
             errors.append("pypdf library not available. Install with: pip install pypdf")
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(errors),
                 document_metadata=DocumentMetadata(
@@ -259,11 +397,15 @@ class PdfExtractor(BaseExtractor):
                     file_format="pdf",
                 ),
             )
+            return
 
+        session = None
         try:
-            # Step 2: Try native text extraction
-            reader = PdfReader(str(file_path))
-            page_count = len(reader.pages)
+            # Step 2: Try native text extraction. The session parses the file
+            # once and is shared by every pass below.
+            session = PdfDocumentSession(file_path)
+            reader = session.reader
+            page_count = session.page_count
 
             if INFRASTRUCTURE_AVAILABLE:
                 self.logger.info(
@@ -271,22 +413,33 @@ class PdfExtractor(BaseExtractor):
                     extra={"file": str(file_path), "pages": page_count},
                 )
 
-            # Extract text from each page
+            # Page texts arrive in page order from either path, so block
+            # sequence indices are assigned deterministically below
+            if self._should_parallelize(page_count):
+                page_texts = self._extract_page_texts_parallel(file_path, session, page_count)
+            else:
+                page_texts = self._extract_page_texts(session)
+
+            has_native_text = False
+            ocr_pages = []  # every page routed to OCR
+            pending_ocr = []  # OCR pages not yet recognized
+            held_pages = []  # (page_num, native_text or None) awaiting output
+            ocr_batch_size = max(1, self.ocr_window_size or 1) * self._ocr_worker_count()
+            ocr_block_count = 0
+
             sequence_index = 0
-            native_text_extracted = False
+            block_count = 0
+            total_chars = 0
+            total_words = 0
 
-            for page_num, page in enumerate(reader.pages, start=1):
+            for page_num, text, error in page_texts:
+                native_text = None
                 try:
-                    text = page.extract_text()
+                    if error is not None:
+                        raise RuntimeError(error)
 
                     if text and len(text.strip()) >= self.min_text_threshold:
-                        native_text_extracted = True
-
-                        # Split page text into blocks with heading detection
-                        page_blocks, sequence_index = self._split_text_into_blocks(
-                            text, page_num, sequence_index
-                        )
-                        content_blocks.extend(page_blocks)
+                        native_text = text
 
                 except Exception as e:
                     warnings.append(f"Failed to extract text from page {page_num}: {str(e)}")
@@ -295,28 +448,64 @@ class PdfExtractor(BaseExtractor):
                             f"Page {page_num} extraction failed", extra={"error": str(e)}
                         )
 
-            # Step 3: OCR fallback if needed
-            if not native_text_extracted and self.use_ocr:
+                # Step 3: Per-page OCR routing. Only pages without a usable
+                # text layer that are mostly covered by images are rasterized.
+                if native_text is not None:
+                    has_native_text = True
+                elif self._page_needs_ocr(session, page_num):
+                    ocr_pages.append(page_num)
+                    if self.use_ocr:
+                        pending_ocr.append(page_num)
+
+                held_pages.append((page_num, native_text))
+
+                if pending_ocr and len(pending_ocr) < ocr_batch_size:
+                    continue
+
+                ocr_blocks_by_page = self._ocr_page_batch(file_path, session, pending_ocr)
+                ocr_block_count += sum(len(b) for b in ocr_blocks_by_page.values())
+                page_blocks, sequence_index = self._emit_held_pages(
+                    held_pages, ocr_blocks_by_page, sequence_index
+                )
+                for block in page_blocks:
+                    total_chars += len(block.content)
+                    total_words += len(block.content.split())
+                    yield block
+                block_count += len(page_blocks)
+                pending_ocr = []
+                held_pages = []
+
+            if held_pages:
+                ocr_blocks_by_page = self._ocr_page_batch(file_path, session, pending_ocr)
+                ocr_block_count += sum(len(b) for b in ocr_blocks_by_page.values())
+                page_blocks, sequence_index = self._emit_held_pages(
+                    held_pages, ocr_blocks_by_page, sequence_index
+                )
+                for block in page_blocks:
+                    total_chars += len(block.content)
+                    total_words += len(block.content.split())
+                    yield block
+                block_count += len(page_blocks)
+
+            if ocr_pages and self.use_ocr:
                 if INFRASTRUCTURE_AVAILABLE:
                     self.logger.info(
-                        "Minimal native text found, attempting OCR", extra={"file": str(file_path)}
+                        f"OCR extracted {ocr_block_count} blocks from "
+                        f"{len(ocr_pages)} of {page_count} pages",
+                        extra={"file": str(file_path), "ocr_pages": ocr_pages},
                     )
-
-                if self._needs_ocr(file_path):
-                    ocr_blocks = self._extract_with_ocr(file_path)
-                    content_blocks.extend(ocr_blocks)
-                    if INFRASTRUCTURE_AVAILABLE:
-                        self.logger.info(
-                            f"OCR extracted {len(ocr_blocks)} blocks",
-                            extra={"file": str(file_path)},
-                        )
-            elif not native_text_extracted and not self.use_ocr:
+            elif not has_native_text and not self.use_ocr:
                 warnings.append("No native text found and OCR is disabled")
+            elif ocr_pages and not self.use_ocr:
+                warnings.append(
+                    f"{len(ocr_pages)} page(s) appear to be scanned but OCR is disabled: "
+                    f"{', '.join(str(p) for p in ocr_pages)}"
+                )
 
             # Step 4: Extract tables if configured
             if self.extract_tables and PDFPLUMBER_AVAILABLE:
                 try:
-                    extracted_tables = self._extract_tables(file_path)
+                    extracted_tables = self._extract_tables(file_path, session=session)
                     tables.extend(extracted_tables)
                 except Exception as e:
                     warnings.append(f"Table extraction failed: {str(e)}")
@@ -324,17 +513,15 @@ class PdfExtractor(BaseExtractor):
             # Step 5: Extract image metadata if configured
             if self.extract_images:
                 try:
-                    extracted_images = self._extract_image_metadata(reader, file_path)
+                    extracted_images = self._extract_image_metadata(
+                        reader, file_path, session=session
+                    )
                     images.extend(extracted_images)
                 except Exception as e:
                     warnings.append(f"Image extraction failed: {str(e)}")
 
-            # Step 6: Generate document metadata
-            doc_metadata = self._extract_document_metadata(file_path, reader)
-
-            # Update statistics
-            total_chars = sum(len(b.content) for b in content_blocks)
-            total_words = sum(len(b.content.split()) for b in content_blocks)
+            # Step 6: Generate document metadata (statistics accumulated while streaming)
+            doc_metadata = self._extract_document_metadata(file_path, reader, session=session)
 
             doc_metadata = DocumentMetadata(
                 source_file=doc_metadata.source_file,
@@ -357,14 +544,14 @@ class PdfExtractor(BaseExtractor):
                 extraction_duration_seconds=time.time() - start_time,
             )
 
-            # Step 7: Log completion and return result
+            # Step 7: Log completion and yield result trailer
             duration = time.time() - start_time
             if INFRASTRUCTURE_AVAILABLE:
                 self.logger.info(
                     "PDF extraction complete",
                     extra={
                         "file": str(file_path),
-                        "blocks": len(content_blocks),
+                        "blocks": block_count,
                         "pages": page_count,
                         "tables": len(tables),
                         "images": len(images),
@@ -372,8 +559,7 @@ class PdfExtractor(BaseExtractor):
                     },
                 )
 
-            return ExtractionResult(
-                content_blocks=tuple(content_blocks),
+            yield ExtractionResult(
                 document_metadata=doc_metadata,
                 images=tuple(images),
                 tables=tuple(tables),
@@ -395,7 +581,7 @@ class PdfExtractor(BaseExtractor):
                     "Extraction failed", extra={"file": str(file_path), "error": str(e)}
                 )
 
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(errors),
                 warnings=tuple(warnings),
@@ -405,22 +591,186 @@ class PdfExtractor(BaseExtractor):
                 ),
             )
 
-    def _needs_ocr(self, file_path: Path) -> bool:
+        finally:
+            if session is not None:
+                session.close()
+
+    def _ocr_page_batch(
+        self, file_path: Path, session: PdfDocumentSession, pages: List[int]
+    ) -> dict:
+        """
+        OCR a batch of pages and group the resulting blocks by page.
+
+        Args:
+            file_path: Path to PDF file
+            session: Open document session
+            pages: Page numbers (1-indexed) to OCR; may be empty
+
+        Returns:
+            Mapping of page_num -> list of OCR ContentBlocks
+        """
+        blocks_by_page = {}
+        if not pages:
+            return blocks_by_page
+
+        for block in self._extract_with_ocr(file_path, session=session, pages=pages):
+            blocks_by_page.setdefault(block.position.page, []).append(block)
+        return blocks_by_page
+
+    def _emit_held_pages(
+        self, held_pages: list, ocr_blocks_by_page: dict, sequence_index: int
+    ) -> tuple[List[ContentBlock], int]:
+        """
+        Build blocks for held pages in page order, merging native and OCR text.
+
+        Args:
+            held_pages: List of (page_num, native_text or None) in page order
+            ocr_blocks_by_page: Mapping of page_num -> OCR ContentBlocks
+            sequence_index: Next sequence index
+
+        Returns:
+            Tuple of (blocks, next sequence_index)
+        """
+        blocks = []
+        for page_num, native_text in held_pages:
+            if native_text is not None:
+                # Split page text into blocks with heading detection
+                page_blocks, sequence_index = self._split_text_into_blocks(
+                    native_text, page_num, sequence_index
+                )
+                blocks.extend(page_blocks)
+
+            for block in ocr_blocks_by_page.get(page_num, []):
+                blocks.append(
+                    replace(
+                        block,
+                        position=replace(block.position, sequence_index=sequence_index),
+                    )
+                )
+                sequence_index += 1
+
+        return blocks, sequence_index
+
+    def _extract_page_texts(self, session: PdfDocumentSession):
+        """
+        Extract native text page by page in the current process.
+
+        Text is cached on the session so later passes (OCR probe) reuse it.
+
+        Args:
+            session: Open PdfDocumentSession
+
+        Yields:
+            Tuples of (page_num, text, error) with 1-indexed page numbers
+        """
+        for page_num in range(1, session.page_count + 1):
+            try:
+                yield (page_num, session.get_page_text(page_num), None)
+            except Exception as e:
+                yield (page_num, None, str(e))
+
+    def _should_parallelize(self, page_count: int) -> bool:
+        """
+        Decide whether native text extraction should be sharded across processes.
+
+        Args:
+            page_count: Number of pages in the document
+
+        Returns:
+            True if page-parallel extraction is enabled and worthwhile
+        """
+        if not self.parallel_pages:
+            return False
+        return page_count >= max(self.parallel_min_pages, 2) and self._page_worker_count() > 1
+
+    def _page_worker_count(self) -> int:
+        """Return the number of worker processes to use for page sharding."""
+        return max(1, self.max_page_workers or os.cpu_count() or 1)
+
+    def _extract_page_texts_parallel(
+        self, file_path: Path, session: PdfDocumentSession, page_count: int
+    ) -> List[tuple[int, Optional[str], Optional[str]]]:
+        """
+        Extract native text with the page range split across a process pool.
+
+        Pages are divided into contiguous shards (a few per worker to balance
+        uneven pages). Each worker opens its own reader. Results are returned
+        in page order regardless of completion order and cached on the
+        session. If the pool cannot be used (e.g., encrypted file, restricted
+        environment), falls back to serial extraction with the session reader.
+
+        Args:
+            file_path: Path to PDF file
+            session: Open PdfDocumentSession used for caching and fallback
+            page_count: Number of pages in the document
+
+        Returns:
+            List of (page_num, text, error) tuples in page order
+        """
+        workers = min(self._page_worker_count(), page_count)
+        shard_size = max(1, -(-page_count // (workers * 4)))
+        shards = [
+            (start, min(start + shard_size, page_count))
+            for start in range(0, page_count, shard_size)
+        ]
+
+        if INFRASTRUCTURE_AVAILABLE:
+            self.logger.info(
+                "Extracting PDF pages in parallel",
+                extra={
+                    "file": str(file_path),
+                    "pages": page_count,
+                    "workers": workers,
+                    "shards": len(shards),
+                },
+            )
+
+        # Encrypted documents need the decryption state held by the parent reader
+        if session.reader.is_encrypted:
+            return list(self._extract_page_texts(session))
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_extract_page_range_text, str(file_path), start, stop)
+                    for start, stop in shards
+                ]
+                page_texts = []
+                for future in futures:
+                    page_texts.extend(future.result())
+
+        except Exception as e:
+            if INFRASTRUCTURE_AVAILABLE:
+                self.logger.warning(
+                    "Parallel page extraction failed, falling back to serial",
+                    extra={"file": str(file_path), "error": str(e)},
+                )
+            return list(self._extract_page_texts(session))
+
+        for page_num, text, error in page_texts:
+            if error is None:
+                session.cache_page_text(page_num, text)
+        return page_texts
+
+    def _needs_ocr(self, file_path: Path, session: Optional[PdfDocumentSession] = None) -> bool:
         """
         Determine if PDF requires OCR (is image-based).
 
         Args:
             file_path: Path to PDF file
+            session: Optional open session; reuses its cached page text
 
         Returns:
             True if OCR is needed
         """
+        owns_session = session is None
         try:
-            reader = PdfReader(str(file_path))
+            if owns_session:
+                session = PdfDocumentSession(file_path)
 
             total_text = ""
-            for page in reader.pages[:3]:  # Check first 3 pages
-                text = page.extract_text()
+            for page_num in range(1, min(session.page_count, 3) + 1):  # Check first 3 pages
+                text = session.get_page_text(page_num)
                 if text:
                     total_text += text
 
@@ -431,15 +781,62 @@ class PdfExtractor(BaseExtractor):
             # If we can't determine, assume OCR is needed
             return True
 
-    def _extract_with_ocr(self, file_path: Path) -> List[ContentBlock]:
+        finally:
+            if owns_session and session is not None:
+                session.close()
+
+    def _page_needs_ocr(self, session: PdfDocumentSession, page_num: int) -> bool:
+        """
+        Classify a page without a usable text layer as scanned or blank.
+
+        A page is routed to OCR when images cover at least
+        ocr_min_image_coverage of its area. If coverage cannot be determined,
+        the page is assumed to need OCR.
+
+        Args:
+            session: Open PdfDocumentSession
+            page_num: Page number (1-indexed)
+
+        Returns:
+            True if the page should be OCRed
+        """
+        try:
+            return session.get_page_image_coverage(page_num) >= self.ocr_min_image_coverage
+        except Exception as e:
+            if INFRASTRUCTURE_AVAILABLE:
+                self.logger.debug(
+                    f"Image coverage unavailable for page {page_num}", extra={"error": str(e)}
+                )
+            return True
+
+    def _extract_with_ocr(
+        self,
+        file_path: Path,
+        session: Optional[PdfDocumentSession] = None,
+        pages: Optional[List[int]] = None,
+    ) -> List[ContentBlock]:
         """
         Extract text using OCR (pytesseract).
 
+        Pages are rasterized a small window at a time (pdf2image first_page/
+        last_page) and handed to a pool of tesseract workers. Rendering of the
+        next window overlaps with OCR of the previous one, and each image is
+        released as soon as its page has been recognized, so peak memory is
+        bounded by the window size and worker count rather than page count.
+        When an OCR cache is configured, cached pages are not rendered at all.
+
+        With adaptive DPI enabled, every page is first rendered at ocr_low_dpi;
+        only pages whose mean word confidence falls below
+        ocr_escalation_threshold are rendered again at ocr_dpi. The DPI used
+        for each page is recorded in its block metadata.
+
         Args:
             file_path: Path to PDF file
+            session: Optional open session; used for the page count
+            pages: Optional page numbers (1-indexed) to OCR; defaults to all pages
 
         Returns:
-            List of ContentBlock with OCR-extracted text
+            List of ContentBlock with OCR-extracted text, in page order
         """
         blocks = []
 
@@ -447,62 +844,61 @@ class PdfExtractor(BaseExtractor):
             return blocks
 
         try:
-            # Convert PDF pages to images
-            convert_kwargs = {"dpi": self.ocr_dpi}
-            if self.poppler_path:
-                convert_kwargs["poppler_path"] = self.poppler_path
-
-            images = pdf2image.convert_from_path(str(file_path), **convert_kwargs)
-
-            sequence_index = 0
-            for page_num, image in enumerate(images, start=1):
-                try:
-                    # Run OCR
-                    ocr_data = pytesseract.image_to_data(
-                        image, lang=self.ocr_lang, output_type=pytesseract.Output.DICT
-                    )
-
-                    # Extract text with confidence
-                    page_text = []
-                    confidences = []
-
-                    for i, text in enumerate(ocr_data["text"]):
-                        if text.strip():
-                            page_text.append(text)
-                            conf = (
-                                float(ocr_data["conf"][i]) / 100.0
-                                if ocr_data["conf"][i] != -1
-                                else 0.0
-                            )
-                            confidences.append(conf)
-
-                    if page_text:
-                        combined_text = " ".join(page_text)
-                        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-
-                        block = ContentBlock(
-                            block_type=ContentType.PARAGRAPH,
-                            content=combined_text,
-                            raw_content=combined_text,
-                            position=Position(page=page_num, sequence_index=sequence_index),
-                            confidence=avg_confidence,
-                            metadata={
-                                "page": page_num,
-                                "extraction_method": "ocr",
-                                "ocr_dpi": self.ocr_dpi,
-                                "ocr_lang": self.ocr_lang,
-                                "char_count": len(combined_text),
-                                "word_count": len(combined_text.split()),
-                            },
-                        )
-                        blocks.append(block)
-                        sequence_index += 1
+            if pages is None:
+                if session is not None:
+                    page_count = session.page_count
+                else:
+                    info_kwargs = {"poppler_path": self.poppler_path} if self.poppler_path else {}
+                    page_count = pdf2image.pdfinfo_from_path(str(file_path), **info_kwargs)["Pages"]
+                pages = list(range(1, page_count + 1))
+
+            file_hash = None
+            if self.ocr_cache is not None:
+                file_hash = (
+                    session.file_hash if session is not None else self._compute_file_hash(file_path)
+                )
 
-                except Exception as e:
+            adaptive = self.ocr_adaptive_dpi and self.ocr_low_dpi < self.ocr_dpi
+            first_dpi = self.ocr_low_dpi if adaptive else self.ocr_dpi
+
+            ocr_results = self._ocr_pages_at_dpi(file_path, pages, first_dpi, file_hash)
+            page_dpi = {page_num: first_dpi for page_num in ocr_results}
+
+            if adaptive:
+                # Confidence-driven escalation: only faint or small-print pages
+                # are rendered again at full resolution
+                escalate = [
+                    page_num
+                    for page_num in sorted(ocr_results)
+                    if self._mean_ocr_confidence(ocr_results[page_num])
+                    < self.ocr_escalation_threshold
+                ]
+                if escalate:
                     if INFRASTRUCTURE_AVAILABLE:
-                        self.logger.warning(
-                            f"OCR failed for page {page_num}", extra={"error": str(e)}
+                        self.logger.info(
+                            f"Re-running OCR at {self.ocr_dpi} DPI for {len(escalate)} "
+                            f"low-confidence page(s)",
+                            extra={"file": str(file_path), "pages": escalate},
                         )
+                    high_results = self._ocr_pages_at_dpi(
+                        file_path, escalate, self.ocr_dpi, file_hash
+                    )
+                    for page_num, ocr_data in high_results.items():
+                        ocr_results[page_num] = ocr_data
+                        page_dpi[page_num] = self.ocr_dpi
+
+            sequence_index = 0
+            for page_num in sorted(ocr_results):
+                block = self._build_ocr_block(
+                    ocr_results[page_num],
+                    page_num,
+                    sequence_index,
+                    dpi=page_dpi[page_num],
+                    escalated=(page_dpi[page_num] != first_dpi) if adaptive else None,
+                )
+                if block is not None:
+                    blocks.append(block)
+                    sequence_index += 1
 
         except Exception as e:
             if INFRASTRUCTURE_AVAILABLE:
@@ -510,57 +906,363 @@ class PdfExtractor(BaseExtractor):
 
         return blocks
 
-    def _extract_tables(self, file_path: Path) -> List[TableMetadata]:
+    def _ocr_pages_at_dpi(
+        self, file_path: Path, pages: List[int], dpi: int, file_hash: Optional[str] = None
+    ) -> dict:
+        """
+        OCR a set of pages rendered at one DPI through the windowed pipeline.
+
+        Args:
+            file_path: Path to PDF file
+            pages: Page numbers (1-indexed)
+            dpi: Rasterization DPI
+            file_hash: SHA256 of the file; required for OCR cache lookups
+
+        Returns:
+            Mapping of page_num -> image_to_data output (failed pages omitted)
+        """
+        # Consult the persistent cache before rendering anything
+        ocr_results = {}
+        cache_keys = {}
+        if self.ocr_cache is not None and file_hash is not None:
+            for page_num in pages:
+                key = self.ocr_cache.make_page_key(file_hash, page_num, dpi, self.ocr_lang)
+                cached = self.ocr_cache.get(key)
+                if cached is not None:
+                    ocr_results[page_num] = cached
+                else:
+                    cache_keys[page_num] = key
+
+            if INFRASTRUCTURE_AVAILABLE and ocr_results:
+                self.logger.info(
+                    f"OCR cache hit for {len(ocr_results)} of {len(pages)} pages",
+                    extra={"file": str(file_path), "dpi": dpi},
+                )
+
+        pages_to_render = [p for p in pages if p not in ocr_results]
+
+        window_size = max(1, self.ocr_window_size or 1)
+        workers = self._ocr_worker_count()
+        # Pages rendered but not yet consumed: one window queued behind
+        # the pages currently being recognized
+        max_in_flight = workers + window_size
+
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for first_page, last_page in self._ocr_windows(pages_to_render, window_size):
+                images = self._render_pages(file_path, first_page, last_page, dpi=dpi)
+
+                for page_num, image in enumerate(images, start=first_page):
+                    pending.append((page_num, executor.submit(self._run_ocr, image)))
+                del images
+
+                # Backpressure: drain the oldest pages before rendering more
+                while len(pending) > max_in_flight - window_size:
+                    self._collect_ocr_page(pending, ocr_results, cache_keys)
+
+            while pending:
+                self._collect_ocr_page(pending, ocr_results, cache_keys)
+
+        return ocr_results
+
+    def _ocr_windows(self, pages: List[int], window_size: int) -> List[tuple[int, int]]:
+        """
+        Group page numbers into contiguous render windows.
+
+        Args:
+            pages: Page numbers (1-indexed)
+            window_size: Maximum pages per window
+
+        Returns:
+            List of inclusive (first_page, last_page) ranges in page order
+        """
+        windows = []
+        for page_num in sorted(set(pages)):
+            if windows:
+                first_page, last_page = windows[-1]
+                if page_num == last_page + 1 and page_num - first_page < window_size:
+                    windows[-1] = (first_page, page_num)
+                    continue
+            windows.append((page_num, page_num))
+        return windows
+
+    def _ocr_worker_count(self) -> int:
+        """Return the number of concurrent tesseract workers."""
+        return max(1, self.ocr_workers or min(os.cpu_count() or 1, 4))
+
+    def _render_pages(
+        self, file_path: Path, first_page: int, last_page: int, dpi: Optional[int] = None
+    ) -> list:
+        """
+        Rasterize an inclusive page range for OCR.
+
+        Args:
+            file_path: Path to PDF file
+            first_page: First page to render (1-indexed)
+            last_page: Last page to render (1-indexed, inclusive)
+            dpi: Rasterization DPI (default: ocr_dpi)
+
+        Returns:
+            List of PIL images, one per page
+        """
+        convert_kwargs = {
+            "dpi": dpi or self.ocr_dpi,
+            "first_page": first_page,
+            "last_page": last_page,
+        }
+        if self.poppler_path:
+            convert_kwargs["poppler_path"] = self.poppler_path
+
+        return pdf2image.convert_from_path(str(file_path), **convert_kwargs)
+
+    def _run_ocr(self, image) -> dict:
+        """
+        Run tesseract on one page image and release the image afterwards.
+
+        Args:
+            image: PIL image of the page
+
+        Returns:
+            pytesseract image_to_data output dictionary
+        """
+        try:
+            return pytesseract.image_to_data(
+                image, lang=self.ocr_lang, output_type=pytesseract.Output.DICT
+            )
+        finally:
+            image.close()
+
+    def _collect_ocr_page(
+        self, pending: deque, ocr_results: dict, cache_keys: Optional[dict] = None
+    ) -> None:
+        """
+        Wait for the oldest in-flight OCR page and record its result.
+
+        Args:
+            pending: Queue of (page_num, future) in page order
+            ocr_results: Mapping of page_num -> image_to_data output to fill
+            cache_keys: Optional mapping of page_num -> OCR cache key to store under
+        """
+        page_num, future = pending.popleft()
+
+        try:
+            ocr_data = future.result()
+            ocr_results[page_num] = ocr_data
+
+            if self.ocr_cache is not None and cache_keys and page_num in cache_keys:
+                self.ocr_cache.set(cache_keys[page_num], ocr_data)
+
+        except Exception as e:
+            if INFRASTRUCTURE_AVAILABLE:
+                self.logger.warning(f"OCR failed for page {page_num}", extra={"error": str(e)})
+
+    @staticmethod
+    def _mean_ocr_confidence(ocr_data: dict) -> float:
+        """
+        Return the mean confidence (0.0-1.0) of recognized words on a page.
+
+        Args:
+            ocr_data: pytesseract image_to_data output dictionary
+
+        Returns:
+            Mean word confidence, 0.0 if no text was recognized
+        """
+        confidences = [
+            float(ocr_data["conf"][i]) / 100.0 if ocr_data["conf"][i] != -1 else 0.0
+            for i, text in enumerate(ocr_data["text"])
+            if text.strip()
+        ]
+        return sum(confidences) / len(confidences) if confidences else 0.0
+
+    def _build_ocr_block(
+        self,
+        ocr_data: dict,
+        page_num: int,
+        sequence_index: int,
+        dpi: Optional[int] = None,
+        escalated: Optional[bool] = None,
+    ) -> Optional[ContentBlock]:
+        """
+        Convert tesseract output for one page into a ContentBlock.
+
+        Args:
+            ocr_data: pytesseract image_to_data output dictionary
+            page_num: Page number (1-indexed)
+            sequence_index: Sequence index for the block
+            dpi: DPI the page was rendered at (default: ocr_dpi)
+            escalated: Whether adaptive OCR re-rendered the page at full DPI
+                (None when adaptive DPI is off)
+
+        Returns:
+            ContentBlock, or None if no text was recognized
+        """
+        page_text = [text for text in ocr_data["text"] if text.strip()]
+
+        if not page_text:
+            return None
+
+        combined_text = " ".join(page_text)
+
+        metadata = {
+            "page": page_num,
+            "extraction_method": "ocr",
+            "ocr_dpi": dpi or self.ocr_dpi,
+            "ocr_lang": self.ocr_lang,
+            "char_count": len(combined_text),
+            "word_count": len(combined_text.split()),
+        }
+        if escalated is not None:
+            metadata["ocr_dpi_escalated"] = escalated
+
+        return ContentBlock(
+            block_type=ContentType.PARAGRAPH,
+            content=combined_text,
+            raw_content=combined_text,
+            position=Position(page=page_num, sequence_index=sequence_index),
+            confidence=self._mean_ocr_confidence(ocr_data),
+            metadata=metadata,
+        )
+
+    def _extract_tables(
+        self, file_path: Path, session: Optional[PdfDocumentSession] = None
+    ) -> List[TableMetadata]:
         """
         Extract tables from PDF using pdfplumber.
 
+        Walks the pages once, running table detection and cell extraction in
+        the same step, and releases each page's cached layout objects before
+        moving on so peak memory stays at roughly one page. With
+        table_prefilter enabled, pages that cannot hold a ruled table are
+        skipped before pdfplumber's table finder runs.
+
         Args:
             file_path: Path to PDF file
+            session: Optional open session; reuses its pdfplumber document
 
         Returns:
             List of TableMetadata
         """
         tables = []
+        owns_session = session is None
+        pages_scanned = 0
+        pages_skipped = 0
 
         try:
-            import pdfplumber
+            if owns_session:
+                session = PdfDocumentSession(file_path)
 
-            with pdfplumber.open(str(file_path)) as pdf:
-                for page in pdf.pages:
+            for page_num, page in enumerate(session.plumber.pages, start=1):
+                pages_scanned += 1
+                try:
+                    if self.table_prefilter and not self._is_table_candidate(
+                        session, page_num, page
+                    ):
+                        pages_skipped += 1
+                        continue
                     page_tables = page.extract_tables()
-
-                    for table_data in page_tables:
-                        if table_data and len(table_data) > 0:
-                            # Assume first row is header
-                            has_header = True
-                            header_row = tuple(table_data[0]) if has_header else None
-                            cells = tuple(tuple(row) for row in table_data)
-
-                            num_rows = len(table_data)
-                            num_columns = len(table_data[0]) if table_data else 0
-
-                            table = TableMetadata(
-                                num_rows=num_rows,
-                                num_columns=num_columns,
-                                has_header=has_header,
-                                header_row=header_row,
-                                cells=cells,
-                            )
-                            tables.append(table)
+                finally:
+                    page.close()
+
+                for table_data in page_tables:
+                    if table_data and len(table_data) > 0:
+                        # Assume first row is header
+                        has_header = True
+                        header_row = tuple(table_data[0]) if has_header else None
+                        cells = tuple(tuple(row) for row in table_data)
+
+                        num_rows = len(table_data)
+                        num_columns = len(table_data[0]) if table_data else 0
+
+                        table = TableMetadata(
+                            num_rows=num_rows,
+                            num_columns=num_columns,
+                            has_header=has_header,
+                            header_row=header_row,
+                            cells=cells,
+                        )
+                        tables.append(table)
 
         except Exception as e:
             if INFRASTRUCTURE_AVAILABLE:
                 self.logger.warning("Table extraction failed", extra={"error": str(e)})
 
+        finally:
+            if owns_session and session is not None:
+                session.close()
+
+            with self._table_stats_lock:
+                self._table_stats["pages_scanned"] += pages_scanned
+                self._table_stats["pages_skipped"] += pages_skipped
+                self._table_stats["pages_extracted"] += pages_scanned - pages_skipped
+
+            if INFRASTRUCTURE_AVAILABLE and pages_skipped:
+                self.logger.debug(
+                    f"Table prefilter skipped {pages_skipped} of {pages_scanned} pages",
+                    extra={"file": str(file_path)},
+                )
+
         return tables
 
-    def _extract_image_metadata(self, reader: "PdfReader", file_path: Path) -> List[ImageMetadata]:
+    def _is_table_candidate(self, session: PdfDocumentSession, page_num: int, page) -> bool:
+        """
+        Decide whether a page is worth a full pdfplumber table extraction.
+
+        pdfplumber's default "lines" strategy builds cells from ruling lines,
+        so a table needs at least two horizontal and two vertical edges. The
+        check runs in two tiers: a byte scan of the raw content stream for
+        path operators (no layout parse), then an edge count from the
+        pdfplumber page objects.
+
+        Args:
+            session: Open document session
+            page_num: Page number (1-indexed)
+            page: pdfplumber page
+
+        Returns:
+            True if the page may contain a table
+        """
+        try:
+            if not session.page_has_vector_paths(page_num):
+                return False
+
+            horizontal = vertical = 0
+            for edge in page.edges:
+                if edge["orientation"] == "h":
+                    horizontal += 1
+                else:
+                    vertical += 1
+                if horizontal >= 2 and vertical >= 2:
+                    return True
+            return False
+
+        except Exception:
+            # Never lose a table because the probe failed
+            return True
+
+    def get_table_prefilter_stats(self) -> dict:
+        """
+        Return cumulative table prefilter counters for this extractor.
+
+        Returns:
+            Dictionary with pages_scanned, pages_skipped and pages_extracted
+        """
+        with self._table_stats_lock:
+            return dict(self._table_stats)
+
+    def _extract_image_metadata(
+        self,
+        reader: "PdfReader",
+        file_path: Path,
+        session: Optional[PdfDocumentSession] = None,
+    ) -> List[ImageMetadata]:
         """
         Extract image metadata from PDF.
 
         Args:
             reader: PdfReader instance
             file_path: Path to PDF file
+            session: Optional open session; reuses its per-page image cache
 
         Returns:
             List of ImageMetadata
@@ -568,43 +1270,42 @@ class PdfExtractor(BaseExtractor):
         images = []
 
         try:
-            for page_num, page in enumerate(reader.pages, start=1):
-                if "/XObject" in page["/Resources"]:
-                    xobjects = page["/Resources"]["/XObject"].get_object()
-
-                    for obj_name in xobjects:
-                        obj = xobjects[obj_name]
-
-                        if obj["/Subtype"] == "/Image":
-                            try:
-                                width = obj["/Width"]
-                                height = obj["/Height"]
-
-                                # Determine format
-                                if "/Filter" in obj:
-                                    filter_type = obj["/Filter"]
-                                    if filter_type == "/DCTDecode":
-                                        img_format = "JPEG"
-                                    elif filter_type == "/FlateDecode":
-                                        img_format = "PNG"
-                                    else:
-                                        img_format = str(filter_type)
-                                else:
-                                    img_format = "Unknown"
-
-                                image_meta = ImageMetadata(
-                                    width=width,
-                                    height=height,
-                                    format=img_format,
-                                )
-                                images.append(image_meta)
-
-                            except Exception as e:
-                                if INFRASTRUCTURE_AVAILABLE:
-                                    self.logger.warning(
-                                        f"Failed to extract image metadata on page {page_num}",
-                                        extra={"error": str(e)},
-                                    )
+            for page_num in range(1, len(reader.pages) + 1):
+                if session is not None:
+                    page_images = session.get_page_images(page_num)
+                else:
+                    page_images = get_page_image_xobjects(reader.pages[page_num - 1])
+
+                for obj in page_images:
+                    try:
+                        width = obj["/Width"]
+                        height = obj["/Height"]
+
+                        # Determine format
+                        if "/Filter" in obj:
+                            filter_type = obj["/Filter"]
+                            if filter_type == "/DCTDecode":
+                                img_format = "JPEG"
+                            elif filter_type == "/FlateDecode":
+                                img_format = "PNG"
+                            else:
+                                img_format = str(filter_type)
+                        else:
+                            img_format = "Unknown"
+
+                        image_meta = ImageMetadata(
+                            width=width,
+                            height=height,
+                            format=img_format,
+                        )
+                        images.append(image_meta)
+
+                    except Exception as e:
+                        if INFRASTRUCTURE_AVAILABLE:
+                            self.logger.warning(
+                                f"Failed to extract image metadata on page {page_num}",
+                                extra={"error": str(e)},
+                            )
 
         except Exception as e:
             if INFRASTRUCTURE_AVAILABLE:
@@ -612,13 +1313,19 @@ class PdfExtractor(BaseExtractor):
 
         return images
 
-    def _extract_document_metadata(self, file_path: Path, reader: "PdfReader") -> DocumentMetadata:
+    def _extract_document_metadata(
+        self,
+        file_path: Path,
+        reader: "PdfReader",
+        session: Optional[PdfDocumentSession] = None,
+    ) -> DocumentMetadata:
         """
         Extract document-level metadata from PDF file.
 
         Args:
             file_path: Path to file
             reader: PdfReader instance
+            session: Optional open session; hashes its buffer instead of re-reading
 
         Returns:
             DocumentMetadata with available properties
@@ -628,7 +1335,12 @@ class PdfExtractor(BaseExtractor):
         file_size = file_stat.st_size
 
         # Generate file hash
-        file_hash = self._compute_file_hash(file_path)
+        if session is not None:
+            file_hash = session.file_hash
+            if INFRASTRUCTURE_AVAILABLE:
+                get_provenance_cache().record(file_path, file_hash, session.file_stat)
+        else:
+            file_hash = self._compute_file_hash(file_path)
 
         # Extract PDF metadata
         metadata = reader.metadata if reader.metadata else {}
@@ -688,6 +1400,9 @@ class PdfExtractor(BaseExtractor):
         Returns:
             Hex string of SHA256 hash
         """
+        if INFRASTRUCTURE_AVAILABLE:
+            return get_provenance_cache().file_hash(file_path)
+
         sha256 = hashlib.sha256()
 
         with open(file_path, "rb") as f:
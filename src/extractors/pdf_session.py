@@ -0,0 +1,415 @@
+"""
+PDF Document Session - Shared Parse State for PDF Extraction Passes
+
+PdfExtractor runs several passes over one PDF (native text, OCR probe,
+tables, image metadata, document metadata). A PdfDocumentSession reads the
+file bytes once and hands the same parsed state to every pass, so no pass
+re-opens or re-parses the file.
+
+Features:
+- Single file read shared by pypdf and pdfplumber (in-memory buffer)
+- One PdfReader per document, with per-page object and text caches
+- Per-page image XObject cache (used by image metadata)
+- Per-page image coverage estimate (used by native-vs-OCR page routing)
+- Per-page vector path probe (used by the table-candidate prefilter)
+- Lazy pdfplumber document, opened only when table extraction runs
+- SHA256 of the file computed from the shared buffer (no extra read)
+
+Example:
+    >>> with PdfDocumentSession(Path("document.pdf")) as session:
+    ...     for page_num in range(1, session.page_count + 1):
+    ...         text = session.get_page_text(page_num)
+"""
+
+import hashlib
+import io
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+try:
+    from pypdf import PdfReader
+
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+    if TYPE_CHECKING:
+        from pypdf import PdfReader
+
+try:
+    import pdfplumber
+
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+
+def get_page_image_xobjects(page: Any) -> List[Any]:
+    """
+    Return the image XObjects referenced directly by a pypdf page.
+
+    Args:
+        page: pypdf PageObject
+
+    Returns:
+        List of image XObject dictionaries (empty if none)
+    """
+    images = []
+    resources = page.get("/Resources")
+    if resources is None:
+        return images
+
+    resources = resources.get_object()
+    if "/XObject" in resources:
+        xobjects = resources["/XObject"].get_object()
+        for obj_name in xobjects:
+            obj = xobjects[obj_name].get_object()
+            if obj.get("/Subtype") == "/Image":
+                images.append(obj)
+    return images
+
+
+# Path construction operators (rectangle, line, curves) preceded by an operand.
+# Matches inside text strings are harmless: they only make a page a candidate.
+_PATH_OPERATOR_PATTERN = re.compile(rb"[\d.]\s+(?:re|l|c|v|y)\b")
+
+
+def page_has_vector_paths(page: Any) -> bool:
+    """
+    Cheaply check whether a pypdf page may draw lines or rectangles.
+
+    Scans the decoded content stream bytes for path construction operators
+    without tokenizing it. Pages that place Form XObjects are reported as
+    having paths, since the form may draw them.
+
+    Args:
+        page: pypdf PageObject
+
+    Returns:
+        False only if the page certainly draws no vector paths
+    """
+    resources = page.get("/Resources")
+    if resources is not None:
+        resources = resources.get_object()
+        if "/XObject" in resources:
+            xobjects = resources["/XObject"].get_object()
+            for obj_name in xobjects:
+                if xobjects[obj_name].get_object().get("/Subtype") == "/Form":
+                    return True
+
+    contents = page.get_contents()
+    if contents is None:
+        return False
+
+    return _PATH_OPERATOR_PATTERN.search(contents.get_data()) is not None
+
+
+# Form XObjects nested deeper than this are ignored by the coverage walk
+_MAX_FORM_DEPTH = 8
+
+
+def _concat_matrix(m: tuple, ctm: tuple) -> tuple:
+    """Return the matrix m applied before ctm (both as (a, b, c, d, e, f))."""
+    a, b, c, d, e, f = m
+    ca, cb, cc, cd, ce, cf = ctm
+    return (
+        a * ca + b * cc,
+        a * cb + b * cd,
+        c * ca + d * cc,
+        c * cb + d * cd,
+        e * ca + f * cc + ce,
+        e * cb + f * cd + cf,
+    )
+
+
+def _content_image_area(
+    contents: Any, resources: Any, reader: Any, ctm: tuple, depth: int, seen: set
+) -> float:
+    """
+    Sum the device-space area of images drawn by one content stream.
+
+    Form XObjects are walked recursively with their /Matrix applied, and the
+    area found inside a form is capped at the area of its /BBox.
+    """
+    from pypdf.generic import ContentStream
+
+    image_names = set()
+    forms: Dict[Any, Any] = {}
+    if resources is not None:
+        resources = resources.get_object()
+        if "/XObject" in resources:
+            xobjects = resources["/XObject"].get_object()
+            for obj_name in xobjects:
+                ref = xobjects[obj_name]
+                obj = ref.get_object()
+                subtype = obj.get("/Subtype")
+                if subtype == "/Image":
+                    image_names.add(obj_name)
+                elif subtype == "/Form":
+                    forms[obj_name] = (getattr(ref, "idnum", None), obj)
+
+    if not isinstance(contents, ContentStream):
+        contents = ContentStream(contents, reader)
+
+    stack = []
+    covered = 0.0
+
+    for operands, operator in contents.operations:
+        if operator == b"q":
+            stack.append(ctm)
+        elif operator == b"Q":
+            if stack:
+                ctm = stack.pop()
+        elif operator == b"cm" and len(operands) == 6:
+            ctm = _concat_matrix(tuple(float(x) for x in operands), ctm)
+        elif (operator == b"Do" and operands and operands[0] in image_names) or (
+            operator == b"INLINE IMAGE"
+        ):
+            # Images are drawn into the unit square, so the placed area is
+            # the determinant of the CTM
+            covered += abs(ctm[0] * ctm[3] - ctm[1] * ctm[2])
+        elif operator == b"Do" and operands and operands[0] in forms:
+            idnum, form = forms[operands[0]]
+            if depth >= _MAX_FORM_DEPTH or (idnum is not None and idnum in seen):
+                continue
+            matrix = form.get("/Matrix")
+            form_ctm = ctm
+            if matrix is not None and len(matrix) == 6:
+                form_ctm = _concat_matrix(tuple(float(x) for x in matrix), ctm)
+            inner = _content_image_area(
+                form,
+                form.get("/Resources", resources),
+                reader,
+                form_ctm,
+                depth + 1,
+                (seen | {idnum}) if idnum is not None else seen,
+            )
+            bbox = form.get("/BBox")
+            if bbox is not None and len(bbox) == 4:
+                x0, y0, x1, y1 = (float(x) for x in bbox)
+                det = abs(form_ctm[0] * form_ctm[3] - form_ctm[1] * form_ctm[2])
+                inner = min(inner, abs(x1 - x0) * abs(y1 - y0) * det)
+            covered += inner
+
+    return covered
+
+
+def compute_page_image_coverage(page: Any, reader: Any) -> float:
+    """
+    Estimate the fraction of a pypdf page covered by images.
+
+    Images placed inside Form XObjects (as many scanners emit them) are
+    included, with the form's /Matrix applied and its /BBox as a clip.
+
+    Args:
+        page: pypdf PageObject
+        reader: PdfReader owning the page
+
+    Returns:
+        Coverage between 0.0 and 1.0
+    """
+    page_area = float(page.mediabox.width) * float(page.mediabox.height)
+    if page_area <= 0:
+        return 0.0
+
+    contents = page.get_contents()
+    if contents is None:
+        return 0.0
+
+    covered = _content_image_area(
+        contents,
+        page.get("/Resources"),
+        reader,
+        (1.0, 0.0, 0.0, 1.0, 0.0, 0.0),
+        0,
+        set(),
+    )
+    return min(covered / page_area, 1.0)
+
+
+class PdfDocumentSession:
+    """
+    Parse-once view of a PDF shared by all PdfExtractor passes.
+
+    The session owns the raw file bytes, the pypdf reader, and (lazily) the
+    pdfplumber document. Page objects, page text and image XObjects are
+    cached on first access so later passes never re-parse them.
+
+    Attributes:
+        file_path: Path to the PDF file
+        file_stat: stat of the file taken when it was read
+        reader: PdfReader over the shared in-memory buffer
+
+    Note:
+        Not thread-safe. Create one session per extraction.
+    """
+
+    def __init__(self, file_path: Path):
+        """
+        Open a PDF and parse its structure once.
+
+        Args:
+            file_path: Path to PDF file
+
+        Raises:
+            Exception: Any pypdf parse error (callers treat it as file-level failure)
+        """
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            self.file_stat = os.fstat(f.fileno())
+            self._data = f.read()
+        self.reader = PdfReader(io.BytesIO(self._data))
+
+        self._pages: Dict[int, Any] = {}
+        self._page_texts: Dict[int, Optional[str]] = {}
+        self._page_images: Dict[int, List[Any]] = {}
+        self._page_coverage: Dict[int, float] = {}
+        self._page_paths: Dict[int, bool] = {}
+        self._plumber: Optional[Any] = None
+        self._file_hash: Optional[str] = None
+
+    def __enter__(self) -> "PdfDocumentSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document."""
+        return len(self.reader.pages)
+
+    @property
+    def file_hash(self) -> str:
+        """SHA256 hex digest of the file, computed from the shared buffer."""
+        if self._file_hash is None:
+            self._file_hash = hashlib.sha256(self._data).hexdigest()
+        return self._file_hash
+
+    def get_page(self, page_num: int) -> Any:
+        """
+        Return the pypdf page object for a page.
+
+        Args:
+            page_num: Page number (1-indexed)
+
+        Returns:
+            pypdf PageObject
+        """
+        page = self._pages.get(page_num)
+        if page is None:
+            page = self.reader.pages[page_num - 1]
+            self._pages[page_num] = page
+        return page
+
+    def get_page_text(self, page_num: int) -> Optional[str]:
+        """
+        Return native text for a page, extracting it on first access.
+
+        Args:
+            page_num: Page number (1-indexed)
+
+        Returns:
+            Extracted text (may be empty or None for image-only pages)
+
+        Raises:
+            Exception: Propagates pypdf text extraction errors (not cached)
+        """
+        if page_num not in self._page_texts:
+            self._page_texts[page_num] = self.get_page(page_num).extract_text()
+        return self._page_texts[page_num]
+
+    def cache_page_text(self, page_num: int, text: Optional[str]) -> None:
+        """
+        Store text extracted elsewhere (e.g., by a page-parallel worker).
+
+        Args:
+            page_num: Page number (1-indexed)
+            text: Extracted text
+        """
+        self._page_texts[page_num] = text
+
+    def has_page_text(self, page_num: int) -> bool:
+        """Return True if text for the page is already cached."""
+        return page_num in self._page_texts
+
+    def get_page_images(self, page_num: int) -> List[Any]:
+        """
+        Return the image XObjects referenced directly by a page.
+
+        Args:
+            page_num: Page number (1-indexed)
+
+        Returns:
+            List of image XObject dictionaries (empty if none)
+        """
+        images = self._page_images.get(page_num)
+        if images is None:
+            images = get_page_image_xobjects(self.get_page(page_num))
+            self._page_images[page_num] = images
+        return images
+
+    def get_page_image_coverage(self, page_num: int) -> float:
+        """
+        Return the fraction of a page's area covered by placed images.
+
+        Walks the page content stream, tracking the current transformation
+        matrix through q/Q/cm, and sums the area of every image XObject or
+        inline image drawn, including images nested in Form XObjects.
+        Overlapping images are not de-duplicated, so the result is capped
+        at 1.0.
+
+        Args:
+            page_num: Page number (1-indexed)
+
+        Returns:
+            Coverage between 0.0 and 1.0
+        """
+        coverage = self._page_coverage.get(page_num)
+        if coverage is None:
+            coverage = compute_page_image_coverage(self.get_page(page_num), self.reader)
+            self._page_coverage[page_num] = coverage
+        return coverage
+
+    def page_has_vector_paths(self, page_num: int) -> bool:
+        """
+        Return False only if a page certainly draws no lines or rectangles.
+
+        Args:
+            page_num: Page number (1-indexed)
+
+        Returns:
+            True if the page may contain ruling lines
+        """
+        has_paths = self._page_paths.get(page_num)
+        if has_paths is None:
+            has_paths = page_has_vector_paths(self.get_page(page_num))
+            self._page_paths[page_num] = has_paths
+        return has_paths
+
+    @property
+    def plumber(self) -> Any:
+        """
+        pdfplumber document over the shared buffer, opened on first access.
+
+        Raises:
+            ImportError: If pdfplumber is not installed
+        """
+        if self._plumber is None:
+            if not PDFPLUMBER_AVAILABLE:
+                raise ImportError("pdfplumber library not available")
+            self._plumber = pdfplumber.open(io.BytesIO(self._data))
+        return self._plumber
+
+    def close(self) -> None:
+        """Release the pdfplumber document and cached page state."""
+        if self._plumber is not None:
+            try:
+                self._plumber.close()
+            finally:
+                self._plumber = None
+        self._pages.clear()
+        self._page_images.clear()
+        self._page_coverage.clear()
+        self._page_paths.clear()
@@ -11,17 +11,25 @@ Design:
 - TDD implementation following BaseExtractor interface
 - Uses python-pptx library for parsing
 - Infrastructure integration (ConfigManager, logging, error handling)
+- One walk per slide collects text, notes and image metadata (image format
+  from the package content type, without decoding image bytes)
+- Optional slide-parallel extraction across a process pool, merged in order
 """
 
 import hashlib
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, List, Optional, Union
 
 try:
     from pptx import Presentation
+    from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
     from pptx.exc import PackageNotFoundError
+    from pptx.shapes.picture import Picture
 except ImportError:
     raise ImportError(
         "python-pptx is required for PptxExtractor. " "Install with: pip install python-pptx"
@@ -37,8 +45,10 @@ from core import (
     ContentType,
     DocumentMetadata,
     ExtractionResult,
+    ExtractionStreamItem,
     ImageMetadata,
     Position,
+    collect_extraction_stream,
 )
 
 # Import infrastructure components
@@ -47,12 +57,55 @@ try:
         ConfigManager,
         ErrorHandler,
         get_logger,
+        get_provenance_cache,
     )
 
     INFRASTRUCTURE_AVAILABLE = True
 except ImportError:
     INFRASTRUCTURE_AVAILABLE = False
 
+# Image formats by package content type (the formats python-pptx Image.ext
+# recognizes)
+IMAGE_FORMATS = {
+    "image/bmp": "BMP",
+    "image/gif": "GIF",
+    "image/jpeg": "JPG",
+    "image/png": "PNG",
+    "image/tiff": "TIFF",
+    "image/x-wmf": "WMF",
+}
+
+# (block_type, content, raw_content, metadata) of one slide block;
+# sequence indexes are assigned when slides are merged
+SlideBlock = tuple
+
+
+def _extract_slide_range(
+    file_path: str, config: dict, start: int, stop: int
+) -> List[tuple[int, List[SlideBlock], List[ImageMetadata]]]:
+    """
+    Extract a contiguous range of slides in a worker process.
+
+    Each worker opens its own presentation, so no python-pptx state crosses
+    process boundaries. Defined at module level so it can be pickled by the
+    pool.
+
+    Args:
+        file_path: Path to PPTX file (as string for cheap pickling)
+        config: Extractor settings (plain dict)
+        start: First slide position (0-indexed)
+        stop: End slide position (exclusive)
+
+    Returns:
+        List of (slide_number, slide_blocks, images) tuples
+    """
+    extractor = PptxExtractor({**config, "parallel_slides": False})
+    prs = Presentation(file_path)
+    return [
+        (slide_num, *extractor._extract_slide(slide, slide_num))
+        for slide_num, slide in enumerate(islice(prs.slides, start, stop), start=start + 1)
+    ]
+
 
 class PptxExtractor(BaseExtractor):
     """
@@ -81,6 +134,12 @@ class PptxExtractor(BaseExtractor):
                 - extract_notes: Extract speaker notes (default: True)
                 - extract_images: Extract image metadata (default: True)
                 - skip_empty_slides: Skip slides with no content (default: False)
+                - parallel_slides: Extract slide ranges across a process pool
+                  (default: False)
+                - max_slide_workers: Worker processes for slide-parallel
+                  extraction (default: None = CPU count)
+                - parallel_min_slides: Minimum slide count before the pool is
+                  used (default: 50)
         """
         super().__init__(config if isinstance(config, dict) or config is None else {})
 
@@ -109,14 +168,25 @@ class PptxExtractor(BaseExtractor):
             self.extract_images = extract_images_val if extract_images_val is not None else True
             skip_empty_val = extractor_config.get("skip_empty_slides")
             self.skip_empty_slides = skip_empty_val if skip_empty_val is not None else False
+            parallel_val = extractor_config.get("parallel_slides")
+            self.parallel_slides = parallel_val if parallel_val is not None else False
+            self.max_slide_workers = extractor_config.get("max_slide_workers")
+            parallel_min_val = extractor_config.get("parallel_min_slides")
+            self.parallel_min_slides = parallel_min_val if parallel_min_val is not None else 50
         elif isinstance(config, dict):
             self.extract_notes = config.get("extract_notes", True)
             self.extract_images = config.get("extract_images", True)
             self.skip_empty_slides = config.get("skip_empty_slides", False)
+            self.parallel_slides = config.get("parallel_slides", False)
+            self.max_slide_workers = config.get("max_slide_workers")
+            self.parallel_min_slides = config.get("parallel_min_slides", 50)
         else:
             self.extract_notes = True
             self.extract_images = True
             self.skip_empty_slides = False
+            self.parallel_slides = False
+            self.max_slide_workers = None
+            self.parallel_min_slides = 50
 
     def supports_format(self, file_path: Path) -> bool:
         """
@@ -138,10 +208,28 @@ class PptxExtractor(BaseExtractor):
         """Return human-readable format name."""
         return "Microsoft PowerPoint"
 
+    def supports_streaming(self) -> bool:
+        """Blocks are yielded slide by slide."""
+        return True
+
     def extract(self, file_path: Path) -> ExtractionResult:
         """
         Extract content from PPTX file.
 
+        Collects extract_stream() into a single result.
+
+        Args:
+            file_path: Path to PPTX file
+
+        Returns:
+            ExtractionResult with content blocks and metadata
+        """
+        return collect_extraction_stream(self.extract_stream(file_path))
+
+    def extract_stream(self, file_path: Path) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract content from PPTX file, yielding each slide's blocks as it is read.
+
         Strategy:
         1. Validate file exists and is accessible
         2. Open presentation with python-pptx
@@ -149,16 +237,16 @@ class PptxExtractor(BaseExtractor):
         4. Extract text from shapes (title, body)
         5. Extract speaker notes if configured
         6. Generate presentation metadata
-        7. Return structured result
+        7. Yield ExtractionResult trailer (images, metadata, warnings)
 
         Args:
             file_path: Path to PPTX file
 
-        Returns:
-            ExtractionResult with content blocks and metadata
+        Yields:
+            ContentBlocks slide by slide, then one ExtractionResult
 
         Note:
-            - Returns success=False for file-level errors
+            - Yields a success=False trailer for file-level errors
             - Returns partial results if some slides fail
             - Logs warnings for recoverable issues
         """
@@ -172,7 +260,6 @@ class PptxExtractor(BaseExtractor):
 
         errors = []
         warnings = []
-        content_blocks = []
 
         # Step 1: Validate file
         is_valid, validation_errors = self.validate_file(file_path)
@@ -188,7 +275,7 @@ class PptxExtractor(BaseExtractor):
             else:
                 errors.extend(validation_errors)
 
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(errors),
                 document_metadata=DocumentMetadata(
@@ -196,13 +283,14 @@ class PptxExtractor(BaseExtractor):
                     file_format="pptx",
                 ),
             )
+            return
 
         try:
             # Step 2: Open presentation
             try:
                 prs = Presentation(file_path)
             except PackageNotFoundError as e:
-                return ExtractionResult(
+                yield ExtractionResult(
                     success=False,
                     errors=(f"Invalid PPTX file: {str(e)}",),
                     document_metadata=DocumentMetadata(
@@ -210,8 +298,9 @@ class PptxExtractor(BaseExtractor):
                         file_format="pptx",
                     ),
                 )
+                return
             except Exception as e:
-                return ExtractionResult(
+                yield ExtractionResult(
                     success=False,
                     errors=(f"Failed to open PPTX file: {str(e)}",),
                     document_metadata=DocumentMetadata(
@@ -219,80 +308,46 @@ class PptxExtractor(BaseExtractor):
                         file_format="pptx",
                     ),
                 )
+                return
 
-            # Step 3: Extract slides
+            # Step 3: Extract slides (text, notes and image metadata in one walk)
             sequence_index = 0
-            for slide_num, slide in enumerate(prs.slides, start=1):
-                slide_blocks = []
-
-                # Extract text from shapes
-                for shape in slide.shapes:
-                    if not hasattr(shape, "text") or not shape.text:
-                        continue
-
-                    text = shape.text.strip()
-                    if not text:
-                        continue
+            block_count = 0
+            total_chars = 0
+            total_words = 0
+            images = []
+            for slide_num, slide_blocks, slide_images in self._iter_slides(file_path, prs):
+                images.extend(slide_images)
 
-                    # Detect if this is a title or body text
-                    block_type = self._detect_shape_type(shape, slide)
+                # Skip empty slides if configured
+                if self.skip_empty_slides and not slide_blocks:
+                    continue
 
-                    # Create content block
-                    block = ContentBlock(
+                for block_type, content, raw_content, metadata in slide_blocks:
+                    total_chars += len(content)
+                    total_words += len(content.split())
+                    yield ContentBlock(
                         block_type=block_type,
-                        content=text,
-                        raw_content=shape.text,
+                        content=content,
+                        raw_content=raw_content,
                         position=Position(slide=slide_num, sequence_index=sequence_index),
                         confidence=1.0,
-                        metadata={
-                            "slide_number": slide_num,
-                            "shape_name": shape.name if hasattr(shape, "name") else None,
-                        },
+                        metadata=metadata,
                     )
-                    slide_blocks.append(block)
                     sequence_index += 1
-
-                # Extract speaker notes if configured
-                if self.extract_notes and slide.has_notes_slide:
-                    notes_text = slide.notes_slide.notes_text_frame.text.strip()
-                    if notes_text:
-                        notes_block = ContentBlock(
-                            block_type=ContentType.COMMENT,
-                            content=notes_text,
-                            position=Position(slide=slide_num, sequence_index=sequence_index),
-                            confidence=1.0,
-                            metadata={
-                                "slide_number": slide_num,
-                                "is_speaker_note": True,
-                            },
-                        )
-                        slide_blocks.append(notes_block)
-                        sequence_index += 1
-
-                # Skip empty slides if configured
-                if self.skip_empty_slides and not slide_blocks:
-                    continue
-
-                content_blocks.extend(slide_blocks)
+                block_count += len(slide_blocks)
 
             # Check if we got any content
-            if not content_blocks:
+            if block_count == 0:
                 warnings.append("No content extracted from presentation")
 
-            # Step 3.5: Extract images if configured
-            images = []
-            if self.extract_images:
-                images = self._extract_image_metadata(prs)
-                if INFRASTRUCTURE_AVAILABLE:
-                    self.logger.debug(f"Extracted {len(images)} images")
+            if self.extract_images and INFRASTRUCTURE_AVAILABLE:
+                self.logger.debug(f"Extracted {len(images)} images")
 
             # Step 4: Generate presentation metadata
             doc_metadata = self._extract_presentation_metadata(file_path, prs)
 
-            # Update statistics
-            total_chars = sum(len(b.content) for b in content_blocks)
-            total_words = sum(len(b.content.split()) for b in content_blocks)
-
+            # Update statistics (accumulated while streaming)
             doc_metadata = DocumentMetadata(
                 source_file=doc_metadata.source_file,
                 file_format=doc_metadata.file_format,
@@ -311,26 +366,26 @@ class PptxExtractor(BaseExtractor):
                 extractor_version="0.1.0",
             )
 
-            # Step 5: Log completion and return result
+            # Step 5: Log completion and yield result trailer
             duration = time.time() - start_time
             if INFRASTRUCTURE_AVAILABLE:
                 self.logger.info(
                     "PPTX extraction complete",
                     extra={
                         "file": str(file_path),
-                        "blocks": len(content_blocks),
+                        "blocks": block_count,
                         "slides": len(prs.slides),
                         "duration_seconds": round(duration, 3),
                     },
                 )
 
-            return ExtractionResult(
-                content_blocks=tuple(content_blocks),
+            yield ExtractionResult(
                 document_metadata=doc_metadata,
                 images=tuple(images),
                 success=True,
                 warnings=tuple(warnings),
             )
+            return
 
         except PermissionError as e:
             if self.error_handler:
@@ -358,8 +413,8 @@ class PptxExtractor(BaseExtractor):
                     "Extraction failed", extra={"file": str(file_path), "error": str(e)}
                 )
 
-        # Return failed result
-        return ExtractionResult(
+        # Yield failed result
+        yield ExtractionResult(
             success=False,
             errors=tuple(errors),
             warnings=tuple(warnings),
@@ -369,7 +424,167 @@ class PptxExtractor(BaseExtractor):
             ),
         )
 
-    def _detect_shape_type(self, shape, slide) -> ContentType:
+    def _iter_slides(
+        self, file_path: Path, prs: Presentation
+    ) -> Iterator[tuple[int, List[SlideBlock], List[ImageMetadata]]]:
+        """
+        Yield extracted slides in order, in-process or across a process pool.
+
+        Args:
+            file_path: Path to PPTX file
+            prs: Open python-pptx Presentation (used for in-process extraction)
+
+        Yields:
+            (slide_number, slide_blocks, images) per slide
+        """
+        slide_count = len(prs.slides)
+        next_slide = 0
+
+        if self._should_parallelize(slide_count):
+            try:
+                for slide_num, slide_blocks, slide_images in self._extract_slides_parallel(
+                    file_path, slide_count
+                ):
+                    yield slide_num, slide_blocks, slide_images
+                    next_slide = slide_num
+                return
+            except Exception as e:
+                # Pool unavailable (e.g., restricted environment) or a worker
+                # died: finish the remaining slides in-process
+                if INFRASTRUCTURE_AVAILABLE:
+                    self.logger.warning(
+                        "Slide-parallel extraction failed, continuing serially",
+                        extra={
+                            "file": str(file_path),
+                            "next_slide": next_slide + 1,
+                            "error": str(e),
+                        },
+                    )
+
+        for slide_num, slide in enumerate(
+            islice(prs.slides, next_slide, None), start=next_slide + 1
+        ):
+            yield (slide_num, *self._extract_slide(slide, slide_num))
+
+    def _should_parallelize(self, slide_count: int) -> bool:
+        """Return True if slides should be extracted across a process pool."""
+        return (
+            self.parallel_slides
+            and slide_count >= max(self.parallel_min_slides, 2)
+            and self._slide_worker_count() > 1
+        )
+
+    def _slide_worker_count(self) -> int:
+        """Return the number of worker processes for slide-parallel extraction."""
+        return max(1, self.max_slide_workers or os.cpu_count() or 1)
+
+    def _worker_config(self) -> dict:
+        """Return extractor settings as a plain dict for worker processes."""
+        return {
+            "extract_notes": self.extract_notes,
+            "extract_images": self.extract_images,
+            "skip_empty_slides": self.skip_empty_slides,
+        }
+
+    def _extract_slides_parallel(
+        self, file_path: Path, slide_count: int
+    ) -> Iterator[tuple[int, List[SlideBlock], List[ImageMetadata]]]:
+        """
+        Extract contiguous slide ranges across a process pool.
+
+        Each worker extracts one range; ranges are yielded in slide order as
+        soon as the range and all ranges before it have completed.
+
+        Args:
+            file_path: Path to PPTX file
+            slide_count: Number of slides in the presentation
+
+        Yields:
+            (slide_number, slide_blocks, images) per slide, in slide order
+
+        Raises:
+            Exception: Pool creation or worker failures (caller falls back)
+        """
+        workers = min(self._slide_worker_count(), slide_count)
+        bounds = [slide_count * i // workers for i in range(workers + 1)]
+        config = self._worker_config()
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_extract_slide_range, str(file_path), config, start, stop)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            for future in futures:
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _extract_slide(self, slide, slide_num: int) -> tuple[List[SlideBlock], List[ImageMetadata]]:
+        """
+        Extract text blocks, speaker notes and image metadata from one slide.
+
+        Args:
+            slide: python-pptx Slide object
+            slide_num: Slide number (1-indexed)
+
+        Returns:
+            Tuple of (slide_blocks, images); sequence indexes are assigned by
+            the caller
+        """
+        slide_blocks: List[SlideBlock] = []
+        images: List[ImageMetadata] = []
+
+        # Extract text from all shapes on slide
+        for shape in slide.shapes:
+            # Filled picture placeholders report PLACEHOLDER and are not counted
+            if (
+                self.extract_images
+                and isinstance(shape, Picture)
+                and shape.shape_type == MSO_SHAPE_TYPE.PICTURE
+            ):
+                image_meta = self._picture_metadata(shape, slide_num)
+                if image_meta is not None:
+                    images.append(image_meta)
+
+            text = getattr(shape, "text", None)
+            content = text.strip() if text else None
+            if not content:
+                continue
+
+            # Detect if this is a title or body text
+            shape_name = getattr(shape, "name", None)
+            slide_blocks.append(
+                (
+                    self._detect_shape_type(shape, slide, shape_name),
+                    content,
+                    text,
+                    {
+                        "slide_number": slide_num,
+                        "shape_name": shape_name,
+                    },
+                )
+            )
+
+        # Extract speaker notes if enabled
+        if self.extract_notes and slide.has_notes_slide:
+            notes_text = slide.notes_slide.notes_text_frame.text.strip()
+            if notes_text:
+                slide_blocks.append(
+                    (
+                        ContentType.COMMENT,
+                        notes_text,
+                        None,
+                        {
+                            "slide_number": slide_num,
+                            "is_speaker_note": True,
+                        },
+                    )
+                )
+
+        return slide_blocks, images
+
+    def _detect_shape_type(self, shape, slide, shape_name: Optional[str] = None) -> ContentType:
         """
         Detect content type based on shape properties.
 
@@ -380,18 +595,21 @@ class PptxExtractor(BaseExtractor):
         Args:
             shape: python-pptx Shape object
             slide: python-pptx Slide object
+            shape_name: Shape name if already read (default: read from shape)
 
         Returns:
             ContentType enum value
         """
-        # Check if shape is title placeholder
-        if hasattr(shape, "is_placeholder") and shape.is_placeholder:
-            placeholder_format = shape.placeholder_format
-            if placeholder_format.type == 1:  # Title placeholder type
-                return ContentType.HEADING
+        # Check if shape is title placeholder (the type comes from the
+        # slide's own p:ph element, read once)
+        ph = shape._element.ph if hasattr(shape, "_element") else None
+        if ph is not None and ph.type == PP_PLACEHOLDER.TITLE:
+            return ContentType.HEADING
 
         # Check if shape name suggests it's a title
-        if hasattr(shape, "name") and "title" in shape.name.lower():
+        if shape_name is None:
+            shape_name = getattr(shape, "name", None)
+        if shape_name and "title" in shape_name.lower():
             return ContentType.HEADING
 
         # Default to paragraph
@@ -455,6 +673,9 @@ class PptxExtractor(BaseExtractor):
         Returns:
             Hex string of SHA256 hash
         """
+        if INFRASTRUCTURE_AVAILABLE:
+            return get_provenance_cache().file_hash(file_path)
+
         sha256 = hashlib.sha256()
 
         # Read in chunks to handle large files
@@ -464,76 +685,46 @@ class PptxExtractor(BaseExtractor):
 
         return sha256.hexdigest()
 
-    def _extract_image_metadata(self, prs: Presentation) -> list[ImageMetadata]:
+    def _picture_metadata(self, shape, slide_num: int) -> Optional[ImageMetadata]:
         """
-        Extract image metadata from presentation slides.
+        Build image metadata for a picture shape.
 
-        Strategy:
-        1. Iterate through all slides
-        2. Find shapes that are pictures
-        3. Extract image properties (dimensions, format)
-        4. Create ImageMetadata objects
+        The format comes from the content type of the related image part, so
+        the image bytes are never decoded.
 
         Args:
-            prs: python-pptx Presentation object
+            shape: python-pptx Picture shape
+            slide_num: Slide number (1-indexed)
 
         Returns:
-            List of ImageMetadata objects
+            ImageMetadata, or None if the picture has no embedded image of a
+            known format
         """
-        from pptx.enum.shapes import MSO_SHAPE_TYPE
-
-        images = []
-
         try:
-            for slide_num, slide in enumerate(prs.slides, start=1):
-                for shape in slide.shapes:
-                    # Check if shape is a picture
-                    if not hasattr(shape, "shape_type"):
-                        continue
-
-                    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                        try:
-                            # Get image object
-                            image = shape.image
-
-                            # Get dimensions (convert from EMUs to pixels)
-                            # EMU (English Metric Unit): 914400 EMUs = 1 inch
-                            # Assuming 96 DPI: 1 inch = 96 pixels
-                            width_pixels = (
-                                int(shape.width * 96 / 914400) if hasattr(shape, "width") else None
-                            )
-                            height_pixels = (
-                                int(shape.height * 96 / 914400)
-                                if hasattr(shape, "height")
-                                else None
-                            )
-
-                            # Get image format
-                            img_format = None
-                            if hasattr(image, "ext"):
-                                img_format = image.ext.upper()
-
-                            # Create metadata
-                            image_meta = ImageMetadata(
-                                width=width_pixels,
-                                height=height_pixels,
-                                format=img_format,
-                                # Store slide location in alt_text for now
-                                alt_text=f"Image on slide {slide_num}",
-                            )
-                            images.append(image_meta)
-
-                        except Exception as e:
-                            # Log warning but continue with other images
-                            if INFRASTRUCTURE_AVAILABLE:
-                                self.logger.warning(
-                                    f"Failed to extract image metadata from slide {slide_num}",
-                                    extra={"error": str(e)},
-                                )
+            r_id = shape._element.blip_rId
+            if r_id is None:
+                raise ValueError("no embedded image")
+
+            img_format = IMAGE_FORMATS.get(shape.part.related_part(r_id).content_type)
+            if img_format is None:
+                raise ValueError("unsupported image format")
+
+            # Get dimensions (convert from EMUs to pixels)
+            # EMU (English Metric Unit): 914400 EMUs = 1 inch
+            # Assuming 96 DPI: 1 inch = 96 pixels
+            return ImageMetadata(
+                width=int(shape.width * 96 / 914400),
+                height=int(shape.height * 96 / 914400),
+                format=img_format,
+                # Store slide location in alt_text for now
+                alt_text=f"Image on slide {slide_num}",
+            )
 
         except Exception as e:
-            # Log error but return partial results
+            # Log warning but continue with other images
             if INFRASTRUCTURE_AVAILABLE:
-                self.logger.error("Error during image metadata extraction", extra={"error": str(e)})
-
-        return images
+                self.logger.warning(
+                    f"Failed to extract image metadata from slide {slide_num}",
+                    extra={"error": str(e)},
+                )
+            return None
@@ -2,9 +2,22 @@
 Plain Text Extractor - Extract content from text files.
 
 Supports .txt, .md, and .log files with paragraph-level extraction.
+
+The file is memory-mapped and scanned for paragraph breaks as raw bytes.
+Only one paragraph is decoded at a time, and word and character counts are
+accumulated during that scan, so multi-GB log files are never held in memory
+as a whole. Paragraphs that are not valid UTF-8 are decoded with a legacy
+encoding detected from the first such paragraph (no re-read of the file).
+The SHA256 of the file is computed from the same scan.
 """
 
+import codecs
+import hashlib
+import mmap
+import os
+import re
 from pathlib import Path
+from typing import Iterator, Optional, Union
 from uuid import uuid4
 
 from core import (
@@ -13,9 +26,80 @@ from core import (
     ContentType,
     DocumentMetadata,
     ExtractionResult,
+    ExtractionStreamItem,
     Position,
+    collect_extraction_stream,
 )
 
+# Try to import chardet for encoding detection
+try:
+    import chardet
+
+    CHARDET_AVAILABLE = True
+except ImportError:
+    CHARDET_AVAILABLE = False
+
+# Provenance cache is optional (infrastructure may be absent)
+try:
+    from infrastructure import get_provenance_cache
+
+    INFRASTRUCTURE_AVAILABLE = True
+except ImportError:
+    INFRASTRUCTURE_AVAILABLE = False
+
+# Encodings tried (after chardet) for paragraphs that are not valid UTF-8
+DEFAULT_FALLBACK_ENCODINGS = ("cp1252",)
+
+# Paragraph break in the raw bytes: two consecutive line endings (\r\n, \r
+# or \n), i.e. "\n\n" after universal-newline translation. Written out
+# twice (not {2}) so the regex engine can skip ahead to \r/\n candidates.
+_LINE_END = rb"(?:\r\n|\r(?!\n)|\n)"
+_PARAGRAPH_BREAK = re.compile(_LINE_END + _LINE_END)
+
+# Control characters that mark a fallback decode as binary, not text
+_BINARY_CHARS = re.compile(r"[\x00-\x08\x0e-\x1f]")
+
+# Line endings must be plain ASCII bytes for the byte-level paragraph scan
+_ASCII_PROBE = "\r\n\t abc"
+
+
+def _iter_paragraph_bytes(buffer) -> Iterator[tuple[int, bytes]]:
+    """
+    Split a byte buffer at paragraph breaks, one paragraph at a time.
+
+    Args:
+        buffer: Bytes-like object (e.g., an mmap of the file)
+
+    Yields:
+        (byte_offset, paragraph_bytes) for each paragraph, including empty
+        ones between consecutive breaks and after a trailing break
+    """
+    pos = 0
+    if buffer.find(b"\r") < 0:
+        # LF-only file: plain substring search is much faster than the regex
+        while True:
+            end = buffer.find(b"\n\n", pos)
+            if end < 0:
+                yield pos, buffer[pos:]
+                return
+            yield pos, buffer[pos:end]
+            pos = end + 2
+
+    while True:
+        match = _PARAGRAPH_BREAK.search(buffer, pos)
+        if match is None:
+            yield pos, buffer[pos:]
+            return
+        yield pos, buffer[pos : match.start()]
+        pos = match.end()
+
+
+def _translate_newlines(text: str) -> str:
+    """Apply universal-newline translation (CRLF and CR → LF)."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
 class TextFileExtractor(BaseExtractor):
     """
@@ -28,6 +112,27 @@ class TextFileExtractor(BaseExtractor):
     - Error handling patterns
     """
 
+    def __init__(self, config: Optional[Union[dict, object]] = None):
+        """
+        Initialize text extractor with optional configuration.
+
+        Args:
+            config: Configuration options (dict or ConfigManager):
+                - fallback_encodings: Encodings tried for paragraphs that are
+                  not valid UTF-8, after chardet (default: ["cp1252"])
+        """
+        super().__init__(config if isinstance(config, dict) or config is None else {})
+
+        if hasattr(config, "get_section"):
+            extractor_config = config.get_section("extractors.txt", default={}) or {}
+        else:
+            extractor_config = self.config
+
+        fallback_val = extractor_config.get("fallback_encodings")
+        self.fallback_encodings = (
+            tuple(fallback_val) if fallback_val is not None else DEFAULT_FALLBACK_ENCODINGS
+        )
+
     def supports_format(self, file_path: Path) -> bool:
         """Check if file is a text file."""
         return file_path.suffix.lower() in [".txt", ".md", ".log"]
@@ -36,26 +141,37 @@ class TextFileExtractor(BaseExtractor):
         """Supported file extensions."""
         return [".txt", ".md", ".log"]
 
+    def supports_streaming(self) -> bool:
+        """Blocks are yielded paragraph by paragraph."""
+        return True
+
     def extract(self, file_path: Path) -> ExtractionResult:
         """
         Extract content from text file.
 
+        Collects extract_stream() into a single result.
+        """
+        return collect_extraction_stream(self.extract_stream(file_path))
+
+    def extract_stream(self, file_path: Path) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract content from text file, yielding blocks as they are produced.
+
         Strategy:
         1. Validate file
-        2. Read content
-        3. Split into paragraphs
-        4. Create ContentBlock for each paragraph
-        5. Generate metadata
-        6. Return ExtractionResult
+        2. Memory-map content
+        3. Scan for paragraph breaks, decoding one paragraph at a time
+        4. Yield a ContentBlock for each paragraph
+        5. Generate metadata (counts accumulated during the scan)
+        6. Yield ExtractionResult trailer
         """
         errors = []
         warnings = []
-        content_blocks = []
 
         # Step 1: Validate
         is_valid, validation_errors = self.validate_file(file_path)
         if not is_valid:
-            return ExtractionResult(
+            yield ExtractionResult(
                 success=False,
                 errors=tuple(validation_errors),
                 document_metadata=DocumentMetadata(
@@ -63,60 +179,100 @@ class TextFileExtractor(BaseExtractor):
                     file_format="text",
                 ),
             )
+            return
 
         try:
-            # Step 2: Read content
-            text = file_path.read_text(encoding="utf-8")
-
-            # Step 3: Split into paragraphs
-            paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-
-            if not paragraphs:
+            # Step 2: Memory-map content
+            with (
+                open(file_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                # Steps 3-4: Split into paragraphs and yield ContentBlocks
+                file_stat = os.fstat(f.fileno())
+                sha256 = hashlib.sha256()
+                hashed_to = 0
+                idx = 0
+                word_count = 0
+                char_count = 0
+                fallback_encoding = None
+                for offset, raw in _iter_paragraph_bytes(mm):
+                    if offset:
+                        char_count += 2  # The paragraph break before this one
+                        sha256.update(mm[hashed_to:offset])
+                    sha256.update(raw)
+                    hashed_to = offset + len(raw)
+
+                    try:
+                        text = raw.decode("utf-8")
+                    except UnicodeDecodeError:
+                        if fallback_encoding is None:
+                            fallback_encoding = self._detect_fallback_encoding(raw)
+                            if fallback_encoding is None:
+                                raise
+                            warnings.append(
+                                f"Text at byte {offset} is not valid UTF-8; "
+                                f"decoded as {fallback_encoding}"
+                            )
+                        text = raw.decode(fallback_encoding)
+
+                    text = _translate_newlines(text)
+                    char_count += len(text)
+                    paragraph = text.strip()
+                    if not paragraph:
+                        continue
+
+                    paragraph_words = len(paragraph.split())
+                    word_count += paragraph_words
+
+                    # Detect if this is a heading (simple heuristic: short, no punctuation)
+                    is_heading = len(paragraph) < 80 and not paragraph.endswith(".")
+
+                    yield ContentBlock(
+                        block_id=uuid4(),
+                        block_type=ContentType.HEADING if is_heading else ContentType.PARAGRAPH,
+                        content=paragraph,
+                        raw_content=paragraph,
+                        position=Position(sequence_index=idx),
+                        confidence=1.0,  # High confidence for plain text
+                        metadata={
+                            "char_count": len(paragraph),
+                            "word_count": paragraph_words,
+                        },
+                    )
+                    idx += 1
+
+            if idx == 0:
                 warnings.append("No content found in file")
 
-            # Step 4: Create ContentBlocks
-            for idx, paragraph in enumerate(paragraphs):
-                # Detect if this is a heading (simple heuristic: short, no punctuation)
-                is_heading = len(paragraph) < 80 and not paragraph.endswith(".")
-
-                block = ContentBlock(
-                    block_id=uuid4(),
-                    block_type=ContentType.HEADING if is_heading else ContentType.PARAGRAPH,
-                    content=paragraph,
-                    raw_content=paragraph,
-                    position=Position(sequence_index=idx),
-                    confidence=1.0,  # High confidence for plain text
-                    metadata={
-                        "char_count": len(paragraph),
-                        "word_count": len(paragraph.split()),
-                    },
-                )
-                content_blocks.append(block)
+            file_hash = sha256.hexdigest()
+            if INFRASTRUCTURE_AVAILABLE:
+                get_provenance_cache().record(file_path, file_hash, file_stat)
 
             # Step 5: Generate metadata
             metadata = DocumentMetadata(
                 source_file=file_path,
                 file_format="text",
-                file_size_bytes=file_path.stat().st_size,
-                word_count=len(text.split()),
-                character_count=len(text),
+                file_size_bytes=file_stat.st_size,
+                file_hash=file_hash,
+                word_count=word_count,
+                character_count=char_count,
             )
 
-            # Step 6: Return result
-            return ExtractionResult(
-                content_blocks=tuple(content_blocks),
+            # Step 6: Yield result trailer
+            yield ExtractionResult(
                 document_metadata=metadata,
                 success=True,
                 warnings=tuple(warnings),
             )
+            return
 
         except UnicodeDecodeError:
             errors.append("File is not valid UTF-8 text")
         except Exception as e:
             errors.append(f"Unexpected error: {str(e)}")
 
-        # Return failed result
-        return ExtractionResult(
+        # Yield failed result
+        yield ExtractionResult(
             success=False,
             errors=tuple(errors),
             document_metadata=DocumentMetadata(
@@ -125,6 +281,42 @@ class TextFileExtractor(BaseExtractor):
             ),
         )
 
+    def _detect_fallback_encoding(self, sample: bytes) -> Optional[str]:
+        """
+        Choose an encoding for text that is not valid UTF-8.
+
+        Candidates are chardet's guess (if confident) followed by the
+        configured fallback encodings. A candidate is accepted only if it is
+        ASCII-compatible (so the byte-level paragraph scan stays valid) and
+        decodes the sample into text without binary control characters.
+
+        Args:
+            sample: Bytes of the paragraph that failed to decode
+
+        Returns:
+            Encoding name, or None if the sample does not look like text
+        """
+        candidates = []
+        if CHARDET_AVAILABLE:
+            try:
+                detection = chardet.detect(sample)
+                if detection["confidence"] > 0.7 and detection["encoding"]:
+                    candidates.append(detection["encoding"].lower())
+            except Exception:
+                pass
+        candidates.extend(self.fallback_encodings)
+
+        for encoding in candidates:
+            try:
+                if _ASCII_PROBE.encode(encoding) != _ASCII_PROBE.encode("ascii"):
+                    continue
+                text = sample.decode(encoding)
+            except (LookupError, UnicodeError):
+                continue
+            if not _BINARY_CHARS.search(text):
+                return codecs.lookup(encoding).name
+        return None
+
 
 def main():
     """Example usage of the TextFileExtractor."""
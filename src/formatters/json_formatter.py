@@ -388,6 +388,9 @@ class JsonFormatter(BaseFormatter):
         if table.header_row:
             table_dict["header_row"] = list(table.header_row)
 
+        if getattr(table, "column_types", None):
+            table_dict["column_types"] = list(table.column_types)
+
         if table.cells:
             table_dict["cells"] = [list(row) for row in table.cells]
 
@@ -6,6 +6,7 @@ error handling, and progress tracking.
 """
 
 from .config_manager import ConfigManager, ConfigurationError
+from .disk_cache import DiskCache
 from .error_handler import (
     ConfigError,
     DataExtractionError,
@@ -20,6 +21,9 @@ from .error_handler import (
     UnknownError,
     ValidationError,
 )
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .file_provenance import FileProvenanceCache, get_provenance_cache
+from .ocr_cache import OCRCache, get_ocr_cache
 from .progress_tracker import ProgressTracker
 
 # Logging framework imports (when implemented)
@@ -48,6 +52,13 @@ try:
         "ErrorHandler",
         "RecoveryAction",
         "ProgressTracker",
+        "DiskCache",
+        "OCRCache",
+        "get_ocr_cache",
+        "FileProvenanceCache",
+        "get_provenance_cache",
+        "ExtractionCache",
+        "get_extraction_cache",
         "get_logger",
         "configure_from_yaml",
         "correlation_context",
@@ -72,4 +83,11 @@ except ImportError:
         "ErrorHandler",
         "RecoveryAction",
         "ProgressTracker",
+        "DiskCache",
+        "OCRCache",
+        "get_ocr_cache",
+        "FileProvenanceCache",
+        "get_provenance_cache",
+        "ExtractionCache",
+        "get_extraction_cache",
     ]
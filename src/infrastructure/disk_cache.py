@@ -0,0 +1,218 @@
+"""
+Size-Bounded On-Disk Cache Base for Data Extraction System.
+
+Shared storage for the OCR and extraction result caches. Subclasses choose
+the entry format (file suffix, encode/decode) and build their own keys; this
+module owns the directory layout, accounting and eviction.
+
+Design Principles:
+- One file per entry, named by its key and sharded into 256 subdirectories
+- Size-bounded with least-recently-used eviction (file mtime = last access)
+- Hit/miss/eviction statistics; unreadable entries count as misses
+- Thread-safe; safe to share a directory between processes (writes are atomic)
+
+Usage:
+    >>> class TextCache(DiskCache):
+    >>>     suffix = ".txt"
+    >>>     def _encode(self, value): return value.encode("utf-8")
+    >>>     def _decode(self, payload): return payload.decode("utf-8")
+    >>> cache = TextCache(Path(".cache"), max_size_mb=10)
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Size-bounded directory of cache entries.
+
+    Subclasses set suffix and description and implement _encode/_decode.
+
+    Attributes:
+        cache_dir: Directory holding cache entries
+        max_size_mb: Maximum total size of cache entries in MB
+    """
+
+    # Entry file suffix
+    suffix = ".bin"
+    # Used in log messages ("Failed to write <description> cache entry ...")
+    description = "disk"
+
+    def __init__(self, cache_dir: Union[str, Path], max_size_mb: float):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache storage (created if missing)
+            max_size_mb: Maximum cache size in MB
+
+        Raises:
+            ValueError: If max_size_mb is <= 0
+        """
+        if max_size_mb <= 0:
+            raise ValueError("max_size_mb must be > 0")
+
+        self.cache_dir = Path(cache_dir)
+        self.max_size_mb = max_size_mb
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # In-memory index of entry sizes, rebuilt from disk so entries written
+        # by other processes are accounted for
+        self._sizes: Dict[Path, int] = {}
+        for entry in self.cache_dir.glob(f"*/*{self.suffix}"):
+            try:
+                self._sizes[entry] = entry.stat().st_size
+            except OSError:
+                continue
+        self._total_size = sum(self._sizes.values())
+
+    def _encode(self, value: Any) -> bytes:
+        """Serialize a value for storage."""
+        raise NotImplementedError
+
+    def _decode(self, payload: bytes) -> Any:
+        """Deserialize a stored value (exceptions make the entry a miss)."""
+        raise NotImplementedError
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None on miss
+        """
+        path = self._entry_path(key)
+
+        try:
+            value = self._decode(path.read_bytes())
+        except OSError:
+            value = None
+        except Exception as e:
+            # Truncated entry, or a format this code no longer reads
+            logger.warning(f"Ignoring unreadable {self.description} cache entry {key}: {e}")
+            value = None
+
+        if value is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting old entries if over the size limit.
+
+        Args:
+            key: Cache key
+            value: Value accepted by _encode
+        """
+        path = self._entry_path(key)
+
+        try:
+            payload = self._encode(value)
+        except Exception as e:
+            logger.warning(f"Value for {self.description} cache entry {key} is not cacheable: {e}")
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write {self.description} cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._total_size += len(payload) - self._sizes.get(path, 0)
+            self._sizes[path] = len(payload)
+            self._writes += 1
+            self._evict_if_needed()
+
+    def _evict_if_needed(self) -> None:
+        """Evict least-recently-used entries down to 90% of the limit (lock held)."""
+        max_bytes = self.max_size_mb * 1024 * 1024
+        if self._total_size <= max_bytes:
+            return
+
+        def last_access(entry: Path) -> float:
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for entry in sorted(self._sizes, key=last_access):
+            if self._total_size <= max_bytes * 0.9:
+                break
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to evict {self.description} cache entry {entry}: {e}")
+                continue
+            self._total_size -= self._sizes.pop(entry)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cache entries and reset statistics."""
+        with self._lock:
+            for entry in list(self._sizes):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+            self._sizes.clear()
+            self._total_size = 0
+            self._hits = self._misses = self._writes = self._evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, writes, evictions,
+            num_entries, total_size_mb, max_size_mb and cache_dir
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "num_entries": len(self._sizes),
+                "total_size_mb": self._total_size / (1024 * 1024),
+                "max_size_mb": self.max_size_mb,
+                "cache_dir": str(self.cache_dir),
+            }
@@ -0,0 +1,273 @@
+"""
+Persistent Extraction Result Cache for Data Extraction System.
+
+Stores complete ExtractionResults on disk so re-running the pipeline over
+unchanged documents skips extraction entirely. Used by ExtractionPipeline
+(brownfield CLI) and ExtractorAdapter (greenfield Document pipeline).
+
+Design Principles:
+- Content-addressed keys: SHA256 of the file contents (from the process-wide
+  provenance cache), the extractor class, the source of its module and of
+  every core and extractors module, which optional OCR/parsing dependencies
+  are installed, and the extractor's resolved settings. Editing a file,
+  changing a setting, upgrading any extractor code or installing tesseract
+  all miss.
+- Only successful results are stored
+- Identical files at different paths share an entry; a hit is re-pointed at
+  the requesting file (source path and size) before it is returned
+- One pickle file per entry; storage, LRU eviction and statistics come from
+  DiskCache. Entries are unpickled, so the cache directory must be as
+  trusted as the code itself.
+
+Usage:
+    >>> cache = get_extraction_cache(Path(".data-extract-cache/extraction"))
+    >>> result = cache.get_or_extract(DocxExtractor(), Path("report.docx"))
+    >>> print(cache.get_stats()["hit_ratio"])
+"""
+
+import dataclasses
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import pickle
+import shutil
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from .disk_cache import DiskCache
+from .file_provenance import get_provenance_cache
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored value format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = "1"
+
+# Default location and size used by the CLI
+DEFAULT_CACHE_DIR = Path(".data-extract-cache/extraction")
+DEFAULT_MAX_SIZE_MB = 1024
+
+# Packages whose source shapes extraction output (models and shared helpers
+# such as pdf_session, csv_sniffer, column_profiler and docx_xml)
+SOURCE_DIRS = tuple(
+    Path(__file__).resolve().parent.parent / name for name in ("core", "extractors")
+)
+
+# Optional modules and executables whose presence changes extraction output
+OPTIONAL_MODULES = ("chardet", "lxml", "pdf2image", "pdfplumber", "pytesseract")
+OPTIONAL_EXECUTABLES = ("pdftoppm", "tesseract")
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain(value: Any) -> bool:
+    """True for settings values that serialize the same in every process."""
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_plain(v) for k, v in value.items())
+    return False
+
+
+@lru_cache(maxsize=None)
+def _environment() -> Dict[str, bool]:
+    """Which optional dependencies this process can use (fixed for its lifetime)."""
+    available = {name: importlib.util.find_spec(name) is not None for name in OPTIONAL_MODULES}
+    available.update({name: shutil.which(name) is not None for name in OPTIONAL_EXECUTABLES})
+    return available
+
+
+def _package_sources() -> Dict[str, str]:
+    """SHA256 of every module in SOURCE_DIRS, keyed by package/module name."""
+    provenance = get_provenance_cache()
+    hashes = {}
+    for source_dir in SOURCE_DIRS:
+        for path in sorted(source_dir.glob("*.py")):
+            try:
+                hashes[f"{source_dir.name}/{path.name}"] = provenance.file_hash(path)
+            except OSError:
+                continue
+    return hashes
+
+
+class ExtractionCache(DiskCache):
+    """
+    Size-bounded on-disk cache of extraction results.
+
+    Values are pickled ExtractionResults.
+
+    Attributes:
+        cache_dir: Directory holding cache entries
+        max_size_mb: Maximum total size of cache entries in MB
+    """
+
+    suffix = ".pkl"
+    description = "extraction"
+
+    def __init__(self, cache_dir: Union[str, Path], max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        """
+        Initialize extraction cache.
+
+        Args:
+            cache_dir: Directory for cache storage (created if missing)
+            max_size_mb: Maximum cache size in MB (default: 1024)
+
+        Raises:
+            ValueError: If max_size_mb is <= 0
+        """
+        super().__init__(cache_dir, max_size_mb)
+
+    def _encode(self, result: Any) -> bytes:
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, payload: bytes) -> Any:
+        return pickle.loads(payload)
+
+    @staticmethod
+    def extractor_fingerprint(extractor: Any) -> str:
+        """
+        Describe an extractor's identity, code version, environment and settings.
+
+        The code version covers the extractor's own module and every module in
+        SOURCE_DIRS, since extractors share helpers and models; the
+        environment is which OPTIONAL_MODULES and OPTIONAL_EXECUTABLES are
+        installed, since e.g. OCR only runs when tesseract is. Settings are the extractor's public attributes with plain values
+        (str, numbers, bools, None and containers of them), which covers
+        options resolved from both dict and ConfigManager configuration.
+        Per-run state (sessions, counters) belongs in private attributes.
+
+        Args:
+            extractor: Extractor instance
+
+        Returns:
+            Stable string identifying the extractor's output behavior
+        """
+        cls = type(extractor)
+        try:
+            source = get_provenance_cache().file_hash(inspect.getfile(cls))
+        except (OSError, TypeError):
+            source = ""
+
+        settings = {
+            name: value
+            for name, value in vars(extractor).items()
+            if not name.startswith("_") and _is_plain(value)
+        }
+        return json.dumps(
+            [
+                cls.__module__,
+                cls.__qualname__,
+                getattr(cls, "__version__", ""),
+                source,
+                _package_sources(),
+                _environment(),
+                settings,
+            ],
+            sort_keys=True,
+        )
+
+    @classmethod
+    def make_key(cls, file_hash: str, extractor: Any) -> str:
+        """
+        Build the key for a file's contents extracted by an extractor.
+
+        Args:
+            file_hash: SHA256 of the source file
+            extractor: Extractor instance
+
+        Returns:
+            SHA256 hex digest
+        """
+        hasher = hashlib.sha256(CACHE_FORMAT_VERSION.encode("utf-8"))
+        hasher.update(b"\x1f" + file_hash.encode("utf-8"))
+        hasher.update(b"\x1f" + cls.extractor_fingerprint(extractor).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get_or_extract(self, extractor: Any, file_path: Path) -> Any:
+        """
+        Return the cached result for a file, extracting and storing it on a miss.
+
+        Files that cannot be hashed are extracted without the cache, and
+        failed extractions are not stored. Keys depend only on file contents,
+        so a hit's document metadata is rebuilt for file_path.
+
+        Args:
+            extractor: Extractor instance with extract(Path)
+            file_path: Path to file
+
+        Returns:
+            ExtractionResult
+        """
+        try:
+            key = self.make_key(get_provenance_cache().file_hash(file_path), extractor)
+        except OSError as e:
+            logger.warning(f"Extraction cache bypassed for {file_path}: {e}")
+            return extractor.extract(file_path)
+
+        result = self.get(key)
+        if result is not None:
+            logger.debug(f"Extraction cache hit: {file_path}")
+            return self._for_file(result, file_path)
+
+        result = extractor.extract(file_path)
+        if result.success:
+            self.set(key, result)
+        return result
+
+    @staticmethod
+    def _for_file(result: Any, file_path: Path) -> Any:
+        """
+        Point a cached result's document metadata at the requesting file.
+
+        Args:
+            result: Cached ExtractionResult (possibly stored for another path)
+            file_path: Path the result was requested for
+
+        Returns:
+            ExtractionResult whose source_file and file_size_bytes describe file_path
+        """
+        metadata = result.document_metadata
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = metadata.file_size_bytes
+
+        if metadata.source_file == file_path and metadata.file_size_bytes == size:
+            return result
+        return dataclasses.replace(
+            result,
+            document_metadata=dataclasses.replace(
+                metadata, source_file=file_path, file_size_bytes=size
+            ),
+        )
+
+
+_caches: Dict[Path, ExtractionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_extraction_cache(
+    cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR, max_size_mb: float = DEFAULT_MAX_SIZE_MB
+) -> ExtractionCache:
+    """
+    Return the process-wide ExtractionCache for a directory.
+
+    Args:
+        cache_dir: Directory for cache storage
+        max_size_mb: Maximum cache size in MB (applied on first creation)
+
+    Returns:
+        Shared ExtractionCache instance
+    """
+    resolved = Path(cache_dir).resolve()
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            cache = ExtractionCache(resolved, max_size_mb=max_size_mb)
+            _caches[resolved] = cache
+        return cache
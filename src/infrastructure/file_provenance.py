@@ -0,0 +1,218 @@
+"""
+Process-wide File Provenance Cache for Data Extraction System.
+
+Every stage that records provenance needs the SHA256 of the source file: the
+brownfield extractors (DocumentMetadata.file_hash), the greenfield extractor
+adapter (Metadata.file_hash) and the normalize-stage metadata enricher. This
+cache computes the hash once per file version and hands the same digest to
+all of them.
+
+Design Principles:
+- Keyed by (absolute path, inode, size, mtime_ns): a rewritten or replaced
+  file gets a new key, so a stale digest is never returned
+- Files modified within the last RACY_WINDOW_NS are hashed but not cached,
+  since a same-size rewrite inside one timestamp tick keeps the same key
+- Extractors that already read the whole file (PDF session buffer, CSV parse,
+  text scan) record the digest they computed instead of reading again
+- Misses hash with large buffers (hashlib.file_digest)
+- Bounded in memory with least-recently-used eviction
+- Thread-safe; one instance per process (see get_provenance_cache)
+
+Usage:
+    >>> cache = get_provenance_cache()
+    >>> digest = cache.file_hash(Path("report.pdf"))  # Reads the file once
+    >>> digest == cache.file_hash(Path("report.pdf"))  # Cache hit, no read
+    True
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Default number of file versions remembered
+DEFAULT_MAX_ENTRIES = 4096
+
+# Files modified this recently are not cached (coarse filesystem timestamps
+# cannot distinguish two writes inside one tick)
+RACY_WINDOW_NS = 2_000_000_000
+
+ProvenanceKey = Tuple[str, int, int, int]
+
+
+class FileProvenanceCache:
+    """
+    In-memory cache of file SHA256 digests keyed by file identity.
+
+    Attributes:
+        max_entries: Maximum number of file versions remembered
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize provenance cache.
+
+        Args:
+            max_entries: Maximum number of cached digests (default: 4096)
+
+        Raises:
+            ValueError: If max_entries is <= 0
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._digests: "OrderedDict[ProvenanceKey, str]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._recorded = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(
+        file_path: Union[str, Path], stat_result: Optional[os.stat_result] = None
+    ) -> ProvenanceKey:
+        """
+        Build the cache key for the current version of a file.
+
+        Args:
+            file_path: Path to file
+            stat_result: stat of the file (default: stat now)
+
+        Returns:
+            (absolute path, inode, size, mtime_ns)
+
+        Raises:
+            OSError: If the file cannot be stat'ed
+        """
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        return (
+            os.path.abspath(file_path),
+            stat_result.st_ino,
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        )
+
+    def get(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Look up the digest of a file without reading it.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            SHA256 hex digest, or None if this file version is not cached
+
+        Raises:
+            OSError: If the file cannot be stat'ed
+        """
+        key = self.make_key(file_path)
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest is None:
+                self._misses += 1
+                return None
+            self._digests.move_to_end(key)
+            self._hits += 1
+            return digest
+
+    def file_hash(self, file_path: Union[str, Path]) -> str:
+        """
+        Return the SHA256 of a file, reading it only on a cache miss.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            SHA256 hex digest
+
+        Raises:
+            OSError: If the file cannot be opened or read
+        """
+        digest = self.get(file_path)
+        if digest is not None:
+            return digest
+
+        with open(file_path, "rb") as f:
+            # stat the open file so the key describes the bytes being hashed
+            stat_result = os.fstat(f.fileno())
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+        self._store(self.make_key(file_path, stat_result), digest)
+        return digest
+
+    def record(self, file_path: Union[str, Path], digest: str, stat_result: os.stat_result) -> None:
+        """
+        Store a digest computed while the file was read for another purpose.
+
+        Args:
+            file_path: Path to file
+            digest: SHA256 hex digest of the file contents
+            stat_result: stat of the file taken before it was read (e.g.,
+                os.fstat of the open file)
+        """
+        with self._lock:
+            self._recorded += 1
+        self._store(self.make_key(file_path, stat_result), digest)
+
+    def _store(self, key: ProvenanceKey, digest: str) -> None:
+        """Insert a digest, evicting least-recently-used entries over the bound."""
+        if time.time_ns() - key[3] < RACY_WINDOW_NS:
+            return
+
+        with self._lock:
+            self._digests[key] = digest
+            self._digests.move_to_end(key)
+            while len(self._digests) > self.max_entries:
+                self._digests.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached digests and reset statistics."""
+        with self._lock:
+            self._digests.clear()
+            self._hits = self._misses = self._recorded = self._evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, recorded, evictions,
+            num_entries and max_entries
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "recorded": self._recorded,
+                "evictions": self._evictions,
+                "num_entries": len(self._digests),
+                "max_entries": self.max_entries,
+            }
+
+
+_cache: Optional[FileProvenanceCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_provenance_cache() -> FileProvenanceCache:
+    """
+    Return the process-wide FileProvenanceCache.
+
+    Returns:
+        Shared FileProvenanceCache instance
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FileProvenanceCache()
+        return _cache
@@ -0,0 +1,156 @@
+"""
+Persistent OCR Result Cache for Data Extraction System.
+
+Stores pytesseract ``image_to_data`` output on disk so re-running a batch
+over unchanged scanned documents skips tesseract entirely. Shared by the
+PDF extractor (keyed by file hash + page + render settings) and the
+normalize-stage quality validator (keyed by rendered image pixels).
+
+Design Principles:
+- Content-addressed keys (SHA256) - unchanged inputs always hit
+- One small JSON file per entry; storage, LRU eviction and statistics come
+  from DiskCache
+
+Usage:
+    >>> cache = get_ocr_cache(Path(".data-extract-cache/ocr"), max_size_mb=500)
+    >>> key = OCRCache.make_page_key(file_hash, page=3, dpi=300, lang="eng")
+    >>> ocr_data = cache.get(key)
+    >>> if ocr_data is None:
+    >>>     ocr_data = pytesseract.image_to_data(image, output_type=Output.DICT)
+    >>>     cache.set(key, ocr_data)
+    >>> print(cache.get_stats()["hit_ratio"])
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .disk_cache import DiskCache
+
+# Bump when the stored value format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = "1"
+
+
+class OCRCache(DiskCache):
+    """
+    Size-bounded on-disk cache of OCR results.
+
+    Values are pytesseract image_to_data dictionaries stored as JSON.
+
+    Attributes:
+        cache_dir: Directory holding cache entries
+        max_size_mb: Maximum total size of cache entries in MB
+    """
+
+    suffix = ".json"
+    description = "OCR"
+
+    def __init__(self, cache_dir: Union[str, Path], max_size_mb: float = 500):
+        """
+        Initialize OCR cache.
+
+        Args:
+            cache_dir: Directory for cache storage (created if missing)
+            max_size_mb: Maximum cache size in MB (default: 500)
+
+        Raises:
+            ValueError: If max_size_mb is <= 0
+        """
+        super().__init__(cache_dir, max_size_mb)
+
+    def _encode(self, ocr_data: Dict[str, Any]) -> bytes:
+        return json.dumps(ocr_data, ensure_ascii=False).encode("utf-8")
+
+    def _decode(self, payload: bytes) -> Dict[str, Any]:
+        return json.loads(payload)
+
+    @staticmethod
+    def make_key(*components: Any) -> str:
+        """
+        Build a cache key from arbitrary components.
+
+        Args:
+            *components: Values that together identify an OCR result
+
+        Returns:
+            SHA256 hex digest
+        """
+        hasher = hashlib.sha256(CACHE_FORMAT_VERSION.encode("utf-8"))
+        for component in components:
+            hasher.update(b"\x1f")
+            if isinstance(component, bytes):
+                hasher.update(component)
+            else:
+                hasher.update(str(component).encode("utf-8"))
+        return hasher.hexdigest()
+
+    @classmethod
+    def make_page_key(
+        cls,
+        file_hash: str,
+        page: int,
+        dpi: int,
+        lang: str,
+        flags: Iterable[str] = (),
+    ) -> str:
+        """
+        Build a key for one page of a document rendered with given settings.
+
+        Args:
+            file_hash: SHA256 of the source file
+            page: Page number (1-indexed)
+            dpi: Rasterization DPI
+            lang: Tesseract language(s)
+            flags: Preprocessing flags that change the OCR input
+
+        Returns:
+            Cache key
+        """
+        return cls.make_key("page", file_hash, page, dpi, lang, *sorted(flags))
+
+    @classmethod
+    def make_image_key(
+        cls, image: Any, lang: Optional[str] = None, flags: Iterable[str] = ()
+    ) -> str:
+        """
+        Build a key from the pixels of a rendered page image.
+
+        Args:
+            image: PIL image
+            lang: Tesseract language(s) (None for tesseract default)
+            flags: Preprocessing flags that change the OCR input
+
+        Returns:
+            Cache key
+        """
+        pixel_hash = hashlib.sha256(image.tobytes()).hexdigest()
+        return cls.make_key("image", image.mode, image.size, pixel_hash, lang or "", *sorted(flags))
+
+
+_caches: Dict[Path, OCRCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_ocr_cache(cache_dir: Union[str, Path], max_size_mb: float = 500) -> OCRCache:
+    """
+    Return the process-wide OCRCache for a directory.
+
+    Extractors and validators configured with the same directory share one
+    instance, so statistics aggregate across them.
+
+    Args:
+        cache_dir: Directory for cache storage
+        max_size_mb: Maximum cache size in MB (applied on first creation)
+
+    Returns:
+        Shared OCRCache instance
+    """
+    resolved = Path(cache_dir).resolve()
+    with _caches_lock:
+        cache = _caches.get(resolved)
+        if cache is None:
+            cache = OCRCache(resolved, max_size_mb=max_size_mb)
+            _caches[resolved] = cache
+        return cache
@@ -7,12 +7,24 @@ capabilities for the data extraction tool.
 Public API:
     ExtractionPipeline - Main pipeline orchestrator
     BatchProcessor - Parallel batch file processing
+    compact_result - Strip content payloads from a PipelineResult
+    slim_result - Keep only the status of a PipelineResult
+    StagedExecutor - Batch executor with read, extract and write stage pools
+    CostModel - Per-file processing time estimates for batch scheduling
+    plan_schedule - Largest-first batch order with predicted makespan
 """
 
-from .batch_processor import BatchProcessor
+from .batch_processor import BatchProcessor, compact_result, slim_result
+from .batch_scheduler import CostModel, plan_schedule
 from .extraction_pipeline import ExtractionPipeline
+from .staged_executor import StagedExecutor
 
 __all__ = [
     "ExtractionPipeline",
     "BatchProcessor",
+    "compact_result",
+    "slim_result",
+    "StagedExecutor",
+    "CostModel",
+    "plan_schedule",
 ]
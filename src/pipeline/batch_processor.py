@@ -2,14 +2,19 @@
 BatchProcessor - Parallel File Processing for Large Batches.
 
 This module provides parallel batch processing capabilities for processing
-multiple files concurrently using a thread pool.
+multiple files concurrently using a thread pool or a process pool.
 
 Design:
-- Thread pool for parallel execution
+- Thread pool (default) or process pool for parallel execution
+- Process workers build their own pipeline once, from a picklable factory
 - Progress tracking across all files
 - Error handling without stopping batch
 - Result aggregation and statistics
+- Streaming results (iter_batch / on_result) for bounded memory
 - Configurable worker count and timeouts
+- Process mode enforces per-file deadlines by replacing stuck workers
+- Staged mode overlaps reading, extraction and writing across files
+- Files submitted largest-first by estimated cost (see batch_scheduler)
 
 Example:
     >>> from pipeline import ExtractionPipeline, BatchProcessor
@@ -29,13 +34,18 @@ Example:
     >>> # Get summary
     >>> summary = batch.get_summary(results)
     >>> print(f"Processed {summary['successful']}/{summary['total_files']} files")
+    >>>
+    >>> # CPU-bound batches: one pipeline per worker process
+    >>> batch = BatchProcessor(pipeline_factory=build_pipeline, executor="process")
 """
 
+import multiprocessing
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from core import PipelineResult, ProcessingStage
 from infrastructure import (
@@ -44,7 +54,13 @@ from infrastructure import (
     get_logger,
 )
 
+from .batch_scheduler import CostModel, SchedulePlan, plan_schedule, result_seconds, schedule_report
 from .extraction_pipeline import ExtractionPipeline
+from .staged_executor import DEFAULT_READ_WORKERS, DEFAULT_WRITE_WORKERS, StagedExecutor
+from .worker_pool import WorkerPool, compact_result, slim_result
+
+EXECUTORS = ("thread", "process", "staged")
+SCHEDULES = ("largest_first", "input")
 
 
 class BatchProcessor:
@@ -52,18 +68,30 @@ class BatchProcessor:
     Parallel batch processor for multiple files.
 
     This class coordinates parallel processing of multiple files using
-    a thread pool, providing progress tracking and result aggregation.
+    a thread pool or a process pool, providing progress tracking and
+    result aggregation.
 
     Attributes:
         pipeline: ExtractionPipeline instance to use for processing
-        max_workers: Maximum number of concurrent worker threads
-        timeout_per_file: Optional timeout in seconds per file
+        pipeline_factory: Optional picklable callable building the pipeline
+            in each worker process
+        executor: "thread", "process" or "staged"
+        compact_results: Return results without content payloads (see
+            compact_result); defaults to True in process mode
+        max_workers: Maximum number of concurrent workers
+        timeout_per_file: Optional per-file deadline in seconds (process mode)
+        max_files_per_worker: Optional files per worker process before it is
+            replaced
+        schedule: "largest_first" or "input" submission order
+        cost_model: CostModel estimating per-file processing time
+        last_schedule: Predicted vs actual makespan of the last batch
         logger: Structured logger instance
         error_handler: Error handling component
 
     Thread Safety:
-        This class is thread-safe. The pipeline instances should also
-        be thread-safe or use separate instances per thread.
+        This class is thread-safe. In thread mode the pipeline instances
+        should also be thread-safe or use separate instances per thread;
+        in process mode each worker process has its own pipeline.
     """
 
     def __init__(
@@ -71,6 +99,8 @@ class BatchProcessor:
         pipeline: Optional[ExtractionPipeline] = None,
         max_workers: Optional[int] = None,
         config: Optional[Dict[str, Any]] = None,
+        executor: Optional[str] = None,
+        pipeline_factory: Optional[Callable[[], ExtractionPipeline]] = None,
     ):
         """
         Initialize batch processor.
@@ -80,14 +110,40 @@ class BatchProcessor:
             max_workers: Maximum concurrent workers. Defaults to CPU count.
             config: Optional configuration dict with keys:
                 - max_workers: Worker count override
-                - timeout_per_file: Timeout per file in seconds
+                - timeout_per_file: Per-file deadline in seconds. Enforced in
+                  process mode by killing and replacing the file's worker;
+                  threads cannot be stopped, so thread mode only logs it.
+                - max_files_per_worker: Replace each worker process after
+                  this many files (process mode; default: never)
+                - executor: "thread" (default), "process", or "staged"
+                  (read, extract and write stages on separate pools; see
+                  StagedExecutor). In staged mode max_workers is the number
+                  of extraction processes.
+                - read_workers: Read stage threads (staged mode; default: 2)
+                - write_workers: Write stage threads (staged mode; default: 2)
+                - stage_queue_size: Capacity of the queues between stages
+                  (staged mode; default: twice max_workers)
+                - schedule: "largest_first" (default) submits the files with
+                  the highest estimated cost first; "input" keeps input order
+                - timing_history: JSON file of timings from previous runs,
+                  used to calibrate cost estimates and updated after each batch
+                - compact_results: Return results without content payloads
+                  (default: False in thread mode, True otherwise)
+            executor: "thread", "process" or "staged" (overrides config)
+            pipeline_factory: Picklable callable (module-level function or
+                functools.partial of one) returning a configured pipeline.
+                Process workers call it once each. Without it, workers use a
+                forked copy of pipeline, which needs the "fork" start method.
 
         Raises:
-            ValueError: If max_workers is <= 0
+            ValueError: If max_workers, timeout_per_file or max_files_per_worker
+                is <= 0, the executor or schedule is unknown, or process or
+                staged mode has no pipeline_factory and cannot fork
 
         Example:
             >>> batch = BatchProcessor(max_workers=4)
             >>> batch = BatchProcessor(config={'max_workers': 8, 'timeout_per_file': 300})
+            >>> batch = BatchProcessor(pipeline_factory=build_pipeline, executor="process")
         """
         # Initialize configuration
         config = config or {}
@@ -105,35 +161,95 @@ class BatchProcessor:
             # Default to CPU count, capped at reasonable limit
             self.max_workers = min(os.cpu_count() or 4, 8)
 
-        # Set timeout
+        # Set timeout and worker recycling
         self.timeout_per_file = config.get("timeout_per_file", None)
+        if self.timeout_per_file is not None and self.timeout_per_file <= 0:
+            raise ValueError("timeout_per_file must be > 0")
+
+        self.max_files_per_worker = config.get("max_files_per_worker", None)
+        if self.max_files_per_worker is not None and self.max_files_per_worker <= 0:
+            raise ValueError("max_files_per_worker must be > 0")
+
+        # Set executor
+        self.executor = executor if executor is not None else config.get("executor", "thread")
+        if self.executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {self.executor!r}")
+
+        self.compact_results = config.get("compact_results", self.executor != "thread")
+
+        # Set staged executor pools
+        self.read_workers = config.get("read_workers", DEFAULT_READ_WORKERS)
+        self.write_workers = config.get("write_workers", DEFAULT_WRITE_WORKERS)
+        self.stage_queue_size = config.get("stage_queue_size", None)
+        self._staged: Optional[StagedExecutor] = None
+
+        # Set scheduling
+        self.schedule = config.get("schedule", "largest_first")
+        if self.schedule not in SCHEDULES:
+            raise ValueError(f"schedule must be one of {SCHEDULES}, got {self.schedule!r}")
+
+        self.cost_model = CostModel(history_path=config.get("timing_history"))
+        self.last_schedule: Optional[Dict[str, Any]] = None
 
         # Initialize pipeline
-        self.pipeline = pipeline if pipeline is not None else ExtractionPipeline()
+        self.pipeline_factory = pipeline_factory
+        if pipeline is not None:
+            self.pipeline = pipeline
+        elif pipeline_factory is not None:
+            self.pipeline = pipeline_factory()
+        else:
+            self.pipeline = ExtractionPipeline()
+
+        if (
+            self.executor != "thread"
+            and pipeline_factory is None
+            and multiprocessing.get_start_method() != "fork"
+        ):
+            raise ValueError(
+                f"executor={self.executor!r} needs a pipeline_factory unless workers are forked"
+            )
 
         # Initialize infrastructure
         self.logger = get_logger(__name__)
         self.error_handler = ErrorHandler()
 
-        self.logger.info(f"BatchProcessor initialized with {self.max_workers} workers")
+        if self.timeout_per_file is not None and self.executor != "process":
+            self.logger.warning(
+                "timeout_per_file is only enforced with executor='process'; "
+                f"{self.executor} workers cannot be stopped"
+            )
+
+        self.logger.info(
+            f"BatchProcessor initialized with {self.max_workers} {self.executor} workers"
+        )
 
     def process_batch(
         self,
         file_paths: List[Path],
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_result: Optional[Callable[[PipelineResult], None]] = None,
     ) -> List[PipelineResult]:
         """
         Process multiple files in parallel.
 
-        This method processes all files concurrently using a thread pool,
-        tracking progress and collecting results.
+        This method processes all files concurrently using the configured
+        executor, tracking progress and collecting results.
+
+        With an on_result sink, each full result is passed to the sink as its
+        file completes and only a slim record (status, errors, timings; see
+        slim_result) is kept, so memory stays flat however large the batch.
+        The slim records work with get_summary and get_failed_results.
 
         Args:
             file_paths: List of file paths to process
             progress_callback: Optional callback for progress updates
+            on_result: Optional sink called with each full result as soon as
+                its file completes (in completion order). Exceptions raised
+                by the sink stop the batch.
 
         Returns:
-            List of PipelineResult in same order as input files
+            List of PipelineResult in same order as input files (slim
+            records when on_result is given)
 
         Example:
             >>> files = [Path("doc1.docx"), Path("doc2.pdf")]
@@ -144,9 +260,46 @@ class BatchProcessor:
             >>>     else:
             >>>         print(f"Failed: {result.source_file}")
         """
+        # Store results by input position to preserve order
+        results: List[Optional[PipelineResult]] = [None] * len(file_paths)
+
+        for index, result in self.iter_batch(
+            file_paths, progress_callback=progress_callback, on_result=on_result
+        ):
+            results[index] = slim_result(result) if on_result is not None else result
+
+        return results
+
+    def iter_batch(
+        self,
+        file_paths: List[Path],
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_result: Optional[Callable[[PipelineResult], None]] = None,
+    ) -> Iterator[Tuple[int, PipelineResult]]:
+        """
+        Process multiple files in parallel, yielding results as files complete.
+
+        The batch keeps no reference to a result once it has been yielded.
+        Stopping iteration early cancels files not yet started (thread mode)
+        or stops the worker processes (process and staged modes).
+
+        Args:
+            file_paths: List of file paths to process
+            progress_callback: Optional callback for progress updates
+            on_result: Optional sink called with each result before it is
+                yielded; in staged mode it runs on the write stage threads
+
+        Yields:
+            (index into file_paths, PipelineResult), in completion order
+
+        Example:
+            >>> for index, result in batch.iter_batch(files):
+            >>>     if result.success:
+            >>>         write_outputs(result, output_dir, "json")
+        """
         if not file_paths:
             self.logger.info("No files to process in batch")
-            return []
+            return
 
         self.logger.info(f"Starting batch processing of {len(file_paths)} files")
 
@@ -157,52 +310,153 @@ class BatchProcessor:
             callback=progress_callback,
         )
 
-        # Store results with file path as key to preserve order
-        results_map: Dict[Path, PipelineResult] = {}
+        plan = self._plan(file_paths)
+        batch_start = time.monotonic()
+
+        # Only durations are kept for the schedule report
+        durations: List[Optional[float]] = [None] * len(file_paths)
+        succeeded = [False] * len(file_paths)
+        successful = 0
+
+        # Staged mode runs the sink on its write stage
+        stage_sink = on_result if self.executor == "staged" else None
+
+        # Results arrive here as files complete, so progress callbacks always
+        # run in this process
+        for index, result in self._iter_results(file_paths, plan.order, stage_sink):
+            if on_result is not None and stage_sink is None:
+                on_result(result)
+            durations[index] = result_seconds(result)
+            succeeded[index] = result.success
+            successful += result.success
+            tracker.increment(current_item=str(file_paths[index].name))
+            yield index, result
+
+        self._record_schedule(
+            plan, time.monotonic() - batch_start, file_paths, durations, succeeded
+        )
 
-        # Process files in parallel using thread pool
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all files for processing
-            future_to_file = {
-                executor.submit(self._process_single_file, file_path, tracker): file_path
-                for file_path in file_paths
-            }
+        self.logger.info(f"Batch processing complete: {successful}/{len(file_paths)} successful")
 
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
+    def _plan(self, file_paths: List[Path]) -> SchedulePlan:
+        """Estimate per-file costs and choose the submission order."""
+        costs = [self.cost_model.estimate(file_path) for file_path in file_paths]
+        return plan_schedule(
+            costs, self.max_workers, largest_first=self.schedule == "largest_first"
+        )
 
-                try:
-                    result = future.result(timeout=self.timeout_per_file)
-                    results_map[file_path] = result
+    def _record_schedule(
+        self,
+        plan: SchedulePlan,
+        actual_makespan: float,
+        file_paths: List[Path],
+        durations: List[Optional[float]],
+        succeeded: List[bool],
+    ) -> None:
+        """
+        Report predicted vs actual makespan and feed timings back to the cost model.
 
-                except Exception as e:
-                    # Handle unexpected exceptions
-                    self.logger.exception(f"Unexpected error processing {file_path}: {e}")
+        Only successful files are recorded: a failure or timeout says nothing
+        about how long the file takes to process.
+        """
+        self.last_schedule = {
+            "schedule": self.schedule,
+            **schedule_report(plan, actual_makespan, durations),
+        }
+        self.logger.info(
+            f"Batch makespan: predicted {plan.predicted_makespan:.2f}s, "
+            f"actual {actual_makespan:.2f}s ({self.schedule} order)"
+        )
 
-                    # Create failed result
-                    results_map[file_path] = PipelineResult(
-                        source_file=file_path,
-                        success=False,
-                        failed_stage=ProcessingStage.VALIDATION,
-                        all_errors=(f"Batch processing error: {e}",),
-                        started_at=datetime.now(timezone.utc),
-                        completed_at=datetime.now(timezone.utc),
-                    )
+        for file_path, seconds, ok in zip(file_paths, durations, succeeded):
+            if ok and seconds is not None:
+                self.cost_model.record(file_path, seconds)
+        self.cost_model.save()
 
-                # Update progress
-                tracker.increment(current_item=str(file_path.name))
+    def _iter_results(
+        self,
+        file_paths: List[Path],
+        order: Sequence[int],
+        stage_sink: Optional[Callable[[PipelineResult], None]] = None,
+    ) -> Iterator[Tuple[int, PipelineResult]]:
+        """
+        Run the batch on the configured executor.
 
-        # Return results in original order
-        results = [results_map[file_path] for file_path in file_paths]
+        Args:
+            file_paths: Files to process
+            order: Submission order (indices into file_paths)
+            stage_sink: Result sink for the staged executor's write stage
 
-        self.logger.info(
-            f"Batch processing complete: {sum(1 for r in results if r.success)}/{len(results)} successful"
-        )
+        Yields:
+            (index into file_paths, PipelineResult), in completion order
+        """
+        if self.executor == "staged":
+            self._staged = StagedExecutor(
+                pipeline=self.pipeline,
+                pipeline_factory=self.pipeline_factory,
+                read_workers=self.read_workers,
+                extract_workers=self.max_workers,
+                write_workers=self.write_workers,
+                queue_size=self.stage_queue_size,
+                compact=self.compact_results,
+            )
+            yield from self._staged.imap_unordered(file_paths, order, on_result=stage_sink)
+
+            stats = self._staged.get_stats()
+            self.logger.info(
+                "Stage utilization: "
+                + ", ".join(
+                    f"{name} {stage['utilization']:.0%}" for name, stage in stats["stages"].items()
+                )
+                + f" (bottleneck: {stats['bottleneck']})"
+            )
+            return
+
+        if self.executor == "process":
+            pool = WorkerPool(
+                pipeline_factory=self.pipeline_factory,
+                pipeline=self.pipeline,
+                max_workers=self.max_workers,
+                timeout_per_file=self.timeout_per_file,
+                max_files_per_worker=self.max_files_per_worker,
+                compact=self.compact_results,
+            )
+            yield from pool.imap_unordered(file_paths, order)
+            return
 
-        return results
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Threads take submitted work in FIFO order
+            future_to_index = {
+                executor.submit(self._process_single_file, file_paths[index]): index
+                for index in order
+            }
 
-    def _process_single_file(self, file_path: Path, tracker: ProgressTracker) -> PipelineResult:
+            try:
+                for future in as_completed(future_to_index):
+                    # Drop the future so its result is freed once consumed
+                    index = future_to_index.pop(future)
+                    try:
+                        yield index, future.result()
+                    except Exception as e:
+                        # Handle unexpected exceptions
+                        file_path = file_paths[index]
+                        self.logger.exception(f"Unexpected error processing {file_path}: {e}")
+
+                        # Create failed result
+                        yield index, PipelineResult(
+                            source_file=file_path,
+                            success=False,
+                            failed_stage=ProcessingStage.VALIDATION,
+                            all_errors=(f"Batch processing error: {e}",),
+                            started_at=datetime.now(timezone.utc),
+                            completed_at=datetime.now(timezone.utc),
+                        )
+            finally:
+                # Files not yet started when iteration stops early are skipped
+                for future in future_to_index:
+                    future.cancel()
+
+    def _process_single_file(self, file_path: Path) -> PipelineResult:
         """
         Process a single file within the batch.
 
@@ -211,7 +465,6 @@ class BatchProcessor:
 
         Args:
             file_path: Path to file to process
-            tracker: Progress tracker instance
 
         Returns:
             PipelineResult for this file
@@ -231,7 +484,7 @@ class BatchProcessor:
             # Process through pipeline
             result = self.pipeline.process_file(file_path, progress_callback=file_progress_callback)
 
-            return result
+            return compact_result(result) if self.compact_results else result
 
         except Exception as e:
             # Handle pipeline exceptions
@@ -246,6 +499,18 @@ class BatchProcessor:
                 completed_at=datetime.now(timezone.utc),
             )
 
+    def get_stage_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get per-stage queue depths and utilization of the staged executor.
+
+        Can be called while a batch runs (e.g. from a progress callback).
+
+        Returns:
+            StagedExecutor.get_stats() of the current or last batch, or None
+            if no staged batch has run
+        """
+        return self._staged.get_stats() if self._staged is not None else None
+
     def get_summary(self, results: List[PipelineResult]) -> Dict[str, Any]:
         """
         Get summary statistics for batch results.
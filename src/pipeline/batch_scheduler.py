@@ -0,0 +1,373 @@
+"""
+Batch Scheduler - Cost Estimates and Largest-First Ordering.
+
+Workers take files in submission order, so a large file submitted last
+finishes long after every other worker has gone idle. CostModel estimates
+the processing time of each file before the batch starts, and plan_schedule
+orders the batch longest-processing-time first (LPT) and predicts the
+makespan for a given worker count.
+
+Estimates come from cheap probes that never parse the document:
+- DOCX/PPTX/XLSX: the zip central directory (uncompressed XML size, slide or
+  sheet count)
+- PDF: page count from the /Count entries in the first and last 64KB
+- Everything else: file size
+
+With a timing history file, estimates are calibrated by previous runs: a
+per-format correction factor, and the measured duration of any file seen
+before (same path, size and modification time).
+
+Example:
+    >>> model = CostModel(history_path=Path(".data-extract-cache/batch_timings.json"))
+    >>> plan = plan_schedule([model.estimate(f) for f in files], workers=4)
+    >>> ordered = [files[i] for i in plan.order]
+    >>> print(f"Predicted makespan: {plan.predicted_makespan:.1f}s")
+"""
+
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from each end of a PDF when probing the page count
+PDF_PROBE_BYTES = 65536
+
+# Files remembered in the timing history
+MAX_HISTORY_FILES = 10000
+
+# Weight of the newest run when updating per-format correction factors
+HISTORY_SMOOTHING = 0.3
+
+_MB = 1024 * 1024
+
+# Per-format (seconds per file, seconds per MB of work, seconds per page/slide/sheet)
+DEFAULT_RATES: Dict[str, Tuple[float, float, float]] = {
+    "pdf": (0.05, 0.5, 0.02),
+    "docx": (0.02, 0.15, 0.0),
+    "pptx": (0.05, 0.15, 0.01),
+    "xlsx": (0.05, 0.3, 0.01),
+    "csv": (0.01, 0.2, 0.0),
+    "txt": (0.005, 0.05, 0.0),
+}
+
+# Files that fail validation cost next to nothing
+UNKNOWN_FORMAT_SECONDS = 0.001
+
+_PDF_COUNT = re.compile(rb"/Count\s+(\d+)")
+_PPTX_SLIDE = re.compile(r"ppt/slides/slide\d+\.xml")
+_XLSX_SHEET = re.compile(r"xl/worksheets/sheet\d+\.xml")
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    """
+    Submission order for a batch and its predicted makespan.
+
+    Attributes:
+        order: Indices into the batch, in submission order
+        predicted_makespan: Predicted wall time in seconds with the given workers
+        predicted_work: Sum of the per-file estimates in seconds
+    """
+
+    order: Tuple[int, ...]
+    predicted_makespan: float
+    predicted_work: float
+
+
+def predict_makespan(costs: Sequence[float], order: Sequence[int], workers: int) -> float:
+    """
+    Simulate workers taking files in order, each starting when one is free.
+
+    Args:
+        costs: Estimated seconds per file
+        order: Submission order (indices into costs)
+        workers: Number of workers
+
+    Returns:
+        Predicted wall time in seconds
+    """
+    finish_times = [0.0] * min(workers, len(order))
+    if not finish_times:
+        return 0.0
+    for index in order:
+        heapq.heapreplace(finish_times, finish_times[0] + costs[index])
+    return max(finish_times)
+
+
+def plan_schedule(costs: Sequence[float], workers: int, largest_first: bool = True) -> SchedulePlan:
+    """
+    Order a batch and predict its makespan.
+
+    Args:
+        costs: Estimated seconds per file
+        workers: Number of workers
+        largest_first: Order by descending cost (LPT); False keeps input order
+
+    Returns:
+        SchedulePlan
+    """
+    order = list(range(len(costs)))
+    if largest_first:
+        # Stable sort: equal estimates keep their input order
+        order.sort(key=lambda index: -costs[index])
+    return SchedulePlan(
+        order=tuple(order),
+        predicted_makespan=predict_makespan(costs, order, workers),
+        predicted_work=sum(costs),
+    )
+
+
+class CostModel:
+    """
+    Per-file processing time estimates, optionally calibrated by history.
+
+    Attributes:
+        history_path: JSON file with timings from previous runs (None to disable)
+        rates: Per-format (per file, per MB, per unit) seconds
+
+    Thread Safety:
+        estimate() and record() may be called from multiple threads.
+    """
+
+    def __init__(
+        self,
+        history_path: Optional[Union[str, Path]] = None,
+        rates: Optional[Dict[str, Tuple[float, float, float]]] = None,
+    ):
+        """
+        Initialize cost model.
+
+        Args:
+            history_path: Timing history file (loaded if it exists)
+            rates: Override per-format rates (default: DEFAULT_RATES)
+        """
+        self.history_path = Path(history_path) if history_path is not None else None
+        self.rates = dict(DEFAULT_RATES)
+        if rates:
+            self.rates.update(rates)
+
+        self._lock = threading.Lock()
+        self._scales: Dict[str, float] = {}
+        self._file_seconds: Dict[str, float] = {}
+        # Model estimates from estimate(), reused by record() so a file is
+        # probed once per run rather than again after it is processed
+        self._model_seconds: Dict[str, float] = {}
+        self._load_history()
+
+    @staticmethod
+    def detect_format(file_path: Path) -> Optional[str]:
+        """Format identifier the pipeline would use for a file."""
+        from .extraction_pipeline import ExtractionPipeline
+
+        return ExtractionPipeline.FORMAT_EXTENSIONS.get(file_path.suffix.lower())
+
+    @staticmethod
+    def _file_key(file_path: Path, stat_result: os.stat_result) -> str:
+        return f"{os.path.abspath(file_path)}|{stat_result.st_size}|{stat_result.st_mtime_ns}"
+
+    def probe(self, file_path: Path) -> Tuple[Optional[str], float, int]:
+        """
+        Measure the work in a file without parsing it.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            (format, MB of work, pages/slides/sheets); (None, 0.0, 0) if the
+            file cannot be read or its format is unknown
+        """
+        format_type = self.detect_format(file_path)
+        if format_type is None:
+            return None, 0.0, 0
+
+        try:
+            size_mb = file_path.stat().st_size / _MB
+        except OSError:
+            return None, 0.0, 0
+
+        try:
+            if format_type in ("docx", "pptx", "xlsx"):
+                return (format_type, *self._probe_package(file_path, format_type))
+            if format_type == "pdf":
+                return format_type, size_mb, self._probe_pdf_pages(file_path)
+        except (OSError, zipfile.BadZipFile):
+            pass
+
+        return format_type, size_mb, 0
+
+    @staticmethod
+    def _probe_package(file_path: Path, format_type: str) -> Tuple[float, int]:
+        """Uncompressed XML size and slide/sheet count from the zip directory."""
+        with zipfile.ZipFile(file_path) as package:
+            infos = package.infolist()
+
+        work_mb = sum(info.file_size for info in infos if info.filename.endswith(".xml")) / _MB
+        if format_type == "pptx":
+            units = sum(1 for info in infos if _PPTX_SLIDE.fullmatch(info.filename))
+        elif format_type == "xlsx":
+            units = sum(1 for info in infos if _XLSX_SHEET.fullmatch(info.filename))
+        else:
+            units = 0
+        return work_mb, units
+
+    @staticmethod
+    def _probe_pdf_pages(file_path: Path) -> int:
+        """Largest /Count in the head and tail of a PDF (the page tree root), or 0."""
+        with open(file_path, "rb") as f:
+            head = f.read(PDF_PROBE_BYTES)
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size > PDF_PROBE_BYTES:
+                f.seek(max(PDF_PROBE_BYTES, size - PDF_PROBE_BYTES))
+                head += f.read()
+        return max((int(count) for count in _PDF_COUNT.findall(head)), default=0)
+
+    def model_seconds(self, file_path: Path) -> float:
+        """
+        Estimate from the probe and rates alone (no history).
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Estimated seconds
+        """
+        format_type, work_mb, units = self.probe(file_path)
+        if format_type is None or format_type not in self.rates:
+            return UNKNOWN_FORMAT_SECONDS
+        per_file, per_mb, per_unit = self.rates[format_type]
+        return per_file + per_mb * work_mb + per_unit * units
+
+    def estimate(self, file_path: Path) -> float:
+        """
+        Estimate processing time for a file.
+
+        Uses the measured duration from a previous run of the same file
+        version if known, else the calibrated model.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Estimated seconds
+        """
+        try:
+            key = self._file_key(file_path, file_path.stat())
+        except OSError:
+            return UNKNOWN_FORMAT_SECONDS
+
+        with self._lock:
+            seconds = self._file_seconds.get(key)
+            scale = self._scales.get(self.detect_format(file_path) or "", 1.0)
+        if seconds is not None:
+            return seconds
+
+        model = self.model_seconds(file_path)
+        with self._lock:
+            self._model_seconds[key] = model
+            while len(self._model_seconds) > MAX_HISTORY_FILES:
+                del self._model_seconds[next(iter(self._model_seconds))]
+        return model * scale
+
+    def record(self, file_path: Path, seconds: float) -> None:
+        """
+        Record a measured duration for calibration.
+
+        Reuses the model estimate from estimate() for the same file version;
+        the file is only probed here if it was not estimated first.
+
+        Args:
+            file_path: Path to file
+            seconds: Measured processing time
+        """
+        try:
+            key = self._file_key(file_path, file_path.stat())
+        except OSError:
+            return
+
+        format_type = self.detect_format(file_path)
+        with self._lock:
+            model = self._model_seconds.pop(key, None)
+        if model is None:
+            model = self.model_seconds(file_path)
+
+        with self._lock:
+            self._file_seconds.pop(key, None)
+            self._file_seconds[key] = seconds
+            while len(self._file_seconds) > MAX_HISTORY_FILES:
+                del self._file_seconds[next(iter(self._file_seconds))]
+
+            if format_type is not None and model > 0:
+                ratio = seconds / model
+                previous = self._scales.get(format_type)
+                self._scales[format_type] = (
+                    ratio
+                    if previous is None
+                    else (1 - HISTORY_SMOOTHING) * previous + HISTORY_SMOOTHING * ratio
+                )
+
+    def _load_history(self) -> None:
+        if self.history_path is None or not self.history_path.exists():
+            return
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                history = json.load(f)
+            self._scales = {k: float(v) for k, v in history.get("scales", {}).items()}
+            self._file_seconds = {k: float(v) for k, v in history.get("files", {}).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable timing history {self.history_path}: {e}")
+
+    def save(self) -> None:
+        """Write the timing history file (no-op without history_path)."""
+        if self.history_path is None:
+            return
+
+        with self._lock:
+            payload = json.dumps({"scales": self._scales, "files": self._file_seconds})
+
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.history_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.history_path)
+        except OSError as e:
+            logger.warning(f"Failed to write timing history {self.history_path}: {e}")
+
+
+def result_seconds(result) -> Optional[float]:
+    """Measured duration of a PipelineResult (duration, or start/end timestamps)."""
+    if result.duration_seconds is not None:
+        return result.duration_seconds
+    if result.completed_at is not None and result.started_at is not None:
+        return (result.completed_at - result.started_at).total_seconds()
+    return None
+
+
+def schedule_report(
+    plan: SchedulePlan, actual_makespan: float, durations: Sequence[Optional[float]]
+) -> Dict:
+    """
+    Compare a plan with what happened.
+
+    Args:
+        plan: Plan the batch was submitted with
+        actual_makespan: Measured wall time in seconds
+        durations: Measured seconds per file (None where unknown)
+
+    Returns:
+        Dictionary with predicted/actual makespan and total work in seconds
+    """
+    return {
+        "predicted_makespan_seconds": plan.predicted_makespan,
+        "actual_makespan_seconds": actual_makespan,
+        "predicted_work_seconds": plan.predicted_work,
+        "actual_work_seconds": sum(seconds or 0.0 for seconds in durations),
+    }
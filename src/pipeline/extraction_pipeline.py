@@ -33,16 +33,19 @@ Example:
     >>>     print(f"Extracted {len(result.extraction_result.content_blocks)} blocks")
 """
 
+import dataclasses
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 from core import (
     BaseExtractor,
     BaseFormatter,
     BasePipeline,
     BaseProcessor,
+    DocumentMetadata,
     ExtractionResult,
+    ExtractionStreamItem,
     PipelineResult,
     ProcessingResult,
     ProcessingStage,
@@ -50,6 +53,7 @@ from core import (
 from infrastructure import (
     ConfigManager,
     ErrorHandler,
+    ExtractionCache,
     get_logger,
     timed,
 )
@@ -66,6 +70,7 @@ class ExtractionPipeline(BasePipeline):
         config: Configuration manager instance
         error_handler: Error handling component
         logger: Structured logger instance
+        extraction_cache: Optional persistent cache consulted before extract()
 
     Thread Safety:
         This class is not thread-safe. Create separate instances for
@@ -84,12 +89,18 @@ class ExtractionPipeline(BasePipeline):
         ".txt": "txt",  # Plain text files (for testing)
     }
 
-    def __init__(self, config: Optional[ConfigManager] = None):
+    def __init__(
+        self,
+        config: Optional[ConfigManager] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
+    ):
         """
         Initialize extraction pipeline.
 
         Args:
             config: Optional ConfigManager instance. If None, creates default.
+            extraction_cache: Optional ExtractionCache; unchanged files then
+                skip extraction (default: no cache)
         """
         # Initialize configuration
         self.config = config if config is not None else self._create_default_config()
@@ -103,6 +114,8 @@ class ExtractionPipeline(BasePipeline):
         self._processors: list[BaseProcessor] = []
         self._formatters: list[BaseFormatter] = []
 
+        self.extraction_cache = extraction_cache
+
         self.logger.info("ExtractionPipeline initialized")
 
     def _create_default_config(self) -> ConfigManager:
@@ -292,6 +305,91 @@ class ExtractionPipeline(BasePipeline):
         except Exception as e:
             self.logger.warning(f"Progress callback failed: {e}")
 
+    def stream_file(
+        self,
+        file_path: Path,
+        progress_callback: Optional[Callable[[dict[str, Any]], None]] = None,
+        progress_interval: int = 1000,
+    ) -> Iterator[ExtractionStreamItem]:
+        """
+        Extract a file incrementally through its extractor's extract_stream().
+
+        Yields ContentBlocks (and any streamed table segments) as the
+        extractor produces them, followed by one
+        ExtractionResult trailer with document metadata, tables, images and
+        status. Validation failures yield a single failed trailer. Processors
+        and formatters need the complete document, so they are not run here;
+        use process_file() for the full pipeline.
+
+        Args:
+            file_path: Path to file to extract
+            progress_callback: Optional callback for progress updates
+            progress_interval: Report progress every N blocks
+
+        Yields:
+            ContentBlock items, then one ExtractionResult
+
+        Example:
+            >>> for item in pipeline.stream_file(Path("large.pdf")):
+            >>>     if isinstance(item, ExtractionResult):
+            >>>         print(f"Done: {item.document_metadata.page_count} pages")
+            >>>     else:
+            >>>         sink.write(item)
+        """
+        self.logger.info(f"Streaming file: {file_path}")
+        self._report_progress(progress_callback, "validation", 0.0, "Validating file")
+
+        error_msg = None
+        extractor = None
+        if not file_path.exists():
+            error_msg = f"File not found: {file_path}"
+        else:
+            format_type = self.detect_format(file_path)
+            if format_type is None:
+                error_msg = f"Unknown file format: {file_path.suffix}"
+            else:
+                extractor = self.get_extractor(format_type)
+                if extractor is None:
+                    error_msg = f"No extractor registered for format: {format_type}"
+
+        if error_msg is not None:
+            self.logger.error(error_msg)
+            yield ExtractionResult(
+                success=False,
+                errors=(error_msg,),
+                document_metadata=DocumentMetadata(source_file=file_path, file_format="unknown"),
+            )
+            return
+
+        self._report_progress(progress_callback, "extraction", 20.0, "Extracting content")
+
+        block_count = 0
+        for item in extractor.extract_stream(file_path):
+            if isinstance(item, ExtractionResult) or hasattr(item, "content_blocks"):
+                if item.success:
+                    self._report_progress(
+                        progress_callback,
+                        "complete",
+                        100.0,
+                        f"Extraction complete: {block_count} blocks",
+                    )
+                else:
+                    self.logger.error(f"Extraction failed: {item.errors}")
+                yield item
+                return
+
+            if hasattr(item, "cells"):
+                # Table segment streamed ahead of its block
+                yield item
+                continue
+
+            block_count += 1
+            if progress_interval and block_count % progress_interval == 0:
+                self._report_progress(
+                    progress_callback, "extraction", 20.0, f"Extracted {block_count} blocks"
+                )
+            yield item
+
     @timed(get_logger(__name__))
     def process_file(
         self, file_path: Path, progress_callback: Optional[Callable[[dict[str, Any]], None]] = None
@@ -319,9 +417,33 @@ class ExtractionPipeline(BasePipeline):
             >>> else:
             >>>     print(f"Failed at {result.failed_stage}: {result.all_errors}")
         """
+        result = self.validate_file(file_path, progress_callback)
+        if result.completed_at is None:
+            result = self.extract_file(result, progress_callback)
+        if result.completed_at is None:
+            result = self.format_file(result, progress_callback)
+        return result
+
+    def validate_file(
+        self, file_path: Path, progress_callback: Optional[Callable[[dict[str, Any]], None]] = None
+    ) -> PipelineResult:
+        """
+        Run the validation stage for a file.
+
+        process_file() runs validate_file(), extract_file() and format_file()
+        in turn. Each stage returns a finished result (completed_at set) when
+        the file failed, else an in-progress result for the next stage, so
+        batch executors can run the stages on different workers.
+
+        Args:
+            file_path: Path to file to process
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Failed PipelineResult, or in-progress PipelineResult for extract_file()
+        """
         start_time = datetime.now(timezone.utc)
         all_errors: list[str] = []
-        all_warnings: list[str] = []
 
         self.logger.info(f"Processing file: {file_path}")
         self._report_progress(progress_callback, "validation", 0.0, "Validating file")
@@ -389,11 +511,38 @@ class ExtractionPipeline(BasePipeline):
                 all_errors=tuple(all_errors),
             )
 
+        return PipelineResult(source_file=file_path, started_at=start_time)
+
+    def extract_file(
+        self,
+        pending: PipelineResult,
+        progress_callback: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> PipelineResult:
+        """
+        Run the extraction and processing stages for a validated file.
+
+        Args:
+            pending: In-progress result from validate_file()
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Failed PipelineResult, or in-progress PipelineResult (with
+            extraction and processing results) for format_file()
+        """
+        file_path = pending.source_file
+        start_time = pending.started_at
+        all_errors = list(pending.all_errors)
+        all_warnings = list(pending.all_warnings)
+        extractor = self.get_extractor(self.detect_format(file_path))
+
         # Stage 2: Extraction
         self._report_progress(progress_callback, "extraction", 20.0, "Extracting content")
 
         try:
-            extraction_result = extractor.extract(file_path)
+            if self.extraction_cache is not None:
+                extraction_result = self.extraction_cache.get_or_extract(extractor, file_path)
+            else:
+                extraction_result = extractor.extract(file_path)
 
             # Collect errors and warnings
             all_errors.extend(extraction_result.errors)
@@ -541,6 +690,36 @@ class ExtractionPipeline(BasePipeline):
                 all_warnings=tuple(all_warnings),
             )
 
+        return dataclasses.replace(
+            pending,
+            extraction_result=extraction_result,
+            processing_result=processing_result,
+            all_errors=tuple(all_errors),
+            all_warnings=tuple(all_warnings),
+        )
+
+    def format_file(
+        self,
+        pending: PipelineResult,
+        progress_callback: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> PipelineResult:
+        """
+        Run the formatting stage for an extracted file.
+
+        Args:
+            pending: In-progress result from extract_file()
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Finished PipelineResult
+        """
+        file_path = pending.source_file
+        start_time = pending.started_at
+        extraction_result = pending.extraction_result
+        processing_result = pending.processing_result
+        all_errors = list(pending.all_errors)
+        all_warnings = list(pending.all_warnings)
+
         # Stage 4: Formatting
         self._report_progress(progress_callback, "formatting", 70.0, "Formatting output")
 
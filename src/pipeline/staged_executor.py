@@ -0,0 +1,520 @@
+"""
+StagedExecutor - Stage-Pipelined Batch Execution with Bounded Queues.
+
+The thread and process executors run each file end to end on one worker, so
+a worker reading a file is not parsing and a worker serializing output is
+not extracting. StagedExecutor splits the pipeline into three stages, each
+on its own pool, connected by bounded queues:
+
+- read: validation and SHA256 of the file on a thread pool (I/O bound). The
+  digest goes with the file to the extraction worker, which then does not
+  read the file again to hash it.
+- extract: extraction and processors on a process pool (CPU bound). If an
+  extraction process dies, the pool is rebuilt and each file that was in
+  flight is retried once on its own, so only a file that kills its worker
+  by itself fails. The stage threads are running by then, so the new pool
+  is started from a fresh forkserver (or spawn) process, which needs a
+  pipeline_factory; without one the pool is not rebuilt and the remaining
+  files fail.
+- write: formatting and the result sink (disk writes) on a thread pool
+
+A full queue blocks the stage feeding it, so a slow stage holds back the
+stages before it instead of letting pending files pile up in memory.
+get_stats() reports queue depths and busy time per stage, and can be called
+while the batch runs.
+
+Example:
+    >>> executor = StagedExecutor(pipeline, build_pipeline, extract_workers=4)
+    >>> for index, result in executor.imap_unordered(files, on_result=write):
+    ...     print(files[index].name, result.success)
+    >>> print(executor.get_stats()["bottleneck"])
+"""
+
+import hashlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core import PipelineResult, ProcessingStage
+from infrastructure import get_logger, get_provenance_cache
+
+from .worker_pool import _extract_in_worker, _init_worker, compact_result
+
+STAGES = ("read", "extract", "write")
+_NEXT_STAGE = {"read": "extract", "extract": "write"}
+
+# Default thread counts for the I/O stages
+DEFAULT_READ_WORKERS = 2
+DEFAULT_WRITE_WORKERS = 2
+
+# Seconds between checks for a stopped batch while blocked on a queue
+_POLL_SECONDS = 0.1
+
+# Stage recorded when a stage raises unexpectedly
+_FAILED_STAGES = {
+    "read": ProcessingStage.VALIDATION,
+    "extract": ProcessingStage.EXTRACTION,
+    "write": ProcessingStage.FORMATTING,
+}
+
+# Marks the end of a queue; each consumer puts it back for the next one
+_DONE = object()
+
+
+class _StoppedError(Exception):
+    """Raised in stage threads when the batch is stopped."""
+
+
+class _ExtractPool:
+    """
+    Process pool of the extract stage, rebuilt when one of its processes dies.
+
+    A dead process breaks a ProcessPoolExecutor for good, failing every task
+    submitted to it afterwards. Tasks run either shared (the normal case) or
+    exclusive (alone in the pool, used to retry files that were in flight
+    when the pool broke). Without a rebuild callable a broken pool stays
+    broken and every later task fails.
+    """
+
+    def __init__(
+        self,
+        pool: ProcessPoolExecutor,
+        rebuild: Optional[Callable[[], ProcessPoolExecutor]],
+        logger: Any,
+    ):
+        self._rebuild = rebuild
+        self._logger = logger
+        self._pool = pool
+        self._generation = 0
+        self._running = 0
+        self._exclusive = False
+        self._cond = threading.Condition()
+        self.restarts = 0
+
+    def run(self, fn: Callable[..., Any], *args: Any, exclusive: bool = False) -> Any:
+        """
+        Run fn in the pool and wait for its result.
+
+        Raises:
+            BrokenProcessPool: If a pool process died while the task was in
+                flight (the pool has been rebuilt when this is raised)
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: not self._exclusive)
+            if exclusive:
+                self._exclusive = True
+                self._cond.wait_for(lambda: self._running == 0)
+            self._running += 1
+            pool, generation = self._pool, self._generation
+
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._replace(generation)
+            raise
+        finally:
+            with self._cond:
+                self._running -= 1
+                if exclusive:
+                    self._exclusive = False
+                self._cond.notify_all()
+
+    @property
+    def can_rebuild(self) -> bool:
+        return self._rebuild is not None
+
+    def _replace(self, generation: int) -> None:
+        """Rebuild the pool once per breakage (later callers see a new generation)."""
+        if self._rebuild is None:
+            return
+        with self._cond:
+            if generation != self._generation:
+                return
+            broken = self._pool
+            self._pool = self._rebuild()
+            self._generation += 1
+            self.restarts += 1
+        self._logger.warning("Extraction process died; process pool rebuilt")
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._cond:
+            pool = self._pool
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _StageStats:
+    """Busy time and queue depth counters of one stage."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.files = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._lock = threading.Lock()
+
+    def add_busy(self, seconds: float) -> None:
+        with self._lock:
+            self.files += 1
+            self.busy_seconds += seconds
+
+    def observe_depth(self, depth: int) -> None:
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def snapshot(self) -> Tuple[int, float, int]:
+        """(files, busy_seconds, max_queue_depth)"""
+        with self._lock:
+            return self.files, self.busy_seconds, self.max_queue_depth
+
+
+class StagedExecutor:
+    """
+    Batch executor running read, extract and write stages on separate pools.
+
+    Attributes:
+        pipeline: Pipeline used by the read (validation) and write
+            (formatting) stages in this process
+        pipeline_factory: Picklable callable building the pipeline of each
+            extraction process (None to use a forked copy of pipeline)
+        read_workers: Threads reading and hashing files
+        extract_workers: Extraction processes
+        write_workers: Threads formatting results and running the sink
+        queue_size: Capacity of each queue between stages
+        compact: Results are compacted after formatting (see compact_result)
+    """
+
+    def __init__(
+        self,
+        pipeline: Any,
+        pipeline_factory: Optional[Callable[[], Any]] = None,
+        read_workers: int = DEFAULT_READ_WORKERS,
+        extract_workers: int = 1,
+        write_workers: int = DEFAULT_WRITE_WORKERS,
+        queue_size: Optional[int] = None,
+        compact: bool = True,
+    ):
+        """
+        Initialize staged executor. Pools start on first use.
+
+        Args:
+            pipeline: Configured pipeline (validation and formatters)
+            pipeline_factory: Picklable callable returning a configured
+                pipeline for extraction processes
+            read_workers: Read stage threads (default: 2)
+            extract_workers: Extraction processes (default: 1)
+            write_workers: Write stage threads (default: 2)
+            queue_size: Files each queue holds before its producer waits
+                (default: twice extract_workers)
+            compact: Return compact results (default: True)
+
+        Raises:
+            ValueError: If a worker count or queue_size is <= 0
+        """
+        for name, value in (
+            ("read_workers", read_workers),
+            ("extract_workers", extract_workers),
+            ("write_workers", write_workers),
+        ):
+            if value <= 0:
+                raise ValueError(f"{name} must be > 0")
+        if queue_size is not None and queue_size <= 0:
+            raise ValueError("queue_size must be > 0")
+
+        self.pipeline = pipeline
+        self.pipeline_factory = pipeline_factory
+        self.read_workers = read_workers
+        self.extract_workers = extract_workers
+        self.write_workers = write_workers
+        self.queue_size = queue_size if queue_size is not None else 2 * extract_workers
+        self.compact = compact
+
+        self.logger = get_logger(__name__)
+
+        self._stats: Dict[str, _StageStats] = {}
+        self._queues: Dict[str, "queue.Queue[Any]"] = {}
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def imap_unordered(
+        self,
+        file_paths: Sequence[Path],
+        order: Optional[Sequence[int]] = None,
+        on_result: Optional[Callable[[PipelineResult], None]] = None,
+    ) -> Iterator[Tuple[int, PipelineResult]]:
+        """
+        Process files, yielding results as they complete.
+
+        Args:
+            file_paths: Files to process
+            order: Read order as indices into file_paths (default: input order)
+            on_result: Optional sink called on a write stage thread with each
+                result before it is yielded. An exception raised by the sink
+                stops the batch and is re-raised here.
+
+        Yields:
+            (index into file_paths, PipelineResult), in completion order
+        """
+        if order is None:
+            order = range(len(file_paths))
+
+        self._stats = {
+            "read": _StageStats(self.read_workers),
+            "extract": _StageStats(self.extract_workers),
+            "write": _StageStats(self.write_workers),
+        }
+        self._started = time.monotonic()
+        self._finished = None
+
+        # Queue items are (index, file path, stage input); each stage thread
+        # exits on its own end marker
+        inputs: "queue.Queue[Any]" = queue.Queue()
+        for index in order:
+            inputs.put((index, file_paths[index], None))
+        self._stats["read"].observe_depth(inputs.qsize())
+        for _ in range(self.read_workers):
+            inputs.put(_DONE)
+
+        to_extract: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        to_write: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        outputs: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+
+        self._queues = {"read": inputs, "extract": to_extract, "write": to_write}
+
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        # The first pool forks its extraction processes before the stage threads
+        # exist; a replacement must not fork this (by then threaded) process
+        extract_pool = _ExtractPool(
+            self._new_process_pool(multiprocessing.get_context()),
+            self._rebuild_process_pool if self.pipeline_factory is not None else None,
+            self.logger,
+        )
+
+        def extract(file_path: Path, payload: Any) -> PipelineResult:
+            if isinstance(payload, PipelineResult):
+                # The read stage raised; pass its failure on to the write stage
+                return payload
+            pending, file_hash, stat_result = payload
+            if pending.completed_at is not None:
+                return pending
+            try:
+                return extract_pool.run(_extract_in_worker, pending, file_hash, stat_result)
+            except BrokenProcessPool:
+                if not extract_pool.can_rebuild:
+                    raise
+                # Any file in flight may have been the one that killed the
+                # process; retried alone, only that file breaks the pool again
+                self.logger.warning(f"Retrying {file_path} after extraction process died")
+                return extract_pool.run(
+                    _extract_in_worker, pending, file_hash, stat_result, exclusive=True
+                )
+
+        def write(file_path: Path, pending: PipelineResult) -> PipelineResult:
+            result = pending
+            if result.completed_at is None:
+                result = self.pipeline.format_file(result)
+            return compact_result(result) if self.compact else result
+
+        threads = (
+            self._start_stage("read", self._read, inputs, to_extract, stop, errors)
+            + self._start_stage("extract", extract, to_extract, to_write, stop, errors)
+            + self._start_stage(
+                "write", write, to_write, outputs, stop, errors, on_result=on_result
+            )
+        )
+
+        try:
+            while True:
+                try:
+                    item = outputs.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    if stop.is_set():
+                        break
+                    continue
+                if item is _DONE:
+                    break
+                index, _, result = item
+                yield index, result
+
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            extract_pool.shutdown()
+            self._finished = time.monotonic()
+
+    def _new_process_pool(self, context: Any) -> ProcessPoolExecutor:
+        """Start the extraction processes, each building its pipeline once."""
+        process_pool = ProcessPoolExecutor(
+            max_workers=self.extract_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.pipeline_factory, None if self.pipeline_factory else self.pipeline),
+        )
+        # Start the processes now rather than on the first file
+        process_pool.submit(os.getpid)
+        return process_pool
+
+    def _rebuild_process_pool(self) -> ProcessPoolExecutor:
+        """Replace a broken pool without forking this process (needs pipeline_factory)."""
+        method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        return self._new_process_pool(multiprocessing.get_context(method))
+
+    def _read(self, file_path: Path, _: Any) -> Tuple[PipelineResult, Any, Any]:
+        """Validate a file and hash it (read stage)."""
+        pending = self.pipeline.validate_file(file_path)
+        if pending.completed_at is not None:
+            return pending, None, None
+
+        try:
+            with open(file_path, "rb") as f:
+                # stat the open file so the digest and key describe the same bytes
+                stat_result = os.fstat(f.fileno())
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            # The extraction stage reports unreadable files
+            return pending, None, None
+
+        get_provenance_cache().record(file_path, file_hash, stat_result)
+        return pending, file_hash, stat_result
+
+    def _start_stage(
+        self,
+        name: str,
+        work: Callable[[Path, Any], Any],
+        source: "queue.Queue[Any]",
+        target: "queue.Queue[Any]",
+        stop: threading.Event,
+        errors: List[BaseException],
+        on_result: Optional[Callable[[PipelineResult], None]] = None,
+    ) -> List[threading.Thread]:
+        """Start the threads of one stage, moving items from source to target."""
+        stats = self._stats[name]
+        next_stats = self._stats.get(_NEXT_STAGE.get(name, ""))
+        # Threads of the next stage, or the consuming generator
+        consumers = next_stats.workers if next_stats is not None else 1
+        alive = [stats.workers]
+        alive_lock = threading.Lock()
+
+        def run() -> None:
+            try:
+                while True:
+                    item = self._get(source, stop)
+                    if item is _DONE:
+                        return
+
+                    index, file_path, payload = item
+                    started = time.monotonic()
+                    try:
+                        result = work(file_path, payload)
+                    except Exception as e:
+                        self.logger.exception(f"{name} stage failed for {file_path}: {e}")
+                        result = self._failed_result(file_path, name, e)
+                    if on_result is not None:
+                        on_result(result)
+                    stats.add_busy(time.monotonic() - started)
+
+                    self._put(target, (index, file_path, result), stop)
+                    if next_stats is not None:
+                        next_stats.observe_depth(target.qsize())
+            except _StoppedError:
+                pass
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                with alive_lock:
+                    alive[0] -= 1
+                    last = alive[0] == 0
+                if last:
+                    try:
+                        for _ in range(consumers):
+                            self._put(target, _DONE, stop)
+                    except _StoppedError:
+                        pass
+
+        threads = [
+            threading.Thread(target=run, name=f"staged-{name}-{n}", daemon=True)
+            for n in range(stats.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @staticmethod
+    def _get(source: "queue.Queue[Any]", stop: threading.Event) -> Any:
+        while not stop.is_set():
+            try:
+                return source.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        raise _StoppedError
+
+    @staticmethod
+    def _put(target: "queue.Queue[Any]", item: Any, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+        raise _StoppedError
+
+    @staticmethod
+    def _failed_result(file_path: Path, stage: str, error: Exception) -> PipelineResult:
+        now = datetime.now(timezone.utc)
+        return PipelineResult(
+            source_file=file_path,
+            success=False,
+            failed_stage=_FAILED_STAGES[stage],
+            all_errors=(f"Pipeline exception: {error}",),
+            started_at=now,
+            completed_at=now,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-stage statistics of the current or last batch.
+
+        Safe to call from another thread while a batch runs.
+
+        Returns:
+            Dictionary with elapsed_seconds, bottleneck (stage with the
+            highest utilization) and stages: per stage, workers, files,
+            busy_seconds, utilization (busy time / (workers x elapsed)),
+            queue_depth (files waiting for the stage) and max_queue_depth
+        """
+        if self._started is None:
+            return {"elapsed_seconds": 0.0, "bottleneck": None, "stages": {}}
+
+        end = self._finished if self._finished is not None else time.monotonic()
+        elapsed = end - self._started
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for name in STAGES:
+            stats = self._stats[name]
+            files, busy, max_depth = stats.snapshot()
+            stages[name] = {
+                "workers": stats.workers,
+                "files": files,
+                "busy_seconds": busy,
+                "utilization": busy / (stats.workers * elapsed) if elapsed > 0 else 0.0,
+                "queue_depth": self._queues[name].qsize(),
+                "max_queue_depth": max_depth,
+            }
+
+        bottleneck = max(stages, key=lambda name: stages[name]["utilization"])
+        return {"elapsed_seconds": elapsed, "bottleneck": bottleneck, "stages": stages}
@@ -0,0 +1,436 @@
+"""
+WorkerPool - Recycling Process Pool with Hard Per-File Deadlines.
+
+ProcessPoolExecutor cannot stop one running task: a file stuck in a parser
+loop holds its worker until the batch ends. WorkerPool runs one pipeline per
+worker process and talks to each worker over its own pipe, so the parent
+always knows which file each worker is on and can kill just that worker.
+
+Design:
+- Each worker builds its pipeline once (picklable factory, or forked copy)
+- A file that exceeds its deadline gets its worker killed and replaced; the
+  file gets a failed PipelineResult naming the stage it was stuck in. The
+  deadline clock starts once the worker reports its pipeline is built.
+- A worker that dies (crash, OOM kill) is replaced the same way
+- Workers are recycled after max_files_per_worker files to cap leaks
+- Results are yielded as files complete; other workers keep running
+
+Example:
+    >>> pool = WorkerPool(build_pipeline, max_workers=4, timeout_per_file=300)
+    >>> for index, result in pool.imap_unordered(files):
+    ...     print(files[index].name, result.success)
+"""
+
+import dataclasses
+import multiprocessing
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from core import PipelineResult, ProcessingStage
+from infrastructure import get_logger, get_provenance_cache
+
+# Seconds a worker gets to exit after being asked to stop
+SHUTDOWN_GRACE_SECONDS = 5.0
+
+# Pipeline progress stage names (ExtractionPipeline._report_progress) mapped
+# to the failed stage recorded when a file times out or kills its worker
+_FAILED_STAGES = {
+    "validation": ProcessingStage.VALIDATION,
+    "extraction": ProcessingStage.EXTRACTION,
+    "processing": ProcessingStage.CONTEXT_LINKING,
+    "formatting": ProcessingStage.FORMATTING,
+}
+
+
+# Pipeline owned by this worker process (set by _init_worker)
+_worker_pipeline: Any = None
+
+
+def _init_worker(pipeline_factory: Optional[Callable[[], Any]], pipeline: Any) -> None:
+    """Build (or adopt the forked copy of) the pipeline for this worker process."""
+    global _worker_pipeline
+    _worker_pipeline = pipeline_factory() if pipeline_factory is not None else pipeline
+
+
+def _process_in_worker(
+    file_path: Path, compact: bool, progress_callback: Optional[Callable] = None
+) -> PipelineResult:
+    """Process one file with this worker's pipeline (runs in a worker process)."""
+    try:
+        result = _worker_pipeline.process_file(file_path, progress_callback=progress_callback)
+    except Exception as e:
+        result = PipelineResult(
+            source_file=file_path,
+            success=False,
+            failed_stage=ProcessingStage.EXTRACTION,
+            all_errors=(f"Pipeline exception: {e}",),
+            started_at=datetime.now(timezone.utc),
+            completed_at=datetime.now(timezone.utc),
+        )
+    return compact_result(result) if compact else result
+
+
+def _extract_in_worker(
+    pending: PipelineResult, file_hash: Optional[str], stat_result: Optional[os.stat_result]
+) -> PipelineResult:
+    """
+    Run the extraction and processing stages with this worker's pipeline.
+
+    Used by the staged executor. file_hash and stat_result come from the
+    read stage, which already hashed the file; recording them lets the
+    extractor and extraction cache skip reading the file again for its hash.
+    """
+    file_path = pending.source_file
+    if file_hash is not None and stat_result is not None:
+        get_provenance_cache().record(file_path, file_hash, stat_result)
+    try:
+        return _worker_pipeline.extract_file(pending)
+    except Exception as e:
+        return PipelineResult(
+            source_file=file_path,
+            success=False,
+            failed_stage=ProcessingStage.EXTRACTION,
+            all_errors=(*pending.all_errors, f"Pipeline exception: {e}"),
+            all_warnings=pending.all_warnings,
+            started_at=pending.started_at,
+            completed_at=datetime.now(timezone.utc),
+        )
+
+
+def compact_result(result: PipelineResult) -> PipelineResult:
+    """
+    Drop the content payloads of a pipeline result.
+
+    Keeps status, errors, warnings, timings, document metadata and the
+    formatted outputs; content blocks, images and tables are removed and the
+    processing result is dropped. Used to send results back from worker
+    processes cheaply.
+
+    Args:
+        result: Full pipeline result
+
+    Returns:
+        PipelineResult without content payloads
+    """
+    extraction_result = result.extraction_result
+    if extraction_result is not None:
+        extraction_result = dataclasses.replace(
+            extraction_result, content_blocks=(), images=(), tables=()
+        )
+    return dataclasses.replace(result, extraction_result=extraction_result, processing_result=None)
+
+
+def slim_result(result: PipelineResult) -> PipelineResult:
+    """
+    Keep only the status of a pipeline result.
+
+    Keeps status, failed stage, errors, warnings and timings; extraction and
+    processing results and formatted outputs are dropped. Used to keep one
+    small record per file once a streamed result has been written.
+
+    Args:
+        result: Pipeline result
+
+    Returns:
+        PipelineResult without payloads
+    """
+    return dataclasses.replace(
+        result, extraction_result=None, processing_result=None, formatted_outputs=()
+    )
+
+
+def _worker_main(conn: Any, pipeline_factory: Optional[Callable], pipeline: Any, compact: bool):
+    """
+    Worker process loop: receive file paths, send back stage updates and results.
+
+    Messages to the parent are ("ready", None) once the pipeline is built,
+    ("stage", name) while a file is processed and ("result", PipelineResult)
+    when it is done. None from the parent stops the worker.
+    """
+    _init_worker(pipeline_factory, pipeline)
+    conn.send(("ready", None))
+
+    def report_stage(status):
+        conn.send(("stage", status.get("stage")))
+
+    while True:
+        try:
+            file_path = conn.recv()
+        except (EOFError, OSError):
+            break
+        if file_path is None:
+            break
+        conn.send(("result", _process_in_worker(file_path, compact, report_stage)))
+
+
+class _Worker:
+    """Parent-side handle of one worker process."""
+
+    def __init__(self, process: Any, conn: Any):
+        self.process = process
+        self.conn = conn
+        self.index: Optional[int] = None
+        self.file_path: Optional[Path] = None
+        self.stage: Optional[str] = None
+        self.ready = False
+        self.assigned: float = 0.0
+        # Deadline clock of the current file; starts once the worker has
+        # built its pipeline, so a slow startup does not count against it
+        self.started: Optional[float] = None
+        self.files_done = 0
+
+    def assign(self, index: int, file_path: Path) -> None:
+        self.index = index
+        self.file_path = file_path
+        self.stage = None
+        self.assigned = time.monotonic()
+        self.started = self.assigned if self.ready else None
+        self.conn.send(file_path)
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        if self.busy and self.started is None:
+            self.started = time.monotonic()
+
+    def release(self) -> Tuple[int, Path]:
+        task = (self.index, self.file_path)
+        self.index = None
+        self.file_path = None
+        self.files_done += 1
+        return task
+
+    @property
+    def busy(self) -> bool:
+        return self.index is not None
+
+
+class WorkerPool:
+    """
+    Pool of pipeline worker processes with per-file deadlines.
+
+    Attributes:
+        max_workers: Number of worker processes
+        timeout_per_file: Seconds one file may take before its worker is killed
+            (None for no deadline)
+        max_files_per_worker: Files processed before a worker is replaced
+            (None for no limit)
+        compact: Workers return compact results (see compact_result)
+        workers_started: Worker processes started so far (including replacements)
+        timeouts: Files whose worker was killed for exceeding the deadline
+    """
+
+    def __init__(
+        self,
+        pipeline_factory: Optional[Callable[[], Any]] = None,
+        pipeline: Any = None,
+        max_workers: int = 1,
+        timeout_per_file: Optional[float] = None,
+        max_files_per_worker: Optional[int] = None,
+        compact: bool = True,
+    ):
+        """
+        Initialize worker pool. Workers start on first use.
+
+        Args:
+            pipeline_factory: Picklable callable returning a configured pipeline
+            pipeline: Pipeline copied into forked workers (used when no factory)
+            max_workers: Number of worker processes
+            timeout_per_file: Per-file deadline in seconds (default: none)
+            max_files_per_worker: Recycle workers after this many files
+                (default: never)
+            compact: Return compact results (default: True)
+
+        Raises:
+            ValueError: If max_workers, timeout_per_file or max_files_per_worker
+                is <= 0
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        if timeout_per_file is not None and timeout_per_file <= 0:
+            raise ValueError("timeout_per_file must be > 0")
+        if max_files_per_worker is not None and max_files_per_worker <= 0:
+            raise ValueError("max_files_per_worker must be > 0")
+
+        self.pipeline_factory = pipeline_factory
+        self.pipeline = pipeline if pipeline_factory is None else None
+        self.max_workers = max_workers
+        self.timeout_per_file = timeout_per_file
+        self.max_files_per_worker = max_files_per_worker
+        self.compact = compact
+
+        self.logger = get_logger(__name__)
+        self._context = multiprocessing.get_context()
+
+        self.workers_started = 0
+        self.timeouts = 0
+
+    def _start_worker(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.pipeline_factory, self.pipeline, self.compact),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self.workers_started += 1
+        return _Worker(process, parent_conn)
+
+    def _stop_worker(self, worker: _Worker, kill: bool = False) -> None:
+        if kill:
+            worker.process.kill()
+        else:
+            try:
+                worker.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        worker.process.join(None if kill else SHUTDOWN_GRACE_SECONDS)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+
+    def _failed_result(self, worker: _Worker, error: str) -> PipelineResult:
+        now = datetime.now(timezone.utc)
+        return PipelineResult(
+            source_file=worker.file_path,
+            success=False,
+            failed_stage=_FAILED_STAGES.get(worker.stage, ProcessingStage.EXTRACTION),
+            all_errors=(error,),
+            started_at=now,
+            completed_at=now,
+            duration_seconds=time.monotonic() - worker.assigned,
+        )
+
+    def imap_unordered(
+        self, file_paths: Sequence[Path], order: Optional[Sequence[int]] = None
+    ) -> Iterator[Tuple[int, PipelineResult]]:
+        """
+        Process files, yielding results as they complete.
+
+        Args:
+            file_paths: Files to process
+            order: Dispatch order as indices into file_paths (default: input order)
+
+        Yields:
+            (index into file_paths, PipelineResult), in completion order
+        """
+        if order is None:
+            order = range(len(file_paths))
+        pending = deque((index, file_paths[index]) for index in order)
+        workers: List[_Worker] = []
+
+        try:
+            for _ in range(min(self.max_workers, len(pending))):
+                workers.append(self._start_worker())
+
+            for worker in workers:
+                if pending:
+                    worker.assign(*pending.popleft())
+
+            while any(worker.busy for worker in workers):
+                busy = [worker for worker in workers if worker.busy]
+                ready = wait(
+                    [w.conn for w in busy] + [w.process.sentinel for w in busy],
+                    timeout=self._wait_timeout(busy),
+                )
+
+                for worker in busy:
+                    outcome = self._check_worker(worker, ready)
+                    if outcome is None:
+                        continue
+
+                    result, replace = outcome
+                    index, _ = worker.release()
+                    if replace:
+                        self._stop_worker(worker, kill=True)
+                    elif (
+                        self.max_files_per_worker is not None
+                        and worker.files_done >= self.max_files_per_worker
+                    ):
+                        self._stop_worker(worker)
+                        replace = True
+
+                    if replace:
+                        position = workers.index(worker)
+                        if pending:
+                            workers[position] = worker = self._start_worker()
+                        else:
+                            del workers[position]
+                            worker = None
+
+                    if worker is not None and pending:
+                        worker.assign(*pending.popleft())
+
+                    yield index, result
+        finally:
+            for worker in workers:
+                self._stop_worker(worker, kill=worker.busy)
+
+    def _wait_timeout(self, busy: List[_Worker]) -> Optional[float]:
+        """Seconds until the earliest deadline among busy workers (None if no clock runs)."""
+        clocks = [w.started for w in busy if w.started is not None]
+        if self.timeout_per_file is None or not clocks:
+            return None
+        return max(0.0, min(clocks) + self.timeout_per_file - time.monotonic())
+
+    def _check_worker(
+        self, worker: _Worker, ready: List[Any]
+    ) -> Optional[Tuple[PipelineResult, bool]]:
+        """
+        Read a busy worker's messages and enforce its deadline.
+
+        Returns:
+            None while the file is still running, else (result, replace_worker)
+        """
+        try:
+            while worker.conn.poll():
+                kind, payload = worker.conn.recv()
+                if kind == "result":
+                    return payload, False
+                if kind == "ready":
+                    worker.mark_ready()
+                else:
+                    worker.stage = payload
+        except (EOFError, OSError):
+            pass
+        else:
+            if worker.process.sentinel not in ready and worker.process.is_alive():
+                if (
+                    self.timeout_per_file is None
+                    or worker.started is None
+                    or time.monotonic() - worker.started < self.timeout_per_file
+                ):
+                    return None
+
+                self.timeouts += 1
+                self.logger.warning(
+                    f"Killing worker for {worker.file_path}: exceeded "
+                    f"{self.timeout_per_file}s during {worker.stage or 'startup'}"
+                )
+                return (
+                    self._failed_result(
+                        worker,
+                        f"Timed out after {self.timeout_per_file}s "
+                        f"(stage: {worker.stage or 'startup'})",
+                    ),
+                    True,
+                )
+
+        # Pipe closed or process gone without a result
+        worker.process.join(SHUTDOWN_GRACE_SECONDS)
+        self.logger.error(
+            f"Worker exited while processing {worker.file_path} "
+            f"(exit code {worker.process.exitcode})"
+        )
+        return (
+            self._failed_result(
+                worker, f"Worker process exited unexpectedly (exit code {worker.process.exitcode})"
+            ),
+            True,
+        )
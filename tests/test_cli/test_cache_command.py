@@ -0,0 +1,81 @@
+"""
+Tests for Cache Command and --no-cache - Extraction Result Cache.
+
+Test coverage for:
+- Reusing extraction results across runs
+- Bypassing the cache with --no-cache
+- Cache statistics and clearing
+"""
+
+import click
+import pytest
+import yaml
+
+from cli.main import cli
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    """Config file pointing the extraction cache into the test directory."""
+    config_path = tmp_path / "cache_config.yaml"
+    config_path.write_text(
+        yaml.dump({"cache": {"extraction_dir": str(tmp_path / "cache"), "max_size_mb": 10}})
+    )
+    return config_path
+
+
+def _extract(cli_runner, config, file_path, output, *extra):
+    return cli_runner.invoke(
+        cli,
+        ["--config", str(config), "extract", str(file_path), "--output", str(output), "--force"]
+        + list(extra),
+    )
+
+
+class TestExtractionCache:
+    """Test extract runs populate and reuse the cache."""
+
+    def test_extract_populates_cache(self, cli_runner, cache_config, sample_docx_file, tmp_path):
+        result = _extract(cli_runner, cache_config, sample_docx_file, tmp_path / "out.json")
+
+        assert result.exit_code == 0
+        assert len(list((tmp_path / "cache").glob("*/*.pkl"))) == 1
+
+    def test_cached_output_matches(self, cli_runner, cache_config, sample_docx_file, tmp_path):
+        _extract(
+            cli_runner, cache_config, sample_docx_file, tmp_path / "first.md", "-f", "markdown"
+        )
+        _extract(
+            cli_runner, cache_config, sample_docx_file, tmp_path / "second.md", "-f", "markdown"
+        )
+
+        assert (tmp_path / "second.md").read_text() == (tmp_path / "first.md").read_text()
+
+    def test_no_cache_skips_cache(self, cli_runner, cache_config, sample_docx_file, tmp_path):
+        result = _extract(
+            cli_runner, cache_config, sample_docx_file, tmp_path / "out.json", "--no-cache"
+        )
+
+        assert result.exit_code == 0
+        assert not list((tmp_path / "cache").glob("*/*.pkl"))
+
+
+class TestCacheCommand:
+    """Test cache stats and clear."""
+
+    def test_stats_and_clear(self, cli_runner, cache_config, sample_docx_file, tmp_path):
+        _extract(cli_runner, cache_config, sample_docx_file, tmp_path / "out.json")
+
+        stats = cli_runner.invoke(cli, ["--config", str(cache_config), "cache", "stats"])
+        assert stats.exit_code == 0
+        assert "Entries: 1" in click.unstyle(stats.output)
+
+        cleared = cli_runner.invoke(cli, ["--config", str(cache_config), "cache", "clear"])
+        assert cleared.exit_code == 0
+        assert not list((tmp_path / "cache").glob("*/*.pkl"))
+
+    def test_stats_without_cache(self, cli_runner, cache_config):
+        result = cli_runner.invoke(cli, ["--config", str(cache_config), "cache", "stats"])
+
+        assert result.exit_code == 0
+        assert "No extraction cache" in result.output
@@ -0,0 +1,147 @@
+"""
+Test suite for ColumnProfiler - batch column type inference.
+
+Test Organization:
+- Cell classification (parity with float(), dates, empty cells)
+- Per-column types and header detection
+- Whole-column matching vs per-cell classification
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from extractors.column_profiler import ColumnProfiler
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def profiler():
+    """Create ColumnProfiler with default sample size."""
+    return ColumnProfiler()
+
+
+def _is_float(value):
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+NUMERIC_EDGE_CASES = [
+    "0", "-1", "+2.5", ".5", "5.", "1e10", "1E-3", " 42 ", "1_000", "inf", "-Infinity",
+    "NaN", "1,000", "1__0", "_1", "e5", "1e", "abc", "--1", "0x1F", "1.2.3", "", " ",
+]  # fmt: skip
+
+
+# =============================================================================
+# CLASSIFICATION
+# =============================================================================
+
+
+class TestClassification:
+    """Test cell and column classification."""
+
+    @pytest.mark.parametrize("value", NUMERIC_EDGE_CASES)
+    def test_numeric_matches_float(self, profiler, value):
+        """TEST: A non-blank cell is numeric exactly when float() accepts it."""
+        cell_type = profiler.classify_cell(value)
+
+        if not value.strip():
+            assert cell_type == "empty"
+        else:
+            assert (cell_type == "numeric") == _is_float(value)
+
+    @pytest.mark.parametrize("value", NUMERIC_EDGE_CASES)
+    def test_column_match_agrees_with_cells(self, profiler, value):
+        """TEST: Whole-column matching agrees with per-cell classification."""
+        for column in ([value], ["1", value, " "], [value, "2024-01-05"]):
+            assert profiler.column_types([[cell] for cell in column], 1) == (
+                ColumnProfiler._column_type_by_cell(column),
+            )
+
+    @pytest.mark.parametrize(
+        "value", ["2024-01-05", "2024-01-05T10:30:00Z", "2024/1/5", "05/01/2024", "Jan 5, 2024"]
+    )
+    def test_dates(self, profiler, value):
+        """TEST: Common date forms classify as dates."""
+        assert profiler.classify_cell(value) == "date"
+        assert profiler.column_types([[value], [""]], 1) == ("date",)
+
+    def test_ragged_rows_padded_with_empty(self, profiler):
+        """TEST: Short rows are treated as padded with empty cells."""
+        assert profiler.column_types([["1"], ["2", "x"]], 3) == ("numeric", "text", "empty")
+
+    def test_multiline_cells_use_per_cell_path(self, profiler):
+        """TEST: Cells containing newlines are not split into extra lines."""
+        assert profiler.column_types([["1\n2"], ["3"]], 1) == ("text",)
+        assert profiler.column_types([[" 1\n"], ["3"]], 1) == ("numeric",)
+
+    def test_whitespace_heavy_column_fails_fast(self, profiler):
+        """TEST: A mismatch after many blank-padded cells does not backtrack."""
+        rows = [["   "]] * 5000 + [["x"]]
+
+        assert profiler.column_types(rows, 1) == ("text",)
+
+
+# =============================================================================
+# PROFILES
+# =============================================================================
+
+
+class TestProfile:
+    """Test column types and header detection."""
+
+    def test_column_types_exclude_header(self, profiler):
+        """TEST: Types are computed over data rows only."""
+        rows = [
+            ["id", "when", "name", "note"],
+            ["1", "2024-01-05", "Alice", ""],
+            ["2", "", "3", ""],
+        ]
+
+        profile = profiler.profile(rows)
+
+        assert profile.has_header
+        assert profile.column_types == ("numeric", "date", "text", "empty")
+
+    def test_header_heuristic(self, profiler):
+        """TEST: Text-over-numbers rows have a header; all-numeric rows do not."""
+        assert profiler.profile([["Name", "Age"], ["Alice", "30"]]).has_header
+        assert not profiler.profile([["1", "2"], ["3", "4"]]).has_header
+        assert not profiler.profile([["only", "row"]]).has_header
+
+    def test_configured_header_is_kept(self, profiler):
+        """TEST: A configured has_header overrides detection."""
+        profile = profiler.profile([["1", "2"], ["3", "4"]], has_header=True)
+
+        assert profile.has_header
+        assert profile.column_types == ("numeric", "numeric")
+
+    def test_sample_size_limits_rows(self):
+        """TEST: Only sample_rows rows are profiled."""
+        rows = [["1"]] * 5 + [["text"]]
+
+        profile = ColumnProfiler(sample_rows=5).profile(rows, has_header=False)
+
+        assert profile.sample_rows == 5
+        assert profile.column_types == ("numeric",)
+
+    def test_types_for_pads_and_truncates(self, profiler):
+        """TEST: types_for sizes types to a table width."""
+        profile = profiler.profile([["1", "x"]], has_header=False)
+
+        assert profile.types_for(3) == ("numeric", "text", "empty")
+        assert profile.types_for(1) == ("numeric",)
+
+    def test_empty_sample(self, profiler):
+        """TEST: No rows profile to no types."""
+        assert profiler.profile([]).column_types == ()
@@ -799,6 +799,105 @@ class TestInfrastructureIntegration:
         assert len(error_msg) > 0
 
 
+# =============================================================================
+# CYCLE 11: CHUNKED STREAMING
+# =============================================================================
+
+
+@pytest.fixture
+def chunked_csv(tmp_path):
+    """CSV with a header and 25 data rows."""
+    csv_file = tmp_path / "chunked.csv"
+    lines = ["id,name,score"] + [f"{i},item{i},{i * 10}" for i in range(25)]
+    csv_file.write_text("\n".join(lines))
+    return csv_file
+
+
+class TestChunkedStreaming:
+    """Test chunk_rows streaming of table segments."""
+
+    def test_one_segment_per_batch_with_header(self, chunked_csv):
+        """TEST: Each batch yields its TableMetadata, then a block referencing it."""
+        extractor = CSVExtractor({"chunk_rows": 10})
+
+        items = list(extractor.extract_stream(chunked_csv))
+        tables = [item for item in items if hasattr(item, "cells")]
+        blocks = [item for item in items if hasattr(item, "block_type")]
+
+        assert items[-1].success
+        assert items[-1].tables == ()
+        assert [t.num_rows for t in tables] == [10, 10, 5]
+        assert all(t.header_row == ("id", "name", "score") for t in tables)
+        assert [b.metadata["table_id"] for b in blocks] == [str(t.table_id) for t in tables]
+        assert [b.metadata["row_offset"] for b in blocks] == [0, 10, 20]
+        assert [b.position.sequence_index for b in blocks] == [0, 1, 2]
+        assert items.index(tables[0]) < items.index(blocks[0])
+
+    def test_segments_match_single_table(self, chunked_csv):
+        """TEST: Concatenated segments equal the unchunked table."""
+        whole = CSVExtractor().extract(chunked_csv)
+        chunked = CSVExtractor({"chunk_rows": 7}).extract(chunked_csv)
+
+        assert chunked.success
+        assert chunked.document_metadata.table_count == 4
+        assert [row for t in chunked.tables for row in t.cells] == list(whole.tables[0].cells)
+
+    def test_skip_and_max_rows(self, chunked_csv):
+        """TEST: skip_rows and max_rows apply across batches."""
+        config = {"chunk_rows": 4, "skip_rows": 1, "has_header": False, "max_rows": 9}
+
+        result = CSVExtractor(config).extract(chunked_csv)
+
+        rows = [row for t in result.tables for row in t.cells]
+        assert [t.num_rows for t in result.tables] == [4, 4, 1]
+        assert rows[0] == ("0", "item0", "0")
+        assert rows[-1] == ("8", "item8", "80")
+
+    def test_header_only_yields_empty_segment(self, tmp_path):
+        """TEST: A header-only file still yields one (empty) segment."""
+        csv_file = tmp_path / "header_only.csv"
+        csv_file.write_text("id,name\n")
+
+        result = CSVExtractor({"chunk_rows": 10, "has_header": True}).extract(csv_file)
+
+        assert result.success
+        assert len(result.tables) == 1
+        assert result.tables[0].num_rows == 0
+
+    def test_rows_read_lazily(self, chunked_csv, monkeypatch):
+        """TEST: Chunked mode never materializes the whole file."""
+        extractor = CSVExtractor({"chunk_rows": 10})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("whole-file read in chunked mode")
+
+        monkeypatch.setattr(extractor, "_read_csv_file", fail)
+
+        assert extractor.extract(chunked_csv).success
+
+
+# =============================================================================
+# CYCLE 12: COLUMN TYPES
+# =============================================================================
+
+
+class TestColumnTypes:
+    """Test per-column type inference."""
+
+    def test_column_types_on_table_and_block(self, csv_extractor, sample_csv):
+        """TEST: Column types are set on the table and its block."""
+        result = csv_extractor.extract(sample_csv)
+
+        assert result.tables[0].column_types == ("text", "numeric", "text")
+        assert result.content_blocks[0].metadata["column_types"] == ["text", "numeric", "text"]
+
+    def test_chunked_segments_share_types(self, chunked_csv):
+        """TEST: Every segment carries the types profiled from the first batch."""
+        result = CSVExtractor({"chunk_rows": 10}).extract(chunked_csv)
+
+        assert {t.column_types for t in result.tables} == {("numeric", "text", "numeric")}
+
+
 # =============================================================================
 # PERFORMANCE TESTS
 # =============================================================================
@@ -0,0 +1,139 @@
+"""
+Test suite for CsvSniffer - single-read CSV detection and hashing.
+
+Test Organization:
+- Encoding and BOM detection from the head buffer
+- Delimiter detection
+- Head replay into the main parse
+- File hashing during the parse
+- CSVExtractor integration (one open per file)
+"""
+
+import csv
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from extractors.csv_sniffer import CsvSniffer
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def sniffer():
+    """Create CsvSniffer with default head size."""
+    return CsvSniffer()
+
+
+@pytest.fixture
+def long_csv(tmp_path):
+    """CSV much larger than a small head buffer."""
+    csv_file = tmp_path / "long.csv"
+    lines = ["id;name;note"] + [f'{i};item {i};"multi\nline {i}"' for i in range(500)]
+    csv_file.write_text("\n".join(lines), encoding="utf-8")
+    return csv_file
+
+
+# =============================================================================
+# DETECTION
+# =============================================================================
+
+
+class TestDetection:
+    """Test encoding, BOM and delimiter detection on one head buffer."""
+
+    def test_utf8(self, sniffer):
+        assert sniffer.detect_encoding("Name,Café\n".encode("utf-8")) == "utf-8"
+
+    def test_utf8_split_at_buffer_end(self, sniffer):
+        """A multi-byte character cut off by the head boundary is still UTF-8."""
+        head = "abc,é".encode("utf-8")[:-1]
+        assert sniffer.detect_encoding(head) == "utf-8"
+
+    def test_non_utf8_falls_back(self, sniffer):
+        assert sniffer.detect_encoding(b"Name,Caf\xe9\n") != "utf-8"
+
+    def test_bom_flagged(self, sniffer, tmp_path):
+        csv_file = tmp_path / "bom.csv"
+        csv_file.write_bytes(b"\xef\xbb\xbfa,b\n1,2\n")
+
+        with sniffer.open(csv_file) as source:
+            assert source.has_bom
+            assert source.encoding == "utf-8"
+
+    @pytest.mark.parametrize("delimiter", [",", "\t", ";", "|"])
+    def test_delimiter(self, sniffer, delimiter):
+        head = delimiter.join(["a", "b", "c"]) + "\n" + delimiter.join(["1", "2", "3"]) + "\n"
+        assert sniffer.detect_delimiter(head.encode("utf-8"), "utf-8") == delimiter
+
+    def test_configured_values_skip_detection(self, sniffer, long_csv):
+        with sniffer.open(long_csv, encoding="latin-1", delimiter=",") as source:
+            assert source.encoding == "latin-1"
+            assert source.delimiter == ","
+
+    def test_detect_header(self, sniffer):
+        assert sniffer.detect_header([["Name", "Age"], ["Alice", "30"]])
+        assert not sniffer.detect_header([["1", "2"], ["3", "4"]])
+
+
+# =============================================================================
+# SINGLE-PASS READ AND HASH
+# =============================================================================
+
+
+class TestSinglePass:
+    """Test that the head is replayed and the file hashed during the parse."""
+
+    def test_parse_matches_plain_read_across_head_boundary(self, long_csv):
+        with CsvSniffer(head_size=64).open(long_csv) as source:
+            assert source.delimiter == ";"
+            rows = list(csv.reader(source.text, delimiter=source.delimiter))
+
+        with open(long_csv, "r", encoding="utf-8") as f:
+            expected = list(csv.reader(f, delimiter=";"))
+
+        assert rows == expected
+
+    def test_hash_after_full_parse(self, long_csv):
+        with CsvSniffer(head_size=64).open(long_csv) as source:
+            list(csv.reader(source.text, delimiter=source.delimiter))
+            file_hash = source.file_hash()
+
+        assert file_hash == hashlib.sha256(long_csv.read_bytes()).hexdigest()
+
+    def test_hash_after_partial_parse(self, long_csv):
+        """Unread bytes are hashed when the digest is requested."""
+        with CsvSniffer(head_size=64).open(long_csv) as source:
+            next(csv.reader(source.text, delimiter=source.delimiter))
+            file_hash = source.file_hash()
+
+        assert file_hash == hashlib.sha256(long_csv.read_bytes()).hexdigest()
+
+    def test_extractor_opens_file_once(self, long_csv, monkeypatch):
+        import builtins
+
+        from extractors.csv_extractor import CSVExtractor
+
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        result = CSVExtractor().extract(long_csv)
+        monkeypatch.undo()
+
+        assert result.success
+        assert opened.count(str(long_csv)) == 1
+        assert result.document_metadata.file_hash == (
+            hashlib.sha256(long_csv.read_bytes()).hexdigest()
+        )
@@ -975,6 +975,136 @@ def test_docx_extractor_interface_methods():
     assert isinstance(format_name, str)
 
 
+# ============================================================================
+# Phase 6: lxml Backend Tests
+# ============================================================================
+
+
+def _backend_snapshot(result: ExtractionResult) -> tuple:
+    """Comparable view of an extraction result (excludes IDs and timestamps)."""
+    return (
+        result.success,
+        result.warnings,
+        [
+            (b.block_type, b.content, b.raw_content, b.position.sequence_index, b.metadata)
+            for b in result.content_blocks
+        ],
+        [(t.num_rows, t.num_columns, t.header_row, tuple(t.cells)) for t in result.tables],
+        result.document_metadata.word_count,
+        result.document_metadata.title,
+        result.document_metadata.keywords,
+    )
+
+
+@pytest.fixture
+def rich_docx_file(tmp_path):
+    """DOCX with hyperlinks, breaks, unknown styles and merged table cells."""
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+
+    file_path = tmp_path / "rich.docx"
+    doc = Document()
+    doc.add_heading("Report", level=1)
+
+    para = doc.add_paragraph("Tab\there")
+    run = para.add_run("line")
+    run.add_break()
+    run.add_text("next")
+    para._p.append(
+        parse_xml(f'<w:hyperlink {nsdecls("w")}><w:r><w:t> link</w:t></w:r></w:hyperlink>')
+    )
+
+    unknown = doc.add_paragraph("Unknown style falls back to Normal")
+    unknown._p.get_or_add_pPr().append(parse_xml(f'<w:pStyle {nsdecls("w")} w:val="NoSuchStyle"/>'))
+    doc.add_paragraph("Quoted", style="Quote")
+    doc.add_paragraph("Bullet", style="List Bullet")
+
+    table = doc.add_table(rows=3, cols=3)
+    for row in range(3):
+        for col in range(3):
+            table.cell(row, col).text = f"r{row}c{col}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+
+    doc.add_paragraph("")
+    doc.add_paragraph("After table")
+    doc.core_properties.title = "Rich"
+    doc.core_properties.keywords = "a, b"
+    doc.save(file_path)
+    return file_path
+
+
+@pytest.mark.unit
+@pytest.mark.extraction
+@pytest.mark.parametrize("config", [{}, {"skip_empty": False, "max_paragraph_length": 8}])
+def test_docx_extractor_lxml_backend_matches_python_docx(rich_docx_file, config):
+    """
+    Test that the streaming lxml backend matches the python-docx backend.
+
+    Expected: Identical blocks, styles, tables, warnings and metadata
+    """
+    lxml_result = DocxExtractor(config).extract(rich_docx_file)
+    docx_result = DocxExtractor({**config, "backend": "python-docx"}).extract(rich_docx_file)
+
+    assert DocxExtractor(config).backend == "lxml"
+    assert lxml_result.success is True
+    assert _backend_snapshot(lxml_result) == _backend_snapshot(docx_result)
+
+
+@pytest.mark.unit
+@pytest.mark.extraction
+def test_docx_extractor_lxml_backend_content(rich_docx_file):
+    """
+    Test paragraph text and style resolution of the lxml backend.
+
+    Expected: Hyperlink and break text included, unknown style resolves to Normal
+    """
+    result = DocxExtractor().extract(rich_docx_file)
+
+    blocks = result.content_blocks
+    assert blocks[0].block_type == ContentType.HEADING
+    assert blocks[1].content == "Tab\thereline\nnext link"
+    assert blocks[2].metadata["style_name"] == "Normal"
+    assert blocks[3].block_type == ContentType.QUOTE
+    assert blocks[4].block_type == ContentType.LIST_ITEM
+    # Merged cells repeat the merged text in every grid position they cover
+    assert result.tables[0].cells[0] == ("r0c0\nr0c1", "r0c0\nr0c1", "r0c2")
+    assert result.tables[0].cells[2] == ("r2c0", "r2c1", "r1c2\nr2c2")
+
+
+@pytest.mark.unit
+@pytest.mark.extraction
+def test_docx_extractor_lxml_backend_not_a_package(tmp_path):
+    """
+    Test that the lxml backend reports packages without a main document.
+
+    Expected: success=False with an open failure, as with python-docx
+    """
+    import zipfile
+
+    file_path = tmp_path / "no_document.docx"
+    with zipfile.ZipFile(file_path, "w") as zf:
+        zf.writestr("word/other.xml", "<x/>")
+
+    result = DocxExtractor().extract(file_path)
+
+    assert result.success is False
+    assert "failed to open" in " ".join(result.errors).lower()
+
+
+@pytest.mark.unit
+def test_docx_extractor_backend_config(test_config_file):
+    """
+    Test backend selection from config.
+
+    Expected: lxml by default, python-docx when configured or for unknown values
+    """
+    assert DocxExtractor().backend == "lxml"
+    assert DocxExtractor({"backend": "python-docx"}).backend == "python-docx"
+    assert DocxExtractor({"backend": "other"}).backend == "python-docx"
+    assert DocxExtractor(ConfigManager(test_config_file)).backend == "lxml"
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
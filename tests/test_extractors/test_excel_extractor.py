@@ -571,6 +571,273 @@ class TestEdgeCases:
         assert "test" in result.document_metadata.keywords
 
 
+# =============================================================================
+# READ-ONLY STREAMING
+# =============================================================================
+
+
+class TestReadOnlyStreaming:
+    """Test read-only row-walk extraction against a full workbook load."""
+
+    @staticmethod
+    def _snapshot(result):
+        return [
+            (
+                {k: v for k, v in block.metadata.items() if k != "table_id"},
+                (table.num_rows, table.num_columns, table.cells),
+            )
+            for block, table in zip(result.content_blocks, result.tables)
+        ]
+
+    @pytest.mark.parametrize("fixture_name", ["multi_sheet_xlsx", "formula_xlsx"])
+    def test_matches_full_load(self, request, fixture_name):
+        """Read-only mode produces the same blocks and cells as a full load."""
+        path = request.getfixturevalue(fixture_name)
+
+        streamed = ExcelExtractor({"read_only": True}).extract(path)
+        loaded = ExcelExtractor({"read_only": False}).extract(path)
+
+        assert streamed.success and loaded.success
+        assert self._snapshot(streamed) == self._snapshot(loaded)
+
+    def test_formulas_paired_with_cached_values(self, tmp_path):
+        """Formula strings and cached values come from the same row walk."""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = 1
+        ws["AA2"] = "=A1+1"
+        test_file = tmp_path / "wide.xlsx"
+        wb.save(test_file)
+
+        result = ExcelExtractor().extract(test_file)
+
+        assert result.success
+        assert result.content_blocks[0].metadata["formulas"] == {"AA2": "=A1+1"}
+        assert result.tables[0].num_columns == 27
+        assert result.tables[0].num_rows == 2
+
+    def test_stale_dimension_record_ignored(self, tmp_path):
+        """Sheet extent comes from stored cells, not the declared dimension."""
+        import zipfile
+
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["name", "value"])
+        ws.append(["alpha", 1])
+        saved = tmp_path / "saved.xlsx"
+        wb.save(saved)
+
+        # Rewrite the sheet's <dimension> to claim a much larger range
+        test_file = tmp_path / "stale.xlsx"
+        with zipfile.ZipFile(saved) as src, zipfile.ZipFile(test_file, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data.replace(b'<dimension ref="A1:B2"', b'<dimension ref="A1:Z500"')
+                dst.writestr(item, data)
+
+        result = ExcelExtractor().extract(test_file)
+
+        assert result.success
+        assert result.tables[0].num_rows == 2
+        assert result.tables[0].num_columns == 2
+        assert result.tables[0].cells == (("name", "value"), ("alpha", "1"))
+
+    def test_limits_applied(self, single_sheet_xlsx):
+        """max_rows and max_columns cap the walk in read-only mode."""
+        config = {"max_rows": 2, "max_columns": 1}
+
+        streamed = ExcelExtractor(config).extract(single_sheet_xlsx)
+        loaded = ExcelExtractor({**config, "read_only": False}).extract(single_sheet_xlsx)
+
+        assert streamed.tables[0].num_rows == 2
+        assert streamed.tables[0].num_columns == 1
+        assert self._snapshot(streamed) == self._snapshot(loaded)
+
+    def test_max_rows_keeps_full_sheet_width(self, tmp_path):
+        """Columns used only below the row limit still set the grid width."""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["id", "name"])
+        ws.append(["1", "alpha"])
+        ws.append(["2", "beta", "", "", "late column"])
+        test_file = tmp_path / "late_width.xlsx"
+        wb.save(test_file)
+
+        streamed = ExcelExtractor({"max_rows": 2}).extract(test_file)
+        loaded = ExcelExtractor({"max_rows": 2, "read_only": False}).extract(test_file)
+
+        assert streamed.tables[0].num_rows == 2
+        assert streamed.tables[0].num_columns == 5
+        assert self._snapshot(streamed) == self._snapshot(loaded)
+
+    def test_max_rows_stops_parsing_at_limit(self, tmp_path, monkeypatch):
+        """Rows past max_rows are not walked, even to measure the sheet width."""
+        from openpyxl import Workbook
+        from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+        wb = Workbook()
+        ws = wb.active
+        for row in range(500):
+            ws.append([row, f"value {row}"])
+        ws.cell(row=500, column=4, value="late column")
+        test_file = tmp_path / "tall.xlsx"
+        wb.save(test_file)
+
+        original = ReadOnlyWorksheet.iter_rows
+        walked = []
+
+        def iter_rows(self, *args, **kwargs):
+            walked.append(kwargs.get("max_row"))
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(ReadOnlyWorksheet, "iter_rows", iter_rows)
+
+        table = ExcelExtractor({"max_rows": 10}).extract(test_file).tables[0]
+
+        assert walked and all(max_row == 10 for max_row in walked)
+        assert table.num_rows == 10
+        assert table.num_columns == 4
+
+    def test_column_types_match_full_load_on_ragged_rows(self, tmp_path):
+        """Rows that end early in read-only mode profile like full-width rows."""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "h1"
+        ws["C1"] = "h3"
+        ws["A3"] = "x"
+        test_file = tmp_path / "ragged.xlsx"
+        wb.save(test_file)
+
+        streamed = ExcelExtractor().extract(test_file)
+        loaded = ExcelExtractor({"read_only": False}).extract(test_file)
+
+        assert streamed.tables[0].column_types == loaded.tables[0].column_types
+        assert self._snapshot(streamed) == self._snapshot(loaded)
+
+    def test_column_types_exclude_header_row(self, tmp_path):
+        """The header row the table reports is never typed with the data."""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["When", "Note"])
+        for day in range(1, 4):
+            ws.append([f"2024-01-0{day}", f"entry {day}"])
+        test_file = tmp_path / "dated.xlsx"
+        wb.save(test_file)
+
+        table = ExcelExtractor().extract(test_file).tables[0]
+
+        assert table.has_header
+        assert table.column_types == ("date", "text")
+
+
+# =============================================================================
+# SHEET-PARALLEL EXTRACTION
+# =============================================================================
+
+
+@pytest.fixture
+def many_sheet_xlsx(tmp_path):
+    """Workbook with five small sheets, including formulas."""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    wb.remove(wb.active)
+    for sheet_num in range(5):
+        ws = wb.create_sheet(f"Risk {sheet_num}")
+        ws.append(["id", "score", "double"])
+        for row in range(2, 12):
+            ws.append([f"R{sheet_num}-{row}", row * sheet_num, f"=B{row}*2"])
+    path = tmp_path / "risk_register.xlsx"
+    wb.save(path)
+    return path
+
+
+class TestParallelSheetExtraction:
+    """Test process-pool extraction of multi-sheet workbooks."""
+
+    PARALLEL_CONFIG = {"parallel_sheets": True, "max_sheet_workers": 2, "parallel_min_sheets": 2}
+
+    @staticmethod
+    def _snapshot(result):
+        return [
+            (block.content, block.position.sequence_index, block.metadata.get("formulas"))
+            for block in result.content_blocks
+        ] + [(table.num_rows, table.num_columns, tuple(table.cells)) for table in result.tables]
+
+    def test_matches_serial_in_sheet_order(self, many_sheet_xlsx):
+        """Parallel results merge back in workbook order."""
+        serial = ExcelExtractor().extract(many_sheet_xlsx)
+        parallel = ExcelExtractor(self.PARALLEL_CONFIG).extract(many_sheet_xlsx)
+
+        assert parallel.success
+        assert [b.position.sheet for b in parallel.content_blocks] == [
+            f"Risk {n}" for n in range(5)
+        ]
+        assert self._snapshot(parallel) == self._snapshot(serial)
+        assert parallel.document_metadata.table_count == 5
+
+    def test_falls_back_to_serial_when_pool_unavailable(self, many_sheet_xlsx, monkeypatch):
+        """A pool failure degrades to serial extraction."""
+        import extractors.excel_extractor as excel_module
+
+        def broken_pool(*args, **kwargs):
+            raise OSError("process pool unavailable")
+
+        monkeypatch.setattr(excel_module, "ProcessPoolExecutor", broken_pool)
+
+        serial = ExcelExtractor().extract(many_sheet_xlsx)
+        result = ExcelExtractor(self.PARALLEL_CONFIG).extract(many_sheet_xlsx)
+
+        assert result.success
+        assert self._snapshot(result) == self._snapshot(serial)
+
+    def test_should_parallelize_thresholds(self):
+        """Pool is used only when enabled, above the sheet minimum, with >1 worker."""
+        assert not ExcelExtractor()._should_parallelize(40)
+        assert not ExcelExtractor(self.PARALLEL_CONFIG)._should_parallelize(1)
+        assert ExcelExtractor(self.PARALLEL_CONFIG)._should_parallelize(2)
+        assert not ExcelExtractor(
+            {"parallel_sheets": True, "max_sheet_workers": 1}
+        )._should_parallelize(40)
+
+
+# =============================================================================
+# COLUMN TYPES
+# =============================================================================
+
+
+class TestColumnTypes:
+    """Test per-column type inference on sheets."""
+
+    def test_column_types_inferred(self, tmp_path):
+        """Numeric and text columns are typed below the header row."""
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Item", "Qty", "Notes"])
+        ws.append(["Apple", 3, None])
+        ws.append(["Pear", 4.5, None])
+        file_path = tmp_path / "typed.xlsx"
+        wb.save(file_path)
+
+        result = ExcelExtractor().extract(file_path)
+
+        assert result.tables[0].column_types == ("text", "numeric", "empty")
+        assert result.content_blocks[0].metadata["column_types"] == ["text", "numeric", "empty"]
+
+
 # =============================================================================
 # PERFORMANCE TESTS
 # =============================================================================
@@ -0,0 +1,180 @@
+"""
+Test suite for the streaming extractor protocol (extract_stream).
+
+Every streaming extractor must yield ContentBlocks followed by exactly one
+ExtractionResult trailer, and extract() must equal the collected stream.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.core import ContentBlock, ExtractionResult, collect_extraction_stream
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+
+def _make_txt(tmp_path: Path) -> Path:
+    path = tmp_path / "notes.txt"
+    path.write_text("Title\n\nFirst paragraph.\n\nSecond paragraph.", encoding="utf-8")
+    return path
+
+
+def _make_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "data.csv"
+    path.write_text("name,value\nalpha,1\nbeta,2\n", encoding="utf-8")
+    return path
+
+
+def _make_docx(tmp_path: Path) -> Path:
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("Heading", level=1)
+    doc.add_paragraph("Body paragraph one.")
+    doc.add_paragraph("Body paragraph two.")
+    path = tmp_path / "doc.docx"
+    doc.save(str(path))
+    return path
+
+
+def _make_pptx(tmp_path: Path) -> Path:
+    from pptx import Presentation
+
+    prs = Presentation()
+    for title in ("Intro", "Details"):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = title
+        slide.placeholders[1].text = f"{title} body"
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    return path
+
+
+def _make_pdf(tmp_path: Path) -> Path:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    path = tmp_path / "doc.pdf"
+    c = canvas.Canvas(str(path), pagesize=letter)
+    for page in range(1, 4):
+        c.drawString(100, 750, f"Native text on page {page} of the document")
+        c.showPage()
+    c.save()
+    return path
+
+
+def _extractor(name: str):
+    if name == "txt":
+        from extractors.txt_extractor import TextFileExtractor
+
+        return TextFileExtractor()
+    if name == "csv":
+        from extractors.csv_extractor import CSVExtractor
+
+        return CSVExtractor()
+    if name == "docx":
+        from extractors.docx_extractor import DocxExtractor
+
+        return DocxExtractor()
+    if name == "pptx":
+        from extractors.pptx_extractor import PptxExtractor
+
+        return PptxExtractor()
+    from extractors.pdf_extractor import PdfExtractor
+
+    return PdfExtractor(config={"use_ocr": False})
+
+
+FACTORIES = {
+    "txt": _make_txt,
+    "csv": _make_csv,
+    "docx": _make_docx,
+    "pptx": _make_pptx,
+    "pdf": _make_pdf,
+}
+
+
+# ============================================================================
+# Protocol Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize("fmt", sorted(FACTORIES))
+class TestExtractStreamProtocol:
+    """extract_stream() contract shared by all streaming extractors."""
+
+    def test_supports_streaming(self, fmt):
+        assert _extractor(fmt).supports_streaming() is True
+
+    def test_blocks_then_single_trailer(self, fmt, tmp_path):
+        path = FACTORIES[fmt](tmp_path)
+        items = list(_extractor(fmt).extract_stream(path))
+
+        trailer = items[-1]
+        assert hasattr(trailer, "content_blocks") and trailer.success is True
+        assert trailer.content_blocks == ()
+        assert len(items) > 1
+        assert all(not hasattr(item, "content_blocks") for item in items[:-1])
+        assert [b.position.sequence_index for b in items[:-1]] == list(range(len(items) - 1))
+
+    def test_extract_matches_collected_stream(self, fmt, tmp_path):
+        path = FACTORIES[fmt](tmp_path)
+        extractor = _extractor(fmt)
+
+        extracted = extractor.extract(path)
+        collected = collect_extraction_stream(extractor.extract_stream(path))
+
+        assert [b.content for b in extracted.content_blocks] == [
+            b.content for b in collected.content_blocks
+        ]
+        assert extracted.document_metadata.word_count == collected.document_metadata.word_count
+        assert len(extracted.tables) == len(collected.tables)
+
+    def test_missing_file_yields_failed_trailer(self, fmt, tmp_path):
+        items = list(_extractor(fmt).extract_stream(tmp_path / f"missing.{fmt}"))
+
+        assert len(items) == 1
+        assert items[0].success is False
+        assert items[0].errors
+
+
+class TestCollectExtractionStream:
+    """collect_extraction_stream() behavior."""
+
+    def test_failed_trailer_discards_partial_blocks(self):
+        stream = [
+            ContentBlock(content="partial"),
+            ExtractionResult(success=False, errors=("boom",)),
+        ]
+
+        result = collect_extraction_stream(stream)
+
+        assert result.success is False
+        assert result.content_blocks == ()
+        assert result.errors == ("boom",)
+
+    def test_missing_trailer_raises(self):
+        with pytest.raises(ValueError):
+            collect_extraction_stream([ContentBlock(content="orphan")])
+
+    def test_default_extract_stream_replays_extract(self, tmp_path):
+        from src.core import BaseExtractor
+
+        class ListExtractor(BaseExtractor):
+            def extract(self, file_path):
+                return ExtractionResult(
+                    content_blocks=(ContentBlock(content="a"), ContentBlock(content="b")),
+                    success=True,
+                )
+
+            def supports_format(self, file_path):
+                return True
+
+        items = list(ListExtractor().extract_stream(tmp_path / "any"))
+
+        assert [i.content for i in items[:-1]] == ["a", "b"]
+        assert items[-1].content_blocks == ()
+        assert ListExtractor().supports_streaming() is False
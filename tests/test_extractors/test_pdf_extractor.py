@@ -392,6 +392,87 @@ class TestTableExtraction:
         assert len(table.cells) > 0
 
 
+class TestTablePrefilter:
+    """Test the table-candidate prefilter in front of pdfplumber."""
+
+    @pytest.fixture
+    def mixed_table_pdf(self, tmp_path):
+        """
+        Create a PDF with a ruled table on page 1, plain text on page 2 and
+        text with a single underline on page 3.
+        """
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+
+        pdf_path = tmp_path / "mixed_tables.pdf"
+        c = canvas.Canvas(str(pdf_path), pagesize=letter)
+
+        # Page 1: 3x3 grid
+        xs = [72, 222, 372, 522]
+        ys = [700, 670, 640, 610]
+        for x in xs:
+            c.line(x, ys[0], x, ys[-1])
+        for y in ys:
+            c.line(xs[0], y, xs[-1], y)
+        for row, y in enumerate(ys[:-1]):
+            for col, x in enumerate(xs[:-1]):
+                c.drawString(x + 5, y - 20, f"R{row}C{col}")
+        c.showPage()
+
+        # Page 2: text only
+        c.drawString(72, 700, "Narrative paragraph without any table.")
+        c.showPage()
+
+        # Page 3: underlined heading
+        c.drawString(72, 700, "Underlined heading")
+        c.line(72, 695, 200, 695)
+        c.showPage()
+
+        c.save()
+        return pdf_path
+
+    def test_prefilter_skips_pages_without_rulings(self, mixed_table_pdf):
+        """
+        TEST: Only the ruled page should reach pdfplumber table extraction.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        extractor = PdfExtractor(config={"extract_tables": True})
+        result = extractor.extract(mixed_table_pdf)
+
+        assert len(result.tables) == 1
+        assert result.tables[0].num_rows == 3
+        assert extractor.get_table_prefilter_stats() == {
+            "pages_scanned": 3,
+            "pages_skipped": 2,
+            "pages_extracted": 1,
+        }
+
+    def test_prefilter_matches_full_extraction(self, mixed_table_pdf):
+        """
+        TEST: Prefiltering must not change which tables are found.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        filtered = PdfExtractor(config={"table_prefilter": True}).extract(mixed_table_pdf)
+        unfiltered_extractor = PdfExtractor(config={"table_prefilter": False})
+        unfiltered = unfiltered_extractor.extract(mixed_table_pdf)
+
+        assert [t.cells for t in filtered.tables] == [t.cells for t in unfiltered.tables]
+        assert unfiltered_extractor.get_table_prefilter_stats()["pages_skipped"] == 0
+
+    def test_session_vector_path_probe(self, mixed_table_pdf):
+        """
+        TEST: The content-stream probe should only flag pages that draw paths.
+        """
+        from extractors.pdf_session import PdfDocumentSession
+
+        with PdfDocumentSession(mixed_table_pdf) as session:
+            assert session.page_has_vector_paths(1) is True
+            assert session.page_has_vector_paths(2) is False
+            assert session.page_has_vector_paths(3) is True
+
+
 class TestImageExtraction:
     """Test image metadata extraction."""
 
@@ -1462,5 +1543,564 @@ class TestOCRFallbackMocked:
         assert "ocr" in warnings_text and "disabled" in warnings_text
 
 
+class TestParallelPageExtraction:
+    """Test page-sharded native text extraction across a process pool."""
+
+    @pytest.fixture
+    def multipage_pdf(self, tmp_path):
+        """Create a multi-page PDF with distinct text on each page."""
+        from reportlab.pdfgen import canvas
+
+        pdf_path = tmp_path / "multipage.pdf"
+        c = canvas.Canvas(str(pdf_path))
+        for page in range(1, 7):
+            c.drawString(100, 750, f"This is body text on page number {page}")
+            c.drawString(100, 730, f"Second line of content for page {page}")
+            c.showPage()
+        c.save()
+        return pdf_path
+
+    def test_parallel_matches_serial_output(self, multipage_pdf):
+        """
+        TEST: Parallel extraction should produce the same blocks in the same order.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        serial = PdfExtractor(config={"extract_tables": False}).extract(multipage_pdf)
+        parallel = PdfExtractor(
+            config={
+                "extract_tables": False,
+                "parallel_pages": True,
+                "max_page_workers": 2,
+                "parallel_min_pages": 2,
+            }
+        ).extract(multipage_pdf)
+
+        assert parallel.success is True
+        assert [b.content for b in parallel.content_blocks] == [
+            b.content for b in serial.content_blocks
+        ]
+        assert [b.position.page for b in parallel.content_blocks] == [
+            b.position.page for b in serial.content_blocks
+        ]
+        assert [b.position.sequence_index for b in parallel.content_blocks] == list(
+            range(len(parallel.content_blocks))
+        )
+
+    def test_parallel_skipped_below_min_pages(self, multipage_pdf, monkeypatch):
+        """
+        TEST: Documents shorter than parallel_min_pages should not start a pool.
+        """
+        import extractors.pdf_extractor as pdf_mod
+        from extractors.pdf_extractor import PdfExtractor
+
+        def fail_parallel(self, file_path, reader, page_count):
+            raise AssertionError("process pool should not be used")
+
+        monkeypatch.setattr(pdf_mod.PdfExtractor, "_extract_page_texts_parallel", fail_parallel)
+
+        extractor = PdfExtractor(
+            config={"parallel_pages": True, "max_page_workers": 2, "parallel_min_pages": 100}
+        )
+        result = extractor.extract(multipage_pdf)
+
+        assert result.success is True
+        assert len(result.content_blocks) > 0
+
+    def test_parallel_falls_back_to_serial_on_pool_failure(self, multipage_pdf, monkeypatch):
+        """
+        TEST: Pool failures should fall back to serial extraction, not fail the file.
+        """
+        import extractors.pdf_extractor as pdf_mod
+        from extractors.pdf_extractor import PdfExtractor
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                raise OSError("process pool unavailable")
+
+        monkeypatch.setattr(pdf_mod, "ProcessPoolExecutor", BrokenPool)
+
+        extractor = PdfExtractor(
+            config={"parallel_pages": True, "max_page_workers": 2, "parallel_min_pages": 2}
+        )
+        result = extractor.extract(multipage_pdf)
+
+        assert result.success is True
+        assert {b.position.page for b in result.content_blocks} == set(range(1, 7))
+
+
+class TestPdfDocumentSession:
+    """Test the parse-once session shared by PDF extraction passes."""
+
+    @pytest.fixture
+    def text_pdf(self, tmp_path):
+        """Create a two-page PDF with native text."""
+        from reportlab.pdfgen import canvas
+
+        pdf_path = tmp_path / "session.pdf"
+        c = canvas.Canvas(str(pdf_path))
+        c.drawString(100, 750, "First page content for session tests")
+        c.showPage()
+        c.drawString(100, 750, "Second page content for session tests")
+        c.showPage()
+        c.save()
+        return pdf_path
+
+    def test_page_text_is_cached(self, text_pdf, monkeypatch):
+        """
+        TEST: Page text should be extracted once and reused from the cache.
+        """
+        from pypdf import PageObject
+
+        from extractors.pdf_session import PdfDocumentSession
+
+        calls = {"count": 0}
+        original = PageObject.extract_text
+
+        def counting_extract_text(self, *args, **kwargs):
+            calls["count"] += 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(PageObject, "extract_text", counting_extract_text)
+
+        with PdfDocumentSession(text_pdf) as session:
+            first = session.get_page_text(1)
+            second = session.get_page_text(1)
+
+        assert first == second
+        assert "First page" in first
+        assert calls["count"] == 1
+
+    def test_file_hash_matches_streamed_hash(self, text_pdf):
+        """
+        TEST: Session hash should match the extractor's streamed SHA256.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+        from extractors.pdf_session import PdfDocumentSession
+
+        with PdfDocumentSession(text_pdf) as session:
+            assert session.file_hash == PdfExtractor()._compute_file_hash(text_pdf)
+
+    def test_extract_parses_file_once(self, text_pdf, monkeypatch):
+        """
+        TEST: A full extraction should open exactly one session for all passes.
+        """
+        import extractors.pdf_extractor as pdf_mod
+
+        opened = []
+        original_init = pdf_mod.PdfDocumentSession.__init__
+
+        def tracking_init(self, file_path):
+            opened.append(file_path)
+            original_init(self, file_path)
+
+        monkeypatch.setattr(pdf_mod.PdfDocumentSession, "__init__", tracking_init)
+
+        extractor = pdf_mod.PdfExtractor(config={"extract_tables": True, "extract_images": True})
+        result = extractor.extract(text_pdf)
+
+        assert result.success is True
+        assert len(opened) == 1
+
+    def test_needs_ocr_reuses_session_text(self, text_pdf):
+        """
+        TEST: OCR probe should use cached text from the shared session.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+        from extractors.pdf_session import PdfDocumentSession
+
+        with PdfDocumentSession(text_pdf) as session:
+            session.cache_page_text(1, "")
+            session.cache_page_text(2, "")
+            assert PdfExtractor()._needs_ocr(text_pdf, session=session) is True
+
+        assert PdfExtractor()._needs_ocr(text_pdf) is False
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    """
+    Install fake pdf2image/pytesseract modules that record rendering calls.
+
+    Returns a dict tracking requested page windows, open images and the
+    peak number of simultaneously open images.
+    """
+    import types
+
+    import extractors.pdf_extractor as pdf_mod
+
+    state = {"windows": [], "open": 0, "peak_open": 0}
+
+    class FakeImage:
+        def __init__(self, page_num):
+            self.page_num = page_num
+            self.closed = False
+            state["open"] += 1
+            state["peak_open"] = max(state["peak_open"], state["open"])
+
+        def close(self):
+            if not self.closed:
+                self.closed = True
+                state["open"] -= 1
+
+    def convert_from_path(path, dpi, first_page, last_page, **kwargs):
+        state["windows"].append((first_page, last_page))
+        state.setdefault("dpis", []).append(dpi)
+        images = [FakeImage(n) for n in range(first_page, last_page + 1)]
+        for image in images:
+            image.dpi = dpi
+        return images
+
+    def pdfinfo_from_path(path, **kwargs):
+        return {"Pages": state.get("pages", 5)}
+
+    def image_to_data(image, lang, output_type):
+        return {"text": [f"page{image.page_num}", "word"], "conf": [90, 80]}
+
+    fake_pdf2image = types.SimpleNamespace(
+        convert_from_path=convert_from_path, pdfinfo_from_path=pdfinfo_from_path
+    )
+    fake_pytesseract = types.SimpleNamespace(
+        image_to_data=image_to_data, Output=types.SimpleNamespace(DICT="dict")
+    )
+
+    monkeypatch.setattr(pdf_mod, "TESSERACT_AVAILABLE", True)
+    monkeypatch.setattr(pdf_mod, "pdf2image", fake_pdf2image, raising=False)
+    monkeypatch.setattr(pdf_mod, "pytesseract", fake_pytesseract, raising=False)
+    return state
+
+
+class TestStreamingOCR:
+    """Test windowed, bounded-memory OCR with mocked OCR dependencies."""
+
+    def test_renders_pages_in_windows(self, fake_ocr, tmp_path):
+        """
+        TEST: OCR should rasterize bounded page windows, not the whole document.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        fake_ocr["pages"] = 5
+        extractor = PdfExtractor(config={"ocr_window_size": 2, "ocr_workers": 2})
+        blocks = extractor._extract_with_ocr(tmp_path / "scan.pdf")
+
+        assert fake_ocr["windows"] == [(1, 2), (3, 4), (5, 5)]
+        assert [b.position.page for b in blocks] == [1, 2, 3, 4, 5]
+        assert [b.position.sequence_index for b in blocks] == [0, 1, 2, 3, 4]
+        assert blocks[0].content == "page1 word"
+        assert blocks[0].confidence == pytest.approx(0.85)
+
+    def test_peak_images_bounded_by_window(self, fake_ocr, tmp_path):
+        """
+        TEST: Open page images should be bounded by window size plus workers.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        fake_ocr["pages"] = 40
+        extractor = PdfExtractor(config={"ocr_window_size": 2, "ocr_workers": 2})
+        blocks = extractor._extract_with_ocr(tmp_path / "scan.pdf")
+
+        assert len(blocks) == 40
+        assert fake_ocr["open"] == 0
+        assert fake_ocr["peak_open"] <= 2 + 2
+
+    def test_failed_page_is_skipped(self, fake_ocr, tmp_path, monkeypatch):
+        """
+        TEST: A tesseract failure on one page should not drop other pages.
+        """
+        import extractors.pdf_extractor as pdf_mod
+        from extractors.pdf_extractor import PdfExtractor
+
+        original = pdf_mod.pytesseract.image_to_data
+
+        def flaky_image_to_data(image, lang, output_type):
+            if image.page_num == 2:
+                raise RuntimeError("tesseract crashed")
+            return original(image, lang, output_type)
+
+        monkeypatch.setattr(pdf_mod.pytesseract, "image_to_data", flaky_image_to_data)
+
+        fake_ocr["pages"] = 3
+        blocks = PdfExtractor(config={"ocr_window_size": 1})._extract_with_ocr(
+            tmp_path / "scan.pdf"
+        )
+
+        assert [b.position.page for b in blocks] == [1, 3]
+        assert [b.position.sequence_index for b in blocks] == [0, 1]
+        assert fake_ocr["open"] == 0
+
+
+class TestPerPageOCRRouting:
+    """Test per-page native-vs-OCR routing for mixed PDFs."""
+
+    @pytest.fixture
+    def mixed_pdf(self, tmp_path):
+        """Create a PDF with native text on pages 1 and 3 and a full-page scan on page 2."""
+        from PIL import Image
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+
+        scan_path = tmp_path / "scan.png"
+        Image.new("RGB", (85, 110), color="white").save(scan_path)
+
+        width, height = letter
+        pdf_path = tmp_path / "mixed.pdf"
+        c = canvas.Canvas(str(pdf_path), pagesize=letter)
+        c.drawString(100, 750, "Native body text on the first page")
+        c.showPage()
+        c.drawImage(str(scan_path), 0, 0, width=width, height=height)
+        c.showPage()
+        c.drawString(100, 750, "Native appendix text on the third page")
+        # Small logo should not make a text page look scanned
+        c.drawImage(str(scan_path), 10, 10, width=40, height=40)
+        c.showPage()
+        c.save()
+        return pdf_path
+
+    def test_image_coverage_estimate(self, mixed_pdf):
+        """
+        TEST: Full-page scans should report near-full coverage, logos very little.
+        """
+        from extractors.pdf_session import PdfDocumentSession
+
+        with PdfDocumentSession(mixed_pdf) as session:
+            assert session.get_page_image_coverage(1) == 0.0
+            assert session.get_page_image_coverage(2) == pytest.approx(1.0)
+            assert session.get_page_image_coverage(3) < 0.01
+
+    @pytest.fixture
+    def form_scan_pdf(self, tmp_path):
+        """Create a text-less PDF whose page image is wrapped in a scaled Form XObject."""
+        from PIL import Image
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+
+        scan_path = tmp_path / "scan.png"
+        Image.new("RGB", (85, 110), color="white").save(scan_path)
+
+        width, height = letter
+        pdf_path = tmp_path / "form_scan.pdf"
+        c = canvas.Canvas(str(pdf_path), pagesize=letter)
+        c.beginForm("scan", lowerx=0, lowery=0, upperx=width / 2, uppery=height / 2)
+        c.drawImage(str(scan_path), 0, 0, width=width / 2, height=height / 2)
+        c.endForm()
+        c.saveState()
+        c.scale(2, 2)
+        c.doForm("scan")
+        c.restoreState()
+        c.showPage()
+        c.save()
+        return pdf_path
+
+    def test_image_coverage_includes_form_xobjects(self, form_scan_pdf):
+        """
+        TEST: A scan placed through a Form XObject should count toward coverage,
+        with the form's placement scaling applied.
+        """
+        from extractors.pdf_session import PdfDocumentSession
+
+        with PdfDocumentSession(form_scan_pdf) as session:
+            assert session.get_page_image_coverage(1) == pytest.approx(1.0)
+
+    def test_form_wrapped_scan_is_ocred(self, fake_ocr, form_scan_pdf):
+        """
+        TEST: A page whose only image sits inside a Form XObject should be OCRed.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        extractor = PdfExtractor(config={"extract_tables": False, "extract_images": False})
+        result = extractor.extract(form_scan_pdf)
+
+        assert result.success is True
+        assert fake_ocr["windows"] == [(1, 1)]
+
+    def test_only_scanned_pages_are_ocred(self, fake_ocr, mixed_pdf):
+        """
+        TEST: Only the scanned page should be rasterized, and its OCR block
+        should be merged between the native pages in sequence order.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        extractor = PdfExtractor(config={"extract_tables": False, "extract_images": False})
+        result = extractor.extract(mixed_pdf)
+
+        assert result.success is True
+        assert fake_ocr["windows"] == [(2, 2)]
+
+        pages = [b.position.page for b in result.content_blocks]
+        assert pages == sorted(pages)
+        assert 1 in pages and 2 in pages and 3 in pages
+        assert [b.position.sequence_index for b in result.content_blocks] == list(
+            range(len(result.content_blocks))
+        )
+
+        ocr_blocks = [
+            b for b in result.content_blocks if b.metadata.get("extraction_method") == "ocr"
+        ]
+        assert [b.position.page for b in ocr_blocks] == [2]
+
+    def test_scanned_pages_warn_when_ocr_disabled(self, mixed_pdf):
+        """
+        TEST: Scanned pages in a mixed document should be reported, not silently dropped.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        result = PdfExtractor(config={"use_ocr": False}).extract(mixed_pdf)
+
+        assert result.success is True
+        assert any("scanned" in w.lower() and "2" in w for w in result.warnings)
+
+    def test_stream_yields_native_pages_before_ocr(self, fake_ocr, mixed_pdf):
+        """
+        TEST: extract_stream() should yield page 1 before page 2 is rasterized,
+        and still deliver blocks in page order.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        extractor = PdfExtractor(
+            config={
+                "extract_tables": False,
+                "extract_images": False,
+                "ocr_workers": 1,
+                "ocr_window_size": 1,
+            }
+        )
+        stream = extractor.extract_stream(mixed_pdf)
+
+        first = next(stream)
+        assert first.position.page == 1
+        assert fake_ocr["windows"] == []
+
+        rest = list(stream)
+        trailer = rest[-1]
+        blocks = [first] + rest[:-1]
+
+        assert trailer.success is True
+        assert trailer.content_blocks == ()
+        assert trailer.document_metadata.page_count == 3
+        assert fake_ocr["windows"] == [(2, 2)]
+        pages = [b.position.page for b in blocks]
+        assert pages == sorted(pages)
+        assert [b.position.sequence_index for b in blocks] == list(range(len(blocks)))
+
+    def test_ocr_windows_follow_contiguous_runs(self):
+        """
+        TEST: Non-contiguous OCR pages should be rendered in separate windows.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        extractor = PdfExtractor()
+        windows = extractor._ocr_windows([2, 3, 4, 7, 9, 10], window_size=2)
+
+        assert windows == [(2, 3), (4, 4), (7, 7), (9, 10)]
+
+
+class TestOCRResultCache:
+    """Test the persistent OCR result cache with mocked OCR dependencies."""
+
+    def test_second_run_skips_rendering(self, fake_ocr, tmp_path):
+        """
+        TEST: Re-OCRing an unchanged PDF should be served from the cache.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        pdf_path = tmp_path / "scan.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 scanned")
+        fake_ocr["pages"] = 3
+        config = {"ocr_window_size": 2, "ocr_cache_dir": str(tmp_path / "ocr")}
+
+        first = PdfExtractor(config=config)._extract_with_ocr(pdf_path)
+        assert fake_ocr["windows"] == [(1, 2), (3, 3)]
+
+        fake_ocr["windows"].clear()
+        extractor = PdfExtractor(config=config)
+        second = extractor._extract_with_ocr(pdf_path)
+
+        assert fake_ocr["windows"] == []
+        assert [b.content for b in second] == [b.content for b in first]
+        assert [b.position.sequence_index for b in second] == [0, 1, 2]
+        assert extractor.ocr_cache.get_stats()["hits"] >= 3
+
+    def test_cache_key_includes_render_settings(self, fake_ocr, tmp_path):
+        """
+        TEST: Changing the OCR DPI should not reuse results rendered at another DPI.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        pdf_path = tmp_path / "scan.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 scanned")
+        fake_ocr["pages"] = 1
+        cache_dir = str(tmp_path / "ocr")
+
+        PdfExtractor(config={"ocr_cache_dir": cache_dir})._extract_with_ocr(pdf_path)
+        PdfExtractor(config={"ocr_cache_dir": cache_dir, "ocr_dpi": 150})._extract_with_ocr(
+            pdf_path
+        )
+
+        assert fake_ocr["windows"] == [(1, 1), (1, 1)]
+
+    def test_cache_disabled_by_default(self):
+        """
+        TEST: No OCR cache should be created unless a directory is configured.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        assert PdfExtractor().ocr_cache is None
+
+
+class TestAdaptiveDpiOCR:
+    """Test confidence-driven DPI escalation with mocked OCR dependencies."""
+
+    @pytest.fixture
+    def faint_page_two(self, fake_ocr, monkeypatch):
+        """Page 2 OCRs poorly below 300 DPI; every other page reads cleanly."""
+        import extractors.pdf_extractor as pdf_mod
+
+        def image_to_data(image, lang, output_type):
+            conf = 40 if image.page_num == 2 and image.dpi < 300 else 92
+            return {"text": [f"page{image.page_num}"], "conf": [conf]}
+
+        monkeypatch.setattr(pdf_mod.pytesseract, "image_to_data", image_to_data)
+        return fake_ocr
+
+    def test_escalates_only_low_confidence_pages(self, faint_page_two, tmp_path):
+        """
+        TEST: Only pages below the confidence threshold are re-rendered at full DPI.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        faint_page_two["pages"] = 3
+        extractor = PdfExtractor(
+            config={
+                "ocr_adaptive_dpi": True,
+                "ocr_low_dpi": 150,
+                "ocr_dpi": 300,
+                "ocr_escalation_threshold": 0.8,
+                "ocr_window_size": 3,
+            }
+        )
+        blocks = extractor._extract_with_ocr(tmp_path / "scan.pdf")
+
+        assert faint_page_two["windows"] == [(1, 3), (2, 2)]
+        assert faint_page_two["dpis"] == [150, 300]
+        assert [b.metadata["ocr_dpi"] for b in blocks] == [150, 300, 150]
+        assert [b.metadata["ocr_dpi_escalated"] for b in blocks] == [False, True, False]
+        assert blocks[1].confidence == pytest.approx(0.92)
+        assert [b.position.sequence_index for b in blocks] == [0, 1, 2]
+
+    def test_fixed_dpi_by_default(self, faint_page_two, tmp_path):
+        """
+        TEST: Without adaptive mode every page renders once at ocr_dpi.
+        """
+        from extractors.pdf_extractor import PdfExtractor
+
+        faint_page_two["pages"] = 3
+        extractor = PdfExtractor(config={"ocr_dpi": 300, "ocr_window_size": 3})
+        blocks = extractor._extract_with_ocr(tmp_path / "scan.pdf")
+
+        assert faint_page_two["dpis"] == [300]
+        assert all(b.metadata["ocr_dpi"] == 300 for b in blocks)
+        assert all("ocr_dpi_escalated" not in b.metadata for b in blocks)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
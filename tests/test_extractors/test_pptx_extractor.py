@@ -432,3 +432,179 @@ extractors:
         # Should not crash even with logging
         result = extractor.extract(simple_pptx_file)
         assert result.success
+
+
+# Image Metadata and Slide-Parallel Tests
+@pytest.fixture
+def many_slide_pptx(tmp_path):
+    """Create a PowerPoint file with six slides, pictures, notes and an empty slide."""
+    try:
+        from pptx import Presentation
+        from pptx.util import Inches
+    except ImportError:
+        pytest.skip("python-pptx not installed")
+
+    image_path = Path(__file__).parent.parent / "fixtures" / "test_with_images.pptx"
+    if not image_path.exists():
+        pytest.skip("Image fixture not available")
+
+    # Reuse an embedded PNG from the image fixture
+    source = Presentation(str(image_path))
+    png_blob = next(
+        shape.image.blob
+        for slide in source.slides
+        for shape in slide.shapes
+        if hasattr(shape, "image") and shape.image.content_type == "image/png"
+    )
+    png_file = tmp_path / "logo.png"
+    png_file.write_bytes(png_blob)
+
+    prs = Presentation()
+    for slide_num in range(1, 7):
+        if slide_num == 4:
+            prs.slides.add_slide(prs.slide_layouts[6])  # Empty slide
+            continue
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {slide_num}"
+        slide.placeholders[1].text = f"Body of slide {slide_num}"
+        slide.shapes.add_picture(str(png_file), Inches(1), Inches(1), Inches(2), Inches(1))
+        slide.notes_slide.notes_text_frame.text = f"Notes {slide_num}"
+
+    file_path = tmp_path / "many_slides.pptx"
+    prs.save(str(file_path))
+    return file_path
+
+
+def _result_snapshot(result):
+    """Comparable view of blocks, images and statistics."""
+    return (
+        [
+            (
+                b.block_type,
+                b.content,
+                b.raw_content,
+                b.position.slide,
+                b.position.sequence_index,
+                b.metadata,
+            )
+            for b in result.content_blocks
+        ],
+        [(i.width, i.height, i.format, i.alt_text) for i in result.images],
+        result.document_metadata.word_count,
+        result.document_metadata.page_count,
+    )
+
+
+class TestImageMetadata:
+    """Test image metadata collected during the slide walk."""
+
+    def test_formats_from_content_types(self):
+        """Image formats come from the package content types."""
+        fixture = Path(__file__).parent.parent / "fixtures" / "test_with_images.pptx"
+        if not fixture.exists():
+            pytest.skip("Image fixture not available")
+
+        result = PptxExtractor().extract(fixture)
+
+        assert result.success
+        assert sorted(i.format for i in result.images) == ["JPG", "PNG", "PNG"]
+        assert all(i.alt_text.startswith("Image on slide ") for i in result.images)
+
+    def test_image_bytes_not_decoded(self, many_slide_pptx, monkeypatch):
+        """Image metadata does not inspect image bytes."""
+        from pptx.parts.image import Image
+
+        def fail(*args, **kwargs):
+            raise AssertionError("image bytes decoded")
+
+        monkeypatch.setattr(Image, "_pil_props", property(fail))
+
+        result = PptxExtractor().extract(many_slide_pptx)
+
+        assert result.success
+        assert [i.format for i in result.images] == ["PNG"] * 5
+        assert result.images[0].width == 192
+        assert result.images[0].height == 96
+
+    def test_picture_placeholders_not_counted(self, many_slide_pptx, tmp_path):
+        """Filled picture placeholders are skipped, as in the shape_type filter."""
+        from pptx import Presentation
+        from pptx.enum.shapes import PP_PLACEHOLDER
+
+        source = Presentation(str(many_slide_pptx))
+        png_blob = next(
+            shape.image.blob for shape in source.slides[0].shapes if hasattr(shape, "image")
+        )
+        png_file = tmp_path / "photo.png"
+        png_file.write_bytes(png_blob)
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[8])  # Picture with Caption
+        placeholder = next(
+            p for p in slide.placeholders if p.placeholder_format.type == PP_PLACEHOLDER.PICTURE
+        )
+        placeholder.insert_picture(str(png_file))
+        file_path = tmp_path / "placeholder_picture.pptx"
+        prs.save(str(file_path))
+
+        result = PptxExtractor().extract(file_path)
+
+        assert result.success
+        assert result.images == ()
+
+    def test_images_skipped_when_disabled(self, many_slide_pptx):
+        """extract_images=False collects no image metadata."""
+        result = PptxExtractor({"extract_images": False}).extract(many_slide_pptx)
+
+        assert result.success
+        assert result.images == ()
+
+
+class TestParallelSlideExtraction:
+    """Test process-pool extraction of slide ranges."""
+
+    PARALLEL_CONFIG = {"parallel_slides": True, "max_slide_workers": 2, "parallel_min_slides": 2}
+
+    def test_matches_serial_in_slide_order(self, many_slide_pptx):
+        """Parallel results merge back in slide order with the same sequence indexes."""
+        serial = PptxExtractor().extract(many_slide_pptx)
+        parallel = PptxExtractor(self.PARALLEL_CONFIG).extract(many_slide_pptx)
+
+        assert parallel.success
+        assert _result_snapshot(parallel) == _result_snapshot(serial)
+        assert [b.position.sequence_index for b in parallel.content_blocks] == list(
+            range(len(parallel.content_blocks))
+        )
+
+    def test_skip_empty_slides_applied_after_merge(self, many_slide_pptx):
+        """Empty slides are skipped the same way in parallel mode."""
+        config = {"skip_empty_slides": True}
+        serial = PptxExtractor(config).extract(many_slide_pptx)
+        parallel = PptxExtractor({**self.PARALLEL_CONFIG, **config}).extract(many_slide_pptx)
+
+        assert 4 not in {b.position.slide for b in parallel.content_blocks}
+        assert _result_snapshot(parallel) == _result_snapshot(serial)
+
+    def test_falls_back_to_serial_when_pool_unavailable(self, many_slide_pptx, monkeypatch):
+        """A pool failure degrades to serial extraction."""
+        import extractors.pptx_extractor as pptx_module
+
+        def broken_pool(*args, **kwargs):
+            raise OSError("process pool unavailable")
+
+        monkeypatch.setattr(pptx_module, "ProcessPoolExecutor", broken_pool)
+
+        serial = PptxExtractor().extract(many_slide_pptx)
+        result = PptxExtractor(self.PARALLEL_CONFIG).extract(many_slide_pptx)
+
+        assert result.success
+        assert _result_snapshot(result) == _result_snapshot(serial)
+
+    def test_should_parallelize_thresholds(self):
+        """Pool is used only when enabled, above the slide minimum, with >1 worker."""
+        assert not PptxExtractor()._should_parallelize(400)
+        assert not PptxExtractor(self.PARALLEL_CONFIG)._should_parallelize(1)
+        assert PptxExtractor(self.PARALLEL_CONFIG)._should_parallelize(2)
+        assert not PptxExtractor(
+            {"parallel_slides": True, "max_slide_workers": 1}
+        )._should_parallelize(400)
@@ -1026,11 +1026,13 @@ def test_407_unexpected_exception_handling(extractor, tmp_path, monkeypatch):
     file_path = tmp_path / "test.txt"
     file_path.write_text("Test content", encoding="utf-8")
 
-    # Mock read_text to raise unexpected exception
-    def mock_read_text(*args, **kwargs):
+    # Mock the paragraph scan to raise unexpected exception
+    import extractors.txt_extractor as txt_module
+
+    def mock_iter_paragraph_bytes(*args, **kwargs):
         raise RuntimeError("Unexpected error during read")
 
-    monkeypatch.setattr(Path, "read_text", mock_read_text)
+    monkeypatch.setattr(txt_module, "_iter_paragraph_bytes", mock_iter_paragraph_bytes)
 
     # Act
     result = extractor.extract(file_path)
@@ -1044,5 +1046,88 @@ def test_407_unexpected_exception_handling(extractor, tmp_path, monkeypatch):
     assert "unexpected error" in error_text
 
 
+# ============================================================================
+# Category 6: Streaming Scan and Encoding Fallback Tests
+# ============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.extraction
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"One\r\n\r\nTwo\r\nstill two\r\n\r\n\r\nThree\r\n",
+        b"One\r\rTwo\rstill two\r\n\nThree\r",
+        b"\n\nOne\n\n\n\nTwo words\n \n\nThree\n\n",
+    ],
+    ids=["crlf", "mixed-cr", "lf-runs"],
+)
+def test_501_scan_matches_whole_file_split(extractor, tmp_path, raw):
+    """
+    Test paragraphs and counts match a whole-file universal-newline split.
+
+    The streaming byte scan must produce the same blocks and document
+    statistics as reading the text and splitting it on blank lines.
+    """
+    # Arrange
+    file_path = tmp_path / "scan.txt"
+    file_path.write_bytes(raw)
+    text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    expected = [p.strip() for p in text.split("\n\n") if p.strip()]
+
+    # Act
+    result = extractor.extract(file_path)
+
+    # Assert
+    assert result.success is True
+    assert [block.content for block in result.content_blocks] == expected
+    assert result.document_metadata.word_count == len(text.split())
+    assert result.document_metadata.character_count == len(text)
+
+
+@pytest.mark.unit
+@pytest.mark.extraction
+def test_502_legacy_encoding_falls_back(extractor, tmp_path):
+    """
+    Test paragraphs that are not UTF-8 are decoded with a fallback encoding.
+
+    Earlier UTF-8 paragraphs are unaffected and a warning records the switch.
+    """
+    # Arrange
+    file_path = tmp_path / "legacy.log"
+    file_path.write_bytes(
+        "Caf\u00e9 opened.\n\n".encode("utf-8") + "Na\u00efve r\u00e9sum\u00e9.".encode("cp1252")
+    )
+
+    # Act
+    result = extractor.extract(file_path)
+
+    # Assert
+    assert result.success is True
+    assert [block.content for block in result.content_blocks] == [
+        "Caf\u00e9 opened.",
+        "Na\u00efve r\u00e9sum\u00e9.",
+    ]
+    assert any("cp1252" in warning for warning in result.warnings)
+
+
+@pytest.mark.unit
+@pytest.mark.extraction
+def test_503_fallback_encodings_configurable(tmp_path):
+    """
+    Test an empty fallback list keeps strict UTF-8 behavior.
+    """
+    # Arrange
+    file_path = tmp_path / "legacy.txt"
+    file_path.write_bytes("R\u00e9sum\u00e9".encode("cp1252"))
+
+    # Act
+    result = TextFileExtractor({"fallback_encodings": []}).extract(file_path)
+
+    # Assert
+    assert result.success is False
+    assert "utf-8" in " ".join(result.errors).lower()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -15,15 +15,25 @@ Test Coverage Areas:
 Coverage Target: >85%
 """
 
+import gc
+import os
+import threading
+import time
+import warnings
+import weakref
 from unittest.mock import Mock
 
 import pytest
 
+# Import extractors (real extractor for process-mode tests)
+from extractors import TextFileExtractor
+
 # Import BatchProcessor (will fail initially - RED phase)
 from pipeline.batch_processor import BatchProcessor
 
 # Import pipeline (ExtractionPipeline already exists)
 from pipeline.extraction_pipeline import ExtractionPipeline
+from pipeline.staged_executor import STAGES, StagedExecutor
 
 # Import core models
 from src.core import (
@@ -62,6 +72,40 @@ def mock_pipeline():
     return pipeline
 
 
+def build_text_pipeline():
+    """Picklable pipeline factory for process-mode tests."""
+    from formatters import JsonFormatter
+
+    pipeline = ExtractionPipeline()
+    pipeline.register_extractor("txt", TextFileExtractor())
+    pipeline.add_formatter(JsonFormatter())
+    return pipeline
+
+
+class StallingTextExtractor(TextFileExtractor):
+    """Text extractor that hangs on files named stall*.txt and dies on crash*.txt."""
+
+    def extract(self, file_path):
+        if file_path.name.startswith("stall"):
+            time.sleep(60)
+        if file_path.name.startswith("crash"):
+            os._exit(3)
+        return super().extract(file_path)
+
+
+def build_stalling_pipeline():
+    """Picklable factory for a pipeline whose extractor can hang or crash."""
+    pipeline = build_text_pipeline()
+    pipeline.register_extractor("txt", StallingTextExtractor())
+    return pipeline
+
+
+def build_slow_starting_pipeline():
+    """Picklable factory for a text pipeline that takes a while to build."""
+    time.sleep(1.5)
+    return build_text_pipeline()
+
+
 # ==============================================================================
 # Test Class: Batch Initialization
 # ==============================================================================
@@ -377,6 +421,76 @@ class TestResultAggregation:
         assert all(r.success for r in successful)
 
 
+# ==============================================================================
+# Test Class: Streaming Results
+# ==============================================================================
+
+
+class TestStreamingResults:
+    """Test streaming results to a sink as files complete."""
+
+    def test_iter_batch_yields_every_file(self, sample_files, mock_pipeline):
+        """Should yield (index, result) once per input file."""
+        batch = BatchProcessor(pipeline=mock_pipeline, max_workers=2)
+
+        streamed = dict(batch.iter_batch(sample_files))
+
+        assert sorted(streamed) == list(range(len(sample_files)))
+        for index, result in streamed.items():
+            assert result.source_file == sample_files[index]
+
+    def test_on_result_receives_full_results_and_keeps_slim_records(self, sample_files):
+        """Should hand full results to the sink and keep only status records."""
+        batch = BatchProcessor(pipeline=build_text_pipeline(), max_workers=2)
+        written = []
+
+        def sink(result):
+            assert result.formatted_outputs
+            assert result.processing_result is not None
+            written.append(result.source_file)
+
+        results = batch.process_batch(sample_files, on_result=sink)
+
+        assert sorted(written) == sorted(sample_files)
+        assert [r.source_file for r in results] == sample_files
+        for result in results:
+            assert result.success
+            assert result.formatted_outputs == ()
+            assert result.extraction_result is None
+            assert result.processing_result is None
+            assert result.duration_seconds is not None
+
+        assert batch.get_summary(results)["successful"] == len(sample_files)
+
+    def test_streamed_results_are_released(self, sample_files, mock_pipeline):
+        """Should not keep references to results after they reach the sink."""
+        batch = BatchProcessor(pipeline=mock_pipeline, max_workers=2)
+        refs = []
+
+        batch.process_batch(sample_files, on_result=lambda result: refs.append(weakref.ref(result)))
+        gc.collect()
+
+        assert len(refs) == len(sample_files)
+        assert all(ref() is None for ref in refs)
+
+    def test_stopping_early_skips_remaining_files(self, sample_files, mock_pipeline):
+        """Should not process queued files after iteration stops."""
+
+        def slow_process(file_path, progress_callback=None):
+            time.sleep(0.05)
+            return PipelineResult(source_file=file_path, success=True)
+
+        mock_pipeline.process_file.side_effect = slow_process
+        batch = BatchProcessor(pipeline=mock_pipeline, max_workers=1)
+
+        stream = batch.iter_batch(sample_files)
+        next(stream)
+        stream.close()
+
+        # The file running when iteration stopped still finishes
+        assert mock_pipeline.process_file.call_count <= 2
+
+
 # ==============================================================================
 # Test Class: Configuration
 # ==============================================================================
@@ -403,3 +517,261 @@ class TestConfiguration:
         # Should have some timeout set (not None)
         assert hasattr(batch, "timeout_per_file")
         assert batch.timeout_per_file is None or batch.timeout_per_file > 0
+
+
+# ==============================================================================
+# Test Class: Process Executor
+# ==============================================================================
+
+
+class TestProcessExecutor:
+    """Test process-pool execution with per-worker pipelines."""
+
+    def test_process_batch_in_worker_processes(self, sample_files):
+        """Workers build their own pipeline and return compact results."""
+        batch = BatchProcessor(
+            max_workers=2, executor="process", pipeline_factory=build_text_pipeline
+        )
+
+        results = batch.process_batch(sample_files)
+
+        assert [r.source_file for r in results] == sample_files
+        assert all(r.success for r in results)
+        assert all(r.formatted_outputs for r in results)
+        assert results[0].extraction_result.content_blocks == ()
+        assert results[0].processing_result is None
+        assert "Test content 0" in results[0].formatted_outputs[0].content
+
+    def test_process_mode_progress_callback(self, sample_files):
+        """Progress callbacks run in the parent as results arrive."""
+        updates = []
+        batch = BatchProcessor(
+            max_workers=2, executor="process", pipeline_factory=build_text_pipeline
+        )
+
+        batch.process_batch(sample_files, progress_callback=updates.append)
+
+        assert updates[-1]["items_processed"] == len(sample_files)
+
+    def test_process_mode_failures_are_results(self, tmp_path):
+        """Files that fail in a worker come back as failed results."""
+        missing = tmp_path / "missing.txt"
+        batch = BatchProcessor(
+            max_workers=1, executor="process", pipeline_factory=build_text_pipeline
+        )
+
+        results = batch.process_batch([missing])
+
+        assert not results[0].success
+        assert results[0].failed_stage == ProcessingStage.VALIDATION
+
+    def test_rejects_unknown_executor(self):
+        """Only thread and process executors exist."""
+        with pytest.raises(ValueError):
+            BatchProcessor(executor="gpu")
+
+
+# ==============================================================================
+# Test Class: Staged Executor
+# ==============================================================================
+
+
+class TestStagedExecutor:
+    """Test the read/extract/write stage pipeline."""
+
+    def test_staged_batch_processes_all_files(self, tmp_path, sample_files):
+        """Should run every file through all stages, keeping input order."""
+        missing = tmp_path / "missing.txt"
+        files = sample_files + [missing]
+        batch = BatchProcessor(
+            pipeline_factory=build_text_pipeline, max_workers=2, executor="staged"
+        )
+
+        results = batch.process_batch(files)
+
+        assert [r.source_file for r in results] == files
+        assert all(r.success for r in results[:-1])
+        assert all(r.formatted_outputs for r in results[:-1])
+        assert results[-1].failed_stage == ProcessingStage.VALIDATION
+
+    def test_sink_runs_on_write_stage(self, sample_files):
+        """Should call on_result from the write stage threads."""
+        batch = BatchProcessor(pipeline_factory=build_text_pipeline, executor="staged")
+        threads = []
+
+        results = batch.process_batch(
+            sample_files, on_result=lambda result: threads.append(threading.current_thread().name)
+        )
+
+        assert len(threads) == len(sample_files)
+        assert all(name.startswith("staged-write") for name in threads)
+        assert all(r.formatted_outputs == () for r in results)
+
+    def test_stage_stats(self, sample_files):
+        """Should report files, queue depths and utilization per stage."""
+        batch = BatchProcessor(
+            pipeline_factory=build_text_pipeline,
+            max_workers=1,
+            executor="staged",
+            config={"stage_queue_size": 2},
+        )
+        assert batch.get_stage_stats() is None
+
+        batch.process_batch(sample_files)
+        stats = batch.get_stage_stats()
+
+        assert stats["bottleneck"] in STAGES
+        assert stats["elapsed_seconds"] > 0
+        for name in STAGES:
+            stage = stats["stages"][name]
+            assert stage["files"] == len(sample_files)
+            assert stage["queue_depth"] == 0
+            assert 0.0 <= stage["utilization"] <= 1.0
+        assert stats["stages"]["read"]["max_queue_depth"] == len(sample_files)
+        assert stats["stages"]["extract"]["max_queue_depth"] <= 2
+        assert stats["stages"]["write"]["max_queue_depth"] <= 2
+
+    def test_sink_exception_stops_batch(self, sample_files):
+        """Should re-raise an exception from the result sink."""
+        batch = BatchProcessor(pipeline_factory=build_text_pipeline, executor="staged")
+
+        def failing_sink(result):
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            batch.process_batch(sample_files, on_result=failing_sink)
+
+    def test_read_stage_exception_is_reported_as_validation_failure(self, sample_files):
+        """An exception in the read stage reaches the result with its own message."""
+        pipeline = build_text_pipeline()
+        validate_file = pipeline.validate_file
+
+        def failing_validate(file_path):
+            if file_path == sample_files[0]:
+                raise RuntimeError("disk on fire")
+            return validate_file(file_path)
+
+        pipeline.validate_file = failing_validate
+        executor = StagedExecutor(pipeline, pipeline_factory=build_text_pipeline)
+
+        results = dict(executor.imap_unordered(sample_files))
+
+        assert not results[0].success
+        assert results[0].failed_stage == ProcessingStage.VALIDATION
+        assert any("disk on fire" in error for error in results[0].all_errors)
+        assert all(results[i].success for i in range(1, len(sample_files)))
+
+    def test_crashed_extraction_process_fails_only_its_file(self, tmp_path, sample_files):
+        """A dying extraction process breaks the pool; it is rebuilt and the
+        files that were in flight are retried."""
+        crashed = tmp_path / "crash.txt"
+        crashed.write_text("kills its worker")
+        files = [crashed] + sample_files
+        executor = StagedExecutor(
+            build_stalling_pipeline(),
+            pipeline_factory=build_stalling_pipeline,
+            extract_workers=2,
+            compact=False,
+        )
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", DeprecationWarning)
+            results = dict(executor.imap_unordered(files))
+
+        assert len(results) == len(files)
+        assert not results[0].success
+        assert results[0].failed_stage == ProcessingStage.EXTRACTION
+        assert all(results[i].success for i in range(1, len(files)))
+        # The replacement pool is not forked from the threaded parent
+        assert not any("fork" in str(warning.message) for warning in caught)
+
+    def test_crashed_extraction_process_without_factory_fails_remaining_files(
+        self, tmp_path, sample_files
+    ):
+        """Without a pipeline_factory the broken pool is not rebuilt by forking."""
+        crashed = tmp_path / "crash.txt"
+        crashed.write_text("kills its worker")
+        files = [crashed] + sample_files
+        executor = StagedExecutor(build_stalling_pipeline(), read_workers=1, queue_size=1)
+
+        results = dict(executor.imap_unordered(files))
+
+        assert len(results) == len(files)
+        assert all(result.failed_stage == ProcessingStage.EXTRACTION for result in results.values())
+
+    def test_rejects_invalid_pool_sizes(self):
+        """Should reject non-positive worker counts and queue sizes."""
+        with pytest.raises(ValueError):
+            StagedExecutor(Mock(), read_workers=0)
+
+        with pytest.raises(ValueError):
+            StagedExecutor(Mock(), queue_size=0)
+
+
+# ==============================================================================
+# Test Class: Per-File Deadlines
+# ==============================================================================
+
+
+class TestPerFileDeadlines:
+    """Test hard deadlines and worker replacement in process mode."""
+
+    def test_stuck_file_times_out_and_batch_continues(self, tmp_path, sample_files):
+        """A hanging file is stopped; the other files still succeed."""
+        stalled = tmp_path / "stall.txt"
+        stalled.write_text("never finishes")
+        batch = BatchProcessor(
+            max_workers=2,
+            executor="process",
+            pipeline_factory=build_stalling_pipeline,
+            config={"timeout_per_file": 1},
+        )
+
+        results = batch.process_batch([stalled] + sample_files)
+
+        assert not results[0].success
+        assert results[0].failed_stage == ProcessingStage.EXTRACTION
+        assert "Timed out after 1s" in results[0].all_errors[0]
+        assert all(r.success for r in results[1:])
+
+    def test_crashed_worker_is_replaced(self, tmp_path, sample_files):
+        """A worker that dies yields a failed result and is replaced."""
+        crashed = tmp_path / "crash.txt"
+        crashed.write_text("kills its worker")
+        batch = BatchProcessor(
+            max_workers=1, executor="process", pipeline_factory=build_stalling_pipeline
+        )
+
+        results = batch.process_batch([crashed] + sample_files)
+
+        assert not results[0].success
+        assert "exit code 3" in results[0].all_errors[0]
+        assert all(r.success for r in results[1:])
+
+    def test_deadline_starts_after_worker_startup(self, sample_files):
+        """Building a worker's pipeline does not count against a file's deadline."""
+        from pipeline.worker_pool import WorkerPool
+
+        pool = WorkerPool(build_slow_starting_pipeline, max_workers=1, timeout_per_file=1)
+
+        results = dict(pool.imap_unordered(sample_files[:2]))
+
+        assert all(result.success for result in results.values())
+        assert pool.timeouts == 0
+        assert pool.workers_started == 1
+
+    def test_workers_recycled_after_max_files(self, sample_files):
+        """Workers are replaced after max_files_per_worker files."""
+        from pipeline.worker_pool import WorkerPool
+
+        pool = WorkerPool(build_text_pipeline, max_workers=1, max_files_per_worker=2)
+
+        results = dict(pool.imap_unordered(sample_files))
+
+        assert all(results[i].success for i in range(len(sample_files)))
+        assert pool.workers_started == 3
+
+    def test_rejects_non_positive_timeout(self):
+        """Deadlines must be positive."""
+        with pytest.raises(ValueError):
+            BatchProcessor(config={"timeout_per_file": 0})
@@ -0,0 +1,262 @@
+"""
+Test Suite for Batch Scheduling - Cost Estimates and Largest-First Order.
+
+Test Coverage Areas:
+1. Largest-first ordering and makespan prediction
+2. Header probes (DOCX/PPTX/XLSX zip directory, PDF page count)
+3. Calibration from timing history
+4. BatchProcessor submission order and schedule report
+"""
+
+import json
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+from pipeline.batch_processor import BatchProcessor
+from pipeline.batch_scheduler import (
+    UNKNOWN_FORMAT_SECONDS,
+    CostModel,
+    plan_schedule,
+    predict_makespan,
+)
+from src.core import PipelineResult
+
+
+class TestPlanSchedule:
+    """Test ordering and makespan prediction."""
+
+    def test_largest_first_order(self):
+        plan = plan_schedule([1.0, 5.0, 3.0, 5.0], workers=2)
+
+        # Equal estimates keep input order
+        assert plan.order == (1, 3, 2, 0)
+        assert plan.predicted_work == pytest.approx(14.0)
+
+    def test_input_order(self):
+        plan = plan_schedule([1.0, 5.0, 3.0], workers=2, largest_first=False)
+
+        assert plan.order == (0, 1, 2)
+
+    def test_largest_last_costs_more_than_lpt(self):
+        costs = [1.0, 1.0, 1.0, 1.0, 4.0]
+
+        # Input order: the 4s file starts after the small ones
+        assert predict_makespan(costs, range(5), workers=2) == pytest.approx(6.0)
+        assert plan_schedule(costs, workers=2).predicted_makespan == pytest.approx(4.0)
+
+    def test_empty_batch(self):
+        plan = plan_schedule([], workers=4)
+
+        assert plan.order == ()
+        assert plan.predicted_makespan == 0.0
+
+
+class TestProbe:
+    """Test cheap header probes."""
+
+    def test_pptx_counts_slides(self, tmp_path):
+        path = tmp_path / "deck.pptx"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+            for n in range(1, 4):
+                package.writestr(f"ppt/slides/slide{n}.xml", "<p:sld/>" * 1000)
+            package.writestr("ppt/slides/_rels/slide1.xml.rels", "<Relationships/>")
+
+        format_type, work_mb, units = CostModel().probe(path)
+
+        assert format_type == "pptx"
+        assert units == 3
+        assert work_mb == pytest.approx(3 * 8000 / (1024 * 1024))
+
+    def test_xlsx_counts_sheets(self, tmp_path):
+        path = tmp_path / "book.xlsx"
+        with zipfile.ZipFile(path, "w") as package:
+            package.writestr("xl/worksheets/sheet1.xml", "<worksheet/>")
+            package.writestr("xl/worksheets/sheet2.xml", "<worksheet/>")
+
+        assert CostModel().probe(path)[2] == 2
+
+    def test_pdf_page_count(self, tmp_path):
+        path = tmp_path / "report.pdf"
+        path.write_bytes(
+            b"%PDF-1.4\n1 0 obj << /Type /Pages /Kids [3 0 R] /Count 12 >> endobj\n"
+            b"2 0 obj << /Type /Pages /Count 4 >> endobj\n%%EOF\n"
+        )
+
+        assert CostModel().probe(path)[2] == 12
+
+    def test_corrupt_package_falls_back_to_size(self, tmp_path):
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip" * 100)
+
+        format_type, work_mb, units = CostModel().probe(path)
+
+        assert format_type == "docx"
+        assert work_mb == pytest.approx(900 / (1024 * 1024))
+        assert units == 0
+
+    def test_missing_and_unknown_files_are_cheap(self, tmp_path):
+        model = CostModel()
+        unknown = tmp_path / "image.bmp"
+        unknown.write_bytes(b"\0" * 10_000)
+
+        assert model.estimate(tmp_path / "missing.pdf") == UNKNOWN_FORMAT_SECONDS
+        assert model.estimate(unknown) == UNKNOWN_FORMAT_SECONDS
+
+    def test_more_pages_cost_more(self, tmp_path):
+        small = tmp_path / "small.pdf"
+        large = tmp_path / "large.pdf"
+        small.write_bytes(b"%PDF-1.4 /Count 2 %%EOF")
+        large.write_bytes(b"%PDF-1.4 /Count 200 %%EOF")
+
+        model = CostModel()
+        assert model.estimate(large) > model.estimate(small)
+
+
+class TestHistory:
+    """Test calibration from previous runs."""
+
+    def test_known_file_uses_measured_time(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+
+        model = CostModel()
+        model.record(path, 2.5)
+
+        assert model.estimate(path) == 2.5
+
+    def test_format_scale_applies_to_new_files(self, tmp_path):
+        seen = tmp_path / "seen.txt"
+        new = tmp_path / "new.txt"
+        seen.write_text("hello")
+        new.write_text("world")
+
+        model = CostModel()
+        baseline = model.estimate(new)
+        model.record(seen, model.model_seconds(seen) * 10)
+
+        assert model.estimate(new) == pytest.approx(baseline * 10)
+
+    def test_record_reuses_estimate_probe(self, tmp_path, monkeypatch):
+        path = tmp_path / "deck.pptx"
+        with zipfile.ZipFile(path, "w") as package:
+            package.writestr("ppt/slides/slide1.xml", "<p:sld/>")
+
+        model = CostModel()
+        model.estimate(path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file probed again after processing")
+
+        monkeypatch.setattr(CostModel, "probe", fail)
+        model.record(path, 3.0)
+
+        assert model.estimate(path) == 3.0
+
+    def test_history_round_trip(self, tmp_path):
+        history = tmp_path / "timings" / "batch_timings.json"
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+
+        model = CostModel(history_path=history)
+        model.record(path, 1.5)
+        model.save()
+
+        assert json.loads(history.read_text())["scales"]["txt"] > 0
+        assert CostModel(history_path=history).estimate(path) == 1.5
+
+    def test_unreadable_history_is_ignored(self, tmp_path):
+        history = tmp_path / "batch_timings.json"
+        history.write_text("{not json")
+
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+
+        assert CostModel(history_path=history).estimate(path) > 0
+
+
+class TestBatchScheduling:
+    """Test BatchProcessor integration."""
+
+    @staticmethod
+    def _recording_pipeline(submitted):
+        pipeline = Mock()
+
+        def process_file(file_path, progress_callback=None):
+            submitted.append(file_path.name)
+            return PipelineResult(source_file=file_path, success=True, duration_seconds=0.01)
+
+        pipeline.process_file.side_effect = process_file
+        return pipeline
+
+    def _write_files(self, tmp_path):
+        paths = []
+        for name, size in [("a.txt", 10), ("b.txt", 50_000), ("c.txt", 1_000)]:
+            path = tmp_path / name
+            path.write_bytes(b"x" * size)
+            paths.append(path)
+        return paths
+
+    def test_submits_largest_first(self, tmp_path):
+        submitted = []
+        batch = BatchProcessor(pipeline=self._recording_pipeline(submitted), max_workers=1)
+
+        results = batch.process_batch(self._write_files(tmp_path))
+
+        assert submitted == ["b.txt", "c.txt", "a.txt"]
+        # Results stay in input order
+        assert [r.source_file.name for r in results] == ["a.txt", "b.txt", "c.txt"]
+
+    def test_input_schedule(self, tmp_path):
+        submitted = []
+        batch = BatchProcessor(
+            pipeline=self._recording_pipeline(submitted),
+            max_workers=1,
+            config={"schedule": "input"},
+        )
+
+        batch.process_batch(self._write_files(tmp_path))
+
+        assert submitted == ["a.txt", "b.txt", "c.txt"]
+
+    def test_reports_makespan_and_saves_history(self, tmp_path):
+        history = tmp_path / "batch_timings.json"
+        batch = BatchProcessor(
+            pipeline=self._recording_pipeline([]),
+            max_workers=2,
+            config={"timing_history": history},
+        )
+
+        batch.process_batch(self._write_files(tmp_path))
+
+        report = batch.last_schedule
+        assert report["schedule"] == "largest_first"
+        assert report["predicted_makespan_seconds"] > 0
+        assert report["actual_makespan_seconds"] > 0
+        assert report["actual_work_seconds"] == pytest.approx(0.03)
+        assert len(json.loads(history.read_text())["files"]) == 3
+
+    def test_failed_files_are_not_recorded(self, tmp_path):
+        history = tmp_path / "batch_timings.json"
+        pipeline = Mock()
+
+        def process_file(file_path, progress_callback=None):
+            return PipelineResult(
+                source_file=file_path,
+                success=file_path.name != "b.txt",
+                duration_seconds=0.001,
+            )
+
+        pipeline.process_file.side_effect = process_file
+        batch = BatchProcessor(pipeline=pipeline, config={"timing_history": history})
+
+        batch.process_batch(self._write_files(tmp_path))
+
+        recorded = json.loads(history.read_text())["files"]
+        assert len(recorded) == 2
+        assert not any("b.txt" in key for key in recorded)
+
+    def test_rejects_unknown_schedule(self):
+        with pytest.raises(ValueError):
+            BatchProcessor(pipeline=Mock(), config={"schedule": "random"})
@@ -585,6 +585,47 @@ class TestEndToEndProcessing:
 # ==============================================================================
 
 
+class TestStreamingExtraction:
+    """Test ExtractionPipeline.stream_file() over extract_stream()."""
+
+    def test_stream_file_yields_blocks_then_trailer(self, tmp_path):
+        from extractors.txt_extractor import TextFileExtractor
+
+        path = tmp_path / "doc.txt"
+        path.write_text("Heading\n\nFirst paragraph.\n\nSecond paragraph.", encoding="utf-8")
+
+        pipeline = ExtractionPipeline()
+        pipeline.register_extractor("txt", TextFileExtractor())
+        progress = []
+
+        items = list(pipeline.stream_file(path, progress_callback=progress.append))
+
+        assert [b.content for b in items[:-1]] == [
+            "Heading",
+            "First paragraph.",
+            "Second paragraph.",
+        ]
+        assert items[-1].success is True
+        assert items[-1].content_blocks == ()
+        assert progress[-1]["stage"] == "complete"
+
+    def test_stream_file_unknown_format(self, tmp_path):
+        path = tmp_path / "file.xyz"
+        path.write_text("content")
+
+        items = list(ExtractionPipeline().stream_file(path))
+
+        assert len(items) == 1
+        assert items[0].success is False
+        assert "Unknown file format" in items[0].errors[0]
+
+    def test_stream_file_no_extractor_registered(self, sample_file):
+        items = list(ExtractionPipeline().stream_file(sample_file))
+
+        assert len(items) == 1
+        assert items[0].success is False
+
+
 class TestErrorHandling:
     """Test error handling and recovery patterns."""
 
@@ -0,0 +1,137 @@
+"""Unit tests for SparseCells compact table storage.
+
+Tests cover:
+- Round trip from dense rows (ragged rows padded, width truncation)
+- Tuple-of-tuples compatibility (len, indexing, iteration, equality)
+- Value interning and non-empty-only storage
+- Pickling
+- JSON formatter serialization of sparse tables
+"""
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.core import (
+    DocumentMetadata,
+    ProcessingResult,
+    SparseCells,
+    SparseCellsBuilder,
+    TableMetadata,
+)
+
+ROWS = (
+    ("name", "", "status"),
+    ("", "", ""),
+    ("alpha", "1", "open"),
+    ("beta", "", "open"),
+)
+
+
+class TestSparseCellsRoundTrip:
+    """Test conversion between dense rows and SparseCells."""
+
+    def test_from_rows_matches_dense(self):
+        cells = SparseCells.from_rows(ROWS)
+
+        assert len(cells) == 4
+        assert cells.num_columns == 3
+        assert tuple(cells) == ROWS
+        assert cells == ROWS
+        assert ROWS == cells
+
+    def test_indexing_and_slicing(self):
+        cells = SparseCells.from_rows(ROWS)
+
+        assert cells[0] == ("name", "", "status")
+        assert cells[-1] == ("beta", "", "open")
+        assert cells[1:3] == ROWS[1:3]
+        with pytest.raises(IndexError):
+            cells[4]
+
+    def test_ragged_rows_padded_to_widest(self):
+        cells = SparseCells.from_rows([("a",), ("b", "c", "d"), ()])
+
+        assert cells == (("a", "", ""), ("b", "c", "d"), ("", "", ""))
+
+    def test_explicit_width_truncates(self):
+        cells = SparseCells.from_rows(ROWS, num_columns=2)
+
+        assert cells == tuple(row[:2] for row in ROWS)
+        assert cells.non_empty_count == 4
+
+    def test_empty(self):
+        cells = SparseCells.from_rows([])
+
+        assert not cells
+        assert len(cells) == 0
+        assert cells == ()
+
+
+class TestSparseCellsStorage:
+    """Test compact storage properties."""
+
+    def test_only_non_empty_cells_stored(self):
+        cells = SparseCells.from_rows(ROWS)
+
+        assert cells.non_empty_count == 7
+        assert list(cells.iter_non_empty()) == [
+            (0, 0, "name"),
+            (0, 2, "status"),
+            (2, 0, "alpha"),
+            (2, 1, "1"),
+            (2, 2, "open"),
+            (3, 0, "beta"),
+            (3, 2, "open"),
+        ]
+        assert cells.values.count("open") == 1
+
+    def test_values_interned(self):
+        builder = SparseCellsBuilder()
+        for _ in range(1000):
+            builder.add_row(["open", "", "closed"])
+        cells = builder.build()
+
+        assert cells.values == ("open", "closed")
+        assert cells[999] == ("open", "", "closed")
+
+    def test_pickle_round_trip_smaller_than_dense(self):
+        rows = [("open" if i % 2 else "",) + ("",) * 48 + (str(i % 10),) for i in range(2000)]
+        cells = SparseCells.from_rows(rows)
+
+        restored = pickle.loads(pickle.dumps(cells))
+
+        assert restored == cells
+        assert restored == tuple(rows)
+        assert len(pickle.dumps(cells)) < len(pickle.dumps(tuple(rows)))
+
+    def test_hash_consistent_with_tuple(self):
+        cells = SparseCells.from_rows(ROWS)
+
+        assert hash(cells) == hash(ROWS)
+
+
+class TestSparseCellsFormatting:
+    """Test formatters iterate SparseCells like dense rows."""
+
+    def test_json_formatter_serializes_sparse_table(self):
+        from src.formatters.json_formatter import JsonFormatter
+
+        table = TableMetadata(
+            num_rows=4,
+            num_columns=3,
+            has_header=True,
+            header_row=ROWS[0],
+            cells=SparseCells.from_rows(ROWS),
+        )
+        result = ProcessingResult(
+            document_metadata=DocumentMetadata(source_file=Path("t.xlsx"), file_format="xlsx"),
+            tables=(table,),
+            success=True,
+        )
+
+        parsed = json.loads(JsonFormatter().format(result).content)
+
+        assert parsed["tables"][0]["cells"] == [list(row) for row in ROWS]
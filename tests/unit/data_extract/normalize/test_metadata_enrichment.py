@@ -143,7 +143,7 @@ class TestCalculateFileHash:
             temp_path.unlink()
 
     def test_calculate_file_hash_custom_chunk_size(self):
-        """Test file hashing with custom chunk size (AC-2.6.1)."""
+        """Test that the deprecated chunk size warns and does not change the hash (AC-2.6.1)."""
         content = "Test content for custom chunk size"
 
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
@@ -152,9 +152,12 @@ class TestCalculateFileHash:
 
         try:
             # Hash with different chunk sizes - should produce same result
-            hash_8kb = calculate_file_hash(temp_path, chunk_size=8192)
-            hash_4kb = calculate_file_hash(temp_path, chunk_size=4096)
-            hash_1kb = calculate_file_hash(temp_path, chunk_size=1024)
+            with pytest.warns(DeprecationWarning, match="chunk_size"):
+                hash_8kb = calculate_file_hash(temp_path, chunk_size=8192)
+            with pytest.warns(DeprecationWarning, match="chunk_size"):
+                hash_4kb = calculate_file_hash(temp_path, chunk_size=4096)
+            with pytest.warns(DeprecationWarning, match="chunk_size"):
+                hash_1kb = calculate_file_hash(temp_path, chunk_size=1024)
 
             # Chunk size should not affect hash result (determinism)
             assert hash_8kb == hash_4kb == hash_1kb
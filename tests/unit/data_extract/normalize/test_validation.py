@@ -179,16 +179,12 @@ class TestOCRConfidenceCalculation:
         mock_image_class.open.return_value = mock_image
 
         mock_pytesseract.Output.DICT = 0
-        # Three calls: before preprocessing check, after preprocessing check, final calculation
+        # Two calls: before preprocessing check, final calculation (doubles as "after")
         mock_pytesseract.image_to_data.side_effect = [
             {
                 "conf": ["80", "82", "85"],
                 "text": ["low", "quality", "text"],
             },  # Before preprocessing
-            {
-                "conf": ["90", "92", "95"],
-                "text": ["improved", "quality", "text"],
-            },  # After preprocessing
             {
                 "conf": ["90", "92", "95"],
                 "text": ["improved", "quality", "text"],
@@ -209,6 +205,114 @@ class TestOCRConfidenceCalculation:
         # Should return confidence after preprocessing: (90+92+95)/3 / 100 = 0.923
         assert confidence == pytest.approx(0.923, abs=0.001)
 
+    @patch("src.data_extract.normalize.validation.TESSERACT_AVAILABLE", True)
+    @patch("src.data_extract.normalize.validation.pytesseract", create=True)
+    @patch("src.data_extract.normalize.validation.Image", create=True)
+    def test_validate_ocr_confidence_uses_ocr_cache(
+        self, mock_image_class, mock_pytesseract, tmp_path
+    ):
+        """Test that a cached result for the same image skips tesseract."""
+        from infrastructure.ocr_cache import OCRCache
+
+        mock_image = MagicMock()
+        mock_image.tobytes.return_value = b"pixels"
+        mock_image.mode = "L"
+        mock_image.size = (10, 10)
+        mock_image_class.open.return_value = mock_image
+
+        mock_pytesseract.Output.DICT = 0
+        mock_pytesseract.image_to_data.return_value = {
+            "conf": ["90", "80"],
+            "text": ["cached", "text"],
+        }
+
+        validator = QualityValidator(
+            ocr_preprocessing_enabled=False, ocr_cache=OCRCache(tmp_path / "ocr")
+        )
+        first, _ = validator.validate_ocr_confidence(Path("page.png"), preprocess=False)
+        second, ocr_data = validator.validate_ocr_confidence(Path("page.png"), preprocess=False)
+
+        assert mock_pytesseract.image_to_data.call_count == 1
+        assert second == first == pytest.approx(0.85)
+        assert ocr_data["text"] == ["cached", "text"]
+        assert validator.ocr_cache.get_stats()["hits"] == 1
+
+
+class TestSinglePassOCRValidation:
+    """Test single-pass OCR confidence measurement."""
+
+    @staticmethod
+    def _preprocessing_mocks(mock_image_class, mock_enhance):
+        mock_image = MagicMock()
+        mock_image.mode = "L"
+        mock_image.filter.return_value = mock_image
+        mock_image_class.open.return_value = mock_image
+        mock_enhancer = MagicMock()
+        mock_enhancer.enhance.return_value = mock_image
+        mock_enhance.Contrast.return_value = mock_enhancer
+
+    @patch("src.data_extract.normalize.validation.TESSERACT_AVAILABLE", True)
+    @patch("src.data_extract.normalize.validation.pytesseract", create=True)
+    @patch("src.data_extract.normalize.validation.Image", create=True)
+    @patch("src.data_extract.normalize.validation.ImageFilter", create=True)
+    @patch("src.data_extract.normalize.validation.ImageEnhance", create=True)
+    def test_single_pass_runs_tesseract_once(
+        self, mock_enhance, mock_filter, mock_image_class, mock_pytesseract
+    ):
+        """Unsampled images are OCRed once, on the preprocessed image."""
+        self._preprocessing_mocks(mock_image_class, mock_enhance)
+        mock_pytesseract.Output.DICT = 0
+        mock_pytesseract.image_to_data.return_value = {"conf": ["90", "92"], "text": ["a", "b"]}
+
+        validator = QualityValidator(ocr_single_pass=True, ocr_comparison_sample_rate=0.0)
+        confidence, _ = validator.validate_ocr_confidence(Path("page.png"))
+
+        assert mock_pytesseract.image_to_data.call_count == 1
+        assert confidence == pytest.approx(0.91)
+
+    @patch("src.data_extract.normalize.validation.TESSERACT_AVAILABLE", True)
+    @patch("src.data_extract.normalize.validation.pytesseract", create=True)
+    @patch("src.data_extract.normalize.validation.Image", create=True)
+    @patch("src.data_extract.normalize.validation.ImageFilter", create=True)
+    @patch("src.data_extract.normalize.validation.ImageEnhance", create=True)
+    def test_single_pass_sampled_comparison(
+        self, mock_enhance, mock_filter, mock_image_class, mock_pytesseract
+    ):
+        """Sampled images also get the before-preprocessing pass for telemetry."""
+        self._preprocessing_mocks(mock_image_class, mock_enhance)
+        mock_pytesseract.Output.DICT = 0
+        mock_pytesseract.image_to_data.side_effect = [
+            {"conf": ["70"], "text": ["before"]},
+            {"conf": ["90"], "text": ["after"]},
+        ]
+        mock_logger = MagicMock()
+
+        validator = QualityValidator(
+            ocr_single_pass=True, ocr_comparison_sample_rate=1.0, logger=mock_logger
+        )
+        confidence, _ = validator.validate_ocr_confidence(Path("page.png"))
+
+        assert mock_pytesseract.image_to_data.call_count == 2
+        assert confidence == pytest.approx(0.90)
+        mock_logger.info.assert_any_call(
+            "ocr_preprocessing_applied",
+            image_path="page.png",
+            confidence_before=pytest.approx(0.70),
+            confidence_after=pytest.approx(0.90),
+            improvement=pytest.approx(0.20),
+        )
+
+    def test_sampling_is_deterministic(self):
+        """The same image path is always either sampled or not."""
+        validator = QualityValidator(ocr_single_pass=True, ocr_comparison_sample_rate=0.5)
+        paths = [Path(f"page_{i}.png") for i in range(200)]
+
+        first = [validator._should_compare_preprocessing(p) for p in paths]
+        second = [validator._should_compare_preprocessing(p) for p in paths]
+
+        assert first == second
+        assert 50 < sum(first) < 150
+
 
 class TestDocumentAverageConfidence:
     """Test document-level average confidence calculation."""
@@ -0,0 +1,102 @@
+"""
+Unit tests for the size-bounded on-disk cache base.
+
+Covers hit/miss accounting, persistence, LRU eviction, clearing and
+unreadable entries, through a minimal text subclass.
+"""
+
+import os
+
+import pytest
+
+from infrastructure.disk_cache import DiskCache
+
+
+class TextCache(DiskCache):
+    """Stores strings as UTF-8 files."""
+
+    suffix = ".txt"
+    description = "text"
+
+    def _encode(self, value):
+        return value.encode("utf-8")
+
+    def _decode(self, payload):
+        return payload.decode("utf-8")
+
+
+class TestStorage:
+    """Test get/set and statistics."""
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = TextCache(tmp_path, max_size_mb=1)
+
+        assert cache.get("a" * 64) is None
+        cache.set("a" * 64, "hello")
+        assert cache.get("a" * 64) == "hello"
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(0.5)
+        assert stats["writes"] == 1
+        assert stats["num_entries"] == 1
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        TextCache(tmp_path, max_size_mb=1).set("a" * 64, "hello")
+
+        reopened = TextCache(tmp_path, max_size_mb=1)
+        assert reopened.get_stats()["num_entries"] == 1
+        assert reopened.get("a" * 64) == "hello"
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        cache = TextCache(tmp_path, max_size_mb=1)
+        path = cache._entry_path("c" * 64)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"\xff\xfe not utf-8")
+
+        assert cache.get("c" * 64) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_unencodable_value_is_skipped(self, tmp_path):
+        cache = TextCache(tmp_path, max_size_mb=1)
+
+        cache.set("a" * 64, 42)
+
+        assert cache.get_stats()["writes"] == 0
+        assert cache.get("a" * 64) is None
+
+    def test_rejects_non_positive_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            TextCache(tmp_path, max_size_mb=0)
+
+
+class TestEviction:
+    """Test size bound and clearing."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = TextCache(tmp_path, max_size_mb=1)
+        payload = "x" * 400_000
+
+        cache.set("a" * 64, payload)
+        cache.set("b" * 64, payload)
+        # Make entry a the oldest so it is evicted first
+        oldest = cache._entry_path("a" * 64)
+        os.utime(oldest, (1, 1))
+        cache.set("c" * 64, payload)
+
+        assert cache.get_stats()["evictions"] >= 1
+        assert not oldest.exists()
+        assert cache.get("c" * 64) == payload
+        assert cache.get_stats()["total_size_mb"] <= 1
+
+    def test_clear_removes_entries(self, tmp_path):
+        cache = TextCache(tmp_path, max_size_mb=1)
+        cache.set("a" * 64, "hello")
+
+        cache.clear()
+
+        assert cache.get("a" * 64) is None
+        stats = cache.get_stats()
+        assert stats["num_entries"] == 0
+        assert stats["total_size_mb"] == 0
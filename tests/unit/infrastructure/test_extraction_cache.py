@@ -0,0 +1,230 @@
+"""
+Unit tests for the persistent extraction result cache.
+
+Covers key derivation, round-tripping ExtractionResults, and the pipeline
+and adapter integrations; storage and eviction are covered by test_disk_cache.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from infrastructure.extraction_cache import ExtractionCache, get_extraction_cache
+from infrastructure.file_provenance import RACY_WINDOW_NS
+from src.core.models import ContentBlock, ContentType, DocumentMetadata, ExtractionResult
+
+
+def _write(path, data: bytes):
+    """Write a file and backdate it past the provenance racy window."""
+    path.write_bytes(data)
+    past = time.time_ns() - 10 * RACY_WINDOW_NS
+    os.utime(path, ns=(past, past))
+    return path
+
+
+class CountingExtractor:
+    """Minimal extractor that records how often it runs."""
+
+    def __init__(self, prefix: str = "text", succeed: bool = True):
+        self.prefix = prefix
+        self.succeed = succeed
+        self._calls = 0
+
+    @property
+    def calls(self) -> int:
+        return self._calls
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        self._calls += 1
+        return ExtractionResult(
+            content_blocks=(
+                ContentBlock(
+                    block_type=ContentType.PARAGRAPH,
+                    content=f"{self.prefix}: {file_path.read_text()}",
+                ),
+            ),
+            document_metadata=DocumentMetadata(
+                source_file=file_path,
+                file_format="txt",
+                file_size_bytes=file_path.stat().st_size,
+            ),
+            success=self.succeed,
+        )
+
+
+class TestKeys:
+    """Test content-addressed key derivation."""
+
+    def test_same_inputs_same_key(self):
+        assert ExtractionCache.make_key("a" * 64, CountingExtractor()) == ExtractionCache.make_key(
+            "a" * 64, CountingExtractor()
+        )
+
+    def test_file_hash_and_settings_change_key(self):
+        key = ExtractionCache.make_key("a" * 64, CountingExtractor())
+
+        assert ExtractionCache.make_key("b" * 64, CountingExtractor()) != key
+        assert ExtractionCache.make_key("a" * 64, CountingExtractor(prefix="other")) != key
+
+    def test_private_and_object_attributes_ignored(self):
+        extractor = CountingExtractor()
+        key = ExtractionCache.make_key("a" * 64, extractor)
+
+        extractor._session = object()
+        extractor.logger = object()
+
+        assert ExtractionCache.make_key("a" * 64, extractor) == key
+
+    def test_editing_a_helper_module_changes_key(self, tmp_path, monkeypatch):
+        import infrastructure.extraction_cache as extraction_cache
+
+        helpers = tmp_path / "extractors"
+        helpers.mkdir()
+        helper = _write(helpers / "pdf_session.py", b"COVERAGE_THRESHOLD = 0.5\n")
+        monkeypatch.setattr(extraction_cache, "SOURCE_DIRS", (helpers,))
+        cache = ExtractionCache(tmp_path / "cache")
+        path = _write(tmp_path / "doc.txt", b"hello")
+        extractor = CountingExtractor()
+        key = ExtractionCache.make_key("a" * 64, extractor)
+        cache.get_or_extract(extractor, path)
+
+        _write(helper, b"COVERAGE_THRESHOLD = 0.25\n")
+        cache.get_or_extract(extractor, path)
+
+        assert ExtractionCache.make_key("a" * 64, extractor) != key
+        assert extractor.calls == 2
+
+    def test_installing_an_optional_dependency_changes_key(self, monkeypatch):
+        import infrastructure.extraction_cache as extraction_cache
+
+        extractor = CountingExtractor()
+        environment = dict(extraction_cache._environment(), tesseract=False)
+        monkeypatch.setattr(extraction_cache, "_environment", lambda: environment)
+        without_ocr = ExtractionCache.make_key("a" * 64, extractor)
+
+        environment["tesseract"] = True
+
+        assert ExtractionCache.make_key("a" * 64, extractor) != without_ocr
+
+
+class TestGetOrExtract:
+    """Test cache hits, misses and what gets stored."""
+
+    def test_second_run_skips_extraction(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache")
+        path = _write(tmp_path / "doc.txt", b"hello")
+        extractor = CountingExtractor()
+
+        first = cache.get_or_extract(extractor, path)
+        second = cache.get_or_extract(extractor, path)
+
+        assert extractor.calls == 1
+        assert second == first
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+
+    def test_identical_files_keep_their_own_provenance(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache")
+        first_path = _write(tmp_path / "a.txt", b"same contents")
+        second_path = _write(tmp_path / "b.txt", b"same contents")
+        extractor = CountingExtractor()
+
+        first = cache.get_or_extract(extractor, first_path)
+        second = cache.get_or_extract(extractor, second_path)
+
+        assert extractor.calls == 1
+        assert first.document_metadata.source_file == first_path
+        assert second.document_metadata.source_file == second_path
+        assert second.document_metadata.file_size_bytes == second_path.stat().st_size
+        assert second.content_blocks == first.content_blocks
+
+    def test_persists_across_instances(self, tmp_path):
+        path = _write(tmp_path / "doc.txt", b"hello")
+        ExtractionCache(tmp_path / "cache").get_or_extract(CountingExtractor(), path)
+
+        extractor = CountingExtractor()
+        result = ExtractionCache(tmp_path / "cache").get_or_extract(extractor, path)
+
+        assert extractor.calls == 0
+        assert result.content_blocks[0].content == "text: hello"
+
+    def test_changed_file_extracts_again(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache")
+        path = _write(tmp_path / "doc.txt", b"version 1")
+        extractor = CountingExtractor()
+        cache.get_or_extract(extractor, path)
+
+        _write(path, b"version 2 is longer")
+        result = cache.get_or_extract(extractor, path)
+
+        assert extractor.calls == 2
+        assert result.content_blocks[0].content == "text: version 2 is longer"
+
+    def test_failed_results_not_stored(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache")
+        path = _write(tmp_path / "doc.txt", b"hello")
+        extractor = CountingExtractor(succeed=False)
+
+        cache.get_or_extract(extractor, path)
+        cache.get_or_extract(extractor, path)
+
+        assert extractor.calls == 2
+        assert cache.get_stats()["num_entries"] == 0
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = ExtractionCache(tmp_path / "cache")
+        key = "c" * 64
+        cache._entry_path(key).parent.mkdir(parents=True)
+        cache._entry_path(key).write_bytes(b"not a pickle")
+
+        assert cache.get(key) is None
+        assert cache.get_stats()["misses"] == 1
+
+
+def test_shared_instance_per_directory(tmp_path):
+    assert get_extraction_cache(tmp_path) is get_extraction_cache(tmp_path / ".")
+
+
+class TestIntegrations:
+    """Test ExtractionPipeline and ExtractorAdapter consult the cache."""
+
+    def test_pipeline_uses_cache(self, tmp_path):
+        from src.pipeline import ExtractionPipeline
+
+        path = _write(tmp_path / "doc.txt", b"hello")
+        extractor = CountingExtractor()
+        pipeline = ExtractionPipeline(extraction_cache=ExtractionCache(tmp_path / "cache"))
+        pipeline.register_extractor("txt", extractor)
+
+        assert pipeline.process_file(path).success
+        assert pipeline.process_file(path).success
+        assert extractor.calls == 1
+
+    def test_adapter_uses_cache_and_converts_each_time(self, tmp_path):
+        from src.data_extract.extract.adapter import ExtractorAdapter
+
+        path = _write(tmp_path / "doc.txt", b"hello")
+        extractor = CountingExtractor()
+        adapter = ExtractorAdapter(extractor, "TXT", cache=ExtractionCache(tmp_path / "cache"))
+
+        first = adapter.process(path)
+        second = adapter.process(path)
+
+        assert extractor.calls == 1
+        assert second.text == first.text
+        assert second.id != first.id
+
+    def test_get_extractor_passes_cache_to_adapter(self, tmp_path):
+        from src.data_extract.extract import get_extractor
+
+        path = _write(tmp_path / "notes.txt", b"First paragraph.\n\nSecond paragraph.\n")
+        cache = ExtractionCache(tmp_path / "cache")
+
+        adapter = get_extractor(path, cache=cache)
+        adapter.process(path)
+        get_extractor(path, cache=cache).process(path)
+
+        assert adapter.cache is cache
+        assert get_extractor(path).cache is None
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["writes"]) == (1, 1)
@@ -0,0 +1,151 @@
+"""
+Unit tests for the process-wide file provenance cache.
+
+Covers hashing, key invalidation on file changes, recorded digests,
+LRU eviction, and sharing across the extract and normalize call sites.
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from infrastructure.file_provenance import (
+    RACY_WINDOW_NS,
+    FileProvenanceCache,
+    get_provenance_cache,
+)
+
+
+def _write(path, data: bytes):
+    """Write a file and backdate it past the racy window."""
+    path.write_bytes(data)
+    past = time.time_ns() - 10 * RACY_WINDOW_NS
+    os.utime(path, ns=(past, past))
+    return path
+
+
+class TestFileHash:
+    """Test hashing and cache hits."""
+
+    def test_hash_then_hit(self, tmp_path):
+        cache = FileProvenanceCache()
+        path = _write(tmp_path / "a.bin", b"provenance" * 1000)
+
+        expected = hashlib.sha256(path.read_bytes()).hexdigest()
+        assert cache.file_hash(path) == expected
+        assert cache.file_hash(path) == expected
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["num_entries"] == 1
+
+    def test_hit_does_not_read_file(self, tmp_path, monkeypatch):
+        cache = FileProvenanceCache()
+        path = _write(tmp_path / "a.bin", b"data")
+        cache.file_hash(path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file read on cache hit")
+
+        monkeypatch.setattr(hashlib, "file_digest", fail)
+        assert cache.file_hash(path) == hashlib.sha256(b"data").hexdigest()
+
+    def test_changed_file_gets_new_hash(self, tmp_path):
+        cache = FileProvenanceCache()
+        path = _write(tmp_path / "a.txt", b"version 1")
+        first = cache.file_hash(path)
+
+        _write(path, b"version 2, longer")
+        assert cache.file_hash(path) != first
+        assert cache.file_hash(path) == hashlib.sha256(b"version 2, longer").hexdigest()
+
+    def test_recently_modified_file_not_cached(self, tmp_path):
+        cache = FileProvenanceCache()
+        path = tmp_path / "fresh.txt"
+        path.write_bytes(b"just written")
+
+        assert cache.file_hash(path) == hashlib.sha256(b"just written").hexdigest()
+        assert cache.get_stats()["num_entries"] == 0
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            FileProvenanceCache().file_hash(tmp_path / "missing.txt")
+
+
+class TestRecordedDigests:
+    """Test digests recorded by extractors that already read the file."""
+
+    def test_recorded_digest_is_served(self, tmp_path):
+        cache = FileProvenanceCache()
+        path = _write(tmp_path / "a.csv", b"a,b\n1,2\n")
+
+        cache.record(path, "f" * 64, os.stat(path))
+
+        assert cache.get(path) == "f" * 64
+        assert cache.get_stats()["recorded"] == 1
+
+    def test_stale_stat_is_never_served(self, tmp_path):
+        cache = FileProvenanceCache()
+        path = _write(tmp_path / "a.csv", b"a,b\n")
+        stale = os.stat(path)
+
+        _write(path, b"a,b\n1,2\n")
+        cache.record(path, "0" * 64, stale)
+
+        assert cache.get(path) is None
+
+
+class TestEvictionAndSharing:
+    """Test bounded size and the process-wide instance."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = FileProvenanceCache(max_entries=2)
+        paths = [_write(tmp_path / f"{n}.bin", bytes([n])) for n in range(3)]
+
+        cache.file_hash(paths[0])
+        cache.file_hash(paths[1])
+        cache.file_hash(paths[0])  # Refresh 0, so 1 is least recently used
+        cache.file_hash(paths[2])
+
+        assert cache.get(paths[1]) is None
+        assert cache.get(paths[0]) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError):
+            FileProvenanceCache(max_entries=0)
+
+    def test_extract_and_normalize_import_one_module(self):
+        import extractors.csv_extractor as csv_extractor
+        import extractors.pdf_extractor as pdf_extractor
+        import src.data_extract.extract.adapter as adapter
+        import src.data_extract.normalize.metadata as metadata
+
+        assert csv_extractor.get_provenance_cache is get_provenance_cache
+        assert pdf_extractor.get_provenance_cache is get_provenance_cache
+        assert adapter.get_provenance_cache is get_provenance_cache
+        assert metadata.get_provenance_cache is get_provenance_cache
+
+    def test_extract_and_normalize_reuse_extractor_hash(self, tmp_path, monkeypatch):
+        from src.data_extract.extract.txt import TxtExtractorAdapter
+        from src.data_extract.normalize.metadata import calculate_file_hash
+
+        cache = get_provenance_cache()
+        cache.clear()
+        path = _write(tmp_path / "notes.txt", b"First paragraph.\n\nSecond paragraph.\n")
+
+        # Only the text scan itself may hash the file
+        def fail(*args, **kwargs):
+            raise AssertionError("file re-read for hashing")
+
+        monkeypatch.setattr(hashlib, "file_digest", fail)
+
+        document = TxtExtractorAdapter().process(path)
+        expected = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        assert document.metadata.file_hash == expected
+        assert calculate_file_hash(path) == expected
+        assert cache.get_stats()["recorded"] == 1
@@ -0,0 +1,79 @@
+"""
+Unit tests for the persistent OCR result cache.
+
+Covers key construction, JSON round-tripping and process-wide instance
+sharing; storage and eviction are covered by test_disk_cache.
+"""
+
+import pytest
+from PIL import Image
+
+from infrastructure.ocr_cache import OCRCache, get_ocr_cache
+
+OCR_DATA = {"text": ["hello", "world"], "conf": [91, 87]}
+
+
+class TestOCRCacheKeys:
+    """Test cache key construction."""
+
+    def test_page_key_is_deterministic(self):
+        key1 = OCRCache.make_page_key("abc", 1, 300, "eng")
+        key2 = OCRCache.make_page_key("abc", 1, 300, "eng")
+        assert key1 == key2
+        assert len(key1) == 64
+
+    def test_page_key_varies_with_settings(self):
+        base = OCRCache.make_page_key("abc", 1, 300, "eng")
+        assert OCRCache.make_page_key("abc", 2, 300, "eng") != base
+        assert OCRCache.make_page_key("abc", 1, 150, "eng") != base
+        assert OCRCache.make_page_key("abc", 1, 300, "deu") != base
+        assert OCRCache.make_page_key("abc", 1, 300, "eng", flags=("deskew",)) != base
+
+    def test_image_key_uses_pixels(self):
+        white = Image.new("L", (10, 10), color=255)
+        black = Image.new("L", (10, 10), color=0)
+
+        assert OCRCache.make_image_key(white) == OCRCache.make_image_key(white.copy())
+        assert OCRCache.make_image_key(white) != OCRCache.make_image_key(black)
+        assert OCRCache.make_image_key(white) != OCRCache.make_image_key(
+            white, flags=("preprocess",)
+        )
+
+
+class TestOCRCacheStorage:
+    """Test JSON round-tripping (storage itself is covered by test_disk_cache)."""
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = OCRCache(tmp_path)
+        key = OCRCache.make_page_key("abc", 1, 300, "eng")
+
+        assert cache.get(key) is None
+        cache.set(key, OCR_DATA)
+        assert cache.get(key) == OCR_DATA
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(0.5)
+        assert stats["writes"] == 1
+        assert stats["num_entries"] == 1
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        key = OCRCache.make_page_key("abc", 1, 300, "eng")
+        OCRCache(tmp_path).set(key, OCR_DATA)
+
+        reopened = OCRCache(tmp_path)
+        assert reopened.get_stats()["num_entries"] == 1
+        assert reopened.get(key) == OCR_DATA
+
+
+def test_get_ocr_cache_shares_instance_per_directory(tmp_path):
+    assert get_ocr_cache(tmp_path / "a") is get_ocr_cache(tmp_path / "a")
+    assert get_ocr_cache(tmp_path / "a") is not get_ocr_cache(tmp_path / "b")
+
+
+def test_normalizer_and_pdf_extractor_share_one_cache_module():
+    import extractors.pdf_extractor as pdf_extractor
+    import src.data_extract.normalize.normalizer as normalizer
+
+    assert normalizer.get_ocr_cache is pdf_extractor.get_ocr_cache